@@ -0,0 +1,372 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the chart data hot paths on synthetic SQLite and DuckDB datasets.
+
+    python scripts/benchmark_chart_data.py --rows 10000 --rows 5000000
+    python scripts/benchmark_chart_data.py --output scripts/benchmark_chart_data.json
+    python scripts/benchmark_chart_data.py --baseline scripts/benchmark_chart_data.json
+
+Each case is timed ``--repeat`` times per engine and dataset size, from
+building the ``SupersetResultSet`` of the fetched rows to serializing, caching,
+post-processing and pivoting the resulting dataframe. ``--output`` writes the
+timings as JSON, in the layout of ``pytest-benchmark``; ``--baseline`` compares
+the run with such a file and fails when the best time of a case is more than
+``--tolerance`` slower than its baseline. Timings depend on the machine, so
+compare against a baseline recorded on the same one.
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import sqlite3
+import statistics
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+
+ENGINES = ("sqlite", "duckdb")
+
+CACHE_KEY = "benchmark_chart_data"
+
+# A chart query of the size the SQL Lab and chart data paths parse on every
+# request: a CTE, a join, and the filters of a busy dashboard.
+SQL = """
+WITH recent AS (
+    SELECT ds, region, country, category, revenue, orders
+    FROM facts
+    WHERE ds >= '2024-01-01' AND ds < '2025-01-01'
+)
+SELECT
+    recent.region AS region,
+    recent.country AS country,
+    recent.category AS category,
+    SUM(recent.revenue) AS revenue,
+    SUM(recent.orders) AS orders,
+    COUNT(*) AS count
+FROM recent
+JOIN (SELECT DISTINCT country FROM facts WHERE orders > 0) AS active
+    ON active.country = recent.country
+WHERE recent.region IN (
+        'region 0', 'region 1', 'region 2', 'region 3', 'region 4',
+        'region 5', 'region 6', 'region 7', 'region 8', 'region 9'
+    )
+    AND recent.category NOT IN ('category 0', 'category 1', 'category 2')
+    AND recent.country NOT LIKE '%9'
+    AND (recent.revenue > 10 OR recent.orders BETWEEN 1 AND 50)
+GROUP BY recent.region, recent.country, recent.category
+ORDER BY revenue DESC
+LIMIT 10000;
+SELECT COUNT(*) FROM facts;
+"""
+
+
+def measure(func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """
+    Return the timing statistics of ``repeat`` runs of ``func``, in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "max": max(timings),
+        "mean": statistics.mean(timings),
+        "median": statistics.median(timings),
+        "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "rounds": len(timings),
+    }
+
+
+def make_dataset(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "ds": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 365, rows), unit="D"),
+            "region": rng.choice([f"region {i}" for i in range(10)], rows),
+            "country": rng.choice([f"country {i}" for i in range(100)], rows),
+            "category": rng.choice([f"category {i}" for i in range(8)], rows),
+            "revenue": rng.uniform(0, 1000, rows).round(2),
+            "orders": rng.integers(0, 100, rows),
+        }
+    )
+
+
+def fetch(engine: str, dataset: pd.DataFrame) -> tuple[list[tuple[Any, ...]], Any]:
+    """
+    Load the dataset into an in-memory database and fetch it back, returning
+    the rows and cursor description a DB-API driver hands to Superset.
+    """
+    connection: Any
+    if engine == "duckdb":
+        import duckdb
+
+        connection = duckdb.connect()
+        connection.register("dataset", dataset)
+        connection.execute("CREATE TABLE facts AS SELECT * FROM dataset")
+    else:
+        connection = sqlite3.connect(":memory:")
+        dataset.to_sql("facts", connection, index=False)
+
+    try:
+        cursor = connection.execute("SELECT * FROM facts")
+        return cursor.fetchall(), cursor.description
+    finally:
+        connection.close()
+
+
+@contextmanager
+def data_cache() -> Iterator[None]:
+    """
+    Use the configured data cache, or an in-process one when caching is off,
+    so that setting and getting results still pickles and unpickles them.
+    """
+    from flask import current_app
+    from flask_caching.backends import NullCache
+
+    from superset.extensions import cache_manager
+
+    cache = cache_manager.data_cache
+    backend = cache.cache
+    if not isinstance(backend, NullCache):
+        yield
+        return
+
+    cache.init_app(current_app, {"CACHE_TYPE": "SimpleCache"})
+    try:
+        yield
+    finally:
+        current_app.extensions["cache"][cache] = backend
+
+
+def get_cases(engine: str, dataset: pd.DataFrame) -> dict[str, Callable[[], Any]]:
+    from superset.charts.client_processing import pivot_df
+    from superset.common.query_object import QueryObject
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.constants import CacheRegion
+    from superset.dataframe import df_to_records
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.utils import csv, json
+
+    db_engine_spec = DuckDBEngineSpec if engine == "duckdb" else SqliteEngineSpec
+    data, description = fetch(engine, dataset)
+    df = SupersetResultSet(data, description, db_engine_spec).to_pandas_df()
+    records = df_to_records(df)
+    query_object = QueryObject(
+        post_processing=[
+            {
+                "operation": "pivot",
+                "options": {
+                    "index": ["ds"],
+                    "columns": ["region"],
+                    "aggregates": {
+                        "revenue": {"operator": "sum"},
+                        "orders": {"operator": "mean"},
+                    },
+                },
+            },
+            {"operation": "flatten"},
+        ],
+    )
+    cache_value = {"df": df, "query": SQL, "annotation_data": {}}
+    QueryCacheManager.set(CACHE_KEY, cache_value, region=CacheRegion.DATA)
+
+    return {
+        "result_set": lambda: SupersetResultSet(data, description, db_engine_spec),
+        "df_to_records": lambda: df_to_records(df),
+        "json_dumps": lambda: json.dumps(
+            {"result": [{"data": records}]},
+            default=json.json_int_dttm_ser,
+            ignore_nan=True,
+        ),
+        "df_to_escaped_csv": lambda: csv.df_to_escaped_csv(df, index=False),
+        "exec_post_processing": lambda: query_object.exec_post_processing(df),
+        "query_cache_set": lambda: QueryCacheManager.set(
+            CACHE_KEY, cache_value, region=CacheRegion.DATA
+        ),
+        "query_cache_get": lambda: QueryCacheManager.get(
+            CACHE_KEY, region=CacheRegion.DATA
+        ),
+        "pivot_df": lambda: pivot_df(
+            df,
+            rows=["region", "country"],
+            columns=["category"],
+            metrics=["revenue", "orders"],
+            show_rows_total=True,
+            show_columns_total=True,
+        ),
+    }
+
+
+def run_benchmarks(
+    rows: Sequence[int], engines: Sequence[str], repeat: int, seed: int
+) -> list[dict[str, Any]]:
+    """
+    Time every case for each engine and dataset size.
+    """
+    from superset.sql.parse import SQLScript
+
+    benchmarks = []
+    with data_cache():
+        for engine in engines:
+            benchmarks.append(
+                {
+                    "group": "sql_script",
+                    "name": f"sql_script[{engine}]",
+                    "params": {"engine": engine},
+                    "stats": measure(partial(SQLScript, SQL, engine), repeat),
+                }
+            )
+            for size in rows:
+                cases = get_cases(engine, make_dataset(size, seed))
+                for case, func in cases.items():
+                    benchmarks.append(
+                        {
+                            "group": case,
+                            "name": f"{case}[{engine}-{size}]",
+                            "params": {"engine": engine, "rows": size},
+                            "stats": measure(func, repeat),
+                        }
+                    )
+    return benchmarks
+
+
+def find_regressions(
+    benchmarks: Sequence[dict[str, Any]],
+    baseline: Sequence[dict[str, Any]],
+    tolerance: float,
+) -> list[str]:
+    """
+    Names of the benchmarks whose best time exceeds their baseline's by more
+    than ``tolerance``, a fraction of the baseline time.
+    """
+    baseline_stats = {benchmark["name"]: benchmark["stats"] for benchmark in baseline}
+    return [
+        benchmark["name"]
+        for benchmark in benchmarks
+        if benchmark["name"] in baseline_stats
+        and benchmark["stats"]["min"]
+        > baseline_stats[benchmark["name"]]["min"] * (1 + tolerance)
+    ]
+
+
+@click.command()
+@click.option(
+    "--rows",
+    type=int,
+    multiple=True,
+    default=(10_000, 100_000),
+    help="Dataset size; repeat the option to benchmark several sizes.",
+)
+@click.option(
+    "--engine",
+    "engines",
+    type=click.Choice(ENGINES),
+    multiple=True,
+    default=ENGINES,
+    help="Database to fetch the dataset from; repeat for several.",
+)
+@click.option("--repeat", default=5, help="Number of runs per case.")
+@click.option("--seed", default=42, help="Seed for the synthetic datasets.")
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the results to this JSON file.",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Compare the results with this JSON file.",
+)
+@click.option(
+    "--tolerance",
+    default=0.25,
+    help="Slowdown over the baseline, as a fraction, reported as a regression.",
+)
+def main(  # pylint: disable=too-many-arguments
+    rows: tuple[int, ...],
+    engines: tuple[str, ...],
+    repeat: int,
+    seed: int,
+    output: Path | None,
+    baseline: Path | None,
+    tolerance: float,
+) -> None:
+    from superset.utils import json
+
+    print(f"Benchmarking {', '.join(map(str, rows))} rows, {repeat} runs per case\n")
+    benchmarks = run_benchmarks(rows, engines, repeat, seed)
+    baseline_stats = {}
+    if baseline:
+        baseline_benchmarks = json.loads(baseline.read_text())["benchmarks"]
+        baseline_stats = {
+            benchmark["name"]: benchmark["stats"] for benchmark in baseline_benchmarks
+        }
+
+    for benchmark in benchmarks:
+        line = f"{benchmark['name']}: {benchmark['stats']['min']:.4f} s"
+        if stats := baseline_stats.get(benchmark["name"]):
+            change = benchmark["stats"]["min"] / stats["min"] - 1
+            line += f" (baseline {stats['min']:.4f} s, {change:+.0%})"
+        print(line)
+
+    if output:
+        results = {
+            "machine_info": {
+                "machine": platform.machine(),
+                "processor": platform.processor(),
+                "system": platform.system(),
+                "python_implementation": platform.python_implementation(),
+                "python_version": platform.python_version(),
+                "cpu_count": os.cpu_count(),
+            },
+            "datetime": datetime.now(timezone.utc).isoformat(),
+            "benchmarks": benchmarks,
+        }
+        output.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"\nWrote {output}")
+
+    if baseline and (
+        regressions := find_regressions(benchmarks, baseline_benchmarks, tolerance)
+    ):
+        raise click.ClickException(
+            f"{len(regressions)} benchmark(s) more than {tolerance:.0%} slower "
+            f"than {baseline}: {', '.join(regressions)}"
+        )
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
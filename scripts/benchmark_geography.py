@@ -0,0 +1,112 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the vectorized geography post-processing operations against the
+row-wise ``pygeohash``/``geopy`` implementations they replaced.
+
+    python scripts/benchmark_geography.py --rows 200000
+"""
+
+import time
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pygeohash
+from geopy.point import Point
+from pandas import DataFrame
+
+from superset.utils.pandas_postprocessing import (
+    geodetic_parse,
+    geohash_decode,
+    geohash_encode,
+)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Return the best wall-clock time of ``repeat`` runs of ``func``.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@click.command()
+@click.option("--rows", default=200_000, help="Number of rows to process.")
+@click.option("--repeat", default=3, help="Number of runs per implementation.")
+@click.option("--seed", default=42, help="Seed for the random coordinates.")
+def main(rows: int, repeat: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    df = DataFrame(
+        {
+            "latitude": rng.uniform(-90, 90, rows),
+            "longitude": rng.uniform(-180, 180, rows),
+        }
+    )
+    df["geohash"] = [
+        pygeohash.encode(lat, lon)
+        for lat, lon in zip(df["latitude"], df["longitude"], strict=True)
+    ]
+    df["geodetic"] = [
+        f"{lat:.8f}, {lon:.8f}, {alt:.3f}km"
+        for lat, lon, alt in zip(
+            df["latitude"], df["longitude"], rng.uniform(0, 10, rows), strict=True
+        )
+    ]
+
+    cases = {
+        "geohash_encode": (
+            lambda: geohash_encode(
+                df, geohash="out", latitude="latitude", longitude="longitude"
+            ),
+            lambda: df.apply(
+                lambda row: pygeohash.encode(row["latitude"], row["longitude"]),
+                axis=1,
+            ),
+        ),
+        "geohash_decode": (
+            lambda: geohash_decode(
+                df, geohash="geohash", latitude="lat", longitude="lon"
+            ),
+            lambda: df["geohash"].apply(pygeohash.decode),
+        ),
+        "geodetic_parse": (
+            lambda: geodetic_parse(
+                df, geodetic="geodetic", latitude="lat", longitude="lon"
+            ),
+            lambda: df["geodetic"].apply(lambda location: tuple(Point(location))),
+        ),
+    }
+
+    print(f"Benchmarking {rows} rows, best of {repeat} runs\n")
+    for name, (vectorized, row_wise) in cases.items():
+        vectorized_duration = measure(vectorized, repeat)
+        row_wise_duration = measure(row_wise, repeat)
+        print(
+            f"{name}: {vectorized_duration:.3f} s vectorized, "
+            f"{row_wise_duration:.3f} s row-wise "
+            f"({row_wise_duration / vectorized_duration:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
@@ -0,0 +1,117 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark ``pivot_df`` subtotals, assembled in one concatenation, against
+inserting them one group at a time.
+
+    python scripts/benchmark_pivot_df.py --groups 2000
+"""
+
+import time
+from functools import partial
+from typing import Any, Callable
+from unittest.mock import patch
+
+import click
+import numpy as np
+import pandas as pd
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Return the best wall-clock time of ``repeat`` runs of ``func``.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@click.command()
+@click.option("--groups", default=2000, help="Number of second-level row groups.")
+@click.option("--columns", default=10, help="Number of pivoted column values.")
+@click.option("--repeat", default=3, help="Number of runs per implementation.")
+@click.option("--seed", default=42, help="Seed for the random metrics.")
+def main(groups: int, columns: int, repeat: int, seed: int) -> None:
+    from superset.charts import client_processing
+    from superset.charts.client_processing import pivot_df
+
+    rng = np.random.default_rng(seed)
+    outer = max(groups // 20, 1)
+    rows = groups * 4
+    df = pd.DataFrame(
+        {
+            "region": [f"region {i % outer}" for i in range(rows)],
+            "country": [f"country {i % groups}" for i in range(rows)],
+            "city": [f"city {i % 4}" for i in range(rows)],
+            "category": [f"category {i}" for i in rng.integers(0, columns, rows)],
+            "revenue": rng.uniform(0, 1000, rows),
+            "orders": rng.integers(0, 100, rows),
+        }
+    )
+    options: dict[str, Any] = {
+        "rows": ["region", "country", "city"],
+        "columns": ["category"],
+        "metrics": ["revenue", "orders"],
+        "show_rows_total": True,
+        "show_columns_total": True,
+    }
+
+    def iteratively(**kwargs: Any) -> pd.DataFrame:
+        with (
+            patch.object(
+                client_processing,
+                "add_row_subtotals",
+                client_processing.add_row_subtotals_iteratively,
+            ),
+            patch.object(
+                client_processing,
+                "add_column_subtotals",
+                client_processing.add_column_subtotals_iteratively,
+            ),
+        ):
+            return pivot_df(df, **kwargs)
+
+    cases: dict[str, dict[str, Any]] = {
+        "sum": {"aggfunc": "Sum"},
+        "average, metrics combined": {"aggfunc": "Average", "combine_metrics": True},
+        "sum, transposed": {"aggfunc": "Sum", "transpose_pivot": True},
+    }
+
+    print(f"Benchmarking {rows} rows in {groups} groups, best of {repeat} runs\n")
+    for name, kwargs in cases.items():
+        batched = partial(pivot_df, df, **options, **kwargs)
+        iterative = partial(iteratively, **options, **kwargs)
+        pd.testing.assert_frame_equal(batched(), iterative())
+        batched_duration = measure(batched, repeat)
+        iterative_duration = measure(iterative, repeat)
+        print(
+            f"{name}: {batched_duration:.3f} s batched, "
+            f"{iterative_duration:.3f} s iterative "
+            f"({iterative_duration / batched_duration:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
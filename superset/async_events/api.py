@@ -17,7 +17,7 @@
 import logging
 import uuid
 
-from flask import request, Response
+from flask import request, Response, stream_with_context
 from flask_appbuilder import expose
 from flask_appbuilder.api import safe
 from flask_appbuilder.security.decorators import permission_name, protect
@@ -105,6 +105,66 @@ class AsyncEventsRestApi(BaseSupersetApi):
 
         return self.response(200, result=events)
 
+    @expose("/stream", methods=("GET",))
+    @event_logger.log_this
+    @protect()
+    @safe
+    @statsd_metrics
+    @permission_name("list")
+    def stream(self) -> Response:
+        """
+        Stream the Redis async events as server-sent events.
+        ---
+        get:
+          summary: Stream the Redis async events as server-sent events
+          description: >-
+            Holds the connection open and pushes the events of the user's
+            channel as they happen, instead of having the client poll for them.
+            Each event carries its stream ID as the SSE event ID, so a client
+            reconnecting with the `Last-Event-ID` header (or the `last_id` query
+            param) resumes right after the last event it received. The stream
+            holds a server worker until it closes, so it needs an async worker
+            class (gevent or eventlet).
+          parameters:
+          - in: query
+            name: last_id
+            description: Last ID received by the client
+            schema:
+                type: string
+          responses:
+            200:
+              description: Stream of async events
+              content:
+                text/event-stream:
+                  schema:
+                    type: string
+            401:
+              $ref: '#/components/responses/401'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        try:
+            async_channel_id = async_query_manager.parse_channel_id_from_request(
+                request
+            )
+        except AsyncQueryTokenException:
+            return self.response_401()
+
+        last_event_id = request.headers.get("Last-Event-ID") or request.args.get(
+            "last_id"
+        )
+        return Response(
+            stream_with_context(
+                async_query_manager.stream_events(async_channel_id, last_event_id)
+            ),
+            mimetype="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                # don't let reverse proxies buffer the events
+                "X-Accel-Buffering": "no",
+            },
+        )
+
     @expose("/<job_id>/cancel", methods=("POST",))
     @event_logger.log_this
     @protect()
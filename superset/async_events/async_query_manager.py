@@ -19,12 +19,14 @@ from __future__ import annotations
 import hashlib
 import hmac
 import logging
+import time
 import uuid
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
-from typing import Any, Literal, Optional, TYPE_CHECKING
+from typing import Any, Callable, Literal, Optional, TYPE_CHECKING, Union
 
 import jwt
-from flask import Flask, Request, request, Response, session
+from flask import current_app, Flask, Request, request, Response, session
 from flask_caching.backends.base import BaseCache
 
 from superset.async_events.cache_backend import (
@@ -75,6 +77,12 @@ def parse_event(event_data: tuple[str, dict[str, Any]]) -> dict[str, Any]:
     return {"id": event_id, **json.loads(event_payload)}
 
 
+def format_server_sent_event(event: dict[str, Any]) -> str:
+    # the stream ID doubles as the SSE event ID, so a reconnecting client sends
+    # it back as the ``Last-Event-ID`` header and resumes right after it
+    return f"id: {event['id']}\ndata: {json.dumps(event)}\n\n"
+
+
 def increment_id(entry_id: str) -> str:
     # redis stream IDs are in this format: '1607477697866-0'
     try:
@@ -110,6 +118,9 @@ class AsyncQueryManager:
     # Redis key prefix (within the GAQ stream namespace) for the per-job record
     # that authorizes cancellation and flags a job as cancelled for the worker.
     _JOB_REGISTRY_PREFIX = "job-cancel:"
+    # Redis key prefix for the job currently computing the data behind a cache
+    # key, which identical submissions attach to instead of running their own.
+    _INFLIGHT_JOB_PREFIX = "job-inflight:"
 
     def __init__(self) -> None:
         super().__init__()
@@ -123,6 +134,10 @@ class AsyncQueryManager:
         self._jwt_cookie_samesite: Optional[Literal["None", "Lax", "Strict"]] = None
         self._jwt_secret: str
         self._jwt_expiration_seconds: int = 0
+        self._sse_heartbeat_interval: int = 15
+        self._sse_max_duration: int = 300
+        self._sse_retry_delay: int = 500
+        self._coalesce_window: int = 0
         self._load_chart_data_into_cache_job: Any = None
         # pylint: disable=invalid-name
 
@@ -160,6 +175,12 @@ class AsyncQueryManager:
         self._jwt_expiration_seconds = app.config[
             "GLOBAL_ASYNC_QUERIES_JWT_EXPIRATION_SECONDS"
         ]
+        self._sse_heartbeat_interval = app.config[
+            "GLOBAL_ASYNC_QUERIES_SSE_HEARTBEAT_INTERVAL"
+        ]
+        self._sse_max_duration = app.config["GLOBAL_ASYNC_QUERIES_SSE_MAX_DURATION"]
+        self._sse_retry_delay = app.config["GLOBAL_ASYNC_QUERIES_POLLING_DELAY"]
+        self._coalesce_window = app.config["GLOBAL_ASYNC_QUERIES_COALESCE_WINDOW"]
 
         if app.config["GLOBAL_ASYNC_QUERIES_REGISTER_REQUEST_HANDLERS"]:
             self.register_request_handlers(app)
@@ -289,7 +310,11 @@ class AsyncQueryManager:
         return f"{self._stream_prefix}{self._JOB_REGISTRY_PREFIX}{job_id}"
 
     def _register_cancellable_job(
-        self, job_id: str, channel_id: str, user_id: Optional[int]
+        self,
+        job_id: str,
+        channel_id: str,
+        user_id: Optional[int],
+        cache_key: Optional[str] = None,
     ) -> None:
         """
         Persist the identity a later cancel request must match. Keyed by
@@ -297,21 +322,45 @@ class AsyncQueryManager:
         the cancel endpoint can authorize the caller against the job's original
         owner without trusting the client-supplied id. Expires with the JWT so
         it never outlives the job it guards.
+
+        Jobs other submissions can attach to also record the ``cache_key`` they
+        are computing, so their attached jobs are notified when they finish.
         """
         if not self._cache:
             return
+        record: dict[str, Any] = {"channel_id": channel_id, "user_id": user_id}
+        if cache_key:
+            record["cache_key"] = cache_key
         self._cache.set(
             self._job_registry_key(job_id),
-            json.dumps({"channel_id": channel_id, "user_id": user_id}),
+            json.dumps(record),
             ex=self._jwt_expiration_seconds or None,
         )
 
+    def _inflight_job_key(self, cache_key: str) -> str:
+        return f"{self._stream_prefix}{self._INFLIGHT_JOB_PREFIX}{cache_key}"
+
+    def _attached_jobs_key(self, cache_key: str) -> str:
+        return f"{self._inflight_job_key(cache_key)}:attached"
+
     def submit_chart_data_job(
         self,
         channel_id: str,
         form_data: dict[str, Any],
         user_id: Optional[int] = None,
+        cache_key: Union[str, Callable[[], Optional[str]], None] = None,
     ) -> dict[str, Any]:
+        """
+        Enqueue a job loading the chart data into the cache.
+
+        When ``cache_key`` identifies the data (including the RLS and
+        impersonation context of the current user) and a job computing the same
+        key was submitted within ``GLOBAL_ASYNC_QUERIES_COALESCE_WINDOW``
+        seconds, the new job attaches to it instead: no task is enqueued, and
+        the job's own completion event is sent when the running job finishes.
+        ``cache_key`` may be a function computing the key, which is only called
+        when jobs are coalesced.
+        """
         # pylint: disable=import-outside-toplevel
         from superset import security_manager
 
@@ -320,19 +369,118 @@ class AsyncQueryManager:
         # this way we can keep the cache key consistent between sync and async command
         # so that it can be looked up consistently
         job_metadata = self.init_job(channel_id, user_id)
+        task_job_metadata = (
+            {**job_metadata, "guest_token": guest_user.guest_token}
+            if (guest_user := security_manager.get_current_guest_user_if_guest())
+            else job_metadata
+        )
+        if callable(cache_key):
+            cache_key = cache_key() if self._coalesce_window else None
+        if cache_key and self._coalesce_window:
+            if self._attach_to_inflight_job(cache_key, task_job_metadata, form_data):
+                current_app.config["STATS_LOGGER"].incr("async_query.coalesced")
+                return job_metadata
+            self._register_cancellable_job(
+                job_metadata["job_id"], channel_id, user_id, cache_key
+            )
+
+        self._enqueue_chart_data_job(task_job_metadata, form_data)
+        return job_metadata
+
+    def _enqueue_chart_data_job(
+        self, task_job_metadata: dict[str, Any], form_data: dict[str, Any]
+    ) -> None:
         self._load_chart_data_into_cache_job.apply_async(
-            args=[
-                {**job_metadata, "guest_token": guest_user.guest_token}
-                if (guest_user := security_manager.get_current_guest_user_if_guest())
-                else job_metadata,
-                form_data,
-            ],
+            args=[task_job_metadata, form_data],
             # Use job_id as the Celery task id so the cancel endpoint can revoke
             # the running task by the id the client already holds.
-            task_id=job_metadata["job_id"],
+            task_id=task_job_metadata["job_id"],
             expires=self._jwt_expiration_seconds,
         )
-        return job_metadata
+
+    def _attach_to_inflight_job(
+        self,
+        cache_key: str,
+        task_job_metadata: dict[str, Any],
+        form_data: dict[str, Any],
+    ) -> bool:
+        """
+        Attach a job to the one computing ``cache_key``, if there is one.
+
+        :returns: False if no job is computing the key, in which case the caller
+            becomes the job others attach to and has to enqueue its task
+        """
+        if not self._cache:
+            return False
+
+        inflight_key = self._inflight_job_key(cache_key)
+        job_id = task_job_metadata["job_id"]
+        if self._cache.set(inflight_key, job_id, ex=self._coalesce_window, nx=True):
+            return False
+
+        attached_jobs_key = self._attached_jobs_key(cache_key)
+        attached_job = json.dumps(
+            {"job_metadata": task_job_metadata, "form_data": form_data}
+        )
+        self._cache.rpush(attached_jobs_key, attached_job)
+        self._cache.expire(attached_jobs_key, self._jwt_expiration_seconds)
+
+        # The running job may have finished between the two writes above and
+        # never see this one: take it back and run it, unless the running job
+        # already popped it, in which case it will be notified.
+        if self._cache.get(inflight_key) is None and self._cache.lrem(
+            attached_jobs_key, 1, attached_job
+        ):
+            self._cache.set(inflight_key, job_id, ex=self._coalesce_window, nx=True)
+            return False
+        return True
+
+    def _release_attached_jobs(
+        self, cache_key: str, status: str, **kwargs: Any
+    ) -> None:
+        """
+        Notify the jobs attached to a finished job of its outcome.
+
+        When the job was cancelled, its user's decision shouldn't cancel the
+        others: the first attached job is enqueued in its place instead, and
+        the remaining ones stay attached to it.
+        """
+        if not self._cache:
+            return
+
+        inflight_key = self._inflight_job_key(cache_key)
+        attached_jobs_key = self._attached_jobs_key(cache_key)
+        if status == self.STATUS_CANCELLED:
+            if raw := self._cache.lpop(attached_jobs_key):
+                attached_job = json.loads(raw)
+                task_job_metadata = attached_job["job_metadata"]
+                job_id = task_job_metadata["job_id"]
+                self._cache.set(inflight_key, job_id, ex=self._coalesce_window)
+                self._register_cancellable_job(
+                    job_id,
+                    task_job_metadata["channel_id"],
+                    task_job_metadata["user_id"],
+                    cache_key,
+                )
+                self._enqueue_chart_data_job(
+                    task_job_metadata, attached_job["form_data"]
+                )
+                return
+
+        self._cache.delete(inflight_key)
+        while raw := self._cache.lpop(attached_jobs_key):
+            task_job_metadata = json.loads(raw)["job_metadata"]
+            if self.is_job_cancelled(task_job_metadata["job_id"]):
+                continue
+            self.update_job(
+                build_job_metadata(
+                    task_job_metadata["channel_id"],
+                    task_job_metadata["job_id"],
+                    task_job_metadata["user_id"],
+                ),
+                status,
+                **kwargs,
+            )
 
     def read_events(
         self, channel: str, last_id: Optional[str]
@@ -343,6 +491,52 @@ class AsyncQueryManager:
         stream_name = f"{self._stream_prefix}{channel}"
         start_id = increment_id(last_id) if last_id else "-"
         results = self._cache.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
+        return self._parse_events(results)
+
+    def read_events_blocking(
+        self, channel: str, last_id: Optional[str], block: int
+    ) -> list[Optional[dict[str, Any]]]:
+        """
+        Read the events following ``last_id`` off of the channel stream, waiting
+        up to ``block`` milliseconds for new ones if there are none yet.
+        """
+        if not self._cache:
+            raise CacheBackendNotInitialized("Cache backend not initialized")
+
+        stream_name = f"{self._stream_prefix}{channel}"
+        # unlike XRANGE, XREAD is exclusive of the ID it is given
+        results = self._cache.xread(
+            {stream_name: last_id or "0"}, self.MAX_EVENT_COUNT, max(1, block)
+        )
+        return self._parse_events(results[0][1] if results else [])
+
+    def stream_events(self, channel: str, last_id: Optional[str]) -> Iterator[str]:
+        """
+        Push the events of a channel as server-sent events as they are added to
+        its stream, holding the connection on a blocking read instead of having
+        the client poll for them.
+
+        A comment is sent as a heartbeat whenever no event shows up within
+        ``GLOBAL_ASYNC_QUERIES_SSE_HEARTBEAT_INTERVAL`` seconds, so proxies keep
+        the connection open and dead clients are noticed. The stream ends after
+        ``GLOBAL_ASYNC_QUERIES_SSE_MAX_DURATION`` seconds to free the worker;
+        the client then reconnects and resumes after the last event it got.
+        """
+        deadline = time.monotonic() + self._sse_max_duration
+        yield f"retry: {self._sse_retry_delay}\n\n"
+
+        while (remaining := deadline - time.monotonic()) > 0:
+            block = min(self._sse_heartbeat_interval, remaining)
+            events = self.read_events_blocking(channel, last_id, int(block * 1000))
+            if not events:
+                yield ": heartbeat\n\n"
+                continue
+            for event in events:
+                if event:
+                    last_id = event["id"]
+                    yield format_server_sent_event(event)
+
+    def _parse_events(self, results: list[Any]) -> list[Optional[dict[str, Any]]]:
         # Decode bytes to strings, decode_responses is not supported at RedisCache and RedisSentinelCache  # noqa: E501
         if isinstance(self._cache, (RedisSentinelCacheBackend, RedisCacheBackend)):
             decoded_results = [
@@ -381,6 +575,16 @@ class AsyncQueryManager:
         logger.debug("********** logging event data to stream %s", scoped_stream_name)
         logger.debug(event_data)
 
+        # Jobs attached to this one are released once its outcome is announced,
+        # but it has to be looked up before the record goes away.
+        cache_key = None
+        if self._coalesce_window and status in (
+            self.STATUS_DONE,
+            self.STATUS_ERROR,
+            self.STATUS_CANCELLED,
+        ):
+            cache_key = self._get_job_cache_key(job_metadata["job_id"])
+
         # Drop the cancel record before announcing the result, so a cancel that
         # arrives once the job is done finds nothing to flag and is reported as
         # such instead of contradicting the event below. A cancelled job keeps
@@ -393,6 +597,15 @@ class AsyncQueryManager:
         self._cache.xadd(scoped_stream_name, event_data, "*", self._stream_limit)
         self._cache.xadd(full_stream_name, event_data, "*", self._stream_limit_firehose)
 
+        if cache_key:
+            self._release_attached_jobs(cache_key, status, **kwargs)
+
+    def _get_job_cache_key(self, job_id: str) -> Optional[str]:
+        if not self._cache:
+            return None
+        raw = self._cache.get(self._job_registry_key(job_id))
+        return json.loads(raw).get("cache_key") if raw is not None else None
+
     def is_job_cancelled(self, job_id: str) -> bool:
         """
         Whether ``cancel_job`` has flagged this job for cancellation.
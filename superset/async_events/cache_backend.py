@@ -117,6 +117,46 @@ class RedisCacheBackend(RedisCache):
         """
         return self._cache.delete(*names)
 
+    def expire(self, name: str, time: int) -> bool:
+        """
+        Set an expire flag on key ``name`` for ``time`` seconds.
+
+        :param name: Key name
+        :param time: Expire time in seconds
+        :returns: True if the timeout was set, False if the key does not exist
+        """
+        return self._cache.expire(name, time)
+
+    def rpush(self, name: str, *values: str) -> int:
+        """
+        Append values to the tail of the list at key ``name``.
+
+        :param name: Key name
+        :param values: Values to append
+        :returns: Length of the list after the push
+        """
+        return self._cache.rpush(name, *values)
+
+    def lpop(self, name: str) -> Any:
+        """
+        Remove and return the first element of the list at key ``name``.
+
+        :param name: Key name
+        :returns: The element (bytes), or None if the list is empty
+        """
+        return self._cache.lpop(name)
+
+    def lrem(self, name: str, count: int, value: str) -> int:
+        """
+        Remove occurrences of ``value`` from the list at key ``name``.
+
+        :param name: Key name
+        :param count: Number of occurrences to remove, 0 removes all of them
+        :param value: Value to remove
+        :returns: Number of removed elements
+        """
+        return self._cache.lrem(name, count, value)
+
     def publish(self, channel: str, message: str) -> int:
         """
         Publish a message to a Redis pub/sub channel.
@@ -154,6 +194,24 @@ class RedisCacheBackend(RedisCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xread(
+        self,
+        streams: dict[str, str],
+        count: int | None = None,
+        block: int | None = None,
+    ) -> list[Any]:
+        """
+        Read the entries following the given IDs off of one or more streams.
+
+        :param streams: Mapping of stream name to the last ID already read
+        :param count: Maximum number of entries to return per stream
+        :param block: Milliseconds to wait for new entries if there are none
+        :returns: ``[stream_name, [(entry_id, fields), ...]]`` pairs, empty if
+            the wait timed out
+        """
+        count = count or self.MAX_EVENT_COUNT
+        return self._cache.xread(streams, count, block)
+
     @classmethod
     def from_config(cls, config: dict[str, Any]) -> RedisCacheBackend:
         kwargs = {
@@ -310,6 +368,46 @@ class RedisSentinelCacheBackend(RedisSentinelCache):
         """
         return self._cache.delete(*names)
 
+    def expire(self, name: str, time: int) -> bool:
+        """
+        Set an expire flag on key ``name`` for ``time`` seconds.
+
+        :param name: Key name
+        :param time: Expire time in seconds
+        :returns: True if the timeout was set, False if the key does not exist
+        """
+        return self._cache.expire(name, time)
+
+    def rpush(self, name: str, *values: str) -> int:
+        """
+        Append values to the tail of the list at key ``name``.
+
+        :param name: Key name
+        :param values: Values to append
+        :returns: Length of the list after the push
+        """
+        return self._cache.rpush(name, *values)
+
+    def lpop(self, name: str) -> Any:
+        """
+        Remove and return the first element of the list at key ``name``.
+
+        :param name: Key name
+        :returns: The element (bytes), or None if the list is empty
+        """
+        return self._cache.lpop(name)
+
+    def lrem(self, name: str, count: int, value: str) -> int:
+        """
+        Remove occurrences of ``value`` from the list at key ``name``.
+
+        :param name: Key name
+        :param count: Number of occurrences to remove, 0 removes all of them
+        :param value: Value to remove
+        :returns: Number of removed elements
+        """
+        return self._cache.lrem(name, count, value)
+
     def publish(self, channel: str, message: str) -> int:
         """
         Publish a message to a Redis pub/sub channel.
@@ -347,6 +445,24 @@ class RedisSentinelCacheBackend(RedisSentinelCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xread(
+        self,
+        streams: dict[str, str],
+        count: int | None = None,
+        block: int | None = None,
+    ) -> list[Any]:
+        """
+        Read the entries following the given IDs off of one or more streams.
+
+        :param streams: Mapping of stream name to the last ID already read
+        :param count: Maximum number of entries to return per stream
+        :param block: Milliseconds to wait for new entries if there are none
+        :returns: ``[stream_name, [(entry_id, fields), ...]]`` pairs, empty if
+            the wait timed out
+        """
+        count = count or self.MAX_EVENT_COUNT
+        return self._cache.xread(streams, count, block)
+
     @classmethod
     def from_config(cls, config: dict[str, Any]) -> RedisSentinelCacheBackend:
         kwargs = {
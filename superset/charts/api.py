@@ -24,7 +24,6 @@ from zipfile import is_zipfile, ZipFile
 from flask import current_app, redirect, request, Response, send_file, url_for
 from flask_appbuilder.api import expose, protect, rison as parse_rison, safe
 from flask_appbuilder.hooks import before_request
-from flask_appbuilder.models.sqla.interface import SQLAInterface
 from flask_babel import ngettext
 from marshmallow import ValidationError
 from werkzeug.wrappers import Response as WerkzeugResponse
@@ -119,6 +118,7 @@ from superset.versioning.etag import set_version_etag
 from superset.versioning.schemas import VersionListItemSchema
 from superset.views.base_api import (
     BaseSupersetModelRestApi,
+    KeysetSQLAInterface,
     RelatedFieldFilter,
     requires_form_data,
     requires_json,
@@ -141,7 +141,7 @@ _CHART_PURGE_BINDING = SoftDeleteBinding(
 
 
 class ChartRestApi(SoftDeleteApiMixin, BaseSupersetModelRestApi):
-    datamodel = SQLAInterface(Slice)
+    datamodel = KeysetSQLAInterface(Slice)
 
     resource_name = "chart"
     allow_browser_login = True
@@ -75,6 +75,229 @@ def get_column_key(label: tuple[str, ...], metrics: list[str]) -> tuple[Any, ...
     return tuple(parts)
 
 
+def get_prefix_runs(
+    labels: pd.MultiIndex, length: int
+) -> Optional[tuple[np.ndarray, np.ndarray]]:
+    """
+    Find the runs of labels sharing their first ``length`` levels.
+
+    Returns the start and stop positions of each run, or None when a prefix
+    appears in more than one run and its subtotal has no single position.
+    """
+    if length == 0:
+        return np.array([0]), np.array([len(labels)])
+
+    codes = np.column_stack(labels.codes[:length])
+    breaks = np.flatnonzero((codes[1:] != codes[:-1]).any(axis=1)) + 1
+    starts = np.concatenate(([0], breaks))
+    stops = np.concatenate((breaks, [len(labels)]))
+    if len({tuple(prefix) for prefix in codes[starts].tolist()}) != len(starts):
+        return None
+    return starts, stops
+
+
+def get_level_runs(
+    labels: pd.MultiIndex,
+) -> Optional[list[tuple[np.ndarray, np.ndarray]]]:
+    """
+    Find the runs of labels of every subtotal level, from the overall total
+    down to the deepest subgroups, or None if a group is not contiguous.
+    """
+    runs = []
+    for level in range(labels.nlevels):
+        if (level_runs := get_prefix_runs(labels, level)) is None:
+            return None
+        runs.append(level_runs)
+    return runs
+
+
+def get_subtotal_label(
+    prefix: tuple[Any, ...], total: str, nlevels: int
+) -> tuple[Any, ...]:
+    """
+    Label of the subtotal of a group, padded to the depth of the axis.
+    """
+    return (*prefix, total, *([""] * (nlevels - len(prefix) - 1)))
+
+
+def stack_subtotals(subtotals: list[pd.Series]) -> list[pd.DataFrame]:
+    """
+    Turn subtotals into rows, one frame per run of subtotals sharing a dtype.
+
+    Concatenating these frames gives the same dtypes as concatenating one
+    single-row frame per subtotal, with far fewer frames.
+    """
+    frames: list[pd.DataFrame] = []
+    start = 0
+    while start < len(subtotals):
+        dtype = subtotals[start].dtype
+        stop = start + 1
+        while stop < len(subtotals) and subtotals[stop].dtype == dtype:
+            stop += 1
+        if isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+            block = subtotals[start:stop]
+            frames.append(
+                pd.DataFrame(
+                    np.vstack([subtotal.to_numpy() for subtotal in block]),
+                    index=pd.MultiIndex.from_tuples(
+                        [subtotal.name for subtotal in block]
+                    ),
+                    columns=block[0].index,
+                    dtype=dtype,
+                )
+            )
+        else:
+            frames.extend(subtotal.to_frame().T for subtotal in subtotals[start:stop])
+        start = stop
+    return frames
+
+
+def add_row_subtotals(df: pd.DataFrame, aggfunc: str, metric_name: str) -> pd.DataFrame:
+    """
+    Add a row after each group of rows with its subtotal, and a total row.
+
+    Subtotals are computed from the original rows for every level, and the
+    frame is assembled with a single concatenation instead of one per group.
+    The result is the same as ``add_row_subtotals_iteratively``, which is
+    used when a group is not contiguous.
+    """
+    labels = df.index
+    nlevels = labels.nlevels
+    runs = None if df.empty else get_level_runs(labels)
+    if runs is None:
+        return add_row_subtotals_iteratively(df, aggfunc, metric_name)
+
+    # ``pd.to_numeric`` infers the dtype of each group on its own, so it is
+    # applied group by group unless it would leave every column unchanged
+    coerce = aggfunc != CURRENCY_CONTEXT_AGGREGATION and not all(
+        is_plain_numeric(dtype) for dtype in df.dtypes
+    )
+
+    subtotals: list[pd.Series] = []
+    positions = [np.arange(len(df))]
+    ranks = [np.zeros(len(df), dtype=int)]
+    for level, (starts, stops) in enumerate(runs):
+        total = metric_name if level == 0 else __("Subtotal")
+        for start, stop in zip(starts, stops, strict=True):
+            values = df.iloc[start:stop]
+            if coerce:
+                values = values.apply(pd.to_numeric, errors="coerce")
+            subtotal = pivot_v2_aggfunc_map[aggfunc](values, axis=0)
+            subtotal.name = get_subtotal_label(labels[start][:level], total, nlevels)
+            subtotals.append(subtotal)
+        # a subtotal goes after the last row of its group, and after the
+        # subtotals of the deeper groups ending there
+        positions.append(stops - 1)
+        ranks.append(np.full(len(starts), nlevels - level))
+
+    df = pd.concat([df, *stack_subtotals(subtotals)])
+    order = np.lexsort((np.concatenate(ranks), np.concatenate(positions)))
+    return df.iloc[order]
+
+
+def add_row_subtotals_iteratively(
+    df: pd.DataFrame, aggfunc: str, metric_name: str
+) -> pd.DataFrame:
+    """
+    Add a row after each group of rows with its subtotal, and a total row.
+
+    We start from the overall group, and iterate deeper into subgroups,
+    inserting one row at a time.
+    """
+    groups = df.index
+    for level in range(df.index.nlevels):
+        subgroups = {group[:level] for group in groups}
+        for subgroup in subgroups:
+            try:
+                slice_ = df.index.get_loc(subgroup)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception(
+                    "Error getting location for subgroup %s from %s",
+                    subgroup,
+                    groups,
+                )
+                raise
+
+            subtotal_values = df.iloc[slice_, :]
+            if aggfunc != CURRENCY_CONTEXT_AGGREGATION:
+                subtotal_values = subtotal_values.apply(pd.to_numeric, errors="coerce")
+            subtotal = pivot_v2_aggfunc_map[aggfunc](subtotal_values, axis=0)
+            depth = groups.nlevels - len(subgroup) - 1
+            total = metric_name if level == 0 else __("Subtotal")
+            subtotal.name = tuple([*subgroup, total, *([""] * depth)])  # noqa: C409
+            # insert row after subgroup
+            df = pd.concat(
+                [df[: slice_.stop], subtotal.to_frame().T, df[slice_.stop :]]
+            )
+    return df
+
+
+def add_column_subtotals(
+    df: pd.DataFrame, aggfunc: str, metric_name: str
+) -> pd.DataFrame:
+    """
+    Add a column after each group of columns with its subtotal, and a total
+    column.
+
+    Like ``add_row_subtotals``, subtotals are computed from the original
+    columns and added in a single concatenation; the result is the same as
+    ``add_column_subtotals_iteratively``.
+    """
+    labels = df.columns
+    nlevels = labels.nlevels
+    runs = None if labels.empty else get_level_runs(labels)
+    if runs is None:
+        return add_column_subtotals_iteratively(df, aggfunc, metric_name)
+
+    subtotals: dict[int, pd.Series] = {}
+    names: list[tuple[Any, ...]] = []
+    positions = [np.arange(len(labels))]
+    ranks = [np.zeros(len(labels), dtype=int)]
+    for level, (starts, stops) in enumerate(runs):
+        total = metric_name if level == 0 else __("Subtotal")
+        for start, stop in zip(starts, stops, strict=True):
+            subtotals[len(names)] = pivot_v2_aggfunc_map[aggfunc](
+                df.iloc[:, start:stop], axis=1
+            )
+            names.append(get_subtotal_label(labels[start][:level], total, nlevels))
+        positions.append(stops - 1)
+        ranks.append(np.full(len(starts), nlevels - level))
+
+    subtotal_columns = pd.DataFrame(subtotals, index=df.index)
+    subtotal_columns.columns = pd.MultiIndex.from_tuples(names, names=labels.names)
+    df = pd.concat([df, subtotal_columns], axis=1)
+    order = np.lexsort((np.concatenate(ranks), np.concatenate(positions)))
+    return df.iloc[:, order]
+
+
+def add_column_subtotals_iteratively(
+    df: pd.DataFrame, aggfunc: str, metric_name: str
+) -> pd.DataFrame:
+    """
+    Add a column after each group of columns with its subtotal, and a total
+    column, inserting one column at a time.
+    """
+    groups = df.columns
+    for level in range(df.columns.nlevels):
+        subgroups = {group[:level] for group in groups}
+        for subgroup in subgroups:
+            slice_ = df.columns.get_loc(subgroup)
+            subtotal = pivot_v2_aggfunc_map[aggfunc](df.iloc[:, slice_], axis=1)
+            depth = df.columns.nlevels - len(subgroup) - 1
+            total = metric_name if level == 0 else __("Subtotal")
+            subtotal_name = tuple([*subgroup, total, *([""] * depth)])  # noqa: C409
+            # insert column after subgroup
+            df.insert(int(slice_.stop), subtotal_name, subtotal)
+    return df
+
+
+def is_plain_numeric(dtype: Any) -> bool:
+    """
+    Whether ``pd.to_numeric`` leaves a column of this dtype unchanged.
+    """
+    return isinstance(dtype, np.dtype) and dtype.kind in "iuf"
+
+
 def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-statements, too-many-branches  # noqa: C901
     df: pd.DataFrame,
     rows: list[str],
@@ -168,9 +391,7 @@ def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-s
         df.columns = pd.MultiIndex.from_tuples([(str(i),) for i in df.columns])
 
     if show_rows_total:
-        # add subtotal for each group and overall total; we start from the
-        # overall group, and iterate deeper into subgroups
-        groups = df.columns
+        # add subtotal for each group and overall total
         if not apply_metrics_on_rows:
             for col in df.columns:
                 # we need to replace the temporary placeholder with either a string
@@ -183,47 +404,10 @@ def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-s
             # when we applied metrics on rows, we switched the columns and rows
             # so checking column type doesn't apply. Replace everything with np.nan
             df.replace("SUPERSET_PANDAS_NAN", np.nan, inplace=True)
-        for level in range(df.columns.nlevels):
-            subgroups = {group[:level] for group in groups}
-            for subgroup in subgroups:
-                slice_ = df.columns.get_loc(subgroup)
-                subtotal = pivot_v2_aggfunc_map[aggfunc](df.iloc[:, slice_], axis=1)
-                depth = df.columns.nlevels - len(subgroup) - 1
-                total = metric_name if level == 0 else __("Subtotal")
-                subtotal_name = tuple([*subgroup, total, *([""] * depth)])  # noqa: C409
-                # insert column after subgroup
-                df.insert(int(slice_.stop), subtotal_name, subtotal)
+        df = add_column_subtotals(df, aggfunc, metric_name)
 
     if rows and show_columns_total:
-        # add subtotal for each group and overall total; we start from the
-        # overall group, and iterate deeper into subgroups
-        groups = df.index
-        for level in range(df.index.nlevels):
-            subgroups = {group[:level] for group in groups}
-            for subgroup in subgroups:
-                try:
-                    slice_ = df.index.get_loc(subgroup)
-                except Exception:  # pylint: disable=broad-except
-                    logger.exception(
-                        "Error getting location for subgroup %s from %s",
-                        subgroup,
-                        groups,
-                    )
-                    raise
-
-                subtotal_values = df.iloc[slice_, :]
-                if aggfunc != CURRENCY_CONTEXT_AGGREGATION:
-                    subtotal_values = subtotal_values.apply(
-                        pd.to_numeric, errors="coerce"
-                    )
-                subtotal = pivot_v2_aggfunc_map[aggfunc](subtotal_values, axis=0)
-                depth = groups.nlevels - len(subgroup) - 1
-                total = metric_name if level == 0 else __("Subtotal")
-                subtotal.name = tuple([*subgroup, total, *([""] * depth)])  # noqa: C409
-                # insert row after subgroup
-                df = pd.concat(
-                    [df[: slice_.stop], subtotal.to_frame().T, df[slice_.stop :]]
-                )
+        df = add_row_subtotals(df, aggfunc, metric_name)
 
     # if we want to apply the metrics on the rows we need to pivot the
     # dataframe back
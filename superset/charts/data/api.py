@@ -37,9 +37,12 @@ from superset.charts.data.dashboard_filter_context import (
     DashboardFilterContext,
     get_dashboard_filter_context,
 )
-from superset.charts.data.form_data import set_form_data
+from superset.charts.data.form_data import batch_item_form_data, set_form_data
 from superset.charts.data.query_context_cache_loader import QueryContextCacheLoader
-from superset.charts.schemas import ChartDataQueryContextSchema
+from superset.charts.schemas import (
+    ChartDataBatchRequestSchema,
+    ChartDataQueryContextSchema,
+)
 from superset.commands.chart.data.create_async_job_command import (
     CreateAsyncChartDataJobCommand,
 )
@@ -53,11 +56,13 @@ from superset.commands.chart.exceptions import (
 )
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.chart_data_timing import ChartDataExecutionResult
+from superset.common.utils.query_cache_manager import QueryCacheManager
 from superset.connectors.sqla.models import BaseDatasource
-from superset.constants import CACHE_DISABLED_TIMEOUT
+from superset.constants import CACHE_DISABLED_TIMEOUT, CacheRegion
 from superset.daos.exceptions import DatasourceNotFound
 from superset.exceptions import QueryObjectValidationError, SupersetSecurityException
 from superset.extensions import event_logger
+from superset.models.helpers import sqla_query_memo
 from superset.models.sql_lab import Query
 from superset.utils import json
 from superset.utils.core import (
@@ -77,7 +82,7 @@ logger = logging.getLogger(__name__)
 
 
 class ChartDataRestApi(ChartRestApi):
-    include_route_methods = {"get_data", "data", "data_from_cache"}
+    include_route_methods = {"get_data", "data", "data_batch", "data_from_cache"}
 
     @expose("/<int:pk>/data/", methods=("GET",))
     @protect()
@@ -234,17 +239,7 @@ class ChartDataRestApi(ChartRestApi):
                 )
             )
 
-        # TODO: support CSV, SQL query and other non-JSON types
-        # Don't use async queries when cache is disabled (cache_timeout=-1)
-        # as async queries depend on caching to retrieve results
-        cache_timeout = query_context.get_cache_timeout()
-        use_async = (
-            is_feature_enabled("GLOBAL_ASYNC_QUERIES")
-            and query_context.result_format == ChartDataResultFormat.JSON
-            and query_context.result_type == ChartDataResultType.FULL
-            and cache_timeout != CACHE_DISABLED_TIMEOUT
-        )
-        if use_async:
+        if self._should_run_async(query_context):
             return self._run_async(json_body, command, add_extra_log_payload)
 
         try:
@@ -338,17 +333,7 @@ class ChartDataRestApi(ChartRestApi):
                 )
             )
 
-        # TODO: support CSV, SQL query and other non-JSON types
-        # Don't use async queries when cache is disabled (cache_timeout=-1)
-        # as async queries depend on caching to retrieve results
-        cache_timeout = query_context.get_cache_timeout()
-        use_async = (
-            is_feature_enabled("GLOBAL_ASYNC_QUERIES")
-            and query_context.result_format == ChartDataResultFormat.JSON
-            and query_context.result_type == ChartDataResultType.FULL
-            and cache_timeout != CACHE_DISABLED_TIMEOUT
-        )
-        if use_async:
+        if self._should_run_async(query_context):
             return self._run_async(json_body, command, add_extra_log_payload)
 
         form_data = json_body.get("form_data")
@@ -432,6 +417,204 @@ class ChartDataRestApi(ChartRestApi):
 
         return self._get_data_response(command, True)
 
+    @expose("/data/batch", methods=("POST",))
+    @protect()
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.data_batch",
+        log_to_statsd=False,
+        allow_extra_payload=True,
+    )
+    def data_batch(
+        self, add_extra_log_payload: Callable[..., None] = lambda **kwargs: None
+    ) -> Response:
+        """
+        Take the query contexts of several charts and return the payload data
+        response for each of them
+        ---
+        post:
+          summary: Return payload data responses for several query contexts
+          description: >-
+            Takes the query contexts of several charts, for instance those of a
+            dashboard, and returns for each of them the response of
+            `/api/v1/chart/data`. The cached data of all the queries is read in
+            one round trip, and only the queries missing from the cache are run.
+            Only JSON results are supported.
+          requestBody:
+            description: >-
+              The query contexts, at most `CHART_DATA_BATCH_MAX_SIZE` of them.
+            required: true
+            content:
+              application/json:
+                schema:
+                  $ref: "#/components/schemas/ChartDataBatchRequestSchema"
+          responses:
+            200:
+              description: The response to each query context
+              content:
+                application/json:
+                  schema:
+                    $ref: "#/components/schemas/ChartDataBatchResponseSchema"
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        if not request.is_json:
+            return self.response_400(message=_("Request is not JSON"))
+        try:
+            forms = ChartDataBatchRequestSchema().load(request.json)["queries"]
+        except ValidationError as error:
+            return self.response_400(
+                message=_(
+                    "Request is incorrect: %(error)s", error=error.normalized_messages()
+                )
+            )
+        max_size = app.config["CHART_DATA_BATCH_MAX_SIZE"]
+        if len(forms) > max_size:
+            return self.response_400(
+                message=_(
+                    "At most %(max_size)s query contexts can be requested at once",
+                    max_size=max_size,
+                )
+            )
+
+        commands = []
+        cache_keys = []
+        # each query context is evaluated with its own form data, which the Jinja
+        # macros read in place of the batch request body, and its own memo: the
+        # SqlaQuery built to compute its cache key is reused to run it on a miss
+        memos: list[dict[Any, Any]] = [{} for _ in forms]
+        for form, memo in zip(forms, memos, strict=True):
+            with batch_item_form_data(form), sqla_query_memo(memo):
+                command = self._create_batch_command(form)
+                if isinstance(command, tuple):
+                    cache_keys.extend(command[0].get_query_cache_keys())
+            commands.append(command)
+        QueryCacheManager.prefetch(cache_keys, region=CacheRegion.DATA)
+        results = []
+        for form, command, memo in zip(forms, commands, memos, strict=True):
+            if isinstance(command, tuple):
+                with batch_item_form_data(form), sqla_query_memo(memo):
+                    results.append(self._get_batch_result(form, *command))
+            else:
+                results.append(command)
+
+        add_extra_log_payload(
+            is_cached=[
+                [query.get("is_cached") for query in result["result"]]
+                for result in results
+                if result["status_code"] == 200
+            ]
+        )
+        with event_logger.log_context(f"{self.__class__.__name__}.json_dumps"):
+            response_data = json.dumps(
+                {"result": results},
+                default=json.json_int_dttm_ser,
+                ignore_nan=True,
+            )
+        resp = make_response(response_data, 200)
+        resp.headers["Content-Type"] = "application/json; charset=utf-8"
+        return resp
+
+    def _create_batch_command(
+        self, form: dict[str, Any]
+    ) -> tuple[ChartDataCommand, QueryContext] | dict[str, Any]:
+        """
+        Create the command loading the data of a query context of a batch, or the
+        error response to the query context.
+        """
+        try:
+            query_context = self._create_query_context_from_form(form)
+            command = ChartDataCommand(query_context)
+            command.validate()
+        except DatasourceNotFound:
+            return {"status_code": 404, "message": "Not found"}
+        except SupersetSecurityException:
+            return {"status_code": 403, "message": "Forbidden"}
+        except QueryObjectValidationError as error:
+            return {"status_code": 400, "message": error.message}
+        except ValidationError as error:
+            return {
+                "status_code": 400,
+                "message": _(
+                    "Request is incorrect: %(error)s", error=error.normalized_messages()
+                ),
+            }
+
+        if query_context.result_format != ChartDataResultFormat.JSON:
+            return {
+                "status_code": 400,
+                "message": _("Only JSON results can be requested in a batch"),
+            }
+        return command, query_context
+
+    def _get_batch_result(
+        self,
+        form: dict[str, Any],
+        command: ChartDataCommand,
+        query_context: QueryContext,
+    ) -> dict[str, Any]:
+        """
+        Load the data of a query context of a batch, or start an async job loading
+        it, and return the response to the query context.
+        """
+        try:
+            if self._should_run_async(query_context):
+                if not form.get("force"):
+                    with contextlib.suppress(ChartDataCacheLoadError):
+                        result = command.execute(force_cached=True)
+                        return self._get_batch_payload(result, form, query_context)
+
+                async_command = CreateAsyncChartDataJobCommand()
+                try:
+                    async_command.validate(request)
+                except AsyncQueryTokenException:
+                    return {"status_code": 401, "message": "Not authorized"}
+                async_result = async_command.run(
+                    form, get_user_id(), command.get_cache_key
+                )
+                return {"status_code": 202, **async_result}
+
+            result = command.execute()
+        except ChartDataCacheLoadError as exc:
+            return {"status_code": 422, "message": sanitize_error_message(exc.message)}
+        except ChartDataQueryFailedError as exc:
+            return {"status_code": 400, "message": sanitize_error_message(exc.message)}
+        return self._get_batch_payload(result, form, query_context)
+
+    def _get_batch_payload(
+        self,
+        result: ChartDataExecutionResult,
+        form: dict[str, Any],
+        query_context: QueryContext,
+    ) -> dict[str, Any]:
+        materialized_result = result.materialize()
+        if query_context.result_type == ChartDataResultType.POST_PROCESSED:
+            materialized_result = apply_client_processing(
+                materialized_result,
+                form.get("form_data"),
+                query_context.datasource,
+            )
+        return {
+            "status_code": 200,
+            **self._get_json_payload(materialized_result, result),
+        }
+
+    @staticmethod
+    def _should_run_async(query_context: QueryContext) -> bool:
+        # TODO: support CSV, SQL query and other non-JSON types
+        # Don't use async queries when cache is disabled (cache_timeout=-1)
+        # as async queries depend on caching to retrieve results
+        return (
+            is_feature_enabled("GLOBAL_ASYNC_QUERIES")
+            and query_context.result_format == ChartDataResultFormat.JSON
+            and query_context.result_type == ChartDataResultType.FULL
+            and query_context.get_cache_timeout() != CACHE_DISABLED_TIMEOUT
+        )
+
     def _run_async(
         self,
         form_data: dict[str, Any],
@@ -464,7 +647,9 @@ class ChartDataRestApi(ChartRestApi):
         except AsyncQueryTokenException:
             return self.response_401()
 
-        async_result = async_command.run(form_data, get_user_id())
+        async_result = async_command.run(
+            form_data, get_user_id(), command.get_cache_key
+        )
         return self.response(202, **async_result)
 
     def _send_chart_response(  # noqa: C901
@@ -565,24 +750,9 @@ class ChartDataRestApi(ChartRestApi):
             )
 
         if result_format == ChartDataResultFormat.JSON:
-            queries = materialized_result["queries"]
-            if execution_result and app.config.get("CHART_DATA_INCLUDE_TIMING"):
-                for query, query_result in zip(
-                    queries, execution_result.queries, strict=True
-                ):
-                    query["timing"] = query_result.timing.as_public_dict()
-
-            if security_manager.is_guest_user():
-                for query in queries:
-                    query.pop("query", None)
-                    query.pop("stacktrace", None)
-                    if query.get("error"):
-                        query["error"] = sanitize_error_message(query["error"])
-
-            payload: dict[str, Any] = {"result": queries}
-            if dashboard_filter_context is not None:
-                payload["dashboard_filters"] = dashboard_filter_context.to_dict()
-
+            payload = self._get_json_payload(
+                materialized_result, execution_result, dashboard_filter_context
+            )
             with event_logger.log_context(f"{self.__class__.__name__}.json_dumps"):
                 response_data = json.dumps(
                     payload,
@@ -595,6 +765,31 @@ class ChartDataRestApi(ChartRestApi):
 
         return self.response_400(message=f"Unsupported result_format: {result_format}")
 
+    @staticmethod
+    def _get_json_payload(
+        materialized_result: dict[str, Any],
+        execution_result: ChartDataExecutionResult | None = None,
+        dashboard_filter_context: DashboardFilterContext | None = None,
+    ) -> dict[str, Any]:
+        queries = materialized_result["queries"]
+        if execution_result and app.config.get("CHART_DATA_INCLUDE_TIMING"):
+            for query, query_result in zip(
+                queries, execution_result.queries, strict=True
+            ):
+                query["timing"] = query_result.timing.as_public_dict()
+
+        if security_manager.is_guest_user():
+            for query in queries:
+                query.pop("query", None)
+                query.pop("stacktrace", None)
+                if query.get("error"):
+                    query["error"] = sanitize_error_message(query["error"])
+
+        payload: dict[str, Any] = {"result": queries}
+        if dashboard_filter_context is not None:
+            payload["dashboard_filters"] = dashboard_filter_context.to_dict()
+        return payload
+
     @staticmethod
     def _get_default_export_filename(form_data: dict[str, Any] | None) -> str:
         """
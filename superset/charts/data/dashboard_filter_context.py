@@ -16,12 +16,18 @@
 # under the License.
 from __future__ import annotations
 
+import copy
 import logging
+import threading
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
+from cachetools import LRUCache
 from flask_babel import gettext as _
+from sqlalchemy import inspect
 
 from superset import db, security_manager
 from superset.constants import (
@@ -32,10 +38,21 @@ from superset.constants import (
 from superset.models.dashboard import Dashboard
 from superset.utils import json
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm.state import InstanceState
+
 logger = logging.getLogger(__name__)
 
 CHART_TYPE = "CHART"
 
+# Native-filter scope indexes keyed by (dashboard id, changed_on). Any saved edit
+# to the dashboard bumps ``changed_on``, so stale entries are never hit again and
+# simply age out of the LRU.
+_scope_index_cache: LRUCache[tuple[int, datetime], DashboardFilterScopeIndex] = (
+    LRUCache(maxsize=256)
+)
+_scope_index_lock = threading.Lock()
+
 
 class DashboardFilterStatus(str, Enum):
     APPLIED = "applied"
@@ -72,18 +89,39 @@ class DashboardFilterContext:
         }
 
 
-def _is_filter_in_scope_for_chart(
+@dataclass
+class DashboardFilterScopeIndex:
+    """
+    The native filters of a dashboard, pre-resolved against its layout.
+
+    ``chart_filters`` maps every chart in the layout to the (non-divider) native
+    filters in scope for it, in configuration order. Charts missing from the
+    layout are resolved on demand as root-level charts.
+    """
+
+    filters: list[dict[str, Any]] = field(default_factory=list)
+    chart_filters: dict[int, list[dict[str, Any]]] = field(default_factory=dict)
+
+    def filters_for_chart(self, chart_id: int) -> list[dict[str, Any]]:
+        """
+        The native filters in scope for a chart. The index is shared by all the
+        requests of the process, hence callers get copies they may modify.
+        """
+        if chart_id in self.chart_filters:
+            return copy.deepcopy(self.chart_filters[chart_id])
+        return copy.deepcopy(
+            [flt for flt in self.filters if _is_in_scope(flt, chart_id, parents=None)]
+        )
+
+
+def _is_in_scope(
     filter_config: dict[str, Any],
     chart_id: int,
-    position_json: dict[str, Any],
+    parents: list[str] | None,
 ) -> bool:
     """
-    Determines whether a native filter applies to a given chart.
-
-    A chart is in scope when one of its layout ancestors is in ``rootPath`` and
-    it's not excluded. The persisted ``chartsInScope`` is intentionally NOT used
-    here (it's a denormalized cache that the frontend recomputes from ``scope``
-    on every load, so it can be stale).
+    Scope check against the chart's layout ancestors, ``None`` when the chart is
+    not in the layout.
     """
     scope = filter_config.get("scope", {})
     root_path: list[str] = scope.get("rootPath", [])
@@ -92,8 +130,7 @@ def _is_filter_in_scope_for_chart(
     if chart_id in excluded:
         return False
 
-    if chart_layout_item := _find_chart_layout_item(chart_id, position_json):
-        parents: list[str] = chart_layout_item.get("parents", [])
+    if parents is not None:
         return any(parent in root_path for parent in parents)
 
     # If the chart doesn't exist in the dashboard layout, treat it as a
@@ -101,6 +138,24 @@ def _is_filter_in_scope_for_chart(
     return "ROOT_ID" in root_path
 
 
+def _is_filter_in_scope_for_chart(
+    filter_config: dict[str, Any],
+    chart_id: int,
+    position_json: dict[str, Any],
+) -> bool:
+    """
+    Determines whether a native filter applies to a given chart.
+
+    A chart is in scope when one of its layout ancestors is in ``rootPath`` and
+    it's not excluded. The persisted ``chartsInScope`` is intentionally NOT used
+    here (it's a denormalized cache that the frontend recomputes from ``scope``
+    on every load, so it can be stale).
+    """
+    chart_layout_item = _find_chart_layout_item(chart_id, position_json)
+    parents = chart_layout_item.get("parents", []) if chart_layout_item else None
+    return _is_in_scope(filter_config, chart_id, parents)
+
+
 def _find_chart_layout_item(
     chart_id: int,
     position_json: dict[str, Any],
@@ -117,6 +172,62 @@ def _find_chart_layout_item(
     return None
 
 
+def _build_filter_scope_index(dashboard: Dashboard) -> DashboardFilterScopeIndex:
+    """Parse the dashboard's metadata and layout once and resolve every scope."""
+    metadata = json.loads(dashboard.json_metadata or "{}")
+    native_filter_config = metadata.get("native_filter_configuration", [])
+    if not isinstance(native_filter_config, list):
+        native_filter_config = []
+    position_json = json.loads(dashboard.position_json or "{}")
+    if not isinstance(position_json, dict):
+        position_json = {}
+
+    index = DashboardFilterScopeIndex(
+        filters=[
+            flt
+            for flt in native_filter_config
+            if isinstance(flt, dict) and flt.get("type", "") != "DIVIDER"
+        ],
+    )
+    for item in position_json.values():
+        if not isinstance(item, dict) or item.get("type") != CHART_TYPE:
+            continue
+        chart_id = item.get("meta", {}).get("chartId")
+        if chart_id is None or chart_id in index.chart_filters:
+            # A chart placed twice is scoped by its first layout item, matching
+            # _find_chart_layout_item
+            continue
+        parents: list[str] = item.get("parents", [])
+        index.chart_filters[chart_id] = [
+            flt for flt in index.filters if _is_in_scope(flt, chart_id, parents)
+        ]
+    return index
+
+
+def get_filter_scope_index(dashboard: Dashboard) -> DashboardFilterScopeIndex:
+    """
+    Get the native-filter scope index of a dashboard.
+
+    Indexes of persisted dashboards are cached per (id, ``changed_on``), so
+    resolving filters for many charts, or across requests, parses the dashboard's
+    JSON once per version. Dashboards with pending unsaved changes are indexed
+    without caching.
+    """
+    state: InstanceState[Dashboard] | None = inspect(dashboard, raiseerr=False)
+    changed_on = getattr(dashboard, "changed_on", None)
+    if state is None or state.modified or not isinstance(changed_on, datetime):
+        return _build_filter_scope_index(dashboard)
+
+    key = (dashboard.id, changed_on)
+    with _scope_index_lock:
+        index = _scope_index_cache.get(key)
+    if index is None:
+        index = _build_filter_scope_index(dashboard)
+        with _scope_index_lock:
+            _scope_index_cache[key] = index
+    return index
+
+
 def _merge_extra_form_data(
     base: dict[str, Any],
     new: dict[str, Any],
@@ -238,13 +349,15 @@ def _get_filter_target_column(filter_config: dict[str, Any]) -> str | None:
 def _validate_chart_on_dashboard(
     dashboard: Dashboard,
     chart_id: int,
+    slice_ids: Iterable[int] | None = None,
 ) -> None:
     """
     Validate that a chart belongs to a dashboard.
 
     :raises ValueError: if the chart is not found on the dashboard
     """
-    slice_ids = {slc.id for slc in dashboard.slices}
+    if slice_ids is None:
+        slice_ids = {slc.id for slc in dashboard.slices}
     if chart_id not in slice_ids:
         raise ValueError(
             _(
@@ -266,31 +379,9 @@ def _check_dashboard_access(dashboard: Dashboard) -> None:
     security_manager.raise_for_access(dashboard=dashboard)
 
 
-def get_dashboard_filter_context(
-    dashboard_id: int,
-    chart_id: int,
-    *,
-    active_data_mask: dict[str, Any] | None = None,
-) -> DashboardFilterContext:
+def _get_accessible_dashboard(dashboard_id: int) -> Dashboard:
     """
-    Build a DashboardFilterContext for a chart on a dashboard.
-
-    Loads the dashboard's native filter configuration, determines which
-    filters are in scope for the given chart, resolves each filter's value,
-    and returns the merged extra_form_data along with metadata about each filter.
-
-    When ``active_data_mask`` is provided (e.g. the live filter state from a
-    dashboard view), each in-scope filter present in the mask uses its active
-    ``extraFormData`` instead of the saved default; an empty active value means
-    the filter was cleared. Filters absent from the mask fall back to their
-    saved defaults, so omitting ``active_data_mask`` reproduces the dashboard's
-    initial-load behavior.
-
-    :param dashboard_id: The ID of the dashboard
-    :param chart_id: The ID of the chart
-    :param active_data_mask: Optional live filter state keyed by native filter id
-    :returns: DashboardFilterContext with merged extra_form_data and filter metadata
-    :raises ValueError: if dashboard not found or chart not on dashboard
+    :raises ValueError: if dashboard not found
     :raises SupersetSecurityException: if the user cannot access the dashboard
     """
     dashboard = db.session.query(Dashboard).filter_by(id=dashboard_id).one_or_none()
@@ -300,25 +391,17 @@ def get_dashboard_filter_context(
         )
 
     _check_dashboard_access(dashboard)
-    _validate_chart_on_dashboard(dashboard, chart_id)
-
-    metadata = json.loads(dashboard.json_metadata or "{}")
-    native_filter_config: list[dict[str, Any]] = metadata.get(
-        "native_filter_configuration", []
-    )
+    return dashboard
 
-    position_json: dict[str, Any] = json.loads(dashboard.position_json or "{}")
 
+def _build_filter_context(
+    index: DashboardFilterScopeIndex,
+    chart_id: int,
+    active_data_mask: dict[str, Any] | None,
+) -> DashboardFilterContext:
     context = DashboardFilterContext()
 
-    for flt in native_filter_config:
-        flt_type = flt.get("type", "")
-        if flt_type == "DIVIDER":
-            continue
-
-        if not _is_filter_in_scope_for_chart(flt, chart_id, position_json):
-            continue
-
+    for flt in index.filters_for_chart(chart_id):
         flt_id = flt.get("id", "")
         flt_name = flt.get("name", "")
         target_column = _get_filter_target_column(flt)
@@ -341,6 +424,81 @@ def get_dashboard_filter_context(
     return context
 
 
+def get_dashboard_filter_context(
+    dashboard_id: int,
+    chart_id: int,
+    *,
+    active_data_mask: dict[str, Any] | None = None,
+) -> DashboardFilterContext:
+    """
+    Build a DashboardFilterContext for a chart on a dashboard.
+
+    Loads the dashboard's native filter configuration, determines which
+    filters are in scope for the given chart, resolves each filter's value,
+    and returns the merged extra_form_data along with metadata about each filter.
+
+    When ``active_data_mask`` is provided (e.g. the live filter state from a
+    dashboard view), each in-scope filter present in the mask uses its active
+    ``extraFormData`` instead of the saved default; an empty active value means
+    the filter was cleared. Filters absent from the mask fall back to their
+    saved defaults, so omitting ``active_data_mask`` reproduces the dashboard's
+    initial-load behavior.
+
+    To resolve several charts of the same dashboard, prefer
+    :func:`get_dashboard_filter_contexts`.
+
+    :param dashboard_id: The ID of the dashboard
+    :param chart_id: The ID of the chart
+    :param active_data_mask: Optional live filter state keyed by native filter id
+    :returns: DashboardFilterContext with merged extra_form_data and filter metadata
+    :raises ValueError: if dashboard not found or chart not on dashboard
+    :raises SupersetSecurityException: if the user cannot access the dashboard
+    """
+    return get_dashboard_filter_contexts(
+        dashboard_id,
+        [chart_id],
+        active_data_mask=active_data_mask,
+    )[chart_id]
+
+
+def get_dashboard_filter_contexts(
+    dashboard_id: int,
+    chart_ids: Iterable[int] | None = None,
+    *,
+    active_data_mask: dict[str, Any] | None = None,
+) -> dict[int, DashboardFilterContext]:
+    """
+    Build the DashboardFilterContext of several charts of a dashboard at once.
+
+    The dashboard is loaded and access-checked once, and the charts are resolved
+    against its cached scope index (see :func:`get_filter_scope_index`), so the
+    cost does not grow with repeated metadata parsing. Each chart gets its own
+    context object, which callers are free to mutate.
+
+    :param dashboard_id: The ID of the dashboard
+    :param chart_ids: The charts to resolve; defaults to every chart on the
+        dashboard
+    :param active_data_mask: Optional live filter state keyed by native filter id
+    :returns: A DashboardFilterContext per chart id
+    :raises ValueError: if dashboard not found or a chart is not on the dashboard
+    :raises SupersetSecurityException: if the user cannot access the dashboard
+    """
+    dashboard = _get_accessible_dashboard(dashboard_id)
+    index = get_filter_scope_index(dashboard)
+
+    # Adding or removing charts doesn't bump the dashboard's changed_on, so its
+    # charts are read from the relationship rather than the cached index
+    slice_ids = {slc.id for slc in dashboard.slices}
+    chart_ids = list(slice_ids if chart_ids is None else chart_ids)
+    for chart_id in chart_ids:
+        _validate_chart_on_dashboard(dashboard, chart_id, slice_ids)
+
+    return {
+        chart_id: _build_filter_context(index, chart_id, active_data_mask)
+        for chart_id in chart_ids
+    }
+
+
 def apply_dashboard_filter_context(  # noqa: C901
     query_context: dict[str, Any],
     extra_form_data: dict[str, Any],
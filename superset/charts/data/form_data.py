@@ -17,6 +17,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, TYPE_CHECKING
 
 from flask import g
@@ -31,6 +33,23 @@ def set_form_data(form_data: dict[str, Any]) -> None:
     g.form_data = form_data
 
 
+@contextmanager
+def batch_item_form_data(form_data: dict[str, Any]) -> Iterator[None]:
+    """
+    Expose a query context of a batch request to Jinja template macros as if it
+    was the body of a chart data API request.
+    """
+    previous = g.get("form_data"), g.get("batch_item_json_body")
+    set_form_data(form_data)
+    g.batch_item_json_body = form_data
+    try:
+        yield
+    finally:
+        g.form_data, g.batch_item_json_body = previous
+        if previous[0] is None:
+            g.pop("form_data", None)
+
+
 def _serialize_query(
     query: QueryObject,
     form_data: dict[str, Any],
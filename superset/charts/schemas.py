@@ -1819,6 +1819,50 @@ class ChartDataAsyncResponseSchema(Schema):
     )
 
 
+class ChartDataBatchRequestSchema(Schema):
+    queries = fields.List(
+        fields.Dict(),
+        required=True,
+        validate=Length(min=1),
+        metadata={
+            "description": "The query contexts to return the data of, as sent to "
+            "`/api/v1/chart/data`"
+        },
+    )
+
+
+class ChartDataBatchResultSchema(ChartDataAsyncResponseSchema):
+    """
+    The response to a query context in a batch: its data when the status code is
+    200, the async job details when it is 202, and an error message otherwise
+    """
+
+    status_code = fields.Integer(
+        metadata={
+            "description": "The status code `/api/v1/chart/data` would have "
+            "responded with for the query context"
+        }
+    )
+    result = fields.List(
+        fields.Nested(ChartDataResponseResult),
+        metadata={
+            "description": "A list of results for each corresponding query in the "
+            "query context."
+        },
+    )
+    message = fields.String(metadata={"description": "The error message"})
+
+
+class ChartDataBatchResponseSchema(Schema):
+    result = fields.List(
+        fields.Nested(ChartDataBatchResultSchema),
+        metadata={
+            "description": "The response to each query context, in the order of "
+            "the request"
+        },
+    )
+
+
 class ChartFavStarResponseResult(Schema):
     id = fields.Integer(metadata={"description": "The Chart id"})
     value = fields.Boolean(metadata={"description": "The FaveStar value"})
@@ -1938,6 +1982,8 @@ CHART_SCHEMAS = (
     DashboardFiltersResponseSchema,
     ChartDataResponseSchema,
     ChartDataAsyncResponseSchema,
+    ChartDataBatchRequestSchema,
+    ChartDataBatchResponseSchema,
     # TODO: These should optimally be included in the QueryContext schema as an `anyOf`
     #  in ChartDataPostProcessingOperation.options, but since `anyOf` is not
     #  by Marshmallow<3, this is not currently possible.
@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Union
 
 from flask import Request
 
@@ -32,12 +32,17 @@ class CreateAsyncChartDataJobCommand:
             request
         )
 
-    def run(self, form_data: dict[str, Any], user_id: Optional[int]) -> dict[str, Any]:
+    def run(
+        self,
+        form_data: dict[str, Any],
+        user_id: Optional[int],
+        cache_key: Union[str, Callable[[], Optional[str]], None] = None,
+    ) -> dict[str, Any]:
         if not getattr(self, "_async_channel_id", None):
             raise RuntimeError(
                 "CreateAsyncChartDataJobCommand.run() called before validate(); "
                 "the async channel id was not initialized."
             )
         return async_query_manager.submit_chart_data_job(
-            self._async_channel_id, form_data, user_id
+            self._async_channel_id, form_data, user_id, cache_key
         )
@@ -27,7 +27,8 @@ from superset.commands.chart.exceptions import (
 from superset.common.chart_data import ChartDataResultType
 from superset.common.chart_data_timing import ChartDataExecutionResult
 from superset.common.query_context import QueryContext
-from superset.exceptions import CacheLoadError
+from superset.exceptions import CacheLoadError, SupersetException
+from superset.utils.hashing import hash_from_dict
 
 logger = logging.getLogger(__name__)
 
@@ -97,5 +98,61 @@ class ChartDataCommand(BaseCommand):
             cache_key=result.cache_key,
         )
 
+    def run_df(self, **kwargs: Any) -> list[dict[str, Any]]:
+        """
+        Run the queries and return their payloads with each result as the
+        DataFrame under ``df``, for consumers that stream the rows themselves
+        instead of serializing them in the query context's result format.
+        """
+        force_cached = kwargs.get("force_cached", False)
+        try:
+            payloads = self._query_context.get_df_payloads(force_cached=force_cached)
+        except CacheLoadError as ex:
+            raise ChartDataCacheLoadError(ex.message) from ex
+
+        for payload in payloads:
+            if payload.get("error"):
+                raise ChartDataQueryFailedError(
+                    _("Error: %(error)s", error=payload["error"])
+                )
+
+        return payloads
+
+    def get_cache_key(self) -> str:
+        """
+        Key identifying the data this command loads for the current user: the
+        query context cache key along with the cache keys of its queries, which
+        carry the RLS and impersonation context.
+        """
+        return hash_from_dict(
+            {
+                "query_context": self._query_context.cache_key(),
+                "queries": [
+                    self._query_context.query_cache_key(query)
+                    for query in self._query_context.queries
+                ],
+            }
+        )
+
+    def get_query_cache_keys(self) -> list[str]:
+        """
+        Cache keys of the data of the queries that are to be read from the cache,
+        to read them ahead of running the command. Queries whose key can't be
+        computed are left out, and fail when the command runs.
+        """
+        if self._query_context.force:
+            return []
+
+        keys = []
+        for query in self._query_context.queries:
+            try:
+                query.validate()
+                key = self._query_context.query_cache_key(query)
+            except SupersetException:
+                continue
+            if key:
+                keys.append(key)
+        return keys
+
     def validate(self) -> None:
         self._query_context.raise_for_access()
@@ -18,9 +18,10 @@
 
 import logging
 from collections.abc import Iterator
-from typing import Callable
+from typing import Any, Callable
 
 import yaml
+from sqlalchemy.orm import selectinload
 
 from superset.commands.chart.exceptions import ChartNotFoundError
 from superset.daos.chart import ChartDAO
@@ -45,6 +46,11 @@ class ExportChartsCommand(ExportModelsCommand):
     dao = ChartDAO
     not_found = ChartNotFoundError
 
+    def _query_options(self) -> list[Any]:
+        if feature_flag_manager.is_feature_enabled("TAGGING_SYSTEM"):
+            return [selectinload(Slice.tags)]
+        return []
+
     @staticmethod
     def _file_name(model: Slice) -> str:
         file_name = get_filename(model.slice_name, model.id)
@@ -22,6 +22,7 @@ from typing import Any, Optional, Callable
 from collections.abc import Collection, Iterator
 
 import yaml
+from sqlalchemy.orm import joinedload, selectinload
 
 from superset.commands.chart.export import ExportChartsCommand
 from superset.commands.tag.export import ExportTagsCommand
@@ -289,6 +290,12 @@ class ExportDashboardsCommand(ExportModelsCommand):
     dao = DashboardDAO
     not_found = DashboardNotFoundError
 
+    def _query_options(self) -> list[Any]:
+        options = [selectinload(Dashboard.slices), joinedload(Dashboard.theme)]
+        if feature_flag_manager.is_feature_enabled("TAGGING_SYSTEM"):
+            options.append(selectinload(Dashboard.tags))
+        return options
+
     @staticmethod
     def _file_name(model: Dashboard) -> str:
         file_name = get_filename(model.dashboard_title, model.id)
@@ -21,10 +21,12 @@ from typing import Any, Callable
 from collections.abc import Iterator
 
 import yaml
+from sqlalchemy.orm import selectinload
 
 from superset.commands.database.exceptions import DatabaseNotFoundError
 from superset.daos.database import DatabaseDAO
 from superset.commands.export.models import ExportModelsCommand
+from superset.connectors.sqla.models import SqlaTable
 from superset.models.core import Database
 from superset.utils.dict_import_export import EXPORT_VERSION
 from superset.utils.file import get_filename
@@ -55,6 +57,14 @@ class ExportDatabasesCommand(ExportModelsCommand):
     dao = DatabaseDAO
     not_found = DatabaseNotFoundError
 
+    def _query_options(self) -> list[Any]:
+        if not self.export_related:
+            return []
+        return [
+            selectinload(Database.tables).selectinload(SqlaTable.columns),
+            selectinload(Database.tables).selectinload(SqlaTable.metrics),
+        ]
+
     @staticmethod
     def _file_name(model: Database) -> str:
         db_file_name = get_filename(model.database_name, model.id, skip_id=True)
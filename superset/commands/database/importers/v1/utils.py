@@ -24,6 +24,7 @@ from superset import db, security_manager
 from superset.commands.database.exceptions import DatabaseInvalidError
 from superset.commands.database.utils import add_permissions
 from superset.commands.exceptions import ImportFailedError
+from superset.commands.importers.v1.utils import find_existing_for_import
 from superset.constants import PASSWORD_MASK
 from superset.databases.ssh_tunnel.models import SSHTunnel
 from superset.databases.utils import make_url_safe
@@ -115,7 +116,7 @@ def import_database(  # noqa: C901
         "can_write",
         "Database",
     )
-    existing = db.session.query(Database).filter_by(uuid=config["uuid"]).first()
+    existing = find_existing_for_import(Database, config["uuid"])
     if existing:
         if not overwrite or not can_write:
             return existing
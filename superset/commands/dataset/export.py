@@ -18,9 +18,10 @@
 
 import logging
 from collections.abc import Iterator
-from typing import Callable
+from typing import Any, Callable
 
 import yaml
+from sqlalchemy.orm import joinedload, selectinload
 
 from superset.commands.export.models import ExportModelsCommand
 from superset.connectors.sqla.models import SqlaTable
@@ -40,6 +41,13 @@ class ExportDatasetsCommand(ExportModelsCommand):
     dao = DatasetDAO
     not_found = DatasetNotFoundError
 
+    def _query_options(self) -> list[Any]:
+        return [
+            joinedload(SqlaTable.database),
+            selectinload(SqlaTable.columns),
+            selectinload(SqlaTable.metrics),
+        ]
+
     @staticmethod
     def _file_name(model: SqlaTable) -> str:
         db_file_name = get_filename(
@@ -41,6 +41,7 @@ removed by the purge cascade.
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, cast, Literal, TypeAlias
@@ -136,39 +137,86 @@ def write_ahead(
         session.close()
 
 
+def write_ahead_many(
+    *,
+    trigger: str,
+    actor: str,
+    entity_type: str,
+    entities: Sequence[tuple[str | None, int]],
+) -> list[UUID] | None:
+    """Insert one ``pending`` row per ``(entity_uuid, removed_dashboard_slices)``
+    in a single commit, for the set-based purge. Returns the row ids in input
+    order, or ``None`` if the write fails, in which case no row was written."""
+    session = _dedicated_session()
+    try:
+        created_on = _utc_now()
+        records = [
+            PurgeAuditLog(
+                status=STATUS_PENDING,
+                trigger=trigger,
+                actor=actor,
+                entity_type=entity_type,
+                entity_uuid=entity_uuid,
+                removed_dashboard_slices=removed_dashboard_slices,
+                created_on=created_on,
+            )
+            for entity_uuid, removed_dashboard_slices in entities
+        ]
+        session.add_all(records)
+        # Read the ids before the commit expires the rows, which would reload
+        # each one.
+        session.flush()
+        record_ids = [cast(UUID, record.id) for record in records]
+        session.commit()
+        return record_ids
+    except Exception:  # pylint: disable=broad-except
+        session.rollback()
+        logger.warning(
+            "deletion_retention: failed to write pending audit rows", exc_info=True
+        )
+        return None
+    finally:
+        session.close()
+
+
+def _finalize_statement(record_id: UUID, status: str, **details: Any) -> Any:
+    """The conditional UPDATE that moves one pending row to *status*."""
+    values: dict[str, Any] = {"status": status}
+    if status == STATUS_CONFIRMED:
+        values["confirmed_on"] = _utc_now()
+    referrers = details.get("affected_referrers")
+    if referrers:
+        values["affected_referrers"] = ",".join(referrers)
+    removed_dashboard_slices = details.get("removed_dashboard_slices")
+    if removed_dashboard_slices is not None:
+        values["removed_dashboard_slices"] = removed_dashboard_slices
+    elif status in (STATUS_FAILED, STATUS_BLOCKED):
+        # The write-ahead row recorded the count the purge INTENDED to
+        # remove. On a failed or blocked attempt the cleanup rolled back,
+        # so leaving it would assert removals that never happened.
+        values["removed_dashboard_slices"] = 0
+    # Conditional UPDATE, not read-then-write: only pending rows may
+    # transition (a delayed worker must not overwrite an outcome
+    # reconcile_pending() already recorded — the audit history is
+    # immutable once finalized), and the status predicate makes that
+    # atomic under concurrent finalizers.
+    return (
+        sa.update(PurgeAuditLog.__table__)
+        .where(
+            PurgeAuditLog.__table__.c.id == record_id,
+            PurgeAuditLog.__table__.c.status == STATUS_PENDING,
+        )
+        .values(**values)
+    )
+
+
 def finalize(record_id: UUID | None, status: str, **details: Any) -> None:
     """Finalize a pending attempt on the dedicated audit session."""
     if record_id is None:
         return
     session = _dedicated_session()
     try:
-        values: dict[str, Any] = {"status": status}
-        if status == STATUS_CONFIRMED:
-            values["confirmed_on"] = _utc_now()
-        referrers = details.get("affected_referrers")
-        if referrers:
-            values["affected_referrers"] = ",".join(referrers)
-        removed_dashboard_slices = details.get("removed_dashboard_slices")
-        if removed_dashboard_slices is not None:
-            values["removed_dashboard_slices"] = removed_dashboard_slices
-        elif status in (STATUS_FAILED, STATUS_BLOCKED):
-            # The write-ahead row recorded the count the purge INTENDED to
-            # remove. On a failed or blocked attempt the cleanup rolled back,
-            # so leaving it would assert removals that never happened.
-            values["removed_dashboard_slices"] = 0
-        # Conditional UPDATE, not read-then-write: only pending rows may
-        # transition (a delayed worker must not overwrite an outcome
-        # reconcile_pending() already recorded — the audit history is
-        # immutable once finalized), and the status predicate makes that
-        # atomic under concurrent finalizers.
-        session.execute(
-            sa.update(PurgeAuditLog.__table__)
-            .where(
-                PurgeAuditLog.__table__.c.id == record_id,
-                PurgeAuditLog.__table__.c.status == STATUS_PENDING,
-            )
-            .values(**values)
-        )
+        session.execute(_finalize_statement(record_id, status, **details))
         session.commit()
     except Exception:  # pylint: disable=broad-except
         session.rollback()
@@ -182,6 +230,33 @@ def finalize(record_id: UUID | None, status: str, **details: Any) -> None:
         session.close()
 
 
+def finalize_many(
+    outcomes: Mapping[UUID, tuple[str, Mapping[str, Any]]],
+) -> None:
+    """Finalize many pending attempts, each ``id -> (status, details)``, in
+    one commit on the dedicated audit session.
+
+    A failure leaves every row pending for ``reconcile_pending()``, as a
+    failed ``finalize`` does for its single row.
+    """
+    if not outcomes:
+        return
+    session = _dedicated_session()
+    try:
+        for record_id, (status, details) in outcomes.items():
+            session.execute(_finalize_statement(record_id, status, **details))
+        session.commit()
+    except Exception:  # pylint: disable=broad-except
+        session.rollback()
+        logger.warning(
+            "deletion_retention: failed to finalize %s audit rows",
+            len(outcomes),
+            exc_info=True,
+        )
+    finally:
+        session.close()
+
+
 def confirm(record_id: UUID | None, **details: Any) -> None:
     """Mark an attempt confirmed after the entity transaction commits."""
     finalize(record_id, STATUS_CONFIRMED, **details)
@@ -42,7 +42,7 @@ Cascade tiers:
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator, Mapping
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -53,6 +53,12 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from superset.commands.deletion_retention.purge_policy import (
+    blocked_entity_reasons,
+    count_dashboard_slices_by_id,
+    dangling_chart_uuids_by_id,
+    dataset_permission_names,
+    delete_associations_for,
+    delete_owned_children_for,
     get_purge_policy,
     PurgeBlockedError,
     PurgeEntityPolicy,
@@ -147,6 +153,21 @@ class CascadeResult:
     blocked_reason: str | None = None
 
 
+@dataclass
+class BatchCascadeResult:
+    """Outcome of one set-based cascade over a chunk of entities.
+
+    ``results`` holds a ``CascadeResult`` for every requested id: purged,
+    blocked, or not purged because the row was restored, is gone, or changed
+    identity. ``version_rows_removed`` is the chunk total; the per-entity
+    results leave it at zero.
+    """
+
+    entity_type: str
+    results: dict[int, CascadeResult]
+    version_rows_removed: int = 0
+
+
 class PurgeRaceLostError(Exception):
     """Raised to roll back dependent cleanup when the entity delete loses."""
 
@@ -302,6 +323,133 @@ def cascade_hard_delete(
     )
 
 
+def cascade_hard_delete_many(
+    session: Session,
+    model: type[Any],
+    entity_uuids: Mapping[int, str | None],
+    *,
+    cutoff: datetime,
+) -> BatchCascadeResult:
+    """Remove a chunk of retention-eligible entities of one model at once.
+
+    The set-based counterpart of ``cascade_hard_delete(enforce_window=True)``
+    for the scheduled purge. *entity_uuids* maps each id to the uuid the
+    caller audited. Every phase runs as one statement per declared dependency
+    with ``IN (chunk)`` rather than one per entity, inside a single savepoint:
+
+    * the locked claim selects the rows that are still eligible and still
+      carry the audited uuid; the others are reported as not purged;
+    * blocked rows are reported with their reason and left in place;
+    * dependents, version history and the remaining rows are deleted with the
+      same identity and eligibility predicates as the per-entity cascade.
+
+    Any failure, including a conditional delete that removes fewer rows than
+    were claimed, rolls the whole chunk back and propagates, so the caller can
+    retry the chunk one entity at a time to isolate it.
+    """
+    table = model.__table__
+    policy: PurgeEntityPolicy = get_purge_policy(model)
+    entity_type: str = policy.entity_type
+    results: dict[int, CascadeResult] = {
+        entity_id: CascadeResult(
+            purged=False, entity_type=entity_type, entity_uuid=uuid
+        )
+        for entity_id, uuid in entity_uuids.items()
+    }
+    if not entity_uuids:
+        return BatchCascadeResult(entity_type=entity_type, results=results)
+
+    eligibility = _eligibility_predicates(
+        table, enforce_window=True, cutoff=cutoff, require_archived=False
+    )
+    version_rows = 0
+
+    with session.begin_nested():
+        claimed = _claim_chunk(session, table, entity_uuids, eligibility)
+        blocked = blocked_entity_reasons(session, policy, claimed)
+        for entity_id, reason in blocked.items():
+            results[entity_id].blocked_reason = reason
+        targets = [entity_id for entity_id in claimed if entity_id not in blocked]
+        if not targets:
+            return BatchCascadeResult(entity_type=entity_type, results=results)
+
+        permission_names = dataset_permission_names(session, policy, targets)
+        removed_dashboard_slices = count_dashboard_slices_by_id(
+            session, policy, targets
+        )
+        dangling_chart_uuids = dangling_chart_uuids_by_id(session, policy, targets)
+
+        delete_associations_for(session, policy, targets)
+        delete_owned_children_for(session, policy, targets)
+        version_rows = _delete_version_history_for(session, model, targets)
+
+        identity = _chunk_identity_predicates(table, targets, entity_uuids)
+        delete_entities = sa.delete(table).where(*identity).where(*eligibility)
+        if session.execute(delete_entities).rowcount != len(targets):
+            raise PurgeRaceLostError
+
+        for entity_id in targets:
+            if (permission_name := permission_names.get(entity_id)) is not None:
+                policy.cleanup_permission(session, policy, permission_name, entity_id)
+
+    for entity_id in targets:
+        result = results[entity_id]
+        result.purged = True
+        result.dangling_chart_uuids = dangling_chart_uuids.get(entity_id, [])
+        result.removed_dashboard_slices = removed_dashboard_slices.get(entity_id, 0)
+    return BatchCascadeResult(
+        entity_type=entity_type, results=results, version_rows_removed=version_rows
+    )
+
+
+def _claim_chunk(
+    session: Session,
+    table: sa.Table,
+    entity_uuids: Mapping[int, str | None],
+    eligibility: list[Any],
+) -> list[int]:
+    """Lock the chunk's rows that are still eligible and still carry the
+    audited uuid, and return their ids."""
+    uuid_column = table.c.get("uuid")
+    claim_columns = [table.c.id] if uuid_column is None else [table.c.id, uuid_column]
+    claim = (
+        sa.select(*claim_columns)
+        .where(table.c.id.in_(sorted(entity_uuids)))
+        .where(*eligibility)
+    )
+    claimed: list[int] = []
+    for row in session.execute(claim.with_for_update()):
+        expected = entity_uuids[row.id]
+        # Same rule as _identity_predicates: the uuid pins identity when both
+        # the column and the audited value exist.
+        if uuid_column is None or expected is None or str(row.uuid) == expected:
+            claimed.append(row.id)
+    return claimed
+
+
+def _chunk_identity_predicates(
+    table: sa.Table,
+    entity_ids: list[int],
+    entity_uuids: Mapping[int, str | None],
+) -> list[Any]:
+    """``_identity_predicates`` for a chunk: the ids, plus the audited uuid
+    of every row that has one."""
+    predicates: list[Any] = [table.c.id.in_(entity_ids)]
+    uuid_column = table.c.get("uuid")
+    if uuid_column is None:
+        return predicates
+    audited = [
+        uuid
+        for entity_id in entity_ids
+        if (uuid := entity_uuids[entity_id]) is not None
+    ]
+    unaudited = [
+        entity_id for entity_id in entity_ids if entity_uuids[entity_id] is None
+    ]
+    predicates.append(sa.or_(uuid_column.in_(audited), table.c.id.in_(unaudited)))
+    return predicates
+
+
 def dashboard_slice_count(session: Session, entity: Any) -> int:
     """Return the current dashboard relationship count for audit write-ahead."""
     policy: PurgeEntityPolicy = get_purge_policy(type(entity))
@@ -312,13 +460,14 @@ def _entity_version_targets(
     model: type[Any],
     metadata: sa.MetaData,
     parent_shadow: sa.Table,
-    entity_id: int,
+    entity_ids: Collection[int],
 ) -> list[tuple[sa.Table, Any]]:
-    """The ``(shadow_table, row_predicate)`` pairs that make up *this* entity's
-    own version history: the parent shadow keyed by ``id``, plus — per type —
-    the dashboard/chart M2M shadow (``dashboard_slices_version``) and a
-    dataset's child shadows (``table_columns_version`` / ``sql_metrics_version``
-    keyed by ``table_id``). It never touches another entity's rows."""
+    """The ``(shadow_table, row_predicate)`` pairs that make up *these*
+    entities' own version history: the parent shadow keyed by ``id``, plus —
+    per type — the dashboard/chart M2M shadow (``dashboard_slices_version``)
+    and a dataset's child shadows (``table_columns_version`` /
+    ``sql_metrics_version`` keyed by ``table_id``). It never touches another
+    entity's rows."""
     targets: list[tuple[sa.Table, Any]] = []
     for table_name, column_name in get_purge_policy(model).version_shadow_names:
         shadow: sa.Table | None = (
@@ -331,15 +480,26 @@ def _entity_version_targets(
                 f"Invalid version shadow declaration for {model.__name__}: "
                 f"{table_name}.{column_name}"
             )
-        targets.append((shadow, shadow.c[column_name] == entity_id))
+        targets.append((shadow, shadow.c[column_name].in_(sorted(entity_ids))))
     return targets
 
 
 def _delete_version_history(session: Session, entity: Any, entity_id: int) -> int:
     """Remove the entity's own version-history rows.
 
-    Deletes the entity's parent + child + M2M ``*_version`` shadow rows and the
-    ``version_changes`` rows scoped to this entity (by ``entity_kind`` +
+    See ``_delete_version_history_for``, which does the same for a chunk of
+    entities of one model.
+    """
+    return _delete_version_history_for(session, type(entity), [entity_id])
+
+
+def _delete_version_history_for(
+    session: Session, model: type[Any], entity_ids: Collection[int]
+) -> int:
+    """Remove the version-history rows of *entity_ids*, all of type *model*.
+
+    Deletes the entities' parent + child + M2M ``*_version`` shadow rows and
+    the ``version_changes`` rows scoped to them (by ``entity_kind`` +
     ``entity_id`` — **not** by transaction, which is shared), then sweeps any
     ``version_transaction`` left owning zero surviving shadow / change rows. A
     ``version_transaction`` is a *shared* unit-of-work boundary that can span
@@ -356,7 +516,6 @@ def _delete_version_history(session: Session, entity: Any, entity_id: int) -> in
     except ImportError:
         return 0
 
-    model = type(entity)
     try:
         parent_shadow = version_class(model).__table__
     except ClassNotVersioned:
@@ -366,7 +525,7 @@ def _delete_version_history(session: Session, entity: Any, entity_id: int) -> in
     # version_transaction lives in Continuum's manager, not the shadow metadata.
     tx = versioning_manager.transaction_cls.__table__
     changes = metadata.tables.get("version_changes")
-    targets = _entity_version_targets(model, metadata, parent_shadow, entity_id)
+    targets = _entity_version_targets(model, metadata, parent_shadow, entity_ids)
 
     # Transactions these shadow rows are anchored to — orphan-sweep candidates.
     tx_ids: set[int] = set()
@@ -383,7 +542,7 @@ def _delete_version_history(session: Session, entity: Any, entity_id: int) -> in
     for tbl, pred in targets:
         removed += session.execute(sa.delete(tbl).where(pred)).rowcount
 
-    # version_changes scoped to this entity (entity_kind + entity_id).
+    # version_changes scoped to these entities (entity_kind + entity_id).
     # Counted alongside the shadow rows: callers report the total as the
     # definitive number of version-history rows removed.
     if changes is not None:
@@ -394,7 +553,7 @@ def _delete_version_history(session: Session, entity: Any, entity_id: int) -> in
             removed += session.execute(
                 sa.delete(changes).where(
                     changes.c.entity_kind == kind,
-                    changes.c.entity_id == entity_id,
+                    changes.c.entity_id.in_(sorted(entity_ids)),
                 )
             ).rowcount
 
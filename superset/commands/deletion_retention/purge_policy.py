@@ -19,7 +19,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable, Hashable, Iterable, Mapping
+from collections.abc import Callable, Collection, Hashable, Iterable, Mapping
 from dataclasses import dataclass
 from enum import Enum
 from functools import lru_cache
@@ -74,6 +74,8 @@ CountSnapshot = Callable[[Session, "PurgeEntityPolicy", int], int]
 UuidSnapshot = Callable[[Session, "PurgeEntityPolicy", int], list[str]]
 PermissionSnapshot = Callable[[Session, "PurgeEntityPolicy", int], "str | None"]
 PermissionCleanup = Callable[[Session, "PurgeEntityPolicy", "str | None", int], None]
+# One purge root, or a chunk of roots for the set-based retention purge.
+EntityIds = int | Collection[int]
 
 
 @dataclass(frozen=True, order=True)
@@ -964,10 +966,148 @@ def delete_owned_children(
     )
 
 
+def blocked_entity_reasons(
+    session: Session, policy: PurgeEntityPolicy, entity_ids: Collection[int]
+) -> dict[int, str]:
+    """Apply every declared blocker to a chunk of purge roots at once.
+
+    The set-based counterpart of ``validate_deletion_allowed``: one query per
+    blocker rather than one per blocker and root. Returns the reason of the
+    first blocker that applies to each blocked root, in declaration order.
+    """
+    root_table: sa.Table = sa.inspect(policy.model).local_table
+    metadata: sa.MetaData = root_table.metadata
+    reasons: dict[int, str] = {}
+    for dependency in policy.dependencies:
+        if dependency.classification is not DependencyClassification.BLOCK:
+            continue
+        key: DependencyKey = dependency.key
+        if dependency.blocked_reason is None:
+            raise RuntimeError(f"Missing blocker reason for {key.describe()}")
+        if (
+            key.kind != "foreign_key"
+            or key.direction != "inbound"
+            or key.owner_table != root_table.name
+            or len(key.local_columns) != 1
+            or len(key.remote_columns) != 1
+        ):
+            raise RuntimeError(f"Set-based purge cannot use {key.describe()}")
+        table: sa.Table = _dependency_table(metadata, key)
+        blocked_ids = session.execute(
+            sa.select(root_table.c.id)
+            .select_from(
+                root_table.join(
+                    table,
+                    table.c[key.remote_columns[0]]
+                    == root_table.c[key.local_columns[0]],
+                )
+            )
+            .where(_root_predicate(root_table.c.id, entity_ids))
+            .distinct()
+        ).scalars()
+        for entity_id in blocked_ids:
+            reasons.setdefault(entity_id, dependency.blocked_reason)
+    return reasons
+
+
+def count_dashboard_slices_by_id(
+    session: Session, policy: PurgeEntityPolicy, entity_ids: Collection[int]
+) -> dict[int, int]:
+    """Snapshot dashboard membership for a chunk of roots in one query."""
+    # avoid circular import: dashboard imports the chart model
+    from superset.models.dashboard import dashboard_slices
+
+    column: Any | None = {
+        "chart": dashboard_slices.c.slice_id,
+        "dashboard": dashboard_slices.c.dashboard_id,
+    }.get(policy.entity_type)
+    if column is None:
+        return {}
+    return {
+        entity_id: int(count)
+        for entity_id, count in session.execute(
+            sa.select(column, sa.func.count())
+            .where(_root_predicate(column, entity_ids))
+            .group_by(column)
+        )
+    }
+
+
+def dangling_chart_uuids_by_id(
+    session: Session, policy: PurgeEntityPolicy, entity_ids: Collection[int]
+) -> dict[int, list[str]]:
+    """Return the charts left dangling by each dataset in a chunk."""
+    if policy.entity_type != "dataset":
+        return {}
+    # avoid circular import: the chart model participates in registry assembly
+    from superset.models.slice import Slice
+
+    dangling: dict[int, list[str]] = {}
+    for dataset_id, chart_uuid in session.execute(
+        sa.select(Slice.datasource_id, Slice.uuid)
+        .where(_root_predicate(Slice.__table__.c.datasource_id, entity_ids))
+        .where(Slice.datasource_type == "table")
+    ):
+        dangling.setdefault(dataset_id, []).append(str(chart_uuid))
+    return dangling
+
+
+def dataset_permission_names(
+    session: Session, policy: PurgeEntityPolicy, entity_ids: Collection[int]
+) -> dict[int, str]:
+    """Capture the permission identifiers of a chunk of datasets under lock.
+
+    The set-based counterpart of ``dataset_permission_name``; datasets whose
+    row is gone are absent from the result.
+    """
+    if policy.entity_type != "dataset":
+        return {}
+    from superset import security_manager
+
+    metadata: sa.MetaData = sa.inspect(policy.model).local_table.metadata
+    tables: sa.Table = metadata.tables["tables"]
+    dbs: sa.Table = metadata.tables["dbs"]
+    return {
+        row.id: str(
+            security_manager.get_dataset_perm(row.id, row.table_name, row.database_name)
+        )
+        for row in session.execute(
+            sa.select(tables.c.id, tables.c.table_name, dbs.c.database_name)
+            .select_from(tables.join(dbs, tables.c.database_id == dbs.c.id))
+            .where(_root_predicate(tables.c.id, entity_ids))
+        )
+    }
+
+
+def delete_associations_for(
+    session: Session, policy: PurgeEntityPolicy, entity_ids: Collection[int]
+) -> None:
+    """Execute declared association and tag cleanup for a chunk of roots."""
+    _delete_declared_dependencies(
+        session, policy, entity_ids, DependencyClassification.ASSOCIATION
+    )
+    _execute_listener_effects(
+        session,
+        policy,
+        entity_ids,
+        phase=ExecutionPhase.ASSOCIATIONS,
+        permission_name=None,
+    )
+
+
+def delete_owned_children_for(
+    session: Session, policy: PurgeEntityPolicy, entity_ids: Collection[int]
+) -> None:
+    """Execute declared owned-child cleanup for a chunk of roots."""
+    _delete_declared_dependencies(
+        session, policy, entity_ids, DependencyClassification.OWNED
+    )
+
+
 def _delete_declared_dependencies(
     session: Session,
     policy: PurgeEntityPolicy,
-    entity_id: int,
+    entity_ids: EntityIds,
     classification: DependencyClassification,
 ) -> None:
     """Delete inbound FK dependencies declared for one execution class."""
@@ -985,7 +1125,7 @@ def _delete_declared_dependencies(
         key: DependencyKey = dependency.key
         table: sa.Table = _dependency_table(metadata, key)
         predicates: tuple[Any, ...] = _dependency_predicates(
-            policy, key, entity_id, table
+            policy, key, entity_ids, table
         )
         session.execute(sa.delete(table).where(*predicates))
 
@@ -1001,7 +1141,7 @@ def _dependency_table(metadata: sa.MetaData, key: DependencyKey) -> sa.Table:
 def _dependency_predicates(
     policy: PurgeEntityPolicy,
     key: DependencyKey,
-    entity_id: int,
+    entity_ids: EntityIds,
     table: sa.Table,
 ) -> tuple[Any, ...]:
     """Build an atomic predicate for a simple or composite inbound constraint."""
@@ -1010,7 +1150,7 @@ def _dependency_predicates(
     if len(key.local_columns) != len(key.remote_columns):
         raise RuntimeError(f"Mismatched dependency columns for {key.describe()}")
     owner_values: Any = _owner_value_select(
-        policy, key.owner_table, key.local_columns, entity_id
+        policy, key.owner_table, key.local_columns, entity_ids
     )
     remote_columns: tuple[sa.Column[Any], ...] = tuple(
         table.c[column_name] for column_name in key.remote_columns
@@ -1020,11 +1160,18 @@ def _dependency_predicates(
     return (sa.tuple_(*remote_columns).in_(owner_values),)
 
 
+def _root_predicate(column: sa.Column[Any], entity_ids: EntityIds) -> Any:
+    """Match one purge root by equality, or a chunk of roots with ``IN``."""
+    if isinstance(entity_ids, int):
+        return column == entity_ids
+    return column.in_(sorted(entity_ids))
+
+
 def _owner_value_select(
     policy: PurgeEntityPolicy,
     owner_table_name: str,
     column_names: tuple[str, ...],
-    entity_id: int,
+    entity_ids: EntityIds,
 ) -> Any:
     """Select owner-column values reachable from the purge root through ownership."""
     root_table: sa.Table = sa.inspect(policy.model).local_table
@@ -1034,7 +1181,9 @@ def _owner_value_select(
         owner_table.c[column_name] for column_name in column_names
     )
     if owner_table_name == root_table.name:
-        return sa.select(*selected_columns).where(root_table.c.id == entity_id)
+        return sa.select(*selected_columns).where(
+            _root_predicate(root_table.c.id, entity_ids)
+        )
     reverse_path: list[DependencyKey] = []
     visited: set[str] = set()
     path_table_name: str = owner_table_name
@@ -1048,7 +1197,7 @@ def _owner_value_select(
 
     path: list[DependencyKey] = list(reversed(reverse_path))
     parent_table: sa.Table = root_table
-    parent_predicate: Any = root_table.c.id == entity_id
+    parent_predicate: Any = _root_predicate(root_table.c.id, entity_ids)
     for index, ownership_key in enumerate(path):
         parent_columns: tuple[sa.Column[Any], ...] = tuple(
             parent_table.c[column_name] for column_name in ownership_key.local_columns
@@ -1111,7 +1260,7 @@ def _dependency_owner_depth(
 def _execute_listener_effects(
     session: Session,
     policy: PurgeEntityPolicy,
-    entity_id: int,
+    entity_ids: EntityIds,
     *,
     phase: ExecutionPhase,
     permission_name: str | None,
@@ -1124,9 +1273,11 @@ def _execute_listener_effects(
         ):
             continue
         if dependency.listener_action is ListenerAction.DELETE_TAGGED_OBJECTS:
-            _delete_tagged_objects(session, policy, entity_id)
+            _delete_tagged_objects(session, policy, entity_ids)
         elif dependency.listener_action is ListenerAction.DELETE_DATASET_PERMISSION:
-            _delete_dataset_permission(session, permission_name, entity_id)
+            if not isinstance(entity_ids, int):
+                raise RuntimeError("Dataset permission cleanup runs per entity")
+            _delete_dataset_permission(session, permission_name, entity_ids)
         else:
             raise RuntimeError(
                 f"Unsupported listener action for {dependency.key.describe()}"
@@ -1134,7 +1285,7 @@ def _execute_listener_effects(
 
 
 def _delete_tagged_objects(
-    session: Session, policy: PurgeEntityPolicy, entity_id: int
+    session: Session, policy: PurgeEntityPolicy, entity_ids: EntityIds
 ) -> None:
     """Delete tag rows using the declared root object type."""
     from superset.tags.models import ObjectType, TaggedObject
@@ -1149,7 +1300,7 @@ def _delete_tagged_objects(
         raise ValueError(f"Unsupported purge entity type: {policy.entity_type}") from ex
     session.execute(
         sa.delete(TaggedObject.__table__).where(
-            TaggedObject.object_id == entity_id,
+            _root_predicate(TaggedObject.__table__.c.object_id, entity_ids),
             TaggedObject.object_type == object_type,
         )
     )
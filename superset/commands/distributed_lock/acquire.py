@@ -18,6 +18,8 @@
 from __future__ import annotations
 
 import logging
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -30,6 +32,7 @@ from superset.commands.distributed_lock.base import (
     get_redis_client,
 )
 from superset.daos.key_value import KeyValueDAO
+from superset.distributed_lock.types import LockValue
 from superset.exceptions import (
     AcquireDistributedLockFailedException,
     LockAlreadyHeldException,
@@ -43,6 +46,11 @@ from superset.utils.decorators import transaction
 
 logger = logging.getLogger(__name__)
 
+# Bounds for the polling backoff used while waiting on a database-backed lock,
+# which has no release notification to block on.
+KV_LOCK_POLL_MIN_INTERVAL = 0.05
+KV_LOCK_POLL_MAX_INTERVAL = 1.0
+
 
 def _kv_lock_on_error(ex: Exception) -> None:
     """Translate KV-backend exceptions into the appropriate lock exception type."""
@@ -63,25 +71,43 @@ class AcquireDistributedLock(BaseDistributedLockCommand):
     Uses Redis SET NX EX when DISTRIBUTED_COORDINATION_CONFIG is configured,
     otherwise falls back to KeyValue table.
 
+    Every acquisition stores an owner token so that only the holder can renew
+    (see ``RenewDistributedLock``) or release (see ``ReleaseDistributedLock``) it.
+    When ``wait_timeout`` is set, a held lock is waited on for up to that many
+    seconds: the Redis backend blocks on the release channel published by
+    ``ReleaseDistributedLock`` (bounded by the holder's remaining TTL), the KV
+    backend polls with a capped exponential backoff.
+
     Raises AcquireDistributedLockFailedException if:
     - Lock is already held by another process
     - Redis connection fails
     """
 
     ttl_seconds: int
+    token: str
+    wait_timeout: float | None
 
     def __init__(
         self,
         namespace: str,
         params: dict[str, Any] | None = None,
         ttl_seconds: int | None = None,
+        token: str | None = None,
+        wait_timeout: float | None = None,
     ) -> None:
         super().__init__(namespace, params)
         self.ttl_seconds = ttl_seconds or get_default_lock_ttl()
+        self.token = token or uuid.uuid4().hex
+        self.wait_timeout = wait_timeout
 
     def run(self) -> None:
         if (redis_client := get_redis_client()) is not None:
-            self._acquire_redis(redis_client)
+            if self.wait_timeout:
+                self._acquire_redis_blocking(redis_client, self.wait_timeout)
+            else:
+                self._acquire_redis(redis_client)
+        elif self.wait_timeout:
+            self._acquire_kv_blocking(self.wait_timeout)
         else:
             self._acquire_kv()
 
@@ -92,7 +118,7 @@ class AcquireDistributedLock(BaseDistributedLockCommand):
             # Returns True if lock acquired, None if already exists
             acquired = redis_client.set(
                 self.redis_lock_key,
-                "1",
+                self.token,
                 nx=True,
                 ex=self.ttl_seconds,
             )
@@ -113,21 +139,97 @@ class AcquireDistributedLock(BaseDistributedLockCommand):
                 f"Redis lock failed: {ex}"
             ) from ex
 
+    def _acquire_redis_blocking(self, redis_client: Any, wait_timeout: float) -> None:
+        """
+        Acquire the Redis lock, waiting up to ``wait_timeout`` seconds for it.
+
+        Subscribes to the lock's release channel *before* the first attempt so a
+        release between a failed attempt and the wait cannot be missed. Each wait
+        is also capped by the holder's remaining TTL, so a holder that crashed
+        without releasing does not make the waiter sleep for the full timeout.
+        """
+        deadline = time.monotonic() + wait_timeout
+        pubsub = None
+        try:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(self.redis_release_channel)
+            while True:
+                try:
+                    self._acquire_redis(redis_client)
+                    return
+                except LockAlreadyHeldException:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise
+                # -2: the key vanished since the attempt, retry right away
+                if (pttl := redis_client.pttl(self.redis_lock_key)) == -2:
+                    continue
+                timeout = remaining if pttl < 0 else min(remaining, pttl / 1000)
+                pubsub.get_message(timeout=timeout)
+        except redis.RedisError as ex:
+            logger.error("Redis lock error for %s: %s", self.redis_lock_key, ex)
+            raise AcquireDistributedLockFailedException(
+                f"Redis lock failed: {ex}"
+            ) from ex
+        finally:
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except redis.RedisError:
+                    logger.debug("Failed to close release subscription", exc_info=True)
+
+    def _acquire_kv_blocking(self, wait_timeout: float) -> None:
+        """Acquire the KV lock, polling with backoff for up to ``wait_timeout``."""
+        deadline = time.monotonic() + wait_timeout
+        interval = KV_LOCK_POLL_MIN_INTERVAL
+        while True:
+            try:
+                self._acquire_kv()
+                return
+            except LockAlreadyHeldException:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, KV_LOCK_POLL_MAX_INTERVAL)
+
     @transaction(on_error=_kv_lock_on_error)
     def _acquire_kv(self) -> None:
-        """Acquire lock using KeyValue table (database)."""
-        # Delete expired entries first to prevent stale locks from blocking
-        KeyValueDAO.delete_expired_entries(self.resource)
-
-        # Create entry - unique constraint will raise if lock already exists
-        KeyValueDAO.create_entry(
-            resource=KeyValueResource.LOCK,
-            value={"value": True},
-            codec=self.codec,
-            key=self.key,
-            expires_on=datetime.now(timezone.utc) + timedelta(seconds=self.ttl_seconds),
+        """
+        Acquire lock using KeyValue table (database).
+
+        Only this lock's row is inspected: it is read with ``SKIP LOCKED`` where
+        the backend supports it, so contending workers fail fast instead of
+        queueing on a row lock. An expired row is taken over in place with a
+        conditional update, and a missing row is inserted (the unique constraint
+        arbitrates concurrent inserts). Expired rows of other locks are left to
+        the scheduled ``prune_key_value`` task.
+        """
+        value: LockValue = {"value": True, "owner": self.token}
+        expires_on = datetime.now(timezone.utc) + timedelta(seconds=self.ttl_seconds)
+        entry = KeyValueDAO.get_entry_for_update(
+            self.resource,
+            self.key,
+            skip_locked=True,
         )
 
+        if entry is None:
+            # Create entry - unique constraint will raise if lock already exists
+            KeyValueDAO.create_entry(
+                resource=KeyValueResource.LOCK,
+                value=value,
+                codec=self.codec,
+                key=self.key,
+                expires_on=expires_on,
+            )
+        elif not entry.is_expired() or not KeyValueDAO.take_over_expired_entry(
+            entry,
+            value=value,
+            codec=self.codec,
+            expires_on=expires_on,
+        ):
+            raise LockAlreadyHeldException("KV lock already held")
+
         logger.debug(
             "Acquired KV lock: namespace=%s key=%s (TTL=%ds)",
             self.namespace,
@@ -68,5 +68,10 @@ class BaseDistributedLockCommand(BaseCommand):
         """Redis key for this lock."""
         return f"lock:{self.namespace}:{self.key}"
 
+    @property
+    def redis_release_channel(self) -> str:
+        """Redis pub/sub channel notified whenever this lock is released."""
+        return f"{self.redis_lock_key}:released"
+
     def validate(self) -> None:
         pass
@@ -35,6 +35,17 @@ from superset.utils.decorators import on_error, transaction
 
 logger = logging.getLogger(__name__)
 
+# Delete the lock only if it is still held by the given owner token, and notify
+# waiters blocked in ``AcquireDistributedLock`` that it is free.
+RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    redis.call("del", KEYS[1])
+    redis.call("publish", KEYS[2], "1")
+    return 1
+end
+return 0
+"""
+
 
 class ReleaseDistributedLock(BaseDistributedLockCommand):
     """
@@ -42,8 +53,22 @@ class ReleaseDistributedLock(BaseDistributedLockCommand):
 
     Uses Redis DELETE when DISTRIBUTED_COORDINATION_CONFIG is configured,
     otherwise deletes from KeyValue table.
+
+    When the ``token`` returned by ``AcquireDistributedLock`` is passed, the lock
+    is only deleted while it is still held by that acquisition, so a holder whose
+    TTL lapsed cannot release a lock since taken by someone else. Without a token
+    the lock is deleted unconditionally.
     """
 
+    def __init__(
+        self,
+        namespace: str,
+        params: dict[str, Any] | None = None,
+        token: str | None = None,
+    ) -> None:
+        super().__init__(namespace, params)
+        self.token = token
+
     def run(self) -> None:
         if (redis_client := get_redis_client()) is not None:
             self._release_redis(redis_client)
@@ -51,9 +76,23 @@ class ReleaseDistributedLock(BaseDistributedLockCommand):
             self._release_kv()
 
     def _release_redis(self, redis_client: Any) -> None:
-        """Release lock using Redis DELETE."""
+        """Release lock using Redis DELETE (compare-and-delete given a token)."""
         try:
-            redis_client.delete(self.redis_lock_key)
+            if self.token is None:
+                redis_client.delete(self.redis_lock_key)
+                redis_client.publish(self.redis_release_channel, "1")
+            elif not redis_client.eval(
+                RELEASE_SCRIPT,
+                2,
+                self.redis_lock_key,
+                self.redis_release_channel,
+                self.token,
+            ):
+                logger.warning(
+                    "Redis lock %s is no longer held by this owner, not releasing",
+                    self.redis_lock_key,
+                )
+                return
             logger.debug("Released Redis lock: %s", self.redis_lock_key)
         except redis.RedisError as ex:
             # Log warning but don't raise - TTL will handle cleanup
@@ -75,7 +114,23 @@ class ReleaseDistributedLock(BaseDistributedLockCommand):
     )
     def _release_kv(self) -> None:
         """Release lock using KeyValue table (database)."""
-        KeyValueDAO.delete_entry(self.resource, self.key)
+        if self.token is None:
+            KeyValueDAO.delete_entry(self.resource, self.key)
+        else:
+            entry = KeyValueDAO.get_entry(self.resource, self.key)
+            if entry is None:
+                return
+            # The delete is conditional on the value checked here, so a lock
+            # taken over in between is not released
+            owner = self.codec.decode(entry.value).get("owner")
+            if owner != self.token or not KeyValueDAO.delete_entry_if_unchanged(entry):
+                logger.warning(
+                    "KV lock namespace=%s key=%s is no longer held by this owner, "
+                    "not releasing",
+                    self.namespace,
+                    self.key,
+                )
+                return
         logger.debug(
             "Released KV lock: namespace=%s key=%s",
             self.namespace,
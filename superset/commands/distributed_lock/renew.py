@@ -0,0 +1,118 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any
+
+import redis
+from sqlalchemy.exc import SQLAlchemyError
+
+from superset.commands.distributed_lock.base import (
+    BaseDistributedLockCommand,
+    get_default_lock_ttl,
+    get_redis_client,
+)
+from superset.daos.key_value import KeyValueDAO
+from superset.exceptions import AcquireDistributedLockFailedException
+from superset.key_value.exceptions import KeyValueUpdateFailedError
+from superset.utils.decorators import on_error, transaction
+
+logger = logging.getLogger(__name__)
+
+# Extend the lock's TTL only if it is still held by the given owner token.
+RENEW_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class RenewDistributedLock(BaseDistributedLockCommand):
+    """
+    Extend the lease of a distributed lock held by the given owner token.
+
+    Used to keep a long-running holder's lock alive with a short TTL, so that a
+    crashed holder still frees the lock quickly. ``run`` returns whether the
+    lease was renewed; ``False`` means the lock expired and is no longer owned.
+    """
+
+    ttl_seconds: int
+
+    def __init__(
+        self,
+        namespace: str,
+        params: dict[str, Any] | None,
+        token: str,
+        ttl_seconds: int | None = None,
+    ) -> None:
+        super().__init__(namespace, params)
+        self.token = token
+        self.ttl_seconds = ttl_seconds or get_default_lock_ttl()
+
+    def run(self) -> bool:
+        if (redis_client := get_redis_client()) is not None:
+            return self._renew_redis(redis_client)
+        return self._renew_kv()
+
+    def _renew_redis(self, redis_client: Any) -> bool:
+        """Renew lock using a Redis compare-and-pexpire script."""
+        try:
+            return bool(
+                redis_client.eval(
+                    RENEW_SCRIPT,
+                    1,
+                    self.redis_lock_key,
+                    self.token,
+                    self.ttl_seconds * 1000,
+                )
+            )
+        except redis.RedisError as ex:
+            logger.error("Redis lock renewal error for %s: %s", self.redis_lock_key, ex)
+            raise AcquireDistributedLockFailedException(
+                f"Redis lock renewal failed: {ex}"
+            ) from ex
+
+    @transaction(
+        on_error=partial(
+            on_error,
+            catches=(
+                KeyValueUpdateFailedError,
+                SQLAlchemyError,
+            ),
+            reraise=AcquireDistributedLockFailedException,
+        ),
+    )
+    def _renew_kv(self) -> bool:
+        """Renew lock using KeyValue table (database)."""
+        entry = KeyValueDAO.get_entry_for_update(self.resource, self.key)
+        if (
+            entry is None
+            or entry.is_expired()
+            or self.codec.decode(entry.value).get("owner") != self.token
+        ):
+            return False
+
+        entry.expires_on = datetime.now(timezone.utc) + timedelta(
+            seconds=self.ttl_seconds
+        )
+        entry.changed_on = datetime.now()
+        return True
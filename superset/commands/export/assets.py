@@ -17,7 +17,7 @@
 
 from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import Callable
+from typing import Any, Callable
 
 import yaml
 
@@ -33,18 +33,41 @@ from superset.utils.dict_import_export import EXPORT_VERSION
 
 METADATA_FILE_NAME = "metadata.yaml"
 
+# number of models of a given type loaded (and exported) together
+EXPORT_BATCH_SIZE = 500
+
 
 class ExportAssetsCommand(BaseCommand):
     """
     Command that exports all databases, datasets, charts, dashboards and saved queries.
+
+    Each model type is loaded in id-ordered batches with its relationships
+    eagerly loaded, and files are yielded as each batch is exported. When
+    ``changed_since`` is given only the assets changed at or after it are
+    exported, for incremental backups on top of a previous full export.
     """
 
+    def __init__(
+        self,
+        changed_since: datetime | None = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ):
+        # ``changed_on`` is stored as naive UTC
+        if changed_since is not None and changed_since.tzinfo is not None:
+            changed_since = changed_since.astimezone(timezone.utc).replace(tzinfo=None)
+        self.changed_since = changed_since
+        self.batch_size = batch_size
+
     def run(self) -> Iterator[tuple[str, Callable[[], str]]]:
-        metadata = {
+        metadata: dict[str, Any] = {
             "version": EXPORT_VERSION,
             "type": "assets",
             "timestamp": datetime.now(tz=timezone.utc).isoformat(),
         }
+        if self.changed_since is not None:
+            metadata["changed_since"] = self.changed_since.replace(
+                tzinfo=timezone.utc
+            ).isoformat()
         yield METADATA_FILE_NAME, lambda: yaml.safe_dump(metadata, sort_keys=False)
         seen = {METADATA_FILE_NAME}
 
@@ -59,11 +82,17 @@ class ExportAssetsCommand(BaseCommand):
         dashboard_ids: list[int | str] = []
         chart_ids: list[int | str] = []
         for command in commands:
-            ids = [model.id for model in command.dao.find_all()]
-            for file_name, file_content in command(ids, export_related=False).run():
-                if file_name not in seen:
-                    yield file_name, file_content
-                    seen.add(file_name)
+            ids: list[int | str] = []
+            for batch in command.dao.iter_id_batches(
+                self.batch_size, changed_since=self.changed_since
+            ):
+                for file_name, file_content in command(
+                    batch, export_related=False
+                ).run():
+                    if file_name not in seen:
+                        yield file_name, file_content
+                        seen.add(file_name)
+                ids.extend(batch)
 
             if command == ExportDashboardsCommand:
                 dashboard_ids = ids
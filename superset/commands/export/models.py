@@ -17,7 +17,7 @@
 
 from collections.abc import Iterator
 from datetime import datetime, timezone
-from typing import Callable
+from typing import Any, Callable
 
 import yaml
 from flask_appbuilder import Model
@@ -55,6 +55,13 @@ class ExportModelsCommand(BaseCommand):
     ) -> Iterator[tuple[str, Callable[[], str]]]:
         raise NotImplementedError("Subclasses MUST implement _export")
 
+    def _query_options(self) -> list[Any]:
+        """
+        Loader options for the models, so the relationships ``_export`` walks
+        are fetched with the whole batch instead of one lazy load per model.
+        """
+        return []
+
     def run(self) -> Iterator[tuple[str, Callable[[], str]]]:
         self.validate()
 
@@ -73,6 +80,8 @@ class ExportModelsCommand(BaseCommand):
                     seen.add(file_name)
 
     def validate(self) -> None:
-        self._models = self.dao.find_by_ids(self.model_ids)
+        self._models = self.dao.find_by_ids(
+            self.model_ids, query_options=self._query_options()
+        )
         if len(self._models) != len(self.model_ids):
             raise self.not_found()
@@ -37,6 +37,7 @@ from superset.commands.importers.v1.utils import (
     import_tag,
     load_configs,
     load_metadata,
+    prefetch_existing_for_import,
     validate_metadata_type,
 )
 from superset.commands.query.importers.v1.utils import import_saved_query
@@ -234,7 +235,16 @@ class ImportAssetsCommand(BaseCommand):
     )
     def run(self) -> None:
         self.validate()
-        self._import(self._configs, self.sparse, self.contents, self.overwrite)
+        # Resolve which assets already exist with one query per model type,
+        # instead of one lookup per imported asset.
+        with prefetch_existing_for_import(
+            {
+                self._MODEL_BY_PREFIX[prefix]: [uuid for _, uuid in entries]
+                for prefix, entries in self._bundle_entries_by_prefix().items()
+                if entries
+            }
+        ):
+            self._import(self._configs, self.sparse, self.contents, self.overwrite)
 
     # Maps asset file prefixes to the model class used to look up UUIDs for
     # the "already exists" validation check when ``overwrite`` is ``False``.
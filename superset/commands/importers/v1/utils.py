@@ -14,11 +14,16 @@
 # under the License.
 
 import logging
+import multiprocessing
+from collections.abc import Collection, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path, PurePosixPath
 from typing import Any, Callable, Dict, Optional, Type
 from zipfile import ZipFile
 
 import yaml
+from flask import current_app, g
 from marshmallow import fields, Schema, validate
 from marshmallow.exceptions import ValidationError
 from sqlalchemy.exc import SQLAlchemyError
@@ -40,6 +45,16 @@ from superset.utils.decorators import transaction
 METADATA_FILE_NAME = "metadata.yaml"
 IMPORT_VERSION = "1.0.0"
 
+# libyaml's parser is several times faster than the pure Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# below this many files a bundle is parsed in-process even if
+# ``IMPORT_YAML_PARSE_PROCESSES`` is set, as starting the workers costs more
+MIN_FILES_FOR_PARALLEL_PARSE = 100
+
+# existing rows whose UUIDs are fetched with a single query
+PREFETCH_CHUNK_SIZE = 500
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,17 +69,67 @@ class MetadataSchema(Schema):
     version = fields.String(required=True, validate=validate.Equal(IMPORT_VERSION))
     type = fields.String(required=False)
     timestamp = fields.DateTime()
+    changed_since = fields.DateTime(required=False)
 
 
 def load_yaml(file_name: str, content: str) -> dict[str, Any]:
     """Try to load a YAML file"""
     try:
-        return yaml.safe_load(content)
+        return yaml.load(content, Loader=YAML_LOADER)  # noqa: S506
     except yaml.YAMLError as ex:
         logger.exception("Invalid YAML in %s", file_name)
         raise ValidationError({file_name: "Not a valid YAML file"}) from ex
 
 
+def _parse_yaml(content: str) -> tuple[bool, Any]:
+    """Parse a YAML document in a worker process, returning errors as text"""
+    try:
+        return True, yaml.load(content, Loader=YAML_LOADER)  # noqa: S506
+    except yaml.YAMLError as ex:
+        return False, str(ex)
+
+
+def load_yamls(contents: dict[str, str]) -> dict[str, Any]:
+    """
+    Load several YAML files, mapping each file name to its document or to the
+    ``ValidationError`` raised while loading it.
+
+    Parsing is CPU-bound and independent per file, so large bundles are spread
+    across ``IMPORT_YAML_PARSE_PROCESSES`` worker processes when it is set.
+    """
+    processes = current_app.config["IMPORT_YAML_PARSE_PROCESSES"]
+    if (
+        processes > 1
+        and len(contents) >= MIN_FILES_FOR_PARALLEL_PARSE
+        # daemonic processes (e.g. Celery prefork workers) can't have children
+        and not multiprocessing.current_process().daemon
+    ):
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = executor.map(
+                _parse_yaml,
+                contents.values(),
+                chunksize=max(1, len(contents) // (processes * 4)),
+            )
+            documents: dict[str, Any] = {}
+            for file_name, (ok, value) in zip(contents, results, strict=True):
+                if ok:
+                    documents[file_name] = value
+                else:
+                    logger.error("Invalid YAML in %s: %s", file_name, value)
+                    documents[file_name] = ValidationError(
+                        {file_name: "Not a valid YAML file"}
+                    )
+            return documents
+
+    documents = {}
+    for file_name, content in contents.items():
+        try:
+            documents[file_name] = load_yaml(file_name, content)
+        except ValidationError as ex:
+            documents[file_name] = ex
+    return documents
+
+
 def load_metadata(contents: dict[str, str]) -> dict[str, str]:
     """Apply validation and load a metadata file"""
     if METADATA_FILE_NAME not in contents:
@@ -185,16 +250,23 @@ def load_configs(
             SSHTunnel.uuid, SSHTunnel.server_address, SSHTunnel.server_port
         ).all()
     }
-    for file_name, content in contents.items():
-        # skip directories
-        if not content:
-            continue
-
+    documents = load_yamls(
+        {
+            file_name: content
+            for file_name, content in contents.items()
+            # skip directories
+            if content and f"{file_name.split('/')[0]}/" in schemas
+        }
+    )
+    for file_name, document in documents.items():
         prefix = file_name.split("/")[0]
         schema = schemas.get(f"{prefix}/")
         if schema:
+            config = None
             try:
-                config = load_yaml(file_name, content)
+                if isinstance(document, ValidationError):
+                    raise document
+                config = document
                 if not isinstance(config, dict):
                     # A syntactically valid YAML document whose top-level
                     # value is a scalar or list (not a mapping) has no
@@ -540,6 +612,44 @@ def get_resource_mappings_batched(
     return mapping
 
 
+@contextmanager
+def prefetch_existing_for_import(
+    uuids_by_model: dict[type[Any], Collection[str]],
+) -> Iterator[None]:
+    """Resolve the existing rows for a bundle's UUIDs up front.
+
+    Inside the block, :func:`find_existing_for_import` answers the lookups for
+    these UUIDs from rows loaded with one query per model (and chunk) instead
+    of one query per imported asset. Each prefetched answer is used once, so a
+    repeated lookup (e.g. for a row the import has since created or deleted)
+    goes back to the database. Nesting is safe: the outermost block owns the
+    prefetched rows.
+    """
+    if hasattr(g, "_import_existing_prefetch"):
+        yield
+        return
+
+    prefetched: dict[type[Any], dict[str, Any]] = {}
+    for model_cls, uuids in uuids_by_model.items():
+        incoming = list(dict.fromkeys(str(uuid) for uuid in uuids))
+        rows: dict[str, Any] = dict.fromkeys(incoming)
+        for start in range(0, len(incoming), PREFETCH_CHUNK_SIZE):
+            chunk = incoming[start : start + PREFETCH_CHUNK_SIZE]
+            for row in (
+                db.session.query(model_cls)
+                .execution_options(**{SKIP_VISIBILITY_FILTER_CLASSES: {model_cls}})
+                .filter(model_cls.uuid.in_(chunk))
+            ):
+                rows[str(row.uuid)] = row
+        prefetched[model_cls] = rows
+
+    g._import_existing_prefetch = prefetched
+    try:
+        yield
+    finally:
+        del g._import_existing_prefetch
+
+
 def find_existing_for_import(model_cls: type[Any], uuid: str) -> Any | None:
     """Look up an existing row by UUID for an import, including soft-deleted matches.
 
@@ -565,7 +675,14 @@ def find_existing_for_import(model_cls: type[Any], uuid: str) -> Any | None:
     destructive action explicit at the call site, so a future change
     that adds a permission check on the overwrite path doesn't
     silently leave a "duck around it via soft-delete" backdoor.
+
+    Within :func:`prefetch_existing_for_import` the rows it loaded are used
+    instead of querying.
     """
+    prefetched = getattr(g, "_import_existing_prefetch", {}).get(model_cls)
+    if prefetched is not None and str(uuid) in prefetched:
+        return prefetched.pop(str(uuid))
+
     return (
         db.session.query(model_cls)
         .execution_options(**{SKIP_VISIBILITY_FILTER_CLASSES: {model_cls}})
@@ -18,9 +18,10 @@
 
 import logging
 from collections.abc import Iterator
-from typing import Callable
+from typing import Any, Callable
 
 import yaml
+from sqlalchemy.orm import joinedload
 from werkzeug.utils import secure_filename
 
 from superset.commands.export.models import ExportModelsCommand
@@ -37,6 +38,9 @@ class ExportSavedQueriesCommand(ExportModelsCommand):
     dao = SavedQueryDAO
     not_found = SavedQueryNotFoundError
 
+    def _query_options(self) -> list[Any]:
+        return [joinedload(SavedQuery.database)]
+
     @staticmethod
     def _file_name(model: SavedQuery) -> str:
         # build filename based on database, optional schema, and label
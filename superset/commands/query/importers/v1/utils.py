@@ -19,6 +19,7 @@ from typing import Any
 
 from superset import db, security_manager
 from superset.commands.exceptions import ImportFailedError
+from superset.commands.importers.v1.utils import find_existing_for_import
 from superset.models.sql_lab import SavedQuery
 from superset.utils.core import get_user
 
@@ -42,7 +43,7 @@ def import_saved_query(
         "can_write",
         "SavedQuery",
     )
-    existing = db.session.query(SavedQuery).filter_by(uuid=config["uuid"]).first()
+    existing = find_existing_for_import(SavedQuery, config["uuid"])
     if existing:
         if not overwrite or not can_write:
             return existing
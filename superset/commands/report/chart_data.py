@@ -0,0 +1,117 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional
+
+from flask import current_app as app
+from flask_babel import lazy_gettext as _
+
+from superset import is_feature_enabled, security_manager
+from superset.charts.client_processing import apply_client_processing
+from superset.charts.data.form_data import set_form_data
+from superset.charts.schemas import ChartDataQueryContextSchema
+from superset.commands.base import BaseCommand
+from superset.commands.chart.data.get_data_command import ChartDataCommand
+from superset.commands.report.exceptions import ReportScheduleForbiddenError
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.query_context import QueryContext
+from superset.utils import json
+from superset.utils.core import create_zip
+
+logger = logging.getLogger(__name__)
+
+
+class ReportChartDataCommand(BaseCommand):
+    """
+    Produce a report attachment from a chart's query context inside the worker.
+
+    Returns the same bytes the chart data API would send for the payload's
+    ``result_format`` (CSV, XLSX or JSON, zipped when there are several
+    queries), without looping back through the webserver. It must run as the
+    report executor, since access is checked against the current user.
+    """
+
+    def __init__(
+        self,
+        query_context: dict[str, Any],
+        form_data: Optional[dict[str, Any]] = None,
+    ) -> None:
+        self._payload = query_context
+        # Like the API, client-side post-processing uses the request's
+        # form_data unless the caller passes the chart's saved params.
+        self._form_data = (
+            form_data if form_data is not None else query_context.get("form_data")
+        )
+        self._query_context: Optional[QueryContext] = None
+
+    def run(self) -> Optional[bytes]:
+        self.validate()
+        assert self._query_context is not None
+
+        result = ChartDataCommand(self._query_context).execute().materialize()
+        if self._query_context.result_type == ChartDataResultType.POST_PROCESSED:
+            result = apply_client_processing(
+                result,
+                self._form_data,
+                self._query_context.datasource,
+            )
+
+        queries = result["queries"]
+        result_format = self._query_context.result_format
+        if result_format == ChartDataResultFormat.JSON:
+            return json.dumps(
+                {"result": queries},
+                default=json.json_int_dttm_ser,
+                ignore_nan=True,
+            ).encode("utf-8")
+
+        if not queries:
+            return None
+        if len(queries) == 1:
+            return self._encode(queries[0]["data"])
+        return create_zip(
+            {
+                f"query_{idx + 1}.{result_format}": self._encode(query["data"])
+                for idx, query in enumerate(queries)
+            }
+        ).getvalue()
+
+    def validate(self) -> None:
+        set_form_data(self._payload)
+        self._query_context = ChartDataQueryContextSchema().load(self._payload)
+        ChartDataCommand(self._query_context).validate()
+
+        if self._query_context.result_format in ChartDataResultFormat.table_like():
+            if is_feature_enabled("GRANULAR_EXPORT_CONTROLS"):
+                has_export_perm = security_manager.can_access(
+                    "can_export_data", "Superset"
+                )
+            else:
+                has_export_perm = security_manager.can_access("can_csv", "Superset")
+            if not has_export_perm:
+                raise ReportScheduleForbiddenError(
+                    _("The report executor is not allowed to export chart data")
+                )
+
+    @staticmethod
+    def _encode(data: Any) -> bytes:
+        # Post-processed CSV comes back as text; encode it as CsvResponse would.
+        if isinstance(data, str):
+            return data.encode(app.config["CSV_EXPORT"].get("encoding", "utf-8"))
+        return data
@@ -35,6 +35,7 @@ from superset.commands.base import BaseCommand
 from superset.commands.dashboard.permalink.create import CreateDashboardPermalinkCommand
 from superset.commands.exceptions import CommandException, UpdateFailedError
 from superset.commands.report.alert import AlertCommand
+from superset.commands.report.chart_data import ReportChartDataCommand
 from superset.commands.report.exceptions import (
     ReportScheduleAlertGracePeriodError,
     ReportScheduleClientErrorsException,
@@ -91,7 +92,11 @@ from superset.subjects.types import SubjectType
 from superset.tasks.utils import get_executor
 from superset.utils import json
 from superset.utils.core import HeaderDataType, override_user
-from superset.utils.csv import get_chart_csv_data, get_chart_dataframe
+from superset.utils.csv import (
+    chart_data_to_dataframe,
+    get_chart_csv_data,
+    get_chart_dataframe,
+)
 from superset.utils.decorators import (
     logs_context,
     transaction,
@@ -762,7 +767,7 @@ class BaseReportState:
         """
         start_time: datetime = datetime.now(timezone.utc).replace(tzinfo=None)
 
-        user, _ = resolve_executor_user(self._report_schedule)
+        user, username = resolve_executor_user(self._report_schedule)
 
         max_width = app.config["ALERT_REPORTS_MAX_CUSTOM_SCREENSHOT_WIDTH"]
 
@@ -798,11 +803,20 @@ class BaseReportState:
                 )
                 for url in urls
             ]
+        datasources = (
+            [self._report_schedule.chart.table]
+            if self._report_schedule.chart
+            else self._report_schedule.dashboard.datasources
+        )
         try:
             imges = []
             for screenshot in screenshots:
-                imge = screenshot.get_screenshot(
+                # schedules rendering the same state as the same executor share
+                # a single render
+                imge = screenshot.get_coalesced_screenshot(
                     user=user,
+                    executor=username,
+                    datasources=datasources,
                     log_context=self._log_context,
                     report_execution_context=self._report_execution_context,
                 )
@@ -952,6 +966,35 @@ class BaseReportState:
 
         return query_context
 
+    def _use_in_process_chart_data(self) -> bool:
+        """
+        Whether chart data attachments are generated inside the worker. The
+        screenshot fallback for charts without a saved query context keeps
+        going through the webserver.
+        """
+        return bool(
+            app.config["ALERT_REPORTS_CHART_DATA_IN_PROCESS"]
+            and self._report_schedule.chart.query_context is not None
+        )
+
+    @staticmethod
+    def _get_chart_data_in_process(
+        user: "User",
+        request_payload: dict[str, Any],
+        form_data: Optional[dict[str, Any]] = None,
+    ) -> Optional[bytes]:
+        """
+        Run the chart data request as the report executor inside the worker.
+
+        :param user: The report executor.
+        :param request_payload: Prepared chart data request payload.
+        :param form_data: Form data used for client-side post-processing;
+            defaults to the payload's ``form_data``.
+        :return: Response body bytes, or None when there is no content.
+        """
+        with override_user(user):
+            return ReportChartDataCommand(request_payload, form_data).run()
+
     @staticmethod
     def _post_chart_data(
         chart_url: str,
@@ -997,7 +1040,7 @@ class BaseReportState:
                 raise URLError(response.getcode())
         return content or None
 
-    def _get_data(self, result_format: ChartDataResultFormat) -> bytes:
+    def _get_data(self, result_format: ChartDataResultFormat) -> bytes:  # noqa: C901
         """
         Fetch tabular chart data (CSV or Excel) as raw bytes.
 
@@ -1028,29 +1071,37 @@ class BaseReportState:
 
         start_time: datetime = datetime.now(timezone.utc).replace(tzinfo=None)
         user, username = resolve_executor_user(self._report_schedule)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context(failed_error)
             db.session.refresh(self._report_schedule.chart)
 
+        reserve_seconds = (
+            self._report_execution_context.post_capture_reserve_seconds
+            if self._report_execution_context
+            else 0.0
+        )
         try:
-            if self._report_schedule.chart.query_context is None:
+            if self._use_in_process_chart_data():
+                url = f"chart {self._report_schedule.chart_id} (in process)"
+                self._phase_timeout("data_generation", reserve_seconds=reserve_seconds)
+                data = self._get_chart_data_in_process(
+                    user, self._get_chart_data_request_payload(result_format)
+                )
+            elif self._report_schedule.chart.query_context is None:
                 url = self._get_url(result_format=result_format)
                 data = get_chart_csv_data(
                     chart_url=url,
-                    auth_cookies=auth_cookies,
+                    auth_cookies=machine_auth_provider_factory.instance.get_auth_cookies(
+                        user
+                    ),
                     timeout=self._phase_timeout(
                         "data_generation",
                         requested_seconds=app.config[
                             "ALERT_REPORTS_CSV_REQUEST_TIMEOUT"
                         ],
-                        reserve_seconds=(
-                            self._report_execution_context.post_capture_reserve_seconds
-                            if self._report_execution_context
-                            else 0.0
-                        ),
+                        reserve_seconds=reserve_seconds,
                     ),
                 )
             else:
@@ -1058,18 +1109,16 @@ class BaseReportState:
                 url = get_url_path("ChartDataRestApi.data")
                 data = self._post_chart_data(
                     chart_url=url,
-                    auth_cookies=auth_cookies,
+                    auth_cookies=machine_auth_provider_factory.instance.get_auth_cookies(
+                        user
+                    ),
                     request_payload=request_payload,
                     timeout=self._phase_timeout(
                         "data_generation",
                         requested_seconds=app.config[
                             "ALERT_REPORTS_CSV_REQUEST_TIMEOUT"
                         ],
-                        reserve_seconds=(
-                            self._report_execution_context.post_capture_reserve_seconds
-                            if self._report_execution_context
-                            else 0.0
-                        ),
+                        reserve_seconds=reserve_seconds,
                     ),
                 )
             elapsed_seconds: float = (
@@ -1121,26 +1170,46 @@ class BaseReportState:
 
         url = self._get_url(result_format=ChartDataResultFormat.JSON)
         user, username = resolve_executor_user(self._report_schedule)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
+        reserve_seconds = (
+            self._report_execution_context.post_capture_reserve_seconds
+            if self._report_execution_context
+            else 0.0
+        )
         try:
-            dataframe = get_chart_dataframe(
-                url,
-                auth_cookies,
-                timeout=self._phase_timeout(
-                    "dataframe_generation",
-                    requested_seconds=app.config["ALERT_REPORTS_CSV_REQUEST_TIMEOUT"],
-                    reserve_seconds=(
-                        self._report_execution_context.post_capture_reserve_seconds
-                        if self._report_execution_context
-                        else 0.0
+            if self._use_in_process_chart_data():
+                url = f"chart {self._report_schedule.chart_id} (in process)"
+                self._phase_timeout(
+                    "dataframe_generation", reserve_seconds=reserve_seconds
+                )
+                # Match the saved-chart endpoint, which post-processes with the
+                # chart's params rather than the query context's form_data.
+                try:
+                    form_data = json.loads(self._report_schedule.chart.params or "{}")
+                except json.JSONDecodeError:
+                    form_data = {}
+                content = self._get_chart_data_in_process(
+                    user,
+                    self._get_chart_data_request_payload(ChartDataResultFormat.JSON),
+                    form_data,
+                )
+                dataframe = chart_data_to_dataframe(content) if content else None
+            else:
+                dataframe = get_chart_dataframe(
+                    url,
+                    machine_auth_provider_factory.instance.get_auth_cookies(user),
+                    timeout=self._phase_timeout(
+                        "dataframe_generation",
+                        requested_seconds=app.config[
+                            "ALERT_REPORTS_CSV_REQUEST_TIMEOUT"
+                        ],
+                        reserve_seconds=reserve_seconds,
                     ),
-                ),
-            )
+                )
             elapsed_seconds: float = (
                 datetime.now(timezone.utc).replace(tzinfo=None) - start_time
             ).total_seconds()
@@ -21,6 +21,7 @@ from typing import Any, Callable, List, Optional, Union
 from collections.abc import Iterator
 
 import yaml
+from sqlalchemy.orm import selectinload
 from superset.daos.chart import ChartDAO
 from superset.daos.dashboard import DashboardDAO
 from superset.daos.tag import TagDAO
@@ -28,6 +29,11 @@ from superset.extensions import feature_flag_manager
 from superset.tags.models import ObjectType, TagType
 from superset.commands.export.models import ExportModelsCommand
 from superset.commands.tag.exceptions import TagNotFoundError
+from superset.models.dashboard import Dashboard
+from superset.models.slice import Slice
+
+# dashboards/charts whose tags are loaded with a single query
+TAGGED_MODELS_CHUNK_SIZE = 500
 
 
 class ExportTagsCommand(ExportModelsCommand):
@@ -97,6 +103,23 @@ class ExportTagsCommand(ExportModelsCommand):
 
         return list(tags_dict.values())
 
+    @staticmethod
+    def _find_with_tags(
+        dao: Any, model_cls: Any, model_ids: List[Union[int, str]]
+    ) -> List[Any]:
+        """
+        Load the models with their tags in chunks of ``TAGGED_MODELS_CHUNK_SIZE``,
+        keeping the order of ``model_ids`` and dropping the ones not found.
+        """
+        found: dict[str, Any] = {}
+        for start in range(0, len(model_ids), TAGGED_MODELS_CHUNK_SIZE):
+            chunk = model_ids[start : start + TAGGED_MODELS_CHUNK_SIZE]
+            for model in dao.find_by_ids(
+                chunk, query_options=[selectinload(model_cls.tags)]
+            ):
+                found[str(model.id)] = model
+        return [found[key] for key in map(str, model_ids) if key in found]
+
     @staticmethod
     def _file_content(
         dashboard_ids: Optional[Union[int, List[Union[int, str]]]] = None,
@@ -111,14 +134,9 @@ class ExportTagsCommand(ExportModelsCommand):
             if isinstance(dashboard_ids, int):
                 dashboard_ids = [dashboard_ids]
 
-            dashboards = [
-                dashboard
-                for dashboard in (
-                    DashboardDAO.find_by_id(dashboard_id)
-                    for dashboard_id in dashboard_ids
-                )
-                if dashboard is not None
-            ]
+            dashboards = ExportTagsCommand._find_with_tags(
+                DashboardDAO, Dashboard, dashboard_ids
+            )
 
             for dashboard in dashboards:
                 tags = dashboard.tags if hasattr(dashboard, "tags") else []
@@ -133,11 +151,7 @@ class ExportTagsCommand(ExportModelsCommand):
             if isinstance(chart_ids, int):
                 chart_ids = [chart_ids]
 
-            charts = [
-                chart
-                for chart in (ChartDAO.find_by_id(chart_id) for chart_id in chart_ids)
-                if chart is not None
-            ]
+            charts = ExportTagsCommand._find_with_tags(ChartDAO, Slice, chart_ids)
 
             for chart in charts:
                 tags = chart.tags if hasattr(chart, "tags") else []
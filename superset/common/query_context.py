@@ -110,6 +110,10 @@ class QueryContext:
         """Return query results with timing kept outside query payloads."""
         return self._processor.get_payload_result(cache_query_context, force_cached)
 
+    def get_df_payloads(self, force_cached: bool = False) -> list[dict[str, Any]]:
+        """Return every query's payload with its result left as a DataFrame."""
+        return self._processor.get_df_payloads(force_cached)
+
     def get_cache_timeout(self) -> int | None:
         """
         Get the cache timeout for this query context.
@@ -130,6 +134,9 @@ class QueryContext:
             return self.slice_.cache_timeout
         return self.datasource.cache_timeout
 
+    def cache_key(self, **extra: Any) -> str:
+        return self._processor.cache_key(**extra)
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         return self._processor.query_cache_key(query_obj, **kwargs)
 
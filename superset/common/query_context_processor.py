@@ -46,7 +46,7 @@ from superset.exceptions import (
 )
 from superset.explorables.base import Explorable
 from superset.extensions import cache_manager, security_manager
-from superset.models.helpers import QueryResult
+from superset.models.helpers import QueryResult, sqla_query_memo
 from superset.superset_typing import AdhocColumn, AdhocMetric, Column
 from superset.utils import csv, excel
 from superset.utils.cache import generate_cache_key, set_and_log_cache
@@ -485,27 +485,8 @@ class QueryContextProcessor:
                     if pp.get("operation") == "contribution":
                         pp["options"]["contribution_totals"] = totals
 
-    def get_payload(
-        self,
-        cache_query_context: bool | None = False,
-        force_cached: bool = False,
-    ) -> dict[str, Any]:
-        """Returns the query results with both metadata and data"""
-        result = self.get_payload_result(cache_query_context, force_cached)
-        return_value: dict[str, Any] = {
-            "queries": [query.payload for query in result.queries],
-        }
-        if result.cache_key is not None:
-            return_value["cache_key"] = result.cache_key
-        return return_value
-
-    def get_payload_result(
-        self,
-        cache_query_context: bool | None = False,
-        force_cached: bool = False,
-    ) -> QueryContextExecutionResult:
-        """Return query results with timing kept outside query payloads."""
-
+    def _prepare_queries(self, force_cached: bool = False) -> None:
+        """Resolve contribution totals ahead of running the queries."""
         queries_needing_totals, totals_idx = self._prepare_contribution_totals()
 
         # Skip ensure_totals_available when force_cached=True
@@ -527,15 +508,40 @@ class QueryContextProcessor:
                 )
             ]
 
-        query_results = tuple(
-            get_query_results_with_timing(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
-                query_obj,
-                force_cached,
+    def get_payload(
+        self,
+        cache_query_context: bool | None = False,
+        force_cached: bool = False,
+    ) -> dict[str, Any]:
+        """Returns the query results with both metadata and data"""
+        result = self.get_payload_result(cache_query_context, force_cached)
+        return_value: dict[str, Any] = {
+            "queries": [query.payload for query in result.queries],
+        }
+        if result.cache_key is not None:
+            return_value["cache_key"] = result.cache_key
+        return return_value
+
+    def get_payload_result(
+        self,
+        cache_query_context: bool | None = False,
+        force_cached: bool = False,
+    ) -> QueryContextExecutionResult:
+        """Return query results with timing kept outside query payloads."""
+        self._prepare_queries(force_cached)
+
+        # the cache key and the SQL of each query are derived from the same
+        # SqlaQuery, which only has to be built once
+        with sqla_query_memo():
+            query_results = tuple(
+                get_query_results_with_timing(
+                    query_obj.result_type or self._query_context.result_type,
+                    self._query_context,
+                    query_obj,
+                    force_cached,
+                )
+                for query_obj in self._query_context.queries
             )
-            for query_obj in self._query_context.queries
-        )
 
         cache_key = None
         if cache_query_context:
@@ -557,6 +563,19 @@ class QueryContextProcessor:
 
         return QueryContextExecutionResult(queries=query_results, cache_key=cache_key)
 
+    def get_df_payloads(self, force_cached: bool = False) -> list[dict[str, Any]]:
+        """
+        Return the dataframe payload of every query, leaving each result as the
+        DataFrame under ``df`` rather than materializing it in the requested
+        result format.
+        """
+        self._prepare_queries(force_cached)
+        with sqla_query_memo():
+            return [
+                self._query_context.get_df_payload(query_obj, force_cached)
+                for query_obj in self._query_context.queries
+            ]
+
     def get_cache_timeout(self) -> int:
         """
         Determine the cache timeout (in seconds) for this query context.
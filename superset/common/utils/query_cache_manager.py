@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from typing import Any
 
@@ -42,6 +43,17 @@ _cache: dict[CacheRegion, Cache] = {
 }
 
 
+def _get_prefetched() -> dict[tuple[CacheRegion, str], Any]:
+    """
+    Cache values read ahead by `QueryCacheManager.prefetch` in the current request
+    """
+    if not has_request_context():
+        return {}
+    if not hasattr(g, "query_cache_prefetched"):
+        g.query_cache_prefetched = {}
+    return g.query_cache_prefetched
+
+
 class QueryCacheManager:
     """
     Class for manage query-cache getting and setting
@@ -177,14 +189,18 @@ class QueryCacheManager:
         if not key or not _cache[region] or force_query:
             return query_cache
 
-        try:
-            cache_value = _cache[region].get(key)
-        except Exception as ex:  # pylint: disable=broad-except
-            # A cache backend outage (e.g. Redis connection/timeout errors)
-            # should not surface as an error to the caller: treat it the
-            # same as a cache miss and fall through to querying live data.
-            logger.warning("Error reading cache: %s", error_msg_from_exception(ex))
-            cache_value = None
+        prefetched = _get_prefetched()
+        if (region, key) in prefetched:
+            cache_value = prefetched.pop((region, key))
+        else:
+            try:
+                cache_value = _cache[region].get(key)
+            except Exception as ex:  # pylint: disable=broad-except
+                # A cache backend outage (e.g. Redis connection/timeout errors)
+                # should not surface as an error to the caller: treat it the
+                # same as a cache miss and fall through to querying live data.
+                logger.warning("Error reading cache: %s", error_msg_from_exception(ex))
+                cache_value = None
 
         if cache_value:
             logger.debug("Cache key: %s", key)
@@ -236,6 +252,33 @@ class QueryCacheManager:
             raise CacheLoadError("Error loading data from cache")
         return query_cache
 
+    @staticmethod
+    def prefetch(
+        keys: Iterable[str | None],
+        region: CacheRegion = CacheRegion.DEFAULT,
+    ) -> None:
+        """
+        Read the values of many keys in one round trip (``MGET`` on Redis), for the
+        `get` calls of the current request to use instead of reading each key
+        """
+        unique_keys = [key for key in dict.fromkeys(keys) if key]
+        if not unique_keys or not _cache[region] or not has_request_context():
+            return
+
+        try:
+            values = _cache[region].get_many(*unique_keys)  # type: ignore
+        except Exception as ex:  # pylint: disable=broad-except
+            # the keys are read one at a time by `get` instead
+            logger.warning("Error reading cache: %s", error_msg_from_exception(ex))
+            return
+
+        _get_prefetched().update(
+            {
+                (region, key): value
+                for key, value in zip(unique_keys, values, strict=True)
+            }
+        )
+
     @staticmethod
     def set(
         key: str | None,
@@ -248,6 +291,7 @@ class QueryCacheManager:
         set value to specify cache region, proxy for `set_and_log_cache`
         """
         if key:
+            _get_prefetched().pop((region, key), None)
             set_and_log_cache(_cache[region], key, value, timeout, datasource_uid)
 
     @staticmethod
@@ -256,6 +300,7 @@ class QueryCacheManager:
         region: CacheRegion = CacheRegion.DEFAULT,
     ) -> None:
         if key:
+            _get_prefetched().pop((region, key), None)
             _cache[region].delete(key)
 
     @staticmethod
@@ -198,6 +198,11 @@ DECK_MULTI_MAX_SLICES = 50
 # requested page size, to keep query result sets bounded.
 SQLALCHEMY_DAO_MAX_PAGE_SIZE = 1000
 
+# How long, in seconds, the generic DAO list layer may reuse the total count of a
+# list query (from CACHE_CONFIG) when the caller does not need an exact count, e.g.
+# when paging through MCP list tools. Set to 0 to always count.
+DAO_LIST_COUNT_CACHE_TIMEOUT = 60
+
 # SupersetClient HTTP retry configuration
 # Controls retry behavior for all HTTP requests made through SupersetClient
 # This helps handle transient server errors (like 502 Bad Gateway) automatically
@@ -1024,6 +1029,11 @@ FEATURE_FLAGS: dict[str, bool] = {}
 # to True to have the task log ``would_purge`` counts without deleting anything.
 SOFT_DELETE_RETENTION_DAYS: int = 30
 SOFT_DELETE_PURGE_DRY_RUN: bool = False
+# Number of expired entities the purge task removes together with set-based
+# DELETE ... WHERE id IN (...) statements, in one transaction per chunk (capped
+# at 500). A chunk that fails is retried one entity at a time. Zero keeps the
+# per-entity purge, which runs one transaction and cascade per entity.
+SOFT_DELETE_PURGE_CHUNK_SIZE: int = 0
 
 # A function that receives a dict of all feature flags
 # (DEFAULT_FEATURE_FLAGS merged with FEATURE_FLAGS)
@@ -1284,10 +1294,25 @@ THUMBNAIL_ERROR_CACHE_TTL = int(timedelta(days=1).total_seconds())
 # the worker stuck.  Should exceed the task soft_time_limit (300 s) by a margin.
 THUMBNAIL_COMPUTING_CACHE_TTL = int(timedelta(seconds=360).total_seconds())
 
+# Screenshots of the same resource and state (e.g. report schedules targeting the
+# same dashboard, tab and native filter state) requested within this many seconds
+# share a single render, handed out through the thumbnail cache. Has no effect
+# when THUMBNAIL_CACHE_CONFIG is a NullCache; set to 0 to disable.
+SCREENSHOT_COALESCE_WINDOW = int(timedelta(minutes=5).total_seconds())
+# How long to wait for a render started by another worker before taking the
+# screenshot directly, and how often (in seconds) to check whether it is ready.
+SCREENSHOT_COALESCE_WAIT_TIMEOUT = int(timedelta(minutes=5).total_seconds())
+SCREENSHOT_COALESCE_POLL_INTERVAL = 2
+
 # Cache warmup user — must be set explicitly before enabling the cache-warmup
 # Celery task. Intentionally defaults to None so operators pick a dedicated
 # least-privilege user rather than inadvertently running warmup as "admin".
 SUPERSET_CACHE_WARMUP_USER: str | None = None
+# The dashboard strategies (`dummy`, `top_n_dashboards`, `dashboard_tags`) accept
+# `"data_only": True` in their kwargs to skip the browser: each chart's saved query
+# context, with default native filter values applied, is then run by its own
+# `cache-warmup-chart` Celery task.
+#
 # To warm up native filter option queries, use the `native_filter_options` strategy.
 # This strategy pre-populates the cache for Value-type native filter dropdowns by
 # executing the same chart-data queries the UI sends when a user opens a filter.
@@ -1337,6 +1362,11 @@ SCREENSHOT_PLAYWRIGHT_WAIT_EVENT = "domcontentloaded"
 SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT = int(
     timedelta(seconds=60).total_seconds() * 1000
 )
+# Maximum number of pages a worker renders at once when capturing a batch of URLs
+# (e.g. dashboard cache warm-up) in one browser; 1 captures them one at a time.
+SCREENSHOT_CAPTURE_CONCURRENCY = 4
+# Deadline, in seconds, for each page of such a batch, from navigation to capture.
+SCREENSHOT_CAPTURE_PAGE_TIMEOUT = int(timedelta(minutes=2).total_seconds())
 
 # Tiled screenshot configuration for large dashboards
 SCREENSHOT_TILED_ENABLED = True  # Enable tiled screenshots for large dashboards
@@ -1385,6 +1415,10 @@ DATA_CACHE_MAX_VALUE_SIZE: int | None = None
 # The default keeps the public response contract unchanged.
 CHART_DATA_INCLUDE_TIMING: bool = False
 
+# Maximum number of query contexts a /api/v1/chart/data/batch request can carry.
+# The cached data of all of them is read from DATA_CACHE_CONFIG in one round trip.
+CHART_DATA_BATCH_MAX_SIZE = 100
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -1552,6 +1586,10 @@ EXCEL_EXPORT_S3_CLIENT_KWARGS: dict[str, Any] = {}
 # stay tabular (one worksheet of data) while every other viz type is embedded as
 # a rendered image. Set to None to fall back to the built-in default.
 EXCEL_EXPORT_TABLE_VIZ_TYPES: set[str] | None = None
+# Number of charts whose queries a dashboard export runs concurrently. Sheets
+# are still written in layout order; raise this to overlap warehouse latency on
+# large dashboards, bounded by what the warehouse and worker memory can absorb.
+EXCEL_EXPORT_QUERY_CONCURRENCY = 4
 
 # Optional hook to build a query context for a chart that has no saved
 # ``query_context``, called before the built-in form-data rebuild. Receives the
@@ -1837,6 +1875,14 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
             "task": "deletion_retention.purge_soft_deleted",
             "schedule": crontab(minute=0, hour=0),
         },
+        # Prune expired entries from the key-value store (for example, rows left
+        # behind by the metastore cache backend, locks and PKCE verifiers). Writers
+        # do not delete expired rows inline, so this keeps the table bounded.
+        "prune_key_value": {
+            "task": "prune_key_value",
+            "schedule": crontab(minute="*/15"),
+            "kwargs": {"max_rows_per_run": 100000},
+        },
         # Uncomment to enable pruning of the query table
         # "prune_query": {
         #     "task": "prune_query",
@@ -1855,13 +1901,6 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         #     "schedule": crontab(minute=0, hour=0),
         #     "kwargs": {"retention_period_days": 90, "max_rows_per_run": 10000},
         # },
-        # Uncomment to enable pruning of expired entries from the key-value store
-        # (for example, rows left behind by the metastore cache backend)
-        # "prune_key_value": {
-        #     "task": "prune_key_value",
-        #     "schedule": crontab(minute=0, hour=0),
-        #     "kwargs": {"max_rows_per_run": 10000},
-        # },
         # Uncomment to enable Slack channel cache warm-up
         # "slack.cache_channels": {
         #     "task": "slack.cache_channels",
@@ -2158,6 +2197,14 @@ DB_POLL_INTERVAL_SECONDS: dict[str, int] = {}
 # See here: https://github.com/dropbox/PyHive/blob/8eb0aeab8ca300f3024655419b93dad926c1a351/pyhive/presto.py#L93  # noqa: E501
 PRESTO_POLL_INTERVAL = int(timedelta(seconds=1).total_seconds())
 
+# While a Trino or Presto query runs, the wait between progress polls starts at the
+# intervals above and doubles after every poll, up to DB_POLL_BACKOFF_AGE_RATIO
+# times the age of the query and at most DB_POLL_MAX_INTERVAL_SECONDS, so that
+# long-running queries are polled less and less often. Set the maximum to 0 to
+# poll at a fixed interval.
+DB_POLL_MAX_INTERVAL_SECONDS = 10
+DB_POLL_BACKOFF_AGE_RATIO = 0.1
+
 # Allow list of custom authentications for each DB engine.
 # Example:
 # from your.module import AuthClass
@@ -2537,6 +2584,12 @@ ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES = 1
 # which leaves the report schedule stuck in the WORKING state. Set to None to
 # disable (not recommended).
 ALERT_REPORTS_CSV_REQUEST_TIMEOUT = 60
+# Generate CSV, Excel and embedded-table report attachments for charts with a
+# saved query context by running the chart data command inside the Celery
+# worker, instead of requesting them from the webserver over HTTP. This keeps
+# report bursts off the web tier. The data query is then bounded by the
+# worker's time limits rather than ALERT_REPORTS_CSV_REQUEST_TIMEOUT.
+ALERT_REPORTS_CHART_DATA_IN_PROCESS = False
 # Custom width for screenshots
 ALERT_REPORTS_MIN_CUSTOM_SCREENSHOT_WIDTH = 600
 ALERT_REPORTS_MAX_CUSTOM_SCREENSHOT_WIDTH = 2400
@@ -2937,6 +2990,26 @@ GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
+# Server-sent events stream (GET /api/v1/async_event/stream): a heartbeat comment
+# is sent after this many seconds without events, and the connection is closed
+# after GLOBAL_ASYNC_QUERIES_SSE_MAX_DURATION seconds, at which point the client
+# reconnects and resumes from the last event it received.
+# Each open stream holds a web server worker for that long. With a sync worker
+# class (e.g. gunicorn's default), a few open browser tabs can take every worker,
+# so serve the stream from an async worker class (gevent or eventlet), or keep
+# clients on the polling endpoint.
+GLOBAL_ASYNC_QUERIES_SSE_HEARTBEAT_INTERVAL = 15
+GLOBAL_ASYNC_QUERIES_SSE_MAX_DURATION = int(timedelta(minutes=5).total_seconds())
+# Async chart data jobs submitted for data that an identical job (same query and
+# same RLS/impersonation context) started computing less than this many seconds
+# ago attach to that job rather than enqueuing another one. Set to 0 to disable.
+GLOBAL_ASYNC_QUERIES_COALESCE_WINDOW = int(timedelta(minutes=5).total_seconds())
+# The progress of SQL Lab queries on engines that report it while running (Trino,
+# Presto) is pushed to the async events channel of the user who submitted them.
+# The query row, which clients polling for query updates read, is then written at
+# most this many seconds apart rather than on every change. Set to 0 to write
+# every change.
+GLOBAL_ASYNC_QUERIES_PROGRESS_COMMIT_INTERVAL = 0
 
 # Global async queries cache backend configuration options:
 # - Set 'CACHE_TYPE' to 'RedisCache' for RedisCacheBackend.
@@ -3047,6 +3120,9 @@ ZIPPED_FILE_MAX_SIZE = 100 * 1024 * 1024  # 100MB
 ZIP_FILE_MAX_COMPRESS_RATIO = 200.0
 # Max allowed total decompressed size across all entries in a zipped file
 ZIP_FILE_MAX_TOTAL_SIZE = 1024 * 1024 * 1024  # 1GB
+# Number of worker processes used to parse the YAML files of large import
+# bundles. 0 or 1 parses them in the web/worker process itself.
+IMPORT_YAML_PARSE_PROCESSES = 0
 
 # Configuration for environment tag shown on the navbar. Setting 'text' to '' will hide the tag.  # noqa: E501
 # 'color' support only Ant Design semantic colors (e.g., 'error', 'warning', 'success', 'processing', 'default)  # noqa: E501
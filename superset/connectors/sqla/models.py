@@ -102,7 +102,6 @@ from superset.models.helpers import (
     ImportExportMixin,
     QueryResult,
     SoftDeleteMixin,
-    SQLA_QUERY_KEYS,
     validate_adhoc_subquery,
     validate_rendered_expression,
     validate_stored_expression_at_query_time,
@@ -963,6 +962,10 @@ class AnnotationDatasource(BaseDatasource):
         limit: int = 10000,
         denormalize_column: bool = False,
         array_elements: bool = False,
+        search: str | None = None,
+        search_prefix: bool = False,
+        after: Any = None,
+        ordered: bool = False,
     ) -> list[Any]:
         raise NotImplementedError()
 
@@ -2411,11 +2414,7 @@ class SqlaTable(
 
         extra_cache_keys = super().get_extra_cache_keys(query_obj)
         if self.has_extra_cache_key_calls(query_obj):
-            # Filter out keys that aren't parameters to get_sqla_query
-            filtered_query_obj = {
-                k: v for k, v in query_obj.items() if k in SQLA_QUERY_KEYS
-            }
-            sqla_query = self.get_sqla_query(**cast(Any, filtered_query_obj))
+            sqla_query = self.get_memoized_sqla_query(query_obj)
             extra_cache_keys += sqla_query.extra_cache_keys
 
         # For virtual datasets, include RLS predicates in the cache key
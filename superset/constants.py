@@ -42,6 +42,7 @@ NO_TIME_RANGE = "No filter"
 
 QUERY_CANCEL_KEY = "cancel_query"
 QUERY_EARLY_CANCEL_KEY = "early_cancel_query"
+QUERY_ASYNC_CHANNEL_KEY = "async_channel_id"
 
 LRU_CACHE_MAX_SIZE = 256
 
@@ -153,6 +154,7 @@ MODEL_API_RW_METHOD_PERMISSION_MAP = {
     "cache_screenshot": "read",
     "screenshot": "read",
     "data": "read",
+    "data_batch": "read",
     "data_from_cache": "read",
     "get_charts": "read",
     "get_datasets": "read",
@@ -134,8 +134,12 @@ def create_tool_decorator(
 
             from fastmcp.tools import Tool
 
+            from superset.mcp_service.auth import MCP_ASYNC_VARIANT_ATTR
+
+            # Sync tools are served through their async variant, which runs
+            # them on the bounded MCP tool executor.
             tool = Tool.from_function(
-                wrapped_func,
+                getattr(wrapped_func, MCP_ASYNC_VARIANT_ATTR, wrapped_func),
                 name=tool_name,
                 description=tool_description,
                 tags=tool_tags,
@@ -16,8 +16,12 @@
 # under the License.
 from __future__ import annotations
 
+import base64
 import logging
+import operator
 import uuid as uuid_lib
+from collections.abc import Iterator
+from datetime import date, datetime
 from enum import Enum
 from typing import (
     Any,
@@ -37,7 +41,7 @@ from flask import current_app
 from flask_appbuilder.models.filters import BaseFilter
 from flask_appbuilder.models.sqla.interface import SQLAInterface
 from pydantic import BaseModel, Field
-from sqlalchemy import asc, cast, desc, false, or_, Text
+from sqlalchemy import and_, asc, cast, desc, false, or_, Text
 from sqlalchemy.exc import SQLAlchemyError, StatementError
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.inspection import inspect
@@ -50,7 +54,9 @@ from superset.constants import SKIP_VISIBILITY_FILTER_CLASSES
 from superset.daos.exceptions import (
     DAOFindFailedError,
 )
-from superset.extensions import db
+from superset.extensions import cache_manager, db
+from superset.utils import json
+from superset.utils.hashing import hash_from_str
 
 T = TypeVar("T", bound=CoreModel)
 
@@ -115,6 +121,99 @@ def _like_op(template: str, case_insensitive: bool = False) -> Any:
     return op
 
 
+def _search_filter(column: Any, search: str) -> Any:
+    """Build the case-insensitive "contains" filter of a list search.
+
+    String columns are matched as they are, so that a trigram index on the
+    column (created on PostgreSQL for the main list searches) can serve the
+    search; other columns (e.g. UUIDs) are cast to text first.
+    """
+    pattern = f"%{_escape_like(search)}%"
+    if isinstance(getattr(column, "type", None), sa.String):
+        return column.ilike(pattern, escape="\\")
+    return cast(column, Text).ilike(pattern, escape="\\")
+
+
+def encode_keyset_cursor(value: Any, last_id: Any) -> str:
+    """Opaque cursor resuming a list after the row keyed ``(value, last_id)``."""
+    return base64.urlsafe_b64encode(
+        json.dumps([value, last_id], default=json.json_iso_dttm_ser).encode()
+    ).decode()
+
+
+def decode_keyset_cursor(cursor: str) -> Tuple[Any, Any]:
+    """The ``(order value, id)`` keyset of a cursor; raises ValueError if invalid."""
+    try:
+        value, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    # binascii.Error and JSONDecodeError are ValueErrors
+    except (TypeError, ValueError) as ex:
+        raise ValueError("Invalid cursor") from ex
+    if isinstance(value, (list, dict)) or not isinstance(last_id, (int, str)):
+        raise ValueError("Invalid cursor")
+    return value, last_id
+
+
+def _is_nullable(attr: Any) -> bool:
+    columns = getattr(getattr(attr, "property", None), "columns", None)
+    return not columns or bool(getattr(columns[0], "nullable", True))
+
+
+def _keyset_value(order_attr: Any, value: Any) -> Any:
+    """Convert an order value decoded from JSON back to the type of its column."""
+    if not isinstance(value, str):
+        return value
+    try:
+        python_type = order_attr.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return value
+
+
+def keyset_order_by(order_attr: Any, id_attr: Any, descending: bool) -> List[Any]:
+    """
+    The ORDER BY clauses of a keyset: the order column, with its NULLs last in
+    either direction, then the id as a tie-breaker.
+    """
+    direction = desc if descending else asc
+    clauses = []
+    if order_attr is not None:
+        if _is_nullable(order_attr):
+            clauses.append(sa.case((order_attr.is_(None), 1), else_=0))
+        clauses.append(direction(order_attr))
+    if id_attr is not None:
+        clauses.append(direction(id_attr))
+    return clauses
+
+
+def keyset_filter(
+    order_attr: Any, id_attr: Any, after: Tuple[Any, Any], descending: bool
+) -> Any:
+    """
+    Select the rows that come after the ``(order value, id)`` keyset ``after``
+    in the order of `keyset_order_by`, i.e. with the NULL order values last.
+
+    :raises ValueError: if the order value can't be converted to the column type
+    """
+    value, last_id = after
+    beyond = operator.lt if descending else operator.gt
+    if order_attr is None:
+        return beyond(id_attr, last_id)
+    if value is None:
+        return and_(order_attr.is_(None), beyond(id_attr, last_id))
+    value = _keyset_value(order_attr, value)
+    predicates = [
+        beyond(order_attr, value),
+        and_(order_attr == value, beyond(id_attr, last_id)),
+    ]
+    if _is_nullable(order_attr):
+        predicates.append(order_attr.is_(None))
+    return or_(*predicates)
+
+
 # Define operator_map as a module-level dict after the enum is defined
 operator_map: Dict[ColumnOperatorEnum, Any] = {
     ColumnOperatorEnum.eq: lambda col, val: col == val,
@@ -387,6 +486,7 @@ class BaseDAO(CoreBaseDAO[T], Generic[T]):
         id_column: str | None = None,
         *,
         skip_visibility_filter: bool = False,
+        query_options: list[Any] | None = None,
     ) -> list[T]:
         """
         Find a List of models by a list of ids, if defined applies `base_filter`
@@ -397,6 +497,8 @@ class BaseDAO(CoreBaseDAO[T], Generic[T]):
                          (defaults to id_column_name)
         :param skip_visibility_filter: Keyword-only. If true, skip the
             soft-delete visibility filter so soft-deleted rows are returned
+        :param query_options: Keyword-only. SQLAlchemy query options (e.g.,
+            selectinload) applied to the query, to eager-load relationships
         """
         column = id_column or cls.id_column_name
         id_col = getattr(cls.model_cls, column, None)
@@ -428,6 +530,8 @@ class BaseDAO(CoreBaseDAO[T], Generic[T]):
             query = query.execution_options(
                 **{SKIP_VISIBILITY_FILTER_CLASSES: {cls.model_cls}}
             )
+        if query_options:
+            query = query.options(*query_options)
         query = query.filter(id_col.in_(converted_ids))
         query = cls._apply_base_filter(query, skip_base_filter)
 
@@ -450,6 +554,45 @@ class BaseDAO(CoreBaseDAO[T], Generic[T]):
         query = cls._apply_base_filter(query, skip_base_filter)
         return query.all()
 
+    @classmethod
+    def iter_id_batches(
+        cls,
+        batch_size: int,
+        *,
+        changed_since: datetime | None = None,
+        skip_base_filter: bool = False,
+    ) -> Iterator[list[int]]:
+        """
+        Yield the ids of all models that fit the `base_filter`, in ascending
+        batches of at most ``batch_size``.
+
+        Batches are paged by id (keyset) rather than by offset, so each one is a
+        cheap index range scan no matter how deep into the table it is.
+
+        :param batch_size: Maximum number of ids per batch
+        :param changed_since: Keyword-only. If set, only models changed at or
+            after this (naive UTC) time are included
+        :param skip_base_filter: Keyword-only. If true, skip the base filter
+        """
+        id_col = getattr(cls.model_cls, cls.id_column_name)
+        query = db.session.query(id_col)
+        query = cls._apply_base_filter(query, skip_base_filter)
+        if changed_since is not None:
+            query = query.filter(cls.model_cls.changed_on >= changed_since)  # type: ignore
+
+        last_id: int | None = None
+        while True:
+            page = query
+            if last_id is not None:
+                page = page.filter(id_col > last_id)
+            ids = [row[0] for row in page.order_by(id_col).limit(batch_size)]
+            if not ids:
+                return
+            yield ids
+            if len(ids) < batch_size:
+                return
+            last_id = ids[-1]
+
     @classmethod
     def find_one_or_none(
         cls, skip_base_filter: bool = False, **filter_by: Any
@@ -813,11 +956,7 @@ class BaseDAO(CoreBaseDAO[T], Generic[T]):
             for column_name in search_columns:
                 if hasattr(cls.model_cls, column_name):
                     column = getattr(cls.model_cls, column_name)
-                    search_filters.append(
-                        cast(column, Text).ilike(
-                            f"%{_escape_like(search)}%", escape="\\"
-                        )
-                    )
+                    search_filters.append(_search_filter(column, search))
             if search_filters:
                 query = query.filter(or_(*search_filters))
         if custom_filters:
@@ -839,11 +978,24 @@ class BaseDAO(CoreBaseDAO[T], Generic[T]):
         search_columns: Optional[List[str]] = None,
         custom_filters: Optional[Dict[str, BaseFilter]] = None,
         columns: Optional[List[str]] = None,
+        after: Optional[Tuple[Any, Any]] = None,
+        exact_count: bool = True,
     ) -> Tuple[List[Any], int]:
         """
         Generic list method for filtered, sorted, and paginated results.
         If columns is specified, returns a list of tuples (one per row),
         otherwise returns model instances.
+
+        Rows are ordered by ``order_column``, with NULLs last, and then by id, so
+        pages are stable. Passing ``after`` -- the ``(order_column value, id)`` of
+        the last row of the previous page, as decoded from the cursor of
+        `keyset_cursor` -- pages by keyset instead of ``OFFSET`` (``page`` is
+        then ignored), so deep pages cost the same as the first one. Rows listed
+        by ``columns`` include the order column and the id, for the cursor.
+
+        With ``exact_count`` false the total count may be served from the cache
+        for ``DAO_LIST_COUNT_CACHE_TIMEOUT`` seconds instead of being recounted
+        on every page.
         """
         data_model = SQLAInterface(cls.model_cls, db.session)
 
@@ -866,6 +1018,17 @@ class BaseDAO(CoreBaseDAO[T], Generic[T]):
                 # model instance (Row objects don't support descriptors)
                 needs_full_model = True
 
+        order_attr = getattr(cls.model_cls, order_column, None)
+        id_attr = getattr(cls.model_cls, cls.id_column_name, None)
+        if column_attrs:
+            # the keyset of the last row makes the cursor of the next page
+            column_attrs.extend(
+                attr
+                for attr in (order_attr, id_attr)
+                if isinstance(getattr(attr, "property", None), ColumnProperty)
+                and attr not in column_attrs
+            )
+
         if relationship_loads or needs_full_model:
             # Need full model for relationships or Python @property access.
             # Do NOT apply load_only() here — @property descriptors and
@@ -884,11 +1047,7 @@ class BaseDAO(CoreBaseDAO[T], Generic[T]):
             for column_name in search_columns:
                 if hasattr(cls.model_cls, column_name):
                     column = getattr(cls.model_cls, column_name)
-                    search_filters.append(
-                        cast(column, Text).ilike(
-                            f"%{_escape_like(search)}%", escape="\\"
-                        )
-                    )
+                    search_filters.append(_search_filter(column, search))
             if search_filters:
                 query = query.filter(or_(*search_filters))
         if custom_filters:
@@ -899,20 +1058,26 @@ class BaseDAO(CoreBaseDAO[T], Generic[T]):
 
         # Count before adding relationship joins to avoid inflated counts
         # with one-to-many or many-to-many relationships
-        total_count = query.count()
+        total_count = query.count() if exact_count else cls._cached_count(query)
 
         # Add relationship joins after counting
         if relationship_loads:
             for loader in relationship_loads:
                 query = query.options(loader)
 
-        if hasattr(cls.model_cls, order_column):
-            column = getattr(cls.model_cls, order_column)
-            if order_direction.lower() == "desc":
-                query = query.order_by(desc(column))
-            else:
-                query = query.order_by(asc(column))
-        page = page
+        descending = order_direction.lower() == "desc"
+        # The id is the tie-breaker: it keeps pages stable across equal order
+        # values and is the second half of the keyset.
+        query = query.order_by(
+            *keyset_order_by(
+                order_attr,
+                id_attr if order_column != cls.id_column_name else None,
+                descending,
+            )
+        )
+        if after is not None and id_attr is not None:
+            query = query.filter(keyset_filter(order_attr, id_attr, after, descending))
+            page = 0
         # Clamp the page size to a sane range: at least 1, and no larger than
         # the configured upper bound, to keep result sets bounded.
         # Normalize the configured maximum to a positive integer so that a
@@ -932,6 +1097,51 @@ class BaseDAO(CoreBaseDAO[T], Generic[T]):
         # model instances)
         return items, total_count
 
+    @classmethod
+    def keyset_cursor(cls, item: Any, order_column: str) -> Optional[str]:
+        """
+        The cursor of the rows following ``item`` in a `list` ordered by
+        ``order_column``, or None if the row lacks its keyset.
+        """
+        try:
+            # Lists by a column the model lacks are ordered by id alone
+            value = (
+                getattr(item, order_column)
+                if hasattr(cls.model_cls, order_column)
+                else None
+            )
+            last_id = getattr(item, cls.id_column_name)
+        except AttributeError:
+            return None
+        return encode_keyset_cursor(value, last_id)
+
+    @classmethod
+    def _cached_count(cls, query: Query) -> int:
+        """
+        Count the rows of a list query, reusing a cached count of the same
+        statement for ``DAO_LIST_COUNT_CACHE_TIMEOUT`` seconds.
+        """
+        timeout = current_app.config.get("DAO_LIST_COUNT_CACHE_TIMEOUT", 0)
+        if not timeout:
+            return query.count()
+
+        compiled = query.statement.compile(dialect=db.session.get_bind().dialect)
+        # The soft-delete listener filters at execution time, so which classes
+        # bypass it is part of what is being counted.
+        bypass = sorted(
+            klass.__name__
+            for klass in db.session.info.get(SKIP_VISIBILITY_FILTER_CLASSES, ())
+        )
+        cache_key = "dao_list_count_" + hash_from_str(
+            f"{compiled}|{sorted(compiled.params.items())!r}|{bypass!r}"
+        )
+        if (total_count := cache_manager.cache.get(cache_key)) is not None:
+            return total_count
+
+        total_count = query.count()
+        cache_manager.cache.set(cache_key, total_count, timeout=timeout)
+        return total_count
+
     @classmethod
     def count(
         cls,
@@ -21,7 +21,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, update
 
 from superset import db
 from superset.daos.base import BaseDAO
@@ -37,6 +37,18 @@ from superset.utils.core import get_user_id
 logger = logging.getLogger(__name__)
 
 
+def _supports_skip_locked() -> bool:
+    dialect = db.session.get_bind().dialect
+    version = dialect.server_version_info or ()
+    if dialect.name == "postgresql":
+        return True
+    if dialect.name == "mysql":
+        if getattr(dialect, "is_mariadb", False):
+            return version >= (10, 6)
+        return version >= (8, 0, 1)
+    return False
+
+
 class KeyValueDAO(BaseDAO[KeyValueEntry]):
     @staticmethod
     def get_entry(
@@ -46,6 +58,58 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
         filter_ = get_filter(resource, key)
         return db.session.query(KeyValueEntry).filter_by(**filter_).first()
 
+    @staticmethod
+    def get_entry_for_update(
+        resource: KeyValueResource,
+        key: Key,
+        skip_locked: bool = False,
+    ) -> KeyValueEntry | None:
+        """
+        Fetch an entry and lock its row for the rest of the transaction.
+
+        With ``skip_locked``, a row already locked by another transaction is
+        skipped (``None`` is returned) rather than waited on. Row locks are only
+        requested on backends that support ``SKIP LOCKED`` (PostgreSQL, MySQL
+        8.0.1+ and MariaDB 10.6+); elsewhere this is a plain read.
+        """
+        filter_ = get_filter(resource, key)
+        query = db.session.query(KeyValueEntry).filter_by(**filter_)
+        if _supports_skip_locked():
+            query = query.with_for_update(skip_locked=skip_locked)
+        return query.first()
+
+    @staticmethod
+    def take_over_expired_entry(
+        entry: KeyValueEntry,
+        value: Any,
+        codec: KeyValueCodec,
+        expires_on: datetime | None = None,
+    ) -> bool:
+        """
+        Overwrite an expired entry in place, returning whether it was taken over.
+
+        The update is conditional on the entry still being expired, so when two
+        writers race for the same expired entry exactly one of them wins.
+        """
+        result = db.session.execute(
+            update(KeyValueEntry)
+            .where(
+                and_(
+                    KeyValueEntry.id == entry.id,
+                    KeyValueEntry.expires_on <= datetime.now(),
+                )
+            )
+            .values(
+                value=codec.encode(value),
+                expires_on=expires_on,
+                changed_on=datetime.now(),
+                changed_by_fk=get_user_id(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.session.expire(entry)
+        return result.rowcount == 1
+
     @classmethod
     def get_value(
         cls,
@@ -67,15 +131,37 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
 
         return False
 
+    @staticmethod
+    def delete_entry_if_unchanged(entry: KeyValueEntry) -> bool:
+        """
+        Delete an entry only if its value is still the one read, returning whether
+        it was deleted.
+
+        The comparison and the delete are a single statement, so an entry
+        rewritten in the meantime, e.g. by :meth:`take_over_expired_entry`, is
+        left in place.
+        """
+        result = db.session.execute(
+            delete(KeyValueEntry)
+            .where(
+                and_(
+                    KeyValueEntry.id == entry.id,
+                    KeyValueEntry.value == entry.value,
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.session.expunge(entry)
+        return result.rowcount == 1
+
     @staticmethod
     def delete_expired_entries(resource: KeyValueResource) -> None:
         """
         Bulk-delete every expired entry for the given resource.
 
-        Callers that pass an explicit ``key`` to ``create_entry`` along with an
-        ``expires_on`` must invoke this once before their ``create_entry`` call(s);
-        see :meth:`create_entry` for the rationale. Expired entries are also removed
-        in bulk across all resources by the scheduled ``prune_key_value`` task.
+        This is a range delete, so prefer :meth:`take_over_expired_entry` on hot
+        paths; see :meth:`create_entry`. Expired entries are also removed in
+        batches across all resources by the scheduled ``prune_key_value`` task.
         """
         (
             db.session.query(KeyValueEntry)
@@ -100,15 +186,15 @@ class KeyValueDAO(BaseDAO[KeyValueEntry]):
         Create a new entry in the key-value store.
 
         .. note::
-            This method intentionally does **not** purge expired entries. Callers
-            that pass an explicit ``key`` along with an ``expires_on`` must call
-            :meth:`delete_expired_entries` for the same ``resource`` once before
-            creating their entries. Purging is deliberately hoisted out of this
-            method so that a transaction creating many entries pays the cleanup cost
-            only once up front rather than on every insert. An expired entry still
-            occupying the same ``key`` would otherwise cause this insert to fail the
-            unique constraint. (Entries created without an explicit ``key`` get an
-            auto-generated id and cannot collide, so they need no prior purge.)
+            This method intentionally does **not** purge expired entries. An
+            expired entry still occupying the same ``key`` makes this insert fail
+            the unique constraint, so callers that pass an explicit, reusable
+            ``key`` along with an ``expires_on`` must first look the key up and
+            reuse an expired entry with :meth:`take_over_expired_entry` (or, for
+            bulk writes, call :meth:`delete_expired_entries` once up front).
+            Entries created without an explicit ``key``, or with a fresh random
+            one, cannot collide. Expired entries are otherwise removed in the
+            background by the scheduled ``prune_key_value`` task.
         """
         try:
             encoded_value = codec.encode(value)
@@ -17,9 +17,10 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from flask import current_app
 from sqlalchemy import or_, select
 
 from superset.daos.base import BaseDAO, ColumnOperator, ColumnOperatorEnum
@@ -32,6 +33,7 @@ from superset.reports.models import (
     ReportScheduleType,
     ReportState,
 )
+from superset.tasks.cron_util import cron_next_run
 from superset.utils import json
 from superset.utils.core import get_user_id
 
@@ -257,7 +259,9 @@ class ReportScheduleDAO(BaseDAO[ReportSchedule]):
                     for recipient in recipients
                 ]
 
-        return super().create(item, attributes)
+        item = super().create(item, attributes)
+        cls.refresh_next_run_at(item)
+        return item
 
     @classmethod
     def update(
@@ -290,7 +294,23 @@ class ReportScheduleDAO(BaseDAO[ReportSchedule]):
                     for recipient in recipients
                 ]
 
-        return super().update(item, attributes)
+        item = super().update(item, attributes)
+        cls.refresh_next_run_at(item)
+        return item
+
+    @staticmethod
+    def refresh_next_run_at(item: ReportSchedule) -> None:
+        """
+        Recompute the next run of a report schedule from its crontab.
+
+        The lookup starts at the beginning of the current scheduler window, so a
+        trigger the scheduler is about to pick up is never skipped.
+
+        :param item: The report schedule to update
+        """
+        window_size = current_app.config["ALERT_REPORTS_CRON_WINDOW_SIZE"]
+        after = datetime.now(tz=timezone.utc) - timedelta(seconds=window_size / 2)
+        item.next_run_at = cron_next_run(item.crontab, item.timezone or "UTC", after)
 
     @staticmethod
     def find_active() -> list[ReportSchedule]:
@@ -303,6 +323,26 @@ class ReportScheduleDAO(BaseDAO[ReportSchedule]):
             .all()
         )
 
+    @staticmethod
+    def find_due(before: datetime) -> list[ReportSchedule]:
+        """
+        Find active reports whose next run is due before the given naive UTC
+        datetime, including the ones whose next run has not been computed yet.
+
+        :param before: The (exclusive) upper bound of the next run
+        """
+        return (
+            db.session.query(ReportSchedule)
+            .filter(
+                ReportSchedule.active.is_(True),
+                or_(
+                    ReportSchedule.next_run_at.is_(None),
+                    ReportSchedule.next_run_at < before,
+                ),
+            )
+            .all()
+        )
+
     @staticmethod
     def find_last_success_log(
         report_schedule: ReportSchedule,
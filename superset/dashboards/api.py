@@ -40,7 +40,6 @@ from flask_appbuilder.const import (
     API_LIST_TITLE_RIS_KEY,
     API_ORDER_COLUMNS_RIS_KEY,
 )
-from flask_appbuilder.models.sqla.interface import SQLAInterface
 from flask_babel import gettext, ngettext
 from marshmallow import ValidationError
 from werkzeug.wrappers import Response as WerkzeugResponse
@@ -179,6 +178,7 @@ from superset.versioning.etag import set_version_etag
 from superset.versioning.schemas import VersionListItemSchema
 from superset.views.base_api import (
     BaseSupersetModelRestApi,
+    KeysetSQLAInterface,
     RelatedFieldFilter,
     requires_form_data,
     requires_json,
@@ -300,7 +300,7 @@ DASHBOARD_DATASET_INACCESSIBLE_FIELDS = (
 class DashboardRestApi(
     SoftDeleteApiMixin, CustomTagsOptimizationMixin, BaseSupersetModelRestApi
 ):
-    datamodel = SQLAInterface(Dashboard)
+    datamodel = KeysetSQLAInterface(Dashboard)
 
     include_route_methods = RouteMethod.REST_MODEL_VIEW_CRUD_SET | {
         RouteMethod.EXPORT,
@@ -1812,12 +1812,13 @@ class DashboardRestApi(
         # not a no-op under the default cache. The task releases it when it
         # settles; the TTL is the backstop if that release is ever lost.
         lock_params = export_lock_params(g.user.id, dashboard.id)
+        lock = AcquireDistributedLock(
+            EXPORT_LOCK_NAMESPACE,
+            lock_params,
+            ttl_seconds=EXPORT_LOCK_TTL_SECONDS,
+        )
         try:
-            AcquireDistributedLock(
-                EXPORT_LOCK_NAMESPACE,
-                lock_params,
-                ttl_seconds=EXPORT_LOCK_TTL_SECONDS,
-            ).run()
+            lock.run()
         except LockAlreadyHeldException:
             return self.response(
                 202,
@@ -1833,6 +1834,7 @@ class DashboardRestApi(
                     "active_data_mask": payload.get("active_data_mask", {}),
                     "job_id": job_id,
                     "mode": payload.get("mode", "data"),
+                    "lock_token": lock.token,
                 },
                 task_id=job_id,
             )
@@ -1840,7 +1842,9 @@ class DashboardRestApi(
             # If enqueuing fails (e.g. broker down) the task will never run to
             # release the lock, so free it now rather than block exports until
             # the TTL expires.
-            ReleaseDistributedLock(EXPORT_LOCK_NAMESPACE, lock_params).run()
+            ReleaseDistributedLock(
+                EXPORT_LOCK_NAMESPACE, lock_params, token=lock.token
+            ).run()
             raise
         return self.response(202, job_id=job_id)
 
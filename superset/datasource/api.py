@@ -14,6 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import base64
 import hashlib
 import logging
 from typing import Any
@@ -27,7 +28,7 @@ from superset.commands.datasource.list import GetCombinedDatasourceListCommand
 from superset.connectors.sqla.models import BaseDatasource
 from superset.daos.datasource import DatasourceDAO
 from superset.daos.exceptions import DatasourceNotFound, DatasourceTypeNotSupportedError
-from superset.exceptions import SupersetSecurityException
+from superset.exceptions import QueryObjectValidationError, SupersetSecurityException
 from superset.extensions import cache_manager
 from superset.superset_typing import FlaskResponse
 from superset.utils import json
@@ -41,12 +42,39 @@ from superset.views.base_api import BaseSupersetApi, statsd_metrics
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_COLUMN_VALUES_PAGE_SIZE = 100
+
+
+def _encode_values_cursor(value: Any) -> str:
+    """Opaque cursor resuming a column-values page after ``value``."""
+    return base64.urlsafe_b64encode(
+        json.dumps({"after": value}, default=json.json_iso_dttm_ser).encode()
+    ).decode()
+
+
+def _decode_values_cursor(cursor: str | None) -> Any:
+    """
+    The value a cursor resumes after; raises ValueError if malformed or if the
+    value isn't a scalar.
+    """
+    if not cursor:
+        return None
+    try:
+        after = json.loads(base64.urlsafe_b64decode(cursor.encode()))["after"]
+    # binascii.Error and JSONDecodeError are ValueErrors
+    except (TypeError, KeyError, ValueError) as ex:
+        raise ValueError("Invalid cursor") from ex
+    if isinstance(after, (list, dict)):
+        raise ValueError("Invalid cursor")
+    return after
+
 
 class DatasourceRestApi(BaseSupersetApi):
     allow_browser_login = True
     class_permission_name = "Datasource"
     method_permission_name = {
         "combined_list": "read",
+        "get_column_values_page": "get_column_values",
     }
     resource_name = "datasource"
     openapi_spec_tag = "Datasources"
@@ -115,21 +143,11 @@ class DatasourceRestApi(BaseSupersetApi):
             500:
               $ref: '#/components/responses/500'
         """
-        try:
-            datasource = DatasourceDAO.get_datasource(
-                DatasourceType(datasource_type), datasource_id
-            )
-            datasource.raise_for_access()
-        except ValueError:
-            return self.response(
-                400, message=f"Invalid datasource type: {datasource_type}"
-            )
-        except DatasourceTypeNotSupportedError as ex:
-            return self.response(400, message=ex.message)
-        except DatasourceNotFound as ex:
-            return self.response(404, message=ex.message)
-        except SupersetSecurityException as ex:
-            return self.response(403, message=ex.message)
+        datasource, error = self._get_datasource_for_values(
+            datasource_type, datasource_id
+        )
+        if error is not None:
+            return error
 
         row_limit = apply_max_row_limit(app.config["FILTER_SELECT_ROW_LIMIT"])
         denormalize_column = not datasource.normalize_columns
@@ -159,22 +177,13 @@ class DatasourceRestApi(BaseSupersetApi):
         # - ``uid`` / ``col`` / ``limit`` / ``denorm`` — basic query-shape
         #   isolation so different inputs never collide.
         force = parse_boolean_string(request.args.get("force"))
-        cache_key = (
-            "col_values:"
-            + hashlib.sha256(
-                json.dumps(
-                    {
-                        "uid": datasource.uid,
-                        "col": column_name,
-                        "limit": row_limit,
-                        "denorm": denormalize_column,
-                        "elements": array_elements,
-                        "rls": security_manager.get_rls_cache_key(datasource),
-                        "changed_on": str(getattr(datasource, "changed_on", "")),
-                    },
-                    sort_keys=True,
-                ).encode()
-            ).hexdigest()
+        cache_key = self._column_values_cache_key(
+            "col_values",
+            datasource,
+            column_name,
+            limit=row_limit,
+            denorm=denormalize_column,
+            elements=array_elements,
         )
 
         if (
@@ -233,6 +242,232 @@ class DatasourceRestApi(BaseSupersetApi):
         response.headers["X-Cache-Status"] = "MISS"
         return response
 
+    @expose(
+        "/<datasource_type>/<int:datasource_id>/column/<column_name>/values/page/",
+        methods=("GET",),
+    )
+    @protect()
+    @safe
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: (
+            f"{self.__class__.__name__}.get_column_values_page"
+        ),
+        log_to_statsd=False,
+    )
+    def get_column_values_page(
+        self, datasource_type: str, datasource_id: int, column_name: str
+    ) -> FlaskResponse:
+        """Get one page of the values of a datasource column, optionally searched.
+        ---
+        get:
+          summary: Get a page of sorted, optionally searched column values
+          description: >-
+            Searching, sorting and paging run in the database, so only one page
+            of values is transferred however many distinct values the column
+            has. NULL is not returned.
+          parameters:
+          - in: path
+            schema:
+              type: string
+            name: datasource_type
+            description: The type of datasource
+          - in: path
+            schema:
+              type: integer
+            name: datasource_id
+            description: The id of the datasource
+          - in: path
+            schema:
+              type: string
+            name: column_name
+            description: The name of the column to get values for
+          - in: query
+            schema:
+              type: string
+            name: search
+            description: Only return values containing this text (case-insensitive)
+          - in: query
+            schema:
+              type: boolean
+            name: prefix
+            description: Only return values starting with the search text
+          - in: query
+            schema:
+              type: integer
+            name: page_size
+            description: >-
+              The maximum number of values to return, capped by
+              FILTER_SELECT_ROW_LIMIT
+          - in: query
+            schema:
+              type: string
+            name: cursor
+            description: The next_cursor of the previous page
+          responses:
+            200:
+              description: A page of distinct values for the column
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      result:
+                        type: array
+                        items:
+                          oneOf:
+                            - type: string
+                            - type: integer
+                            - type: number
+                            - type: boolean
+                            - type: object
+                      next_cursor:
+                        type: string
+                        nullable: true
+                        description: Cursor of the next page, null on the last one
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            403:
+              $ref: '#/components/responses/403'
+            404:
+              $ref: '#/components/responses/404'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        datasource, error = self._get_datasource_for_values(
+            datasource_type, datasource_id
+        )
+        if error is not None:
+            return error
+
+        try:
+            page_size = int(
+                request.args.get("page_size", DEFAULT_COLUMN_VALUES_PAGE_SIZE)
+            )
+            after = _decode_values_cursor(request.args.get("cursor"))
+        except ValueError:
+            return self.response(400, message="Invalid page_size or cursor")
+        row_limit = apply_max_row_limit(app.config["FILTER_SELECT_ROW_LIMIT"])
+        page_size = max(1, min(page_size, row_limit))
+        search = request.args.get("search") or None
+        search_prefix = parse_boolean_string(request.args.get("prefix"))
+        denormalize_column = not datasource.normalize_columns
+        array_elements = parse_boolean_string(request.args.get("array_elements"))
+
+        # Same RLS-aware key as get_column_values, so each page of a typeahead
+        # search is shared by users with the same effective RLS.
+        force = parse_boolean_string(request.args.get("force"))
+        cache_key = self._column_values_cache_key(
+            "col_values_page",
+            datasource,
+            column_name,
+            limit=page_size,
+            denorm=denormalize_column,
+            elements=array_elements,
+            search=search,
+            prefix=search_prefix,
+            after=after,
+        )
+        if (
+            not force
+            and (cached := cache_manager.data_cache.get(cache_key)) is not None
+        ):
+            response = self.response(200, **cached)
+            response.headers["X-Cache-Status"] = "HIT"
+            return response
+
+        try:
+            # One extra row tells whether there is a next page
+            values = datasource.values_for_column(
+                column_name=column_name,
+                limit=page_size + 1,
+                denormalize_column=denormalize_column,
+                array_elements=array_elements,
+                search=search,
+                search_prefix=search_prefix,
+                after=after,
+                ordered=True,
+            )
+        except KeyError:
+            return self.response(
+                400, message=f"Column name {column_name} does not exist"
+            )
+        except QueryObjectValidationError as ex:
+            return self.response(400, message=ex.message)
+        except NotImplementedError:
+            return self.response(
+                400,
+                message=(
+                    "Unable to get column values for "
+                    f"datasource type: {datasource_type}"
+                ),
+            )
+
+        page = values[:page_size]
+        payload = {
+            "result": page,
+            "next_cursor": (
+                _encode_values_cursor(page[-1]) if len(values) > page_size else None
+            ),
+        }
+        timeout = datasource.cache_timeout or app.config.get(
+            "CACHE_DEFAULT_TIMEOUT", 300
+        )
+        cache_manager.data_cache.set(cache_key, payload, timeout=timeout)
+        response = self.response(200, **payload)
+        response.headers["X-Cache-Status"] = "MISS"
+        return response
+
+    def _get_datasource_for_values(
+        self, datasource_type: str, datasource_id: int
+    ) -> tuple[Any, FlaskResponse | None]:
+        """Load a datasource the user can access, or the error response."""
+        try:
+            datasource = DatasourceDAO.get_datasource(
+                DatasourceType(datasource_type), datasource_id
+            )
+            datasource.raise_for_access()
+        except ValueError:
+            return None, self.response(
+                400, message=f"Invalid datasource type: {datasource_type}"
+            )
+        except DatasourceTypeNotSupportedError as ex:
+            return None, self.response(400, message=ex.message)
+        except DatasourceNotFound as ex:
+            return None, self.response(404, message=ex.message)
+        except SupersetSecurityException as ex:
+            return None, self.response(403, message=ex.message)
+        return datasource, None
+
+    @staticmethod
+    def _column_values_cache_key(
+        key_prefix: str, datasource: Any, column_name: str, **shape: Any
+    ) -> str:
+        """
+        Cache key of column values, isolated by RLS fingerprint and query shape.
+
+        See ``get_column_values`` for why the RLS fingerprint, rather than the
+        user, is the isolation field.
+        """
+        return (
+            f"{key_prefix}:"
+            + hashlib.sha256(
+                json.dumps(
+                    {
+                        "uid": datasource.uid,
+                        "col": column_name,
+                        "rls": security_manager.get_rls_cache_key(datasource),
+                        "changed_on": str(getattr(datasource, "changed_on", "")),
+                        **shape,
+                    },
+                    sort_keys=True,
+                    default=json.json_iso_dttm_ser,
+                ).encode()
+            ).hexdigest()
+        )
+
     @expose(
         "/<datasource_type>/<int:datasource_id>/validate_expression/",
         methods=("POST",),
@@ -808,7 +808,8 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
 
         # Store the code_verifier server-side in the KV store, keyed by tab_id.
         # This avoids exposing it in the URL/browser history via the JWT state.
-        KeyValueDAO.delete_expired_entries(KeyValueResource.PKCE_CODE_VERIFIER)
+        # The key is a fresh UUID, so no expired entry can be in its way; expired
+        # verifiers are removed by the scheduled `prune_key_value` task.
         KeyValueDAO.create_entry(
             resource=KeyValueResource.PKCE_CODE_VERIFIER,
             value={"code_verifier": code_verifier},
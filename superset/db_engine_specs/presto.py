@@ -59,6 +59,7 @@ from superset.models.sql_types.presto_sql_types import (
     TinyInteger,
 )
 from superset.result_set import destringify
+from superset.sqllab.query_progress import PollBackoff, ProgressReporter
 from superset.superset_typing import ResultSetColumnType
 from superset.utils import core as utils, json
 from superset.utils.core import GenericDataType
@@ -1400,8 +1401,17 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
             db.session.commit()
 
         query_id = query.id
-        poll_interval = query.database.connect_args.get(
-            "poll_interval", app.config["PRESTO_POLL_INTERVAL"]
+        backoff = PollBackoff(
+            interval=query.database.connect_args.get(
+                "poll_interval", app.config["PRESTO_POLL_INTERVAL"]
+            ),
+            max_interval=app.config["DB_POLL_MAX_INTERVAL_SECONDS"],
+            age_ratio=app.config["DB_POLL_BACKOFF_AGE_RATIO"],
+            started=float(query.start_time) / 1000 if query.start_time else None,
+        )
+        reporter = ProgressReporter(
+            query,
+            commit_interval=app.config["GLOBAL_ASYNC_QUERIES_PROGRESS_COMMIT_INTERVAL"],
         )
         logger.info("Query %i: Polling the cursor for progress", query_id)
         polled = cursor.poll()
@@ -1435,9 +1445,9 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
                         completed_splits,
                         total_splits,
                     )
-                    query.progress = max(query.progress, progress)
-                    db.session.commit()
-            time.sleep(poll_interval)
+                    if reporter.update(max(reporter.progress, progress)):
+                        db.session.commit()
+            time.sleep(backoff.next_interval())
             logger.info("Query %i: Polling the cursor for progress", query_id)
             polled = cursor.poll()
 
@@ -48,6 +48,7 @@ from superset.db_engine_specs.exceptions import (
 from superset.db_engine_specs.presto import PrestoBaseEngineSpec
 from superset.models.sql_lab import Query
 from superset.sql.parse import Table
+from superset.sqllab.query_progress import PollBackoff, ProgressReporter
 from superset.superset_typing import ResultSetColumnType
 from superset.utils import json
 from superset.utils.core import create_ssl_cert_file, get_user_agent, QuerySource
@@ -337,7 +338,18 @@ class TrinoEngineSpec(PrestoBaseEngineSpec):
         terminal_states = {"FINISHED", "FAILED", "CANCELED"}
         state = "QUEUED"
         progress = 0.0
-        poll_interval = app.config["DB_POLL_INTERVAL_SECONDS"].get(cls.engine, 1)
+        backoff = PollBackoff(
+            interval=app.config["DB_POLL_INTERVAL_SECONDS"].get(cls.engine, 1),
+            max_interval=app.config.get("DB_POLL_MAX_INTERVAL_SECONDS", 10),
+            age_ratio=app.config.get("DB_POLL_BACKOFF_AGE_RATIO", 0.1),
+            started=float(query.start_time) / 1000 if query.start_time else None,
+        )
+        reporter = ProgressReporter(
+            query,
+            commit_interval=app.config.get(
+                "GLOBAL_ASYNC_QUERIES_PROGRESS_COMMIT_INTERVAL", 0
+            ),
+        )
         max_wait_time = app.config.get("SQLLAB_ASYNC_TIME_LIMIT_SEC", 21600)
         start_time = time.time()
         while state not in terminal_states:
@@ -365,7 +377,6 @@ class TrinoEngineSpec(PrestoBaseEngineSpec):
                 )
                 break
 
-            needs_commit = False
             info = getattr(cursor, "stats", {}) or {}
             state = info.get("state", "UNKNOWN")
             completed_splits = float(info.get("completedSplits", 0))
@@ -376,17 +387,15 @@ class TrinoEngineSpec(PrestoBaseEngineSpec):
                 "QUEUED": __("Queued"),
             }.get(state, state)
 
-            if progress != query.progress:
-                query.progress = progress
-                needs_commit = True
-            if progress_text != query.extra.get("progress_text"):
-                query.set_extra_json_key(key="progress_text", value=progress_text)
-                needs_commit = True
-
-            if needs_commit:
+            if reporter.update(progress, progress_text):
                 db.session.commit()  # pylint: disable=consider-using-transaction
 
-            time.sleep(poll_interval)
+            # wake up as soon as the execute thread is done rather than at the end
+            # of an interval that grows with the age of the query
+            if execute_event is not None:
+                execute_event.wait(backoff.next_interval())
+            else:
+                time.sleep(backoff.next_interval())
 
     @classmethod
     def execute_with_cursor(
@@ -17,18 +17,59 @@
 
 from __future__ import annotations
 
+import logging
+import threading
 import uuid
 from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
 
+from flask import current_app
+
 from superset.distributed_lock.utils import get_key
 
+logger = logging.getLogger(__name__)
+
+
+def _heartbeat(
+    app: Any,
+    namespace: str,
+    params: dict[str, Any],
+    token: str,
+    ttl_seconds: int,
+    stop_event: threading.Event,
+) -> None:
+    """Renew the lock every third of its TTL until ``stop_event`` is set."""
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.distributed_lock.renew import RenewDistributedLock
+
+    with app.app_context():
+        while not stop_event.wait(ttl_seconds / 3):
+            try:
+                renewed = RenewDistributedLock(
+                    namespace, params, token, ttl_seconds
+                ).run()
+            except Exception:  # pylint: disable=broad-except
+                # A transient backend error; the next beat retries before the
+                # remaining two thirds of the TTL run out.
+                logger.warning(
+                    "Failed to renew distributed lock %s", namespace, exc_info=True
+                )
+                continue
+            if not renewed:
+                logger.error(
+                    "Distributed lock %s expired while held, stopping renewal",
+                    namespace,
+                )
+                return
+
 
 @contextmanager
 def DistributedLock(  # noqa: N802
     namespace: str,
     ttl_seconds: int | None = None,
+    wait_timeout: float | None = None,
+    heartbeat: bool = False,
     **kwargs: Any,
 ) -> Iterator[uuid.UUID]:
     """
@@ -38,12 +79,21 @@ def DistributedLock(  # noqa: N802
     configured, falling back to database-backed locking otherwise.
 
     Redis locking uses SET NX EX for atomic acquisition with automatic expiration.
-    Database locking uses the KeyValue table with manual expiration cleanup.
+    Database locking uses the KeyValue table with expiration-aware takeover.
+
+    Each acquisition is tagged with an owner token, so renewal and release only
+    ever affect this holder's lock, never one taken by another process after
+    this one's TTL lapsed.
 
     :param namespace: Lock namespace for grouping related locks
     :param ttl_seconds: Lock TTL in seconds. Defaults to 30 seconds.
                         After expiration, the lock is automatically released
                         to prevent deadlocks from crashed processes.
+    :param wait_timeout: Seconds to wait for a held lock to be released before
+                         giving up. Defaults to failing immediately.
+    :param heartbeat: Renew the lock every third of its TTL from a background
+                      thread while the block runs, so long operations can use
+                      a short TTL.
     :param kwargs: Additional key parameters to differentiate locks
     :yields: UUID identifying this lock acquisition
     :raises LockAlreadyHeldException: If the lock is already held by another process
@@ -57,8 +107,35 @@ def DistributedLock(  # noqa: N802
 
     key = get_key(namespace, **kwargs)
 
-    AcquireDistributedLock(namespace, kwargs, ttl_seconds).run()
+    lock = AcquireDistributedLock(
+        namespace,
+        kwargs,
+        ttl_seconds,
+        wait_timeout=wait_timeout,
+    )
+    lock.run()
+
+    stop_event = threading.Event()
+    heartbeat_thread: threading.Thread | None = None
+    if heartbeat:
+        heartbeat_thread = threading.Thread(
+            target=_heartbeat,
+            args=(
+                current_app._get_current_object(),  # pylint: disable=protected-access
+                namespace,
+                kwargs,
+                lock.token,
+                lock.ttl_seconds,
+                stop_event,
+            ),
+            daemon=True,
+            name=f"distributed-lock-heartbeat-{key}",
+        )
+        heartbeat_thread.start()
     try:
         yield key
     finally:
-        ReleaseDistributedLock(namespace, kwargs).run()
+        stop_event.set()
+        if heartbeat_thread is not None:
+            heartbeat_thread.join()
+        ReleaseDistributedLock(namespace, kwargs, token=lock.token).run()
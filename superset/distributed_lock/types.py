@@ -16,6 +16,10 @@
 # under the License.
 from typing import TypedDict
 
+from typing_extensions import NotRequired
+
 
 class LockValue(TypedDict):
     value: bool
+    # Token of the acquisition holding the lock; absent on legacy entries.
+    owner: NotRequired[str]
@@ -96,14 +96,27 @@ class SupersetMetastoreCache(BaseCache):
         from superset.daos.key_value import KeyValueDAO
 
         try:
-            KeyValueDAO.delete_expired_entries(RESOURCE)
-            KeyValueDAO.create_entry(
-                resource=RESOURCE,
-                value=value,
-                codec=self.codec,
-                key=self.get_key(key),
-                expires_on=self._get_expiry(timeout),
-            )
+            entry_key = self.get_key(key)
+            expires_on = self._get_expiry(timeout)
+            # Only this key's row is looked at: an expired entry is taken over in
+            # place, and other expired rows are left to the `prune_key_value` task.
+            if entry := KeyValueDAO.get_entry(RESOURCE, entry_key):
+                if not entry.is_expired() or not KeyValueDAO.take_over_expired_entry(
+                    entry,
+                    value=value,
+                    codec=self.codec,
+                    expires_on=expires_on,
+                ):
+                    db.session.rollback()  # pylint: disable=consider-using-transaction
+                    return False
+            else:
+                KeyValueDAO.create_entry(
+                    resource=RESOURCE,
+                    value=value,
+                    codec=self.codec,
+                    key=entry_key,
+                    expires_on=expires_on,
+                )
             db.session.commit()  # pylint: disable=consider-using-transaction
             return True
         except (SQLAlchemyError, KeyValueCreateFailedError):
@@ -15,10 +15,9 @@
 # specific language governing permissions and limitations
 # under the License.
 from datetime import datetime
-from io import BytesIO
 from zipfile import is_zipfile, ZipFile
 
-from flask import request, Response, send_file
+from flask import request, Response, stream_with_context
 from flask_appbuilder.api import expose, protect
 
 from superset.commands.export.assets import ExportAssetsCommand
@@ -30,7 +29,7 @@ from superset.commands.importers.v1.assets import ImportAssetsCommand
 from superset.commands.importers.v1.utils import get_contents_from_bundle
 from superset.extensions import event_logger
 from superset.utils import json
-from superset.utils.core import parse_boolean_string
+from superset.utils.core import parse_boolean_string, stream_zip
 from superset.views.base_api import BaseSupersetApi, requires_form_data, statsd_metrics
 
 
@@ -57,7 +56,17 @@ class ImportExportRestApi(BaseSupersetApi):
           summary: Export all assets
           description: >-
             Gets a ZIP file with all the Superset assets (databases, datasets, charts,
-            dashboards, saved queries) as YAML files.
+            dashboards, saved queries) as YAML files. The file is streamed while the
+            assets are exported.
+          parameters:
+          - in: query
+            name: changed_since
+            description: >-
+              Only export the assets changed at or after this ISO 8601 timestamp,
+              for incremental backups on top of a previous full export
+            schema:
+              type: string
+              format: date-time
           responses:
             200:
               description: ZIP file
@@ -66,6 +75,8 @@ class ImportExportRestApi(BaseSupersetApi):
                   schema:
                     type: string
                     format: binary
+            400:
+              $ref: '#/components/responses/400'
             401:
               $ref: '#/components/responses/401'
             404:
@@ -73,24 +84,31 @@ class ImportExportRestApi(BaseSupersetApi):
             500:
               $ref: '#/components/responses/500'
         """
+        changed_since = None
+        if value := request.args.get("changed_since"):
+            try:
+                changed_since = datetime.fromisoformat(value)
+            except ValueError:
+                return self.response_400(
+                    message=f"Invalid changed_since timestamp: {value}"
+                )
+
         timestamp = datetime.now().strftime("%Y%m%dT%H%M%S")
         root = f"assets_export_{timestamp}"
         filename = f"{root}.zip"
 
-        buf = BytesIO()
-        with ZipFile(buf, "w") as bundle:
-            for file_name, file_content in ExportAssetsCommand().run():
-                with bundle.open(f"{root}/{file_name}", "w") as fp:
-                    fp.write(file_content().encode())
-        buf.seek(0)
-
-        response = send_file(
-            buf,
+        files = (
+            (f"{root}/{file_name}", file_content)
+            for file_name, file_content in ExportAssetsCommand(
+                changed_since=changed_since
+            ).run()
+        )
+        return Response(
+            stream_with_context(stream_zip(files)),
             mimetype="application/zip",
-            as_attachment=True,
-            download_name=filename,
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+            direct_passthrough=True,
         )
-        return response
 
     @expose("/import/", methods=("POST",))
     @protect()
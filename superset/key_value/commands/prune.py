@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import defaultdict
 from datetime import datetime
 
 import sqlalchemy as sa
@@ -40,7 +41,9 @@ class KeyValuePruneCommand(BaseCommand):
     Unlike cache backends that evict on read, the metastore does not remove rows
     on its own, so expired entries remain in the table until something deletes
     them. This command performs that housekeeping by deleting every entry whose
-    `expires_on` is in the past, freeing up space in the table.
+    `expires_on` is in the past, in batches, freeing up space in the table. Readers
+    already ignore expired entries, so how promptly they are deleted only affects
+    the size of the table.
 
     Attributes:
         max_rows_per_run (int | None): The maximum number of rows to delete in a
@@ -58,12 +61,14 @@ class KeyValuePruneCommand(BaseCommand):
         """
         self.max_rows_per_run = max_rows_per_run
 
-    def run(self) -> None:
+    def run(self) -> dict[str, int]:
         """
         Executes the prune command
+
+        :returns: The number of expired entries deleted, per resource
         """
         batch_size = 999  # SQLite has a IN clause limit of 999
-        total_deleted = 0
+        deleted: dict[str, int] = defaultdict(int)
         start_time = time.time()
 
         # Capture a single cutoff timestamp and reuse it for both the selection
@@ -74,70 +79,76 @@ class KeyValuePruneCommand(BaseCommand):
         # and deletion is not removed.
         cutoff = datetime.now()
 
-        # Select all IDs whose expiry has already passed. Entries without an
-        # expiry (expires_on IS NULL) never expire and are left untouched. The
-        # `<=` comparison matches KeyValueEntry.is_expired() and
-        # KeyValueDAO.delete_expired_entries() so all expiry checks agree.
-        select_stmt = sa.select(KeyValueEntry.id).where(
+        # Entries without an expiry (expires_on IS NULL) never expire and are
+        # left untouched. The `<=` comparison matches KeyValueEntry.is_expired()
+        # and KeyValueDAO.delete_expired_entries() so all expiry checks agree.
+        is_expired = sa.and_(
             KeyValueEntry.expires_on.isnot(None),
             KeyValueEntry.expires_on <= cutoff,
         )
 
         # Optionally limited by max_rows_per_run
-        # order by oldest first for deterministic deletion
-        if self.max_rows_per_run is not None and self.max_rows_per_run > 0:
-            select_stmt = select_stmt.order_by(KeyValueEntry.id.asc()).limit(
-                self.max_rows_per_run
-            )
-
-        ids_to_delete = db.session.execute(select_stmt).scalars().all()
-
-        total_rows = len(ids_to_delete)
-
-        logger.info("Total rows to be deleted: %s", f"{total_rows:,}")
-
-        next_logging_threshold = 1
-
-        # Iterate over the IDs in batches
-        for i in range(0, total_rows, batch_size):
-            batch_ids = ids_to_delete[i : i + batch_size]
+        remaining = (
+            self.max_rows_per_run
+            if self.max_rows_per_run is not None and self.max_rows_per_run > 0
+            else None
+        )
 
-            # Delete the selected batch using IN clause. The expiry predicate is
-            # re-applied here (against the same cutoff captured before selection)
-            # so an entry refreshed between selection and deletion is left intact.
-            result = db.session.execute(
-                sa.delete(KeyValueEntry).where(
-                    KeyValueEntry.id.in_(batch_ids),
-                    KeyValueEntry.expires_on.isnot(None),
-                    KeyValueEntry.expires_on <= cutoff,
+        # Select and delete one batch at a time, oldest first by id, so that no
+        # run holds more than a batch of ids in memory or locks for long.
+        last_id = 0
+        while remaining is None or remaining > 0:
+            limit = batch_size if remaining is None else min(batch_size, remaining)
+            rows = db.session.execute(
+                sa.select(KeyValueEntry.id, KeyValueEntry.resource)
+                .where(is_expired, KeyValueEntry.id > last_id)
+                .order_by(KeyValueEntry.id.asc())
+                .limit(limit)
+            ).all()
+            if not rows:
+                break
+
+            ids_by_resource: dict[str, list[int]] = defaultdict(list)
+            for row in rows:
+                ids_by_resource[row.resource].append(row.id)
+
+            # The expiry predicate is re-applied on delete (against the same
+            # cutoff captured before selection) so an entry refreshed between
+            # selection and deletion is left intact.
+            for resource, ids in ids_by_resource.items():
+                result = db.session.execute(
+                    sa.delete(KeyValueEntry).where(
+                        KeyValueEntry.id.in_(ids),
+                        is_expired,
+                    )
                 )
-            )
-
-            # Update the total number of deleted records
-            total_deleted += result.rowcount
+                deleted[resource] += result.rowcount
 
             # Explicitly commit the transaction so that, if an error occurs, the
             # records deleted so far are committed
             db.session.commit()
 
-            # Log the number of deleted records every 1% increase in progress
-            percentage_complete = (total_deleted / total_rows) * 100
-            if percentage_complete >= next_logging_threshold:
-                logger.info(
-                    "Deleted %s expired rows from the key-value store (%d%% complete)",
-                    f"{total_deleted:,}",
-                    percentage_complete,
-                )
-                next_logging_threshold += 1
+            logger.debug(
+                "Deleted %s expired rows from the key-value store so far",
+                f"{sum(deleted.values()):,}",
+            )
+            last_id = rows[-1].id
+            if remaining is not None:
+                remaining -= len(rows)
 
         elapsed_time = time.time() - start_time
         minutes, seconds = divmod(elapsed_time, 60)
         formatted_time = f"{int(minutes):02}:{int(seconds):02}"
         logger.info(
-            "Pruning complete: %s expired rows deleted in %s",
-            f"{total_deleted:,}",
+            "Pruning complete: %s expired rows deleted in %s (%s)",
+            f"{sum(deleted.values()):,}",
             formatted_time,
+            ", ".join(
+                f"{resource}: {count:,}" for resource, count in sorted(deleted.items())
+            )
+            or "none",
         )
+        return dict(deleted)
 
     def validate(self) -> None:
         pass
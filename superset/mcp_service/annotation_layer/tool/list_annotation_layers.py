@@ -101,6 +101,7 @@ async def list_annotation_layers(
                 order_column=request.order_column,
                 order_direction=request.order_direction,
                 page=max(request.page - 1, 0),
+                cursor=request.cursor,
                 page_size=request.page_size,
             )
 
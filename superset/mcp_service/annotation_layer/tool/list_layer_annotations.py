@@ -121,6 +121,7 @@ async def list_layer_annotations(
                 order_column=request.order_column,
                 order_direction=request.order_direction,
                 page=max(request.page - 1, 0),
+                cursor=request.cursor,
                 page_size=request.page_size,
             )
 
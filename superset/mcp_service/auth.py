@@ -64,6 +64,10 @@ from superset.mcp_service.mcp_config import (
     MCP_GUEST_ALLOWED_TOOLS,
     validate_multi_issuer_user_resolver,
 )
+from superset.mcp_service.principal_cache import (
+    install_invalidation_listeners,
+    principal_cache,
+)
 from superset.mcp_service.session_scope import _mcp_session_token
 from superset.mcp_service.utils.error_sanitization import (
     sanitize_for_log as _sanitize_for_log,
@@ -103,6 +107,9 @@ MCPUser: TypeAlias = User | GuestUser
 PERMISSION_PREFIX = "can_"
 CLASS_PERMISSION_ATTR = "_class_permission_name"
 METHOD_PERMISSION_ATTR = "_method_permission_name"
+# Set by mcp_auth_hook on wrappers of sync tools: the async variant that runs
+# the tool on the MCP tool executor, which is what gets registered with FastMCP.
+MCP_ASYNC_VARIANT_ATTR = "_mcp_async_variant"
 
 # Tools already warned about for declaring no class_permission_name, so the
 # warning surfaces once per tool instead of on every protected-tool call.
@@ -548,13 +555,39 @@ def load_user_with_relationships(
     errors when the SQLAlchemy session is closed or rolled back after the
     lookup — as happens in MCP tool-execution contexts.
 
+    Users are served from the per-process principal cache for
+    ``MCP_PRINCIPAL_CACHE_TTL`` seconds (see ``principal_cache.py``).
+
     Raises:
         ValueError: If neither username nor email is provided
     """
     if not username and not email:
         raise ValueError("Either username or email must be provided")
 
-    return security_manager.find_user_with_relationships(username=username, email=email)
+    def _load() -> User | None:
+        return security_manager.find_user_with_relationships(
+            username=username, email=email
+        )
+
+    ttl = (
+        current_app.config.get("MCP_PRINCIPAL_CACHE_TTL", 0) if has_app_context() else 0
+    )
+    if not ttl:
+        return _load()
+
+    install_invalidation_listeners(
+        *(
+            model
+            for model in (
+                security_manager.user_model,
+                security_manager.role_model,
+                getattr(security_manager, "group_model", None),
+            )
+            if model is not None
+        )
+    )
+    key = ("username", username) if username else ("email", cast(str, email))
+    return principal_cache.get_or_load(key, ttl, _load)
 
 
 def _resolve_user_from_jwt_context(app: Any) -> MCPUser | None:  # noqa: C901
@@ -1175,7 +1208,10 @@ def mcp_auth_hook(tool_func: F) -> F:  # noqa: C901
     If present, check_tool_permission() verifies the user has the required
     FAB permission before the tool function runs.
 
-    Supports both sync and async tool functions.
+    Supports both sync and async tool functions. The wrapper of a sync tool
+    stays synchronous and carries an async variant (``MCP_ASYNC_VARIANT_ATTR``)
+    that runs it on the bounded MCP tool executor; the tool decorator registers
+    that variant with FastMCP.
     """
     import functools
     import inspect
@@ -1289,55 +1325,75 @@ def mcp_auth_hook(tool_func: F) -> F:  # noqa: C901
 
         wrapper = sync_wrapper
 
-    # Merge original function's __globals__ into wrapper's __globals__
-    # This allows get_type_hints() to resolve type annotations from the
-    # original module (e.g., Context from fastmcp)
-    # FastMCP 2.13.2+ uses get_type_hints() which needs access to these types
-    merged_globals = {**wrapper.__globals__, **tool_func.__globals__}  # type: ignore[attr-defined]
-    new_wrapper = types.FunctionType(
-        wrapper.__code__,  # type: ignore[attr-defined]
-        merged_globals,
-        wrapper.__name__,
-        wrapper.__defaults__,  # type: ignore[attr-defined]
-        wrapper.__closure__,  # type: ignore[attr-defined]
-    )
-    # Copy __dict__ but exclude __wrapped__
-    # NOTE: We intentionally do NOT preserve __wrapped__ here.
-    # Setting __wrapped__ causes inspect.signature() to follow the chain
-    # and find 'ctx' in the original function's signature, even after
-    # FastMCP's create_function_without_params removes it from annotations.
-    # This breaks Pydantic's TypeAdapter which expects signature params
-    # to match type_hints.
-    new_wrapper.__dict__.update(
-        {k: v for k, v in wrapper.__dict__.items() if k != "__wrapped__"}
-    )
-    new_wrapper.__module__ = wrapper.__module__
-    new_wrapper.__qualname__ = wrapper.__qualname__
-    new_wrapper.__annotations__ = wrapper.__annotations__
-    # Copy docstring from original function (not wrapper, which may have lost it)
-    new_wrapper.__doc__ = tool_func.__doc__
-
-    # Set __signature__ from the original function, removing ctx parameter
-    # since FastMCP tools don't expose it to clients.
-    new_params = []
-    for _name, param in _tool_sig.parameters.items():
-        # Skip ctx parameter - FastMCP tools don't expose it to clients
-        if param.annotation is FMContext or (
-            hasattr(param.annotation, "__name__")
-            and param.annotation.__name__ == "Context"
-        ):
-            continue
-        new_params.append(param)
-    new_wrapper.__signature__ = _tool_sig.replace(  # type: ignore[attr-defined]
-        parameters=new_params
-    )
+    def _finalize(wrapper: Callable[..., Any]) -> Callable[..., Any]:
+        """Give ``wrapper`` the tool's globals, signature and docstring."""
+        # Merge original function's __globals__ into wrapper's __globals__
+        # This allows get_type_hints() to resolve type annotations from the
+        # original module (e.g., Context from fastmcp)
+        # FastMCP 2.13.2+ uses get_type_hints() which needs access to these types
+        merged_globals = {**wrapper.__globals__, **tool_func.__globals__}
+        new_wrapper = types.FunctionType(
+            wrapper.__code__,
+            merged_globals,
+            wrapper.__name__,
+            wrapper.__defaults__,
+            wrapper.__closure__,
+        )
+        # Copy __dict__ but exclude __wrapped__
+        # NOTE: We intentionally do NOT preserve __wrapped__ here.
+        # Setting __wrapped__ causes inspect.signature() to follow the chain
+        # and find 'ctx' in the original function's signature, even after
+        # FastMCP's create_function_without_params removes it from annotations.
+        # This breaks Pydantic's TypeAdapter which expects signature params
+        # to match type_hints.
+        new_wrapper.__dict__.update(
+            {k: v for k, v in wrapper.__dict__.items() if k != "__wrapped__"}
+        )
+        new_wrapper.__module__ = wrapper.__module__
+        new_wrapper.__qualname__ = wrapper.__qualname__
+        new_wrapper.__annotations__ = wrapper.__annotations__
+        # Copy docstring from original function (not wrapper, which may have lost it)
+        new_wrapper.__doc__ = tool_func.__doc__
+
+        # Set __signature__ from the original function, removing ctx parameter
+        # since FastMCP tools don't expose it to clients.
+        new_params = []
+        for _name, param in _tool_sig.parameters.items():
+            # Skip ctx parameter - FastMCP tools don't expose it to clients
+            if param.annotation is FMContext or (
+                hasattr(param.annotation, "__name__")
+                and param.annotation.__name__ == "Context"
+            ):
+                continue
+            new_params.append(param)
+        new_wrapper.__signature__ = _tool_sig.replace(  # type: ignore[attr-defined]
+            parameters=new_params
+        )
+
+        # Also remove ctx from annotations to match signature
+        if "ctx" in new_wrapper.__annotations__:
+            del new_wrapper.__annotations__["ctx"]
+
+        # Mark this wrapper as protected so a startup assertion can verify every
+        # registered tool went through mcp_auth_hook (see issue #39395).
+        new_wrapper._mcp_auth_protected = True  # type: ignore[attr-defined]
+        return new_wrapper
 
-    # Also remove ctx from annotations to match signature
-    if "ctx" in new_wrapper.__annotations__:
-        del new_wrapper.__annotations__["ctx"]
+    new_wrapper = _finalize(wrapper)
+
+    if not is_async:
+        # FastMCP registers the async variant so the sync body runs on the
+        # bounded MCP tool executor; the sync wrapper stays directly callable.
+        sync_tool = new_wrapper
+
+        @functools.wraps(tool_func)
+        async def pooled_wrapper(*args: Any, **kwargs: Any) -> Any:
+            from superset.mcp_service.tool_executor import run_in_tool_executor
+
+            return await run_in_tool_executor(
+                tool_func.__name__, sync_tool, *args, **kwargs
+            )
 
-    # Mark this wrapper as protected so a startup assertion can verify every
-    # registered tool went through mcp_auth_hook (see issue #39395).
-    new_wrapper._mcp_auth_protected = True  # type: ignore[attr-defined]
+        setattr(new_wrapper, MCP_ASYNC_VARIANT_ATTR, _finalize(pooled_wrapper))
 
     return new_wrapper  # type: ignore[return-value]
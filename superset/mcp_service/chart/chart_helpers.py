@@ -760,12 +760,11 @@ def build_applied_dashboard_filters(
     from superset.charts.data.dashboard_filter_context import (
         _extract_filter_extra_form_data,
         _get_filter_target_column,
-        _is_filter_in_scope_for_chart,
+        get_filter_scope_index,
     )
     from superset.commands.dashboard.exceptions import DashboardNotFoundError
     from superset.mcp_service.chart.schemas import AppliedDashboardFilter
     from superset.models.dashboard import Dashboard
-    from superset.utils import json
 
     dashboard = db.session.query(Dashboard).filter_by(id=dashboard_id).one_or_none()
     if not dashboard:
@@ -779,23 +778,10 @@ def build_applied_dashboard_filters(
             f"Chart {chart_id} is not on dashboard {dashboard_id}"
         )
 
-    metadata = json.loads(dashboard.json_metadata or "{}")
-    native_filter_config = metadata.get("native_filter_configuration", [])
-    if not isinstance(native_filter_config, list):
-        return []
-    position_json = json.loads(dashboard.position_json or "{}")
-    if not isinstance(position_json, dict):
-        position_json = {}
+    index = get_filter_scope_index(dashboard)
 
     applied: list[AppliedDashboardFilter] = []
-    for flt in native_filter_config:
-        if not isinstance(flt, dict):
-            continue
-        if flt.get("type", "") == "DIVIDER":
-            continue
-        if not _is_filter_in_scope_for_chart(flt, chart_id, position_json):
-            continue
-
+    for flt in index.filters_for_chart(chart_id):
         extra_form_data, status = _extract_filter_extra_form_data(flt)
         column = _get_filter_target_column(flt)
         operator, value = _resolve_filter_operator_and_value(extra_form_data, column)
@@ -53,6 +53,7 @@ from superset.mcp_service.chart.schemas import (
     GetChartDataRequest,
     PerformanceMetadata,
 )
+from superset.mcp_service.tool_executor import run_in_tool_executor
 from superset.mcp_service.utils.cache_utils import get_cache_status_from_result
 from superset.mcp_service.utils.oauth2_utils import (
     build_oauth2_redirect_message,
@@ -683,7 +684,7 @@ async def get_chart_data(  # noqa: C901
             with event_logger.log_context(action="mcp.get_chart_data.query_execution"):
                 command = ChartDataCommand(query_context)
                 command.validate()
-                result = command.run()
+                result = await run_in_tool_executor("get_chart_data", command.run)
 
             # Handle empty query results for certain chart types
             if not result or ("queries" not in result) or len(result["queries"]) == 0:
@@ -1032,7 +1033,7 @@ async def _query_from_form_data(
         with event_logger.log_context(action="mcp.get_chart_data.query_execution"):
             command = ChartDataCommand(query_context)
             command.validate()
-            result = command.run()
+            result = await run_in_tool_executor("get_chart_data", command.run)
 
         if not result or "queries" not in result or len(result["queries"]) == 0:
             logger.warning(
@@ -109,6 +109,15 @@ class PaginatedListRequest(BaseModel, Generic[FilterT]):
             description=f"Number of items per page (max {MAX_PAGE_SIZE})",
         ),
     ]
+    cursor: Annotated[
+        str | None,
+        Field(
+            default=None,
+            description="The next_cursor of the previous response, to get the "
+            "items following it. Faster than 'page' on deep pages, which it "
+            "replaces.",
+        ),
+    ]
 
     @field_validator("filters", mode="before")
     @classmethod
@@ -157,6 +166,10 @@ class PaginatedResponse(BaseModel, Generic[FilterT]):
     total_pages: int
     has_previous: bool
     has_next: bool
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor to pass as 'cursor' to get the next items",
+    )
     columns_requested: List[str] = Field(
         default_factory=list,
         description="Requested columns for the response",
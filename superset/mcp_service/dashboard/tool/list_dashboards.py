@@ -165,6 +165,7 @@ async def list_dashboards(
             order_column=request.order_column,
             order_direction=request.order_direction,
             page=max(request.page - 1, 0),
+            cursor=request.cursor,
             page_size=request.page_size,
             created_by_me=request.created_by_me,
             edited_by_me=request.edited_by_me,
@@ -153,6 +153,7 @@ async def list_databases(
                 order_column=request.order_column,
                 order_direction=request.order_direction,
                 page=max(request.page - 1, 0),
+                cursor=request.cursor,
                 page_size=request.page_size,
                 created_by_me=request.created_by_me,
             )
@@ -88,6 +88,45 @@ MCP_STATELESS_HTTP = True
 # against the FAB security_manager before execution.
 MCP_RBAC_ENABLED = True
 
+# MCP principal cache - seconds a user resolved for a tool call (by JWT
+# username/email, API key or MCP_DEV_USERNAME) is reused by later calls in the
+# same process, instead of reloading the user, roles and groups on every call.
+# Changes to users, roles and groups made through this process's ORM clear the
+# cache immediately; changes made elsewhere (the web app, other MCP workers)
+# take effect once the entry expires, including deactivated accounts. Set to
+# 0 to disable.
+MCP_PRINCIPAL_CACHE_TTL = 30
+
+# MCP instance info cache - seconds the metrics computed by get_instance_info
+# are reused for the same user in this process. Agents call the tool at the
+# start of almost every session, and the counts run over every chart,
+# dashboard and dataset the user can see. Set to 0 to disable.
+MCP_INSTANCE_INFO_CACHE_TTL = 60
+
+# MCP tool executor - bounded thread pool for blocking tool work, so a slow
+# query in one tool call does not stall the event loop shared by every
+# connected client. Synchronous tools always run on it; async tools use it
+# around their blocking sections (e.g. running a ChartDataCommand).
+#
+# - max_workers: threads running tool work in this process.
+# - tool_concurrency: per-tool caps on concurrent calls, by tool name.
+# - default_tool_concurrency: cap for tools not in tool_concurrency
+#   (None: bounded only by max_workers).
+#
+# Queue depth and active workers are emitted as mcp.tool_executor.* gauges.
+#
+# Example:
+#   MCP_TOOL_EXECUTOR_CONFIG = {
+#       "max_workers": 32,
+#       "tool_concurrency": {"get_chart_data": 8, "execute_sql": 4},
+#       "default_tool_concurrency": 16,
+#   }
+MCP_TOOL_EXECUTOR_CONFIG: dict[str, Any] = {
+    "max_workers": 16,
+    "tool_concurrency": {},
+    "default_tool_concurrency": None,
+}
+
 # MCP Disabled Tools - a set of tool names to remove from the MCP server at
 # startup. Disabled tools are silently omitted from tool discovery, so AI
 # clients never see them. Use this when a Superset-provided tool conflicts with
@@ -792,6 +831,9 @@ def get_mcp_config(app_config: dict[str, Any] | None = None) -> dict[str, Any]:
         "MCP_EMBEDDED_GUEST_AUTH_ENABLED": MCP_EMBEDDED_GUEST_AUTH_ENABLED,
         "MCP_GUEST_ALLOWED_TOOLS": set(MCP_GUEST_ALLOWED_TOOLS),
         "MCP_RESTRICTED_TOOL_POLICY": MCP_RESTRICTED_TOOL_POLICY,
+        "MCP_PRINCIPAL_CACHE_TTL": MCP_PRINCIPAL_CACHE_TTL,
+        "MCP_INSTANCE_INFO_CACHE_TTL": MCP_INSTANCE_INFO_CACHE_TTL,
+        "MCP_TOOL_EXECUTOR_CONFIG": MCP_TOOL_EXECUTOR_CONFIG,
         **MCP_SESSION_CONFIG,
         **MCP_CSRF_CONFIG,
     }
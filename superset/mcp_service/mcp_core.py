@@ -19,15 +19,17 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Dict, Generic, List, Literal, Type, TypeVar
 
 from flask_appbuilder.models.sqla.interface import SQLAInterface
 from pydantic import BaseModel
-from sqlalchemy import func
+from sqlalchemy import case, func, inspect
 
-from superset.daos.base import BaseDAO, ColumnOperator, ColumnOperatorEnum
+from superset.daos.base import BaseDAO, ColumnOperator, decode_keyset_cursor
 from superset.extensions import db
 from superset.mcp_service.constants import MAX_PAGE_SIZE, ModelType
 from superset.mcp_service.privacy import (
@@ -317,10 +319,13 @@ class ModelListCore(BaseCore, Generic[L]):
         search: str | None,
         columns_to_load: List[str],
         custom_filters: Dict[str, Any] | None = None,
+        after: tuple[Any, Any] | None = None,
     ) -> tuple[List[Any], int]:
         """Call the DAO list method.
 
         Subclasses may override to change the kwarg name used for filters.
+        The total count may be served from the DAO's short-lived count cache,
+        since paging through a list repeats the same count on every page.
         """
         return self.dao_class.list(
             column_operators=filters,
@@ -332,6 +337,8 @@ class ModelListCore(BaseCore, Generic[L]):
             search_columns=self.search_columns,
             columns=columns_to_load,
             custom_filters=custom_filters,
+            after=after,
+            exact_count=False,
         )
 
     def _build_deleted_state_filter(
@@ -374,9 +381,13 @@ class ModelListCore(BaseCore, Generic[L]):
         edited_by_me: bool = False,
         deleted_state: str | None = None,
         custom_filters: Dict[str, Any] | None = None,
+        cursor: str | None = None,
     ) -> L:
         # Clamp page_size to MAX_PAGE_SIZE as defense-in-depth
         page_size = min(page_size, MAX_PAGE_SIZE)
+        # The next_cursor of a previous page resumes after its last row, in
+        # place of ``page``
+        after = decode_keyset_cursor(cursor) if cursor else None
 
         # Parse filters using generic utility (accepts JSON string or object)
         filters = parse_json_or_passthrough(filters, param_name="filters")
@@ -422,14 +433,16 @@ class ModelListCore(BaseCore, Generic[L]):
 
         # Query the DAO
         items: List[Any]
+        order_column = order_column or "changed_on"
         dao_kwargs = {
             "filters": filters,
-            "order_column": order_column or "changed_on",
+            "order_column": order_column,
             "order_direction": str(order_direction or "desc"),
             "page": page,
             "page_size": page_size,
             "search": search,
             "columns_to_load": columns_to_load,
+            "after": after,
         }
         dao_custom_filters = dict(custom_filters or {})
         if deleted_state_bound is not None:
@@ -456,6 +469,17 @@ class ModelListCore(BaseCore, Generic[L]):
             if obj is not None:
                 item_objs.append(obj)
         total_pages = (total_count + page_size - 1) // page_size if page_size > 0 else 0
+        # A page resumed from a cursor has no page number: a full page may be
+        # followed by more rows
+        has_next = (
+            len(items) == page_size if after is not None else page < total_pages - 1
+        )
+        has_previous = page > 0 or after is not None
+        next_cursor = (
+            self.dao_class.keyset_cursor(items[-1], order_column)
+            if has_next and items
+            else None
+        )
 
         # Report 1-based page in response to match the 1-based input convention
         # used by all list tool wrappers (list_charts, list_datasets, etc.)
@@ -465,8 +489,8 @@ class ModelListCore(BaseCore, Generic[L]):
             page_size=page_size,
             total_count=total_count,
             total_pages=total_pages,
-            has_next=page < total_pages - 1,
-            has_previous=page > 0,
+            has_next=has_next,
+            has_previous=has_previous,
         )
 
         response_kwargs = {
@@ -476,8 +500,9 @@ class ModelListCore(BaseCore, Generic[L]):
             "page": page_1based,
             "page_size": page_size,
             "total_pages": total_pages,
-            "has_previous": page > 0,
-            "has_next": page < total_pages - 1,
+            "has_previous": has_previous,
+            "has_next": has_next,
+            "next_cursor": next_cursor,
             "columns_requested": columns_requested,
             "columns_loaded": columns_to_load,
             "columns_available": self.all_columns,
@@ -729,76 +754,84 @@ class InstanceInfoCore(BaseCore):
             "monthly": 30,
             "quarterly": 90,
         }
+        # Responses by user id, as DAO base filters and feature availability
+        # depend on who is asking: user id -> (expiry, response)
+        self._cache: Dict[int | None, tuple[float, BaseModel]] = {}
+        self._cache_lock = threading.Lock()
 
-    def _calculate_basic_counts(self) -> Dict[str, int]:
-        """Calculate basic entity counts using DAOs."""
-        counts = {}
-        for entity_name, dao_class in self.dao_classes.items():
-            try:
-                counts[f"total_{entity_name}"] = dao_class.count()
-            except Exception as e:
-                self._log_warning(f"Failed to count {entity_name}: {e}")
-                counts[f"total_{entity_name}"] = 0
-        return counts
-
-    def _calculate_time_based_metrics(
-        self, _base_counts: Dict[str, int]
-    ) -> Dict[str, Dict[str, int]]:
-        """Calculate time-based metrics for recent activity."""
-        now = datetime.now(timezone.utc)
-        time_metrics = {}
+    def _calculate_entity_metrics(
+        self,
+    ) -> tuple[Dict[str, int], Dict[str, Dict[str, int]]]:
+        """
+        Calculate entity totals and created/modified counts per time window.
 
-        for window_name, days in self.time_windows.items():
-            cutoff_date = now - timedelta(days=days)
-            window_metrics = {}
+        Each entity takes one aggregate query over its DAO's base-filtered
+        query, with a conditional count per window, instead of a separate
+        count for every window.
 
-            # Calculate created and modified counts for each entity
-            for entity_name, dao_class in self.dao_classes.items():
-                # Skip entities without time tracking
-                if not hasattr(dao_class.model_cls, "created_on"):
-                    continue
+        Returns:
+            Basic counts (``total_<entity>``) and time metrics
+            (``<window>: {<entity>_created, <entity>_modified}``)
+        """
+        now = datetime.now(timezone.utc)
+        base_counts: Dict[str, int] = {}
+        time_metrics: Dict[str, Dict[str, int]] = {
+            window_name: {} for window_name in self.time_windows
+        }
 
-                try:
-                    # Use list() with filters (count() has no params)
-                    _, created_count = dao_class.list(
-                        column_operators=[
-                            ColumnOperator(
-                                col="created_on",
-                                opr=ColumnOperatorEnum.gte,
-                                value=cutoff_date,
-                            )
-                        ],
-                        page_size=1,  # We only need the count
-                        columns=["id"],  # Minimal data transfer
+        for entity_name, dao_class in self.dao_classes.items():
+            model = dao_class.model_cls
+            # Entities without time tracking only get a total
+            tracked = [
+                (suffix, column_name)
+                for suffix, column_name in (
+                    ("created", "created_on"),
+                    ("modified", "changed_on"),
+                )
+                if hasattr(model, column_name)
+            ]
+            labels: list[tuple[str, str]] = []
+            try:
+                # Counting over a subquery matches DAO.count() when the base
+                # filter joins other tables.
+                base = (
+                    dao_class._build_query()
+                    .with_entities(
+                        *[
+                            getattr(model, column_name).label(column_name)
+                            for _, column_name in tracked
+                        ]
+                        # the primary key keeps the model's table in the FROM
+                        or list(inspect(model).primary_key)
                     )
-                    window_metrics[f"{entity_name}_created"] = created_count
-
-                    # Modified count (if changed_on exists)
-                    if hasattr(dao_class.model_cls, "changed_on"):
-                        _, modified_count = dao_class.list(
-                            column_operators=[
-                                ColumnOperator(
-                                    col="changed_on",
-                                    opr=ColumnOperatorEnum.gte,
-                                    value=cutoff_date,
-                                )
-                            ],
-                            page_size=1,  # We only need the count
-                            columns=["id"],  # Minimal data transfer
+                    .subquery()
+                )
+                aggregates = [func.count()]
+                for window_name, days in self.time_windows.items():
+                    cutoff_date = now - timedelta(days=days)
+                    for suffix, column_name in tracked:
+                        aggregates.append(
+                            func.count(case((base.c[column_name] >= cutoff_date, 1)))
                         )
-                        window_metrics[f"{entity_name}_modified"] = modified_count
+                        labels.append((window_name, f"{entity_name}_{suffix}"))
 
-                except Exception as e:
-                    self._log_warning(
-                        f"Failed to calculate {window_name} metrics for "
-                        f"{entity_name}: {e}"
-                    )
-                    window_metrics[f"{entity_name}_created"] = 0
-                    window_metrics[f"{entity_name}_modified"] = 0
-
-            time_metrics[window_name] = window_metrics
+                total, *window_counts = (
+                    db.session.query(*aggregates).select_from(base).one()
+                )
+                base_counts[f"total_{entity_name}"] = total or 0
+                for (window_name, key), count in zip(
+                    labels, window_counts, strict=True
+                ):
+                    time_metrics[window_name][key] = count or 0
+            except Exception as e:
+                self._log_warning(f"Failed to count {entity_name}: {e}")
+                base_counts[f"total_{entity_name}"] = 0
+                if tracked:
+                    for window_name in self.time_windows:
+                        time_metrics[window_name][f"{entity_name}_created"] = 0
+                        time_metrics[window_name][f"{entity_name}_modified"] = 0
 
-        return time_metrics
+        return base_counts, time_metrics
 
     def _calculate_custom_metrics(
         self, base_counts: Dict[str, int], time_metrics: Dict[str, Dict[str, int]]
@@ -833,11 +866,41 @@ class InstanceInfoCore(BaseCore):
         return json.dumps(instance_info.model_dump(), indent=2)
 
     def _generate_instance_info(self) -> BaseModel:
-        """Generate comprehensive instance information."""
+        """
+        Generate comprehensive instance information, reusing the response for
+        the same user for ``MCP_INSTANCE_INFO_CACHE_TTL`` seconds.
+        """
+        from flask import current_app
+
+        from superset.utils.core import get_user_id
+
+        ttl = current_app.config.get("MCP_INSTANCE_INFO_CACHE_TTL", 0)
+        key = get_user_id()
+        if ttl:
+            with self._cache_lock:
+                entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                # Callers decorate the response, so hand out a copy
+                return entry[1].model_copy(deep=True)
+
+        response = self._compute_instance_info()
+        if ttl:
+            with self._cache_lock:
+                now = time.monotonic()
+                self._cache = {
+                    user_id: entry
+                    for user_id, entry in self._cache.items()
+                    if entry[0] > now
+                }
+                self._cache[key] = (now + ttl, response)
+            return response.model_copy(deep=True)
+        return response
+
+    def _compute_instance_info(self) -> BaseModel:
+        """Compute instance information from the metadata database."""
         try:
             # Calculate all metrics
-            base_counts = self._calculate_basic_counts()
-            time_metrics = self._calculate_time_based_metrics(base_counts)
+            base_counts, time_metrics = self._calculate_entity_metrics()
             custom_metrics = self._calculate_custom_metrics(base_counts, time_metrics)
 
             # Combine all data with fallbacks for required fields
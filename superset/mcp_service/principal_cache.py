@@ -0,0 +1,147 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Per-process TTL cache of users resolved for MCP tool calls.
+
+Every tool call resolves its principal, which loads the user with roles and
+group roles eagerly. Agents make many calls in quick succession, so the
+loaded user is kept for ``MCP_PRINCIPAL_CACHE_TTL`` seconds.
+
+Each tool call has its own SQLAlchemy session, so the cache holds a detached
+copy of the user and hands every call ``session.merge(copy, load=False)``: an
+instance bound to the caller's session, built without a query. Inserts,
+updates and deletes of users, roles and groups flushed by this process clear
+the cache.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import pickle
+import threading
+import time
+from typing import Any, Callable, TYPE_CHECKING
+
+from sqlalchemy import event
+from sqlalchemy.orm.state import InstanceState
+
+if TYPE_CHECKING:
+    from flask_appbuilder.security.sqla.models import User
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, str]
+
+
+class _SnapshotPickler(pickle.Pickler):
+    """
+    Pickle ORM instances without the options of the query that loaded them.
+
+    Those options can hold criteria lambdas, such as the soft-delete filter,
+    which cannot be pickled; the copy is merged into a new session and picks
+    up that session's criteria instead.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        if not isinstance(obj, InstanceState):
+            return NotImplemented
+        state = obj.__getstate__()
+        state.pop("load_options", None)
+        return InstanceState.__new__, (InstanceState,), state
+
+
+def _snapshot(user: User) -> bytes:
+    buffer = io.BytesIO()
+    _SnapshotPickler(buffer, pickle.HIGHEST_PROTOCOL).dump(user)
+    return buffer.getvalue()
+
+
+class PrincipalCache:
+    """A thread-safe TTL cache of detached, eagerly loaded users."""
+
+    def __init__(self) -> None:
+        self._entries: dict[CacheKey, tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+        # Bumped on every invalidation, so a load that raced with one is not
+        # stored afterwards.
+        self._generation = 0
+
+    def get_or_load(
+        self,
+        key: CacheKey,
+        ttl: float,
+        load: Callable[[], User | None],
+    ) -> User | None:
+        """
+        Return the cached user for ``key`` bound to the current session, or
+        call ``load`` and cache a non-None result for ``ttl`` seconds.
+        """
+        from superset.extensions import db
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            generation = self._generation
+        if entry is not None and entry[0] > now:
+            return db.session.merge(pickle.loads(entry[1]), load=False)  # noqa: S301
+
+        user = load()
+        if user is None:
+            return None
+        try:
+            # A pickled copy keeps the loaded roles and groups and is detached
+            # from the loading session, which may expire or close it later.
+            snapshot = _snapshot(user)
+        except (pickle.PicklingError, TypeError, AttributeError) as ex:
+            logger.debug("Not caching MCP principal: %s", ex)
+            return user
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (now + ttl, snapshot)
+        return user
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+principal_cache = PrincipalCache()
+
+_listeners_installed = False
+_listeners_lock = threading.Lock()
+
+
+def _invalidate(*args: Any) -> None:
+    principal_cache.clear()
+
+
+def install_invalidation_listeners(*models: type) -> None:
+    """Clear the cache whenever one of ``models`` is inserted, updated or deleted."""
+    global _listeners_installed
+    with _listeners_lock:
+        if _listeners_installed:
+            return
+        for model in models:
+            for identifier in ("after_insert", "after_update", "after_delete"):
+                event.listen(model, identifier, _invalidate)
+        _listeners_installed = True
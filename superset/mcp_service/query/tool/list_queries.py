@@ -120,6 +120,7 @@ async def list_queries(
                 order_column=request.order_column or "changed_on",
                 order_direction=request.order_direction,
                 page=max(request.page - 1, 0),
+                cursor=request.cursor,
                 page_size=request.page_size,
             )
 
@@ -107,6 +107,7 @@ async def list_roles(
                 order_column=request.order_column or "id",
                 order_direction=request.order_direction,
                 page=max(request.page - 1, 0),
+                cursor=request.cursor,
                 page_size=request.page_size,
             )
 
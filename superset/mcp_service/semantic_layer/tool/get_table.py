@@ -44,6 +44,7 @@ from superset.mcp_service.semantic_layer.schemas import (
     GetTableResponse,
     SemanticLayerError,
 )
+from superset.mcp_service.tool_executor import run_in_tool_executor
 from superset.mcp_service.utils.cache_utils import get_cache_status_from_result
 from superset.mcp_service.utils.oauth2_utils import build_oauth2_redirect_message
 from superset.mcp_service.utils.query_utils import validate_names
@@ -357,7 +358,7 @@ async def _run_get_table_query(
         )
         command = ChartDataCommand(query_context)
         command.validate()
-        result = command.run()
+        result = await run_in_tool_executor("get_table", command.run)
 
     query_duration_ms = int((time.time() - start_time) * 1000)
 
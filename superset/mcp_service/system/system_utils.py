@@ -25,6 +25,9 @@ instance metrics, dashboard breakdowns, database breakdowns, and activity summar
 import logging
 from typing import Any, Dict
 
+from sqlalchemy import case, func, literal, select, true
+from sqlalchemy.sql.elements import ColumnElement
+
 from superset.mcp_service.system.schemas import (
     DashboardBreakdown,
     DatabaseBreakdown,
@@ -42,35 +45,44 @@ def calculate_dashboard_breakdown(
     time_metrics: Dict[str, Dict[str, int]],
     dao_classes: Dict[str, Any],
 ) -> DashboardBreakdown:
-    """Calculate detailed dashboard breakdown metrics."""
+    """Calculate detailed dashboard breakdown metrics in one aggregate query."""
     try:
-        from superset.daos.base import ColumnOperator, ColumnOperatorEnum
         from superset.extensions import db
-        from superset.models.dashboard import Dashboard
+        from superset.models.dashboard import Dashboard, dashboard_slices
+        from superset.models.slice import Slice
 
         dashboard_dao = dao_classes["dashboards"]
 
-        # Published vs unpublished
-        published_count = dashboard_dao.count(
-            column_operators=[
-                ColumnOperator(col="published", opr=ColumnOperatorEnum.eq, value=True)
-            ]
+        # Conditional counts over the dashboards the user can see
+        dashboards = (
+            dashboard_dao._build_query()
+            .with_entities(
+                Dashboard.id.label("id"),
+                Dashboard.published.label("published"),
+                Dashboard.certified_by.label("certified_by"),
+            )
+            .subquery()
         )
-        unpublished_count = base_counts.get("total_dashboards", 0) - published_count
-
-        # Certified dashboards
-        certified_count = dashboard_dao.count(
-            column_operators=[
-                ColumnOperator(
-                    col="certified_by", opr=ColumnOperatorEnum.is_not_null, value=None
-                )
-            ]
+        has_charts = (
+            select(Slice.id)
+            .join(dashboard_slices, dashboard_slices.c.slice_id == Slice.id)
+            .where(dashboard_slices.c.dashboard_id == dashboards.c.id)
+            .exists()
+        )
+        published_count, certified_count, dashboards_with_charts = (
+            db.session.query(
+                func.count(case((dashboards.c.published.is_(true()), 1))),
+                func.count(dashboards.c.certified_by),
+                func.count(case((has_charts, 1))),
+            )
+            .select_from(dashboards)
+            .one()
         )
 
+        # Published vs unpublished
+        unpublished_count = base_counts.get("total_dashboards", 0) - published_count
+
         # Dashboards with/without charts
-        dashboards_with_charts = (
-            db.session.query(Dashboard).join(Dashboard.slices).distinct().count()
-        )
         dashboards_without_charts = max(
             0, base_counts.get("total_dashboards", 0) - dashboards_with_charts
         )
@@ -93,29 +105,32 @@ def calculate_dashboard_breakdown(
         )
 
 
+def _uri_scheme(uri: ColumnElement[str]) -> ColumnElement[str]:
+    """SQL expression for the scheme of a SQLAlchemy URI, 'unknown' if absent."""
+    from superset.extensions import db
+
+    if db.session.get_bind().dialect.name == "postgresql":
+        scheme = func.split_part(uri, "://", 1)
+    else:
+        # SQLite and MySQL
+        scheme = func.substr(uri, 1, func.instr(uri, "://") - 1)
+    return case((uri.like("%://%"), scheme), else_=literal("unknown"))
+
+
 def calculate_database_breakdown(
     base_counts: Dict[str, int],
     time_metrics: Dict[str, Dict[str, int]],
     dao_classes: Dict[str, Any],
 ) -> DatabaseBreakdown:
-    """Calculate database type breakdown."""
+    """Calculate database type breakdown, grouped by URI scheme in SQL."""
     try:
         from superset.extensions import db
         from superset.models.core import Database
 
-        # Get database types distribution
-        db_types = db.session.query(
-            Database.database_name, Database.sqlalchemy_uri
-        ).all()
-
-        type_counts: Dict[str, int] = {}
-        for _name, uri in db_types:
-            if uri:
-                # Extract database type from SQLAlchemy URI
-                db_type = uri.split("://")[0] if "://" in uri else "unknown"
-                type_counts[db_type] = type_counts.get(db_type, 0) + 1
-            else:
-                type_counts["unknown"] = type_counts.get("unknown", 0) + 1
+        db_type = _uri_scheme(Database.sqlalchemy_uri).label("db_type")
+        type_counts: Dict[str, int] = dict(
+            db.session.query(db_type, func.count()).group_by(db_type).all()
+        )
 
         return DatabaseBreakdown(by_type=type_counts)
     except Exception:
@@ -0,0 +1,236 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Bounded worker pool for blocking MCP tool work.
+
+Every MCP tool call shares one event loop, so blocking work done on it (a
+synchronous tool body, or a ``ChartDataCommand`` run from an async tool)
+stalls every other connected client. ``run_in_tool_executor`` moves that work
+onto a dedicated thread pool sized by ``MCP_TOOL_EXECUTOR_CONFIG``:
+
+- ``max_workers`` bounds the threads running tool work in this process;
+- ``tool_concurrency`` caps how many calls of one tool run at once, so a burst
+  of slow queries from one tool cannot take every worker, with
+  ``default_tool_concurrency`` applying to tools not listed there;
+- queue depth and active workers are reported as ``mcp.tool_executor.*``
+  gauges, overall and per tool.
+
+The caller's context variables (the Flask app context, the per-call session
+token, FastMCP's request context) are copied into the worker thread, so the
+work sees the same user and SQLAlchemy session as the calling tool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+import weakref
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from flask import current_app, has_app_context
+
+from superset.extensions import stats_logger_manager
+from superset.mcp_service.mcp_config import MCP_TOOL_EXECUTOR_CONFIG
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Ticket:  # pylint: disable=too-few-public-methods
+    """Tracks whether a submitted call is still counted as queued."""
+
+    __slots__ = ("queued",)
+
+    def __init__(self) -> None:
+        self.queued = True
+
+    def leave_queue(self, lock: threading.Lock) -> bool:
+        """Mark the call as no longer queued; True for the first caller only."""
+        with lock:
+            queued, self.queued = self.queued, False
+        return queued
+
+
+class ToolExecutor:
+    """Run blocking tool work on a bounded pool with per-tool concurrency caps."""
+
+    def __init__(
+        self,
+        max_workers: int,
+        tool_concurrency: dict[str, int] | None = None,
+        default_tool_concurrency: int | None = None,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self._tool_concurrency = dict(tool_concurrency or {})
+        self._default_tool_concurrency = default_tool_concurrency
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="mcp-tool"
+        )
+        # asyncio semaphores belong to one event loop; keep a set per loop so
+        # the executor also works when tests run several loops in turn.
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._queued: Counter[str] = Counter()
+        self._active: Counter[str] = Counter()
+
+    def concurrency_limit(self, tool_name: str) -> int | None:
+        """The maximum number of concurrent calls for a tool, if capped."""
+        return self._tool_concurrency.get(tool_name, self._default_tool_concurrency)
+
+    def queue_depth(self, tool_name: str | None = None) -> int:
+        """Calls waiting for a worker, for one tool or overall."""
+        with self._lock:
+            if tool_name is None:
+                return sum(self._queued.values())
+            return self._queued[tool_name]
+
+    def active(self, tool_name: str | None = None) -> int:
+        """Calls running on a worker, for one tool or overall."""
+        with self._lock:
+            if tool_name is None:
+                return sum(self._active.values())
+            return self._active[tool_name]
+
+    async def run(
+        self,
+        tool_name: str,
+        func: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run ``func(*args, **kwargs)`` on the pool and await its result."""
+        loop = asyncio.get_running_loop()
+        ticket = _Ticket()
+        call = functools.partial(
+            contextvars.copy_context().run,
+            self._call,
+            tool_name,
+            ticket,
+            func,
+            args,
+            kwargs,
+        )
+
+        self._update(tool_name, queued=1)
+        try:
+            semaphore = self._semaphore(loop, tool_name)
+            if semaphore is None:
+                return await loop.run_in_executor(self._pool, call)
+            async with semaphore:
+                return await loop.run_in_executor(self._pool, call)
+        finally:
+            # A call cancelled before a worker picked it up leaves the queue
+            # here rather than in _call.
+            if ticket.leave_queue(self._lock):
+                self._update(tool_name, queued=-1)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _semaphore(
+        self, loop: asyncio.AbstractEventLoop, tool_name: str
+    ) -> asyncio.Semaphore | None:
+        if not (limit := self.concurrency_limit(tool_name)):
+            return None
+        with self._lock:
+            semaphores = self._semaphores.setdefault(loop, {})
+            if tool_name not in semaphores:
+                semaphores[tool_name] = asyncio.Semaphore(limit)
+            return semaphores[tool_name]
+
+    def _call(
+        self,
+        tool_name: str,
+        ticket: _Ticket,
+        func: Callable[..., T],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> T:
+        queued = -1 if ticket.leave_queue(self._lock) else 0
+        self._update(tool_name, queued=queued, active=1)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._update(tool_name, active=-1)
+
+    def _update(self, tool_name: str, queued: int = 0, active: int = 0) -> None:
+        with self._lock:
+            self._queued[tool_name] += queued
+            self._active[tool_name] += active
+            tool_queued = self._queued[tool_name]
+            tool_active = self._active[tool_name]
+            total_queued = sum(self._queued.values())
+            total_active = sum(self._active.values())
+
+        stats = stats_logger_manager.instance
+        stats.gauge("mcp.tool_executor.queued", total_queued)
+        stats.gauge("mcp.tool_executor.active", total_active)
+        stats.gauge(f"mcp.tool_executor.{tool_name}.queued", tool_queued)
+        stats.gauge(f"mcp.tool_executor.{tool_name}.active", tool_active)
+
+
+_executor: ToolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _executor_config() -> dict[str, Any]:
+    config = dict(MCP_TOOL_EXECUTOR_CONFIG)
+    if has_app_context():
+        config.update(current_app.config.get("MCP_TOOL_EXECUTOR_CONFIG") or {})
+    return config
+
+
+def get_tool_executor() -> ToolExecutor:
+    """The process-wide tool executor, created from config on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                config = _executor_config()
+                _executor = ToolExecutor(
+                    max_workers=config["max_workers"],
+                    tool_concurrency=config.get("tool_concurrency"),
+                    default_tool_concurrency=config.get("default_tool_concurrency"),
+                )
+                logger.info(
+                    "MCP tool executor started with %s workers",
+                    _executor.max_workers,
+                )
+    return _executor
+
+
+async def run_in_tool_executor(
+    tool_name: str,
+    func: Callable[..., T],
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """
+    Run blocking work for ``tool_name`` on the MCP tool executor.
+
+    Use from async tools around calls that block, such as running a
+    ``ChartDataCommand``, so the event loop stays free for other clients.
+    """
+    return await get_tool_executor().run(tool_name, func, *args, **kwargs)
@@ -0,0 +1,59 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""add next_run_at to report_schedule
+
+Adds a nullable ``next_run_at`` column to the ``report_schedule`` table, along with
+an index on ``(active, next_run_at)``. The scheduler uses it to only look at the
+schedules that are due instead of evaluating every crontab on each tick. Existing
+schedules start out with NULL, which the scheduler treats as due and fills in on
+its next tick.
+
+Revision ID: 4e1f7a9c2b3d
+Revises: 1072de5ed955
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from superset.migrations.shared.utils import (
+    add_columns,
+    create_index,
+    drop_columns,
+    drop_index,
+)
+
+# revision identifiers, used by Alembic.
+revision = "4e1f7a9c2b3d"
+down_revision = "1072de5ed955"
+
+_INDEX_NAME = "ix_report_schedule_active_next_run_at"
+
+
+def upgrade() -> None:
+    """Add the ``next_run_at`` column and its index to ``report_schedule``."""
+    add_columns(
+        "report_schedule",
+        sa.Column("next_run_at", sa.DateTime(), nullable=True),
+    )
+    create_index("report_schedule", _INDEX_NAME, ["active", "next_run_at"])
+
+
+def downgrade() -> None:
+    """Drop the ``next_run_at`` column and its index from ``report_schedule``."""
+    drop_index("report_schedule", _INDEX_NAME)
+    drop_columns("report_schedule", "next_run_at")
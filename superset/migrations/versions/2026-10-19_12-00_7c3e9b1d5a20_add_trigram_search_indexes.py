@@ -0,0 +1,90 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""add trigram search indexes
+
+On PostgreSQL, adds ``pg_trgm`` GIN indexes on the columns the chart, dashboard
+and dataset lists search with ``ILIKE '%term%'``, which a B-tree index cannot
+serve. The migration is a no-op on other databases, and when the ``pg_trgm``
+extension cannot be created (e.g. for lack of privileges) it is skipped with a
+warning; the indexes can then be created by hand once the extension exists.
+
+Revision ID: 7c3e9b1d5a20
+Revises: 4e1f7a9c2b3d
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+import logging
+
+import sqlalchemy as sa
+from alembic import op
+
+from superset.migrations.shared.utils import drop_index, table_has_index
+
+# revision identifiers, used by Alembic.
+revision = "7c3e9b1d5a20"
+down_revision = "4e1f7a9c2b3d"
+
+logger = logging.getLogger("alembic.env")
+
+# (table, column, index name)
+_TRIGRAM_INDEXES = [
+    ("slices", "slice_name", "ix_slices_slice_name_trgm"),
+    ("dashboards", "dashboard_title", "ix_dashboards_dashboard_title_trgm"),
+    ("tables", "table_name", "ix_tables_table_name_trgm"),
+]
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    """Create the ``pg_trgm`` extension and the trigram indexes on PostgreSQL."""
+    if not _is_postgres():
+        return
+
+    bind = op.get_bind()
+    try:
+        with bind.begin_nested():
+            bind.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except sa.exc.DBAPIError:
+        logger.warning(
+            "Could not create the pg_trgm extension; skipping trigram search "
+            "indexes. List searches keep working without them."
+        )
+        return
+
+    for table, column, index_name in _TRIGRAM_INDEXES:
+        if table_has_index(table, index_name):
+            continue
+        op.create_index(
+            index_name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes; the ``pg_trgm`` extension is left in place."""
+    if not _is_postgres():
+        return
+
+    for table, _, index_name in _TRIGRAM_INDEXES:
+        drop_index(table, index_name)
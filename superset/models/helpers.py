@@ -138,6 +138,7 @@ from superset.utils.core import (
     get_metric_names,
     get_non_base_axis_columns,
     get_user_id,
+    get_username,
     get_x_axis_label,
     is_adhoc_column,
     MediumText,
@@ -155,6 +156,7 @@ from superset.utils.date_parser import (
     TimeDeltaAmbiguousError,
 )
 from superset.utils.dates import datetime_to_epoch
+from superset.utils.hashing import hash_from_dict
 from superset.utils.rls import apply_rls, get_predicates_for_table
 
 
@@ -648,6 +650,36 @@ def coerce_array_values(
     return values
 
 
+def _values_cursor_value(column: "TableColumn", after: Any) -> Any:
+    """
+    Convert ``after``, a column value decoded from JSON, to the type of the
+    column: ISO strings of temporal columns become datetimes, and the 0 and 1 of
+    boolean columns become booleans.
+
+    :raises ValueError: if ``after`` isn't a value of the column
+    """
+    if not isinstance(after, (str, int, float)):
+        raise ValueError(after)
+    if column.is_boolean:
+        # databases without a boolean type return 0 and 1
+        if isinstance(after, str) or after not in (0, 1):
+            raise ValueError(after)
+        return bool(after)
+    if isinstance(after, bool):
+        raise ValueError(after)
+    if column.is_numeric:
+        if isinstance(after, str):
+            raise ValueError(after)
+        return after
+    if column.is_temporal and not column.is_string:
+        if not isinstance(after, str):
+            raise ValueError(after)
+        return datetime.fromisoformat(after)
+    if column.is_string and not isinstance(after, str):
+        raise ValueError(after)
+    return after
+
+
 def is_uuid_native_type(native_type: Optional[str]) -> bool:
     """
     Return True if a native column type represents a UUID.
@@ -1527,6 +1559,37 @@ def skip_visibility_filter(session: Session, *classes: type) -> Iterator[None]:
         bypass -= added
 
 
+@contextmanager
+def sqla_query_memo(
+    memo: dict[tuple[int, str | None, str], SqlaQuery] | None = None,
+) -> Iterator[None]:
+    """Share the ``SqlaQuery`` built for a query object within the ``with`` block.
+
+    Building the query renders the Jinja templates, looks up the RLS filters and
+    parses the adhoc expressions, and the same query object is built to collect
+    its extra cache keys and again to execute it. Inside the block,
+    ``ExploreMixin.get_memoized_sqla_query`` builds each distinct query once per
+    datasource and user. Nesting is safe: the outermost block owns the memo.
+
+    :param memo: the memo to use instead of the enclosing one, for queries whose
+        templates render differently, e.g. those of the different query contexts
+        of a batch request, to each keep their own across several blocks
+    """
+    previous = getattr(g, "_sqla_query_memo", None)
+    if memo is None and previous is not None:
+        yield
+        return
+
+    g._sqla_query_memo = {} if memo is None else memo
+    try:
+        yield
+    finally:
+        if previous is None:
+            del g._sqla_query_memo
+        else:
+            g._sqla_query_memo = previous
+
+
 class QueryResult:  # pylint: disable=too-few-public-methods
     """Object returned by the query interface"""
 
@@ -1992,16 +2055,43 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             sql = f"{cte}\n{sql}"
         return sql
 
+    def get_memoized_sqla_query(self, query_obj: QueryObjectDict) -> SqlaQuery:
+        """
+        Build the ``SqlaQuery`` for a query object, reusing the one built for an
+        identical query object within the enclosing ``sqla_query_memo`` block.
+        """
+        # Filter out keys that aren't parameters to get_sqla_query
+        filtered_query_obj = {
+            k: v for k, v in query_obj.items() if k in SQLA_QUERY_KEYS
+        }
+        memo: dict[tuple[int, str | None, str], SqlaQuery] | None = getattr(
+            g, "_sqla_query_memo", None
+        )
+        if memo is None:
+            return self.get_sqla_query(**cast(Any, filtered_query_obj))
+
+        try:
+            key = (
+                id(self),
+                get_username(),
+                hash_from_dict(
+                    filtered_query_obj, ignore_nan=True, default=json.json_int_dttm_ser
+                ),
+            )
+        except TypeError:
+            # not serializable, hence no canonical form to share the query by
+            return self.get_sqla_query(**cast(Any, filtered_query_obj))
+
+        if key not in memo:
+            memo[key] = self.get_sqla_query(**cast(Any, filtered_query_obj))
+        return memo[key]
+
     def get_query_str_extended(
         self,
         query_obj: QueryObjectDict,
         mutate: bool = True,
     ) -> QueryStringExtended:
-        # Filter out keys that aren't parameters to get_sqla_query
-        filtered_query_obj = {
-            k: v for k, v in query_obj.items() if k in SQLA_QUERY_KEYS
-        }
-        sqlaq = self.get_sqla_query(**cast(Any, filtered_query_obj))
+        sqlaq = self.get_memoized_sqla_query(query_obj)
         sql = self.database.compile_sqla_query(
             sqlaq.sqla_query,
             catalog=self.catalog,
@@ -3953,13 +4043,26 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             return None
         return and_(True, *l)
 
-    def values_for_column(  # pylint: disable=too-many-locals
+    def values_for_column(  # pylint: disable=too-many-locals  # noqa: C901
         self,
         column_name: str,
         limit: int = 10000,
         denormalize_column: bool = False,
         array_elements: bool = False,
+        search: str | None = None,
+        search_prefix: bool = False,
+        after: Any = None,
+        ordered: bool = False,
     ) -> list[Any]:
+        """
+        Distinct values of a column, honoring RLS and the fetch-values predicate.
+
+        With ``ordered``, non-NULL values are returned in ascending order, which
+        ``after`` uses for keyset paging: only values greater than it are
+        returned. ``search`` keeps values containing it (or, with
+        ``search_prefix``, starting with it), case-insensitively. All of it runs
+        in the database, so only ``limit`` rows are transferred.
+        """
         # denormalize column name before querying for values
         # unless disabled in the dataset configuration
         db_dialect = self.database.get_dialect()
@@ -3985,19 +4088,31 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             if col_spec and col_spec.generic_type == GenericDataType.MULTI_VALUE:
                 value_expr = db_engine_spec.array_explode(value_expr)
 
-        qry = (
-            sa.select(
-                # The alias (label) here is important because some dialects will
-                # automatically add a random alias to the projection because of the
-                # call to DISTINCT; others will uppercase the column names. This
-                # gives us a deterministic column name in the dataframe.
-                value_expr.label("column_values")
-            )
-            .select_from(tbl)
-            .distinct()
-        )
+        # The alias (label) here is important because some dialects will
+        # automatically add a random alias to the projection because of the
+        # call to DISTINCT; others will uppercase the column names. This
+        # gives us a deterministic column name in the dataframe.
+        value_label = value_expr.label("column_values")
+        qry = sa.select(value_label).select_from(tbl).distinct()
         if limit:
             qry = qry.limit(limit)
+        if search:
+            from superset.daos.base import _escape_like
+
+            pattern = _escape_like(search)
+            text_expr = (
+                value_expr if target_col.is_string else sa.cast(value_expr, sa.String)
+            )
+            qry = qry.where(
+                text_expr.ilike(
+                    f"{pattern}%" if search_prefix else f"%{pattern}%",
+                    escape="\\",
+                )
+            )
+        if ordered:
+            qry = qry.where(value_expr.is_not(None)).order_by(value_label)
+            if after is not None:
+                qry = qry.where(self._values_after(target_col, value_expr, after))
 
         if self.fetch_values_predicate:
             qry = qry.where(self.get_fetch_values_predicate(template_processor=tp))
@@ -4039,6 +4154,33 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                 df = df.replace({np.nan: None})
                 return df["column_values"].to_list()
 
+    def _values_after(
+        self,
+        column: "TableColumn",
+        value_expr: ColumnElement,
+        after: Any,
+    ) -> ColumnElement:
+        """
+        The predicate keeping the values of a column greater than ``after``, a
+        value decoded from JSON, compared as the column's type: datetimes are
+        parsed from their ISO format, and booleans, which not all databases
+        order, are compared for equality.
+
+        :raises QueryObjectValidationError: if ``after`` can't be compared with the
+            values of the column
+        """
+        try:
+            after = _values_cursor_value(column, after)
+        except ValueError as ex:
+            raise QueryObjectValidationError(
+                _("Invalid cursor for column %(column)s", column=column.column_name)
+            ) from ex
+        if column.is_boolean:
+            return sa.false() if after else value_expr == sa.true()
+        if isinstance(after, datetime):
+            return value_expr > self.text(self.dttm_sql_literal(after, column))
+        return value_expr > after
+
     def validate_expression(
         self,
         expression: str,
@@ -110,7 +110,10 @@ class ReportSchedule(AuditMixinNullable, ExtraJSONMixin, Model):
     """
 
     __tablename__ = "report_schedule"
-    __table_args__ = (UniqueConstraint("name", "type"),)
+    __table_args__ = (
+        UniqueConstraint("name", "type"),
+        Index("ix_report_schedule_active_next_run_at", "active", "next_run_at"),
+    )
 
     id = Column(Integer, primary_key=True)
     type = Column(String(50), nullable=False)
@@ -184,6 +187,10 @@ class ReportSchedule(AuditMixinNullable, ExtraJSONMixin, Model):
     retry_attempt = Column(Integer, default=0, nullable=False, server_default="0")
     retry_scheduled_dttm = Column(DateTime, nullable=True)
 
+    # Scheduling state — a lower bound (naive UTC) for the next crontab trigger
+    # that has not been dispatched yet. NULL means it still has to be computed.
+    next_run_at = Column(DateTime, nullable=True)
+
     extra: ReportScheduleExtra  # type: ignore
 
     email_subject = Column(String(255))
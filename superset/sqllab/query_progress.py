@@ -0,0 +1,150 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Pacing and publishing of the progress that engine specs poll from running queries.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from flask import has_request_context, request
+
+from superset import is_feature_enabled
+from superset.async_events.async_query_manager import (
+    AsyncQueryManager,
+    AsyncQueryTokenException,
+    build_job_metadata,
+)
+from superset.constants import QUERY_ASYNC_CHANNEL_KEY
+from superset.extensions import async_query_manager
+from superset.models.sql_lab import Query
+
+logger = logging.getLogger(__name__)
+
+
+def get_async_channel_id() -> str | None:
+    """
+    The async events channel of the current request's user, if they have one.
+    """
+    if not is_feature_enabled("GLOBAL_ASYNC_QUERIES") or not has_request_context():
+        return None
+    try:
+        return async_query_manager.parse_channel_id_from_request(request)
+    except AsyncQueryTokenException:
+        return None
+
+
+class PollBackoff:
+    """
+    Intervals between the polls of a running query's progress.
+
+    The first poll waits ``interval`` seconds and every following one twice as long
+    as the previous, up to ``age_ratio`` times the age of the query and at most
+    ``max_interval``. Short queries are polled at the configured interval, long ones
+    less and less often.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        max_interval: float,
+        age_ratio: float,
+        started: float | None = None,
+    ) -> None:
+        self.interval = interval
+        self.max_interval = max_interval
+        self.age_ratio = age_ratio
+        # the start time of a query loaded from the database is a Decimal
+        self.started = time.time() if started is None else float(started)
+        self._next_interval = interval
+
+    def next_interval(self) -> float:
+        age = time.time() - self.started
+        ceiling = max(self.interval, min(self.max_interval, age * self.age_ratio))
+        interval = min(self._next_interval, ceiling)
+        self._next_interval = interval * 2
+        return interval
+
+
+class ProgressReporter:
+    """
+    Reports the progress of a running query.
+
+    SQL Lab reads the progress from the query row, so every change is set on the
+    query and is to be committed. When the query records the async events channel
+    of the user who submitted it, changes are pushed to that channel instead, and
+    the query row is only updated ``commit_interval`` seconds apart.
+    """
+
+    def __init__(self, query: Query, commit_interval: float) -> None:
+        self.query = query
+        self.commit_interval = commit_interval
+        self.channel_id: str | None = query.extra.get(QUERY_ASYNC_CHANNEL_KEY)
+        if self.channel_id and not is_feature_enabled("GLOBAL_ASYNC_QUERIES"):
+            self.channel_id = None
+        self.progress: float = query.progress
+        self.progress_text: str | None = query.extra.get("progress_text")
+        self._updated = time.monotonic()
+
+    def update(self, progress: float, progress_text: str | None = None) -> bool:
+        """
+        Record the progress of the query, returning whether it was set on the query
+        and needs to be committed.
+        """
+        if progress_text is None:
+            progress_text = self.progress_text
+        if progress == self.progress and progress_text == self.progress_text:
+            return False
+
+        self.progress = progress
+        self.progress_text = progress_text
+        if channel_id := self.channel_id:
+            self.publish(channel_id)
+            if (
+                self.channel_id
+                and time.monotonic() - self._updated < self.commit_interval
+            ):
+                return False
+
+        # Pending changes are only set on the query when they are committed, so
+        # that flushing them doesn't hold a lock on the row until the next commit.
+        self.query.progress = progress
+        if progress_text != self.query.extra.get("progress_text"):
+            self.query.set_extra_json_key(key="progress_text", value=progress_text)
+        self._updated = time.monotonic()
+        return True
+
+    def publish(self, channel_id: str) -> None:
+        job_metadata = build_job_metadata(
+            channel_id, self.query.client_id, self.query.user_id
+        )
+        progress: dict[str, Any] = {"progress": self.progress}
+        if self.progress_text is not None:
+            progress["progress_text"] = self.progress_text
+        try:
+            async_query_manager.update_job(
+                job_metadata, AsyncQueryManager.STATUS_RUNNING, **progress
+            )
+        except Exception:  # pylint: disable=broad-except
+            # fall back to reporting the progress on the query row only
+            logger.warning(
+                "Query %s: failed to publish progress", self.query.id, exc_info=True
+            )
+            self.channel_id = None
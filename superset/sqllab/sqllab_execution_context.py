@@ -26,10 +26,12 @@ from flask_babel import gettext as __
 from sqlalchemy.orm.exc import DetachedInstanceError
 
 from superset import is_feature_enabled
+from superset.constants import QUERY_ASYNC_CHANNEL_KEY
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException
 from superset.models.sql_lab import Query
 from superset.sql.parse import CTASMethod
+from superset.sqllab.query_progress import get_async_channel_id
 from superset.utils import core as utils, json
 from superset.utils.core import apply_max_row_limit, get_user_id
 from superset.utils.dates import now_as_float
@@ -189,7 +191,7 @@ class SqlJsonExecutionContext:  # pylint: disable=too-many-instance-attributes
         start_time = now_as_float()
         ctas = cast(CreateTableAsSelect, self.create_table_as_select)
         if self.select_as_cta:
-            return Query(
+            query = Query(
                 database_id=self.database_id,
                 sql=self.sql,
                 catalog=self.catalog,
@@ -206,20 +208,27 @@ class SqlJsonExecutionContext:  # pylint: disable=too-many-instance-attributes
                 user_id=self.user_id,
                 client_id=self.client_id_or_short_id,
             )
-        return Query(
-            database_id=self.database_id,
-            sql=self.sql,
-            catalog=self.catalog,
-            schema=self.schema,
-            select_as_cta=False,
-            start_time=start_time,
-            tab_name=self.tab_name,
-            limit=self.limit,
-            status=self.status,
-            sql_editor_id=self.sql_editor_id,
-            user_id=self.user_id,
-            client_id=self.client_id_or_short_id,
-        )
+        else:
+            query = Query(
+                database_id=self.database_id,
+                sql=self.sql,
+                catalog=self.catalog,
+                schema=self.schema,
+                select_as_cta=False,
+                start_time=start_time,
+                tab_name=self.tab_name,
+                limit=self.limit,
+                status=self.status,
+                sql_editor_id=self.sql_editor_id,
+                user_id=self.user_id,
+                client_id=self.client_id_or_short_id,
+            )
+        # lets the engine spec push the progress of the query to the user
+        if async_channel_id := get_async_channel_id():
+            query.set_extra_json_key(
+                key=QUERY_ASYNC_CHANNEL_KEY, value=async_channel_id
+            )
+        return query
 
     def get_query_details(self) -> str:
         with contextlib.suppress(DetachedInstanceError):
@@ -20,25 +20,39 @@ import logging
 from dataclasses import dataclass
 from typing import Any, Optional, Union
 
+from celery import group
 from celery.utils.log import get_task_logger
-from flask import current_app
+from flask import current_app, g
 from sqlalchemy import and_, func
 from sqlalchemy.orm import selectinload
 
 from superset import db, security_manager
+from superset.charts.data.dashboard_filter_context import (
+    apply_dashboard_filter_context,
+    DashboardFilterContext,
+    get_dashboard_filter_contexts,
+)
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.query_context import QueryContext
 from superset.daos.dashboard import DashboardDAO
 from superset.extensions import celery_app
 from superset.models.core import Log
 from superset.models.dashboard import Dashboard
+from superset.models.slice import Slice
 from superset.tags.models import Tag, TaggedObject
 from superset.tasks.native_filter_cache import (
     build_native_filter_option_form_data,
     build_native_filter_option_query_context,
     get_eligible_native_filters,
 )
+from superset.utils import json
+from superset.utils.core import override_user
 from superset.utils.date_parser import parse_human_datetime
 from superset.utils.webdriver import _browser_manager, WebDriverPlaywright
+from superset.utils.webdriver_async import (
+    AsyncPlaywrightCapture,
+    can_capture_concurrently,
+)
 
 logger: logging.Logger = get_task_logger(__name__)
 logger.setLevel(logging.INFO)
@@ -53,6 +67,19 @@ class CacheWarmupTask:
     native_filter_id: str | None = None
 
 
+@dataclass(frozen=True)
+class ChartWarmupPayload:
+    """A dashboard chart's query-context payload for data-only cache warm-up."""
+
+    dashboard_id: int
+    chart_id: int
+    query_context: dict[str, Any]
+
+    @property
+    def name(self) -> str:
+        return f"dashboard:{self.dashboard_id}:chart:{self.chart_id}"
+
+
 def get_dash_url(dashboard: Dashboard) -> str:
     """Return external URL for warming up a given dashboard cache."""
     with current_app.test_request_context():
@@ -72,7 +99,9 @@ class Strategy:  # pylint: disable=too-few-public-methods
     A cache warm up strategy.
 
     WebDriver strategies define a `get_urls` method that returns a list of
-    dashboard URLs to warm up. Query task strategies define `get_tasks`.
+    dashboard URLs to warm up. Query task strategies define `get_tasks`, and
+    data-only strategies define `get_chart_payloads`, whose charts are warmed up
+    by one `cache-warmup-chart` task each.
 
     Strategies can be configured in `superset/config.py`:
 
@@ -92,6 +121,7 @@ class Strategy:  # pylint: disable=too-few-public-methods
 
     name: str = ""
     uses_webdriver: bool = True
+    data_only: bool = False
 
     def __init__(self) -> None:
         pass
@@ -102,8 +132,101 @@ class Strategy:  # pylint: disable=too-few-public-methods
     def get_tasks(self) -> list[CacheWarmupTask]:
         return []
 
+    def get_chart_payloads(self) -> list[ChartWarmupPayload]:
+        return []
+
+
+def _saved_query_context(chart: Slice) -> dict[str, Any] | None:
+    """The chart's saved query context, or ``None`` when it is missing or unusable."""
+    if not chart.query_context:
+        return None
+    try:
+        query_context: Any = json.loads(chart.query_context)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(query_context, dict) or not query_context.get("queries"):
+        return None
+    return query_context
+
+
+def get_dashboard_chart_payloads(dashboard: Dashboard) -> list[ChartWarmupPayload]:
+    """
+    Build the data-only warm-up payload of every chart on a dashboard.
+
+    Each payload is the chart's saved query context with the dashboard's default
+    native filter state applied, i.e. the query the chart sends when the dashboard
+    is first opened. Charts without a usable saved query context are skipped.
+    """
+    filter_contexts: dict[int, DashboardFilterContext] = get_dashboard_filter_contexts(
+        dashboard.id
+    )
+    payloads: list[ChartWarmupPayload] = []
+
+    for chart in dashboard.slices:
+        query_context: dict[str, Any] | None = _saved_query_context(chart)
+        if query_context is None:
+            logger.info(
+                "Chart %s on dashboard %s has no saved query context; skipping",
+                chart.id,
+                dashboard.id,
+            )
+            continue
+
+        query_context["result_format"] = ChartDataResultFormat.JSON
+        query_context["result_type"] = ChartDataResultType.FULL
+        query_context["force"] = False
+
+        filter_context: DashboardFilterContext | None = filter_contexts.get(chart.id)
+        if filter_context and filter_context.extra_form_data:
+            apply_dashboard_filter_context(
+                query_context, filter_context.extra_form_data
+            )
+
+        payloads.append(
+            ChartWarmupPayload(
+                dashboard_id=dashboard.id,
+                chart_id=chart.id,
+                query_context=query_context,
+            )
+        )
+
+    return payloads
+
+
+class DashboardStrategy(Strategy):  # pylint: disable=too-few-public-methods
+    """
+    A strategy warming up a set of dashboards.
+
+    By default each dashboard is rendered in a browser. With ``data_only`` set,
+    only the charts' data queries are run, in-process and fanned out across
+    Celery workers, which skips the browser entirely.
+    """
+
+    def __init__(self, data_only: bool = False) -> None:
+        super().__init__()
+        self.data_only = data_only
+        self.uses_webdriver = not data_only
+
+    def get_dashboards(self) -> list[Dashboard]:
+        raise NotImplementedError("Subclasses must implement get_dashboards!")
+
+    def get_urls(self) -> list[str]:
+        return [get_dash_url(dashboard) for dashboard in self.get_dashboards()]
+
+    def get_chart_payloads(self) -> list[ChartWarmupPayload]:
+        payloads: list[ChartWarmupPayload] = []
+        for dashboard in self.get_dashboards():
+            try:
+                payloads.extend(get_dashboard_chart_payloads(dashboard))
+            except Exception:  # noqa: BLE001
+                logger.exception(
+                    "Error building data-only cache warm-up payloads for dashboard %s",
+                    dashboard.id,
+                )
+        return payloads
+
 
-class DummyStrategy(Strategy):  # pylint: disable=too-few-public-methods
+class DummyStrategy(DashboardStrategy):  # pylint: disable=too-few-public-methods
     """
     Warm up all published dashboards.
 
@@ -122,7 +245,7 @@ class DummyStrategy(Strategy):  # pylint: disable=too-few-public-methods
 
     name: str = "dummy"
 
-    def get_urls(self) -> list[str]:
+    def get_dashboards(self) -> list[Dashboard]:
         # Use selectinload to avoid N+1 queries when checking dashboard.slices
         dashboards: list[Dashboard] = (
             db.session.query(Dashboard)
@@ -131,10 +254,10 @@ class DummyStrategy(Strategy):  # pylint: disable=too-few-public-methods
             .all()
         )
 
-        return [get_dash_url(dashboard) for dashboard in dashboards if dashboard.slices]
+        return [dashboard for dashboard in dashboards if dashboard.slices]
 
 
-class TopNDashboardsStrategy(Strategy):  # pylint: disable=too-few-public-methods
+class TopNDashboardsStrategy(DashboardStrategy):  # pylint: disable=too-few-public-methods
     """
     Warm up charts in the top-n dashboards.
 
@@ -150,16 +273,23 @@ class TopNDashboardsStrategy(Strategy):  # pylint: disable=too-few-public-method
             },
         }
 
+    Pass ``'data_only': True`` to run the charts' data queries instead of
+    rendering the dashboards (see `DashboardStrategy`).
     """
 
     name: str = "top_n_dashboards"
 
-    def __init__(self, top_n: int = 5, since: str = "7 days ago") -> None:
-        super().__init__()
+    def __init__(
+        self,
+        top_n: int = 5,
+        since: str = "7 days ago",
+        data_only: bool = False,
+    ) -> None:
+        super().__init__(data_only=data_only)
         self.top_n: int = top_n
         self.since: Any = parse_human_datetime(since) if since else None
 
-    def get_urls(self) -> list[str]:
+    def get_dashboards(self) -> list[Dashboard]:
         records: list[Any] = (
             db.session.query(Log.dashboard_id, func.count(Log.dashboard_id))
             .filter(and_(Log.dashboard_id.isnot(None), Log.dttm >= self.since))
@@ -169,14 +299,15 @@ class TopNDashboardsStrategy(Strategy):  # pylint: disable=too-few-public-method
             .all()
         )
         dash_ids: list[int] = [record.dashboard_id for record in records]
-        dashboards: list[Dashboard] = (
-            db.session.query(Dashboard).filter(Dashboard.id.in_(dash_ids)).all()
+        return (
+            db.session.query(Dashboard)
+            .options(selectinload(Dashboard.slices))
+            .filter(Dashboard.id.in_(dash_ids))
+            .all()
         )
 
-        return [get_dash_url(dashboard) for dashboard in dashboards]
-
 
-class DashboardTagsStrategy(Strategy):  # pylint: disable=too-few-public-methods
+class DashboardTagsStrategy(DashboardStrategy):  # pylint: disable=too-few-public-methods
     """
     Warm up charts in dashboards with custom tags.
 
@@ -194,12 +325,13 @@ class DashboardTagsStrategy(Strategy):  # pylint: disable=too-few-public-methods
 
     name: str = "dashboard_tags"
 
-    def __init__(self, tags: Optional[list[str]] = None) -> None:
-        super().__init__()
+    def __init__(
+        self, tags: Optional[list[str]] = None, data_only: bool = False
+    ) -> None:
+        super().__init__(data_only=data_only)
         self.tags: list[str] = tags or []
 
-    def get_urls(self) -> list[str]:
-        urls: list[str] = []
+    def get_dashboards(self) -> list[Dashboard]:
         tags: list[Tag] = db.session.query(Tag).filter(Tag.name.in_(self.tags)).all()
         tag_ids: list[int] = [tag.id for tag in tags]
 
@@ -217,13 +349,12 @@ class DashboardTagsStrategy(Strategy):  # pylint: disable=too-few-public-methods
         dash_ids: list[int] = [
             tagged_object.object_id for tagged_object in tagged_objects
         ]
-        tagged_dashboards: list[Dashboard] = db.session.query(Dashboard).filter(
-            Dashboard.id.in_(dash_ids)
+        return (
+            db.session.query(Dashboard)
+            .options(selectinload(Dashboard.slices))
+            .filter(Dashboard.id.in_(dash_ids))
+            .all()
         )
-        for dashboard in tagged_dashboards:
-            urls.append(get_dash_url(dashboard))
-
-        return urls
 
 
 class NativeFilterOptionsStrategy(Strategy):  # pylint: disable=too-few-public-methods
@@ -333,6 +464,20 @@ def _warmup_urls(
     window: tuple[int, int],
     results: dict[str, list[str]],
 ) -> None:
+    concurrency: int = current_app.config.get("SCREENSHOT_CAPTURE_CONCURRENCY", 1)
+    if len(urls) > 1 and concurrency > 1 and can_capture_concurrently():
+        for capture in AsyncPlaywrightCapture(window, concurrency=concurrency).capture(
+            urls, "grid-container", user=user
+        ):
+            if capture.screenshot:
+                results["success"].append(capture.url)
+            else:
+                logger.error(
+                    "Error warming up cache for %s: %s", capture.url, capture.error
+                )
+                results["errors"].append(capture.url)
+        return
+
     wd: WebDriverPlaywright = WebDriverPlaywright("", window)
     try:
         for url in urls:
@@ -349,6 +494,50 @@ def _warmup_urls(
         _browser_manager._cleanup()  # noqa: SLF001
 
 
+@celery_app.task(name="cache-warmup-chart")
+def cache_warmup_chart(
+    username: str,
+    dashboard_id: int,
+    chart_id: int,
+    query_context: dict[str, Any],
+) -> dict[str, list[str]]:
+    """
+    Warm up the data cache of a single dashboard chart.
+
+    Dispatched by `cache_warmup` for data-only strategies: runs the chart's
+    query context through `ChartDataCommand` in-process, as the warm-up user.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.charts.schemas import ChartDataQueryContextSchema
+    from superset.commands.chart.data.get_data_command import ChartDataCommand
+
+    task_name: str = ChartWarmupPayload(dashboard_id, chart_id, query_context).name
+    results: dict[str, list[str]] = {"success": [], "errors": []}
+
+    user: Any = security_manager.find_user(username=username)
+    if not user:
+        logger.error("Cache warmup user '%s' not found", username)
+        results["errors"].append(task_name)
+        return results
+
+    with override_user(user, force=False):
+        try:
+            logger.info("Warming up cache for %s", task_name)
+            # Jinja macros resolve form data from g.form_data.
+            g.form_data = query_context.get("form_data") or {}
+            command: Any = ChartDataCommand(
+                ChartDataQueryContextSchema().load(query_context)
+            )
+            command.validate()
+            command.run(cache=True)
+            results["success"].append(task_name)
+        except Exception:  # noqa: BLE001
+            logger.exception("Error warming up cache for %s", task_name)
+            results["errors"].append(task_name)
+
+    return results
+
+
 @celery_app.task(name="cache-warmup")
 def cache_warmup(
     strategy_name: str, *args: Any, **kwargs: Any
@@ -395,10 +584,27 @@ def cache_warmup(
         logger.error(message)
         return message
 
+    if strategy.data_only:
+        with override_user(user, force=False):
+            payloads: list[ChartWarmupPayload] = strategy.get_chart_payloads()
+        # Each chart runs on its own worker; this task only fans them out.
+        if payloads:
+            group(
+                cache_warmup_chart.s(
+                    warmup_username,
+                    payload.dashboard_id,
+                    payload.chart_id,
+                    payload.query_context,
+                )
+                for payload in payloads
+            ).apply_async()
+        results["queued"] = [payload.name for payload in payloads]
+        logger.info("Queued cache warm-up of %s charts", len(payloads))
+        return results
+
     if not strategy.uses_webdriver:
         # pylint: disable=import-outside-toplevel
         from superset.commands.chart.data.get_data_command import ChartDataCommand
-        from superset.utils.core import override_user
 
         with override_user(user, force=False):
             tasks: list[CacheWarmupTask] = strategy.get_tasks()
@@ -22,12 +22,13 @@ it needs to call create_app() in order to initialize things properly
 
 from typing import Any
 
-from celery.signals import task_postrun, worker_process_init
+from celery.signals import task_postrun, worker_process_init, worker_process_shutdown
 from flask import has_app_context
 
 # Superset framework imports
 from superset import create_app
 from superset.extensions import celery_app, db
+from superset.utils.webdriver_async import close_capture_browser
 
 # Init the Flask app / configure everything
 flask_app = create_app()
@@ -48,6 +49,12 @@ def reset_db_connection_pool(**kwargs: Any) -> None:  # pylint: disable=unused-a
         db.engine.dispose()
 
 
+@worker_process_shutdown.connect
+def close_screenshot_browser(**kwargs: Any) -> None:  # pylint: disable=unused-argument
+    # pool processes may exit without running the atexit handlers
+    close_capture_browser()
+
+
 @task_postrun.connect
 def teardown(  # pylint: disable=unused-argument
     retval: Any,
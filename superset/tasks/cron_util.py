@@ -15,6 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from __future__ import annotations
+
 import logging
 from collections.abc import Iterator
 from datetime import datetime, timedelta
@@ -22,7 +24,7 @@ from datetime import datetime, timedelta
 from cron_descriptor import ExpressionDescriptor, get_description
 from croniter import croniter, CroniterBadDateError
 from flask import current_app
-from pytz import timezone as pytz_timezone, UnknownTimeZoneError
+from pytz import BaseTzInfo, timezone as pytz_timezone, UnknownTimeZoneError
 
 logger = logging.getLogger(__name__)
 
@@ -71,16 +73,20 @@ def get_cron_description(cron: str) -> str:
     return description.replace(day_of_week_clause, f", or {clause}", 1)
 
 
-def cron_schedule_window(
-    triggered_at: datetime, cron: str, timezone: str
-) -> Iterator[datetime]:
-    window_size = current_app.config["ALERT_REPORTS_CRON_WINDOW_SIZE"]
+def _get_timezone(timezone: str) -> BaseTzInfo:
     try:
-        tz = pytz_timezone(timezone)
+        return pytz_timezone(timezone)
     except UnknownTimeZoneError:
         # fallback to default timezone
-        tz = pytz_timezone("UTC")
         logger.warning("Timezone %s was invalid. Falling back to 'UTC'", timezone)
+        return pytz_timezone("UTC")
+
+
+def cron_schedule_window(
+    triggered_at: datetime, cron: str, timezone: str
+) -> Iterator[datetime]:
+    window_size = current_app.config["ALERT_REPORTS_CRON_WINDOW_SIZE"]
+    tz = _get_timezone(timezone)
     utc = pytz_timezone("UTC")
     # convert the current time to the user's local time for comparison
     time_now = triggered_at.astimezone(tz)
@@ -99,3 +105,32 @@ def cron_schedule_window(
             "it will not produce any executions",
             cron,
         )
+
+
+def cron_next_run(cron: str, timezone: str, after: datetime) -> datetime | None:
+    """
+    Find the first trigger of a crontab at or after a given (timezone aware)
+    datetime.
+
+    :param cron: The crontab expression
+    :param timezone: The timezone the crontab is expressed in
+    :param after: The datetime from which to look for the next trigger
+    :return: The next trigger as a naive UTC datetime, or ``None`` if the crontab
+        can never match a valid date
+    """
+    tz = _get_timezone(timezone)
+    utc = pytz_timezone("UTC")
+    start_at = after.astimezone(tz)
+    # croniter only yields triggers strictly after its start time
+    crons = croniter(cron, start_at - timedelta(seconds=1))
+    try:
+        for schedule in crons.all_next(datetime):
+            if schedule >= start_at:
+                return schedule.astimezone(utc).replace(tzinfo=None)
+    except CroniterBadDateError:
+        logger.error(
+            "Cron schedule %s can never match a valid date; "
+            "it will not produce any executions",
+            cron,
+        )
+    return None
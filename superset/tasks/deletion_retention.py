@@ -21,9 +21,11 @@ that ages out version rows while keeping the live entity, this removes
 entities that are already soft-deleted. For each
 ``SoftDeleteMixin`` model it selects rows whose ``deleted_at`` is older than
 the per-workspace window and runs the shared cascade per entity, in bounded
-id-ordered batches. Convergent, not strictly idempotent: a re-run with the
-same clock and data removes nothing, but rows that have since crossed the
-cutoff are purged on a later run.
+id-ordered batches. With ``SOFT_DELETE_PURGE_CHUNK_SIZE`` set, each chunk of
+entities is instead purged by one set-based cascade in one transaction, and a
+failing chunk is retried one entity at a time. Convergent, not strictly
+idempotent: a re-run with the same clock and data removes nothing, but rows
+that have since crossed the cutoff are purged on a later run.
 """
 
 from __future__ import annotations
@@ -31,6 +33,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Iterator
 from datetime import datetime, timedelta
+from time import perf_counter
 from typing import Any, cast
 
 import sqlalchemy as sa
@@ -40,17 +43,23 @@ from superset import db
 from superset.commands.deletion_retention import audit
 from superset.commands.deletion_retention.purge_cascade import (
     cascade_hard_delete,
+    cascade_hard_delete_many,
     CascadeResult,
     dashboard_slice_count,
     entity_uuid,
     suppress_purge_association_versions,
 )
+from superset.commands.deletion_retention.purge_policy import (
+    count_dashboard_slices_by_id,
+    get_purge_policy,
+)
 from superset.commands.deletion_retention.window import resolve_retention_window
 from superset.extensions import celery_app, feature_flag_manager, stats_logger_manager
 from superset.models.helpers import (
     skip_visibility_filter,
     SoftDeleteMixin,
 )
+from superset.models.purge_audit_log import STATUS_CONFIRMED, STATUS_FAILED
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -106,6 +115,19 @@ def _iter_eligible_ids(
         after_id = ids[-1]
 
 
+def _set_based_chunk_size() -> int:
+    """The configured ``SOFT_DELETE_PURGE_CHUNK_SIZE``, capped at the scan
+    batch; 0 (also for a malformed value) selects the per-entity purge."""
+    value = current_app.config.get("SOFT_DELETE_PURGE_CHUNK_SIZE", 0)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        logger.warning(
+            "deletion_retention: ignoring invalid SOFT_DELETE_PURGE_CHUNK_SIZE %r",
+            value,
+        )
+        return 0
+    return min(value, _BATCH)
+
+
 def _reconcile_unless_dry_run(dry_run: bool) -> None:
     """Finalize stale pending audit rows, except during a dry run.
 
@@ -181,30 +203,185 @@ def _purge_model(
     """Process one model's eligible rows. Returns ``(purged, would_purge,
     failures, blocked)``. A single entity's blocked/failed cascade never aborts
     the batch."""
-    entity_type = _model_table_name(model)
     purged = would = failures = blocked = 0
+    chunk_size = 0 if dry_run else _set_based_chunk_size()
     for id_batch in _iter_eligible_ids(model, cutoff, _BATCH):
         if dry_run:
             would += len(id_batch)
             continue
-        for entity_id in id_batch:
-            try:
-                result = _purge_one(model, entity_id, cutoff)
-                if result is not None and result.purged:
-                    purged += 1
-                elif result is not None and result.blocked_reason is not None:
-                    blocked += 1
-            except Exception:  # pylint: disable=broad-except
-                db.session.rollback()  # pylint: disable=consider-using-transaction
-                failures += 1
-                logger.exception(
-                    "deletion_retention: cascade failed for %s id=%s",
-                    entity_type,
-                    entity_id,
-                )
+        if not chunk_size:
+            purged_n, failed_n, blocked_n = _purge_each(model, id_batch, cutoff)
+            purged += purged_n
+            failures += failed_n
+            blocked += blocked_n
+            continue
+        for start in range(0, len(id_batch), chunk_size):
+            purged_n, failed_n, blocked_n = _purge_chunk_or_each(
+                model, id_batch[start : start + chunk_size], cutoff
+            )
+            purged += purged_n
+            failures += failed_n
+            blocked += blocked_n
+            logger.info(
+                "deletion_retention: %s progress: purged=%s failed=%s blocked=%s",
+                _model_table_name(model),
+                purged,
+                failures,
+                blocked,
+            )
     return purged, would, failures, blocked
 
 
+def _purge_each(
+    model: type[SoftDeleteMixin], entity_ids: list[int], cutoff: datetime
+) -> tuple[int, int, int]:
+    """Purge entities one at a time. Returns ``(purged, failures, blocked)``."""
+    entity_type = _model_table_name(model)
+    purged = failures = blocked = 0
+    for entity_id in entity_ids:
+        try:
+            result = _purge_one(model, entity_id, cutoff)
+            if result is not None and result.purged:
+                purged += 1
+            elif result is not None and result.blocked_reason is not None:
+                blocked += 1
+        except Exception:  # pylint: disable=broad-except
+            db.session.rollback()  # pylint: disable=consider-using-transaction
+            failures += 1
+            logger.exception(
+                "deletion_retention: cascade failed for %s id=%s",
+                entity_type,
+                entity_id,
+            )
+    return purged, failures, blocked
+
+
+def _purge_chunk_or_each(
+    model: type[SoftDeleteMixin], entity_ids: list[int], cutoff: datetime
+) -> tuple[int, int, int]:
+    """Purge a chunk with the set-based cascade, timing it; if the chunk
+    fails, retry its entities one at a time so one bad entity cannot hold
+    back the rest. Returns ``(purged, failures, blocked)``."""
+    entity_type = _model_table_name(model)
+    started = perf_counter()
+    try:
+        purged, blocked = _purge_chunk(model, entity_ids, cutoff)
+        failures = 0
+    except Exception:  # pylint: disable=broad-except
+        db.session.rollback()  # pylint: disable=consider-using-transaction
+        logger.warning(
+            "deletion_retention: set-based purge of %s %s failed; "
+            "retrying one at a time",
+            len(entity_ids),
+            entity_type,
+            exc_info=True,
+        )
+        stats_logger_manager.instance.incr(f"{_METRIC_PREFIX}.chunk_fallbacks")
+        purged, failures, blocked = _purge_each(model, entity_ids, cutoff)
+    elapsed = perf_counter() - started
+    stats_logger_manager.instance.timing(
+        f"{_METRIC_PREFIX}.chunk_duration.{entity_type}", elapsed * 1000
+    )
+    logger.info(
+        "deletion_retention: %s chunk of %s ids %s..%s: purged=%s failed=%s "
+        "blocked=%s in %.3fs",
+        entity_type,
+        len(entity_ids),
+        entity_ids[0],
+        entity_ids[-1],
+        purged,
+        failures,
+        blocked,
+        elapsed,
+    )
+    return purged, failures, blocked
+
+
+def _purge_chunk(
+    model: type[SoftDeleteMixin], entity_ids: list[int], cutoff: datetime
+) -> tuple[int, int]:
+    """Purge a chunk of entities in one transaction with write-ahead audits.
+
+    The set-based counterpart of ``_purge_one``: the audit rows are written
+    and finalized in one commit each, and the cascade runs one statement per
+    declared dependency for the whole chunk. Returns ``(purged, blocked)``;
+    raises, with the chunk rolled back and its audit rows failed, if any
+    part of the cascade fails.
+    """
+    entity_type = _model_table_name(model)
+    table = _model_table(model)
+    uuid_column = table.c.get("uuid")
+    with skip_visibility_filter(db.session, model):
+        entity_uuids: dict[int, str | None] = {
+            row[0]: (str(row[1]) if row[1] is not None else None)
+            for row in db.session.execute(
+                sa.select(
+                    table.c.id,
+                    uuid_column if uuid_column is not None else sa.null(),
+                ).where(table.c.id.in_(entity_ids))
+            )
+        }
+        removed_dashboard_slices = count_dashboard_slices_by_id(
+            db.session, get_purge_policy(model), list(entity_uuids)
+        )
+    if not entity_uuids:
+        return 0, 0
+    # As in _purge_one: end the read transaction before the audit write.
+    db.session.rollback()  # pylint: disable=consider-using-transaction
+    ids = list(entity_uuids)
+    record_ids = audit.write_ahead_many(
+        trigger=audit.TRIGGER_RETENTION,
+        actor=audit.ACTOR_SYSTEM,
+        entity_type=entity_type,
+        entities=[
+            (entity_uuids[entity_id], removed_dashboard_slices.get(entity_id, 0))
+            for entity_id in ids
+        ],
+    )
+    if record_ids is None:
+        # Fail closed, as _purge_one does.
+        raise RuntimeError(
+            f"deletion_retention: write-ahead audit failed for {len(ids)} "
+            f"{entity_type}; skipping set-based purge"
+        )
+    record_by_id = dict(zip(ids, record_ids, strict=True))
+    try:
+        with suppress_purge_association_versions(db.session):
+            batch = cascade_hard_delete_many(
+                db.session, model, entity_uuids, cutoff=cutoff
+            )
+        # Commit after the suppression block; see _purge_one.
+        db.session.commit()  # pylint: disable=consider-using-transaction
+    except Exception:
+        db.session.rollback()  # pylint: disable=consider-using-transaction
+        audit.finalize_many(
+            {record_id: (STATUS_FAILED, {}) for record_id in record_ids}
+        )
+        raise
+
+    outcomes: dict[Any, tuple[str, dict[str, Any]]] = {}
+    blocked_records = []
+    for entity_id, result in batch.results.items():
+        record_id = record_by_id[entity_id]
+        if result.purged:
+            outcomes[record_id] = (
+                STATUS_CONFIRMED,
+                {
+                    "affected_referrers": result.dangling_chart_uuids,
+                    "removed_dashboard_slices": result.removed_dashboard_slices,
+                },
+            )
+        elif result.blocked_reason is not None:
+            blocked_records.append(record_id)
+        else:
+            outcomes[record_id] = (STATUS_FAILED, {})
+    audit.finalize_many(outcomes)
+    for record_id in blocked_records:
+        _finalize_blocked(record_id)
+    purged = sum(1 for result in batch.results.values() if result.purged)
+    return purged, len(blocked_records)
+
+
 def _purge_one(
     model: type[SoftDeleteMixin], entity_id: int, cutoff: datetime
 ) -> CascadeResult | None:
@@ -280,22 +457,25 @@ def _purge_one(
             removed_dashboard_slices=result.removed_dashboard_slices,
         )
     elif result.blocked_reason is not None:
-        disposition: audit.RetentionBlockedDisposition = (
-            audit.finalize_retention_blocked(record_id)
-        )
-        if disposition == "suppressed":
-            stats_logger_manager.instance.incr(
-                f"{_METRIC_PREFIX}.blocked_audit_suppressed"
-            )
-        elif disposition == "fallback":
-            stats_logger_manager.instance.incr(
-                f"{_METRIC_PREFIX}.blocked_audit_dedupe_fallback"
-            )
+        _finalize_blocked(record_id)
     else:
         audit.fail(record_id)
     return result
 
 
+def _finalize_blocked(record_id: Any) -> None:
+    """Finalize a blocked attempt, counting suppressed and fallback outcomes."""
+    disposition: audit.RetentionBlockedDisposition = audit.finalize_retention_blocked(
+        record_id
+    )
+    if disposition == "suppressed":
+        stats_logger_manager.instance.incr(f"{_METRIC_PREFIX}.blocked_audit_suppressed")
+    elif disposition == "fallback":
+        stats_logger_manager.instance.incr(
+            f"{_METRIC_PREFIX}.blocked_audit_dedupe_fallback"
+        )
+
+
 @celery_app.task(name="deletion_retention.purge_soft_deleted")
 def purge_soft_deleted() -> dict[str, Any]:
     """Beat entry point. Resolves the window live, honors the SOFT_DELETE
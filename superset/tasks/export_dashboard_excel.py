@@ -33,16 +33,20 @@ import copy
 import logging
 import os
 import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import pandas as pd
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app, g
 
 from superset import db, security_manager
 from superset.charts.data.dashboard_filter_context import (
     apply_dashboard_filter_context,
-    get_dashboard_filter_context,
+    DashboardFilterContext,
+    get_dashboard_filter_contexts,
 )
 from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.commands.chart.data.get_data_command import ChartDataCommand
@@ -240,10 +244,6 @@ def _resolve_query_context(chart: Any) -> dict[str, Any] | None:
     )
 
 
-def _record_to_row(record: dict[str, Any], colnames: list[str]) -> list[Any]:
-    return [record.get(col) for col in colnames]
-
-
 def _table_viz_types() -> set[str]:
     """Viz types kept tabular in image mode (config override or built-in default)."""
     return current_app.config.get("EXCEL_EXPORT_TABLE_VIZ_TYPES") or TABLE_VIZ_TYPES
@@ -272,21 +272,13 @@ def _write_chart_image_sheet(
     writer.add_image_sheet(_chart_label(chart), image)
 
 
-def _write_chart_sheets(
-    writer: StreamingXlsxWriter,
-    chart: Any,
+def _prepare_chart_query(
     json_body: dict[str, Any],
-    dashboard_id: int,
-    active_data_mask: dict[str, Any],
-) -> None:
+    filter_context: DashboardFilterContext,
+) -> dict[str, Any]:
     """
-    Run a single chart's query and stream its result(s) into the workbook.
-
-    ``json_body`` is the resolved query-context payload (the chart's saved
-    context or one synthesized from its form data). Charts may yield more than
-    one query (e.g. mixed-series charts); each becomes its own sheet. Raises if
-    the chart cannot be exported, so the caller can skip it and note it in the
-    email.
+    Return the query-context payload to run for a chart: ``json_body`` with the
+    chart's resolved dashboard filters applied and full results requested.
     """
     # Shallow-copy before setting our own top-level keys so the caller's payload
     # keeps its original result_format/result_type. (The nested ``queries`` are
@@ -294,42 +286,69 @@ def _write_chart_sheets(
     # because every payload ``_resolve_query_context`` returns is this chart's
     # alone: freshly parsed, freshly built, or deep-copied from the builder hook.)
     json_body = dict(json_body)
-    # Override any stale saved values: we always want full JSON results.
+    # Override any stale saved values: we always want full results.
     json_body["result_format"] = ChartDataResultFormat.JSON
     json_body["result_type"] = ChartDataResultType.FULL
     json_body.pop("force", None)
 
-    filter_context = get_dashboard_filter_context(
-        dashboard_id=dashboard_id,
-        chart_id=chart.id,
-        active_data_mask=active_data_mask,
-    )
     if filter_context.extra_form_data:
         apply_dashboard_filter_context(json_body, filter_context.extra_form_data)
+    return json_body
 
-    # Jinja macros resolve form data from g.form_data; expose the saved context.
-    g.form_data = json_body
 
-    query_context = ChartDataQueryContextSchema().load(json_body)
-    command = ChartDataCommand(query_context)
-    command.validate()
-    result = command.run()
+def _run_chart_query(
+    app: Any,
+    user_id: int,
+    json_body: dict[str, Any],
+) -> list[pd.DataFrame]:
+    """
+    Run a chart's queries on a pool thread and return one DataFrame per query.
+
+    The thread gets its own app context (and so its own database session), and
+    runs as the requesting user like the rest of the export.
+    """
+    with app.app_context():
+        user = security_manager.get_user_by_id(user_id)
+        with override_user(user, force=False):
+            # Jinja macros resolve form data from g.form_data; expose the saved
+            # context.
+            g.form_data = json_body
+
+            query_context = ChartDataQueryContextSchema().load(json_body)
+            command = ChartDataCommand(query_context)
+            command.validate()
+            return [payload["df"] for payload in command.run_df()]
+
+
+def _write_chart_sheets(
+    writer: StreamingXlsxWriter,
+    chart: Any,
+    frames: list[pd.DataFrame],
+) -> None:
+    """
+    Stream a chart's query results into the workbook.
 
-    for index, query in enumerate(result["queries"]):
-        colnames = query.get("colnames") or []
-        data = query.get("data") or []
+    Charts may yield more than one query (e.g. mixed-series charts); each becomes
+    its own sheet. Rows are streamed straight from each DataFrame rather than
+    materialized as records first.
+    """
+    for index, df in enumerate(frames):
         if index == 0:
             name = f"{chart.id} - {chart.slice_name or ''}"
         else:
             name = f"{chart.id}.{index} - {chart.slice_name or ''}"
         writer.add_sheet(
             name,
-            colnames,
-            (_record_to_row(record, colnames) for record in data),
+            list(df.columns),
+            df.itertuples(index=False, name=None),
         )
 
 
-def _build_workbook(
+def _query_concurrency() -> int:
+    return max(1, int(current_app.config["EXCEL_EXPORT_QUERY_CONCURRENCY"]))
+
+
+def _build_workbook(  # noqa: C901
     path: str,
     dashboard: Any,
     active_data_mask: dict[str, Any],
@@ -339,55 +358,105 @@ def _build_workbook(
 ) -> dict[str, list[str]]:
     """Build the workbook on disk.
 
+    Data charts' queries run concurrently on a bounded pool
+    (``EXCEL_EXPORT_QUERY_CONCURRENCY``) a limited number of charts ahead of the
+    writer, while sheets are still written in layout order, so the export time is
+    no longer the sum of every chart's warehouse latency.
+
     Return the charts that could not be exported, grouped by the reason they
     were omitted (see the ``email.ERROR_*`` reason keys), so the notification
     can explain each group separately.
     """
     errored: dict[str, list[str]] = {}
+    charts = get_charts_in_layout_order(dashboard)
+    # Resolve the dashboard filters of every data chart in one pass, rather than
+    # reloading and re-parsing the dashboard for each chart.
+    filter_contexts = get_dashboard_filter_contexts(
+        dashboard.id,
+        [chart.id for chart in charts if not _renders_as_image(chart, mode)],
+        active_data_mask=active_data_mask,
+    )
+    app = current_app._get_current_object()  # pylint: disable=protected-access
+    concurrency = _query_concurrency()
+    # Results are written in layout order, so a slow chart holds back the ones
+    # after it. Bound how far ahead queries may run to bound buffered results.
+    window = concurrency * 2
+    pending: deque[tuple[Any, Future[list[pd.DataFrame]] | None]] = deque()
+
+    def _write_next() -> None:
+        chart, future = pending.popleft()
+        label = _chart_label(chart)
+        try:
+            if future is None:
+                # Image charts render from their saved params via the webdriver
+                # and don't need a query context.
+                _write_chart_image_sheet(
+                    writer, chart, dashboard.id, active_data_mask, user
+                )
+            else:
+                _write_chart_sheets(writer, chart, future.result())
+        except SoftTimeLimitExceeded:
+            # A soft timeout is a task-level signal, not a per-chart failure:
+            # let it propagate so the outer handler emails a failure and runs
+            # cleanup, rather than continuing until the hard limit kills the
+            # worker (which would skip cleanup, leak temp files, and hold the
+            # in-flight lock until its TTL). ``except Exception`` below would
+            # otherwise swallow it, since it subclasses ``Exception``.
+            raise
+        except _ChartSkippedError:
+            logger.warning(
+                "Skipping chart %s in dashboard export %s (could not render)",
+                chart.id,
+                job_id,
+            )
+            errored.setdefault(email.ERROR_GENERAL, []).append(label)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception(
+                "Skipping chart %s in dashboard export %s", chart.id, job_id
+            )
+            errored.setdefault(email.ERROR_GENERAL, []).append(label)
+
     writer = StreamingXlsxWriter(path)
+    executor = ThreadPoolExecutor(
+        max_workers=concurrency,
+        thread_name_prefix=f"dash-export-{job_id}",
+    )
     try:
-        for chart in get_charts_in_layout_order(dashboard):
-            label = _chart_label(chart)
-            try:
-                if _renders_as_image(chart, mode):
-                    # Image charts render from their saved params via the
-                    # webdriver and don't need a query context.
-                    _write_chart_image_sheet(
-                        writer, chart, dashboard.id, active_data_mask, user
-                    )
-                else:
-                    # Data charts need a query context: use the saved one, or
-                    # rebuild it from form data for eligible viz types. Skip
-                    # cleanly when none is available rather than failing.
+        for chart in charts:
+            future: Future[list[pd.DataFrame]] | None = None
+            if not _renders_as_image(chart, mode):
+                # Data charts need a query context: use the saved one, or
+                # rebuild it from form data for eligible viz types. Skip
+                # cleanly when none is available rather than failing.
+                try:
                     json_body = _resolve_query_context(chart)
-                    if json_body is None:
-                        errored.setdefault(email.ERROR_NO_QUERY_CONTEXT, []).append(
-                            label
-                        )
-                        continue
-                    _write_chart_sheets(
-                        writer, chart, json_body, dashboard.id, active_data_mask
+                except SoftTimeLimitExceeded:
+                    raise
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception(
+                        "Skipping chart %s in dashboard export %s", chart.id, job_id
                     )
-            except SoftTimeLimitExceeded:
-                # A soft timeout is a task-level signal, not a per-chart failure:
-                # let it propagate so the outer handler emails a failure and runs
-                # cleanup, rather than continuing until the hard limit kills the
-                # worker (which would skip cleanup, leak temp files, and hold the
-                # in-flight lock until its TTL). ``except Exception`` below would
-                # otherwise swallow it, since it subclasses ``Exception``.
-                raise
-            except _ChartSkippedError:
-                logger.warning(
-                    "Skipping chart %s in dashboard export %s (could not render)",
-                    chart.id,
-                    job_id,
-                )
-                errored.setdefault(email.ERROR_GENERAL, []).append(label)
-            except Exception:  # pylint: disable=broad-except
-                logger.exception(
-                    "Skipping chart %s in dashboard export %s", chart.id, job_id
+                    errored.setdefault(email.ERROR_GENERAL, []).append(
+                        _chart_label(chart)
+                    )
+                    continue
+                if json_body is None:
+                    errored.setdefault(email.ERROR_NO_QUERY_CONTEXT, []).append(
+                        _chart_label(chart)
+                    )
+                    continue
+                future = executor.submit(
+                    _run_chart_query,
+                    app,
+                    user.id,
+                    _prepare_chart_query(json_body, filter_contexts[chart.id]),
                 )
-                errored.setdefault(email.ERROR_GENERAL, []).append(label)
+            pending.append((chart, future))
+            if len(pending) >= window:
+                _write_next()
+
+        while pending:
+            _write_next()
 
         if writer.sheet_count == 0:
             flat = [label for labels in errored.values() for label in labels]
@@ -396,6 +465,9 @@ def _build_workbook(
                 ["No chart data could be exported.", *flat],
             )
     finally:
+        # On an abort, drop the queries that have not started; the running ones
+        # finish in the background but their results are discarded.
+        executor.shutdown(wait=not pending, cancel_futures=True)
         writer.close()
     return errored
 
@@ -429,6 +501,7 @@ def export_dashboard_excel(
     active_data_mask: dict[str, Any],
     job_id: str,
     mode: str = EXPORT_MODE_DATA,
+    lock_token: str | None = None,
 ) -> None:
     """
     Export a dashboard's charts to an ``.xlsx`` and email a download link.
@@ -439,6 +512,8 @@ def export_dashboard_excel(
     :param job_id: Correlation id, also the Celery task id and S3 object name
     :param mode: ``"data"`` streams every chart's tabular result; ``"images"``
         embeds non-table charts as rendered images and keeps tables tabular
+    :param lock_token: Owner token of the in-flight lock the API acquired, so the
+        release cannot free a lock since re-acquired by a newer export
     """
     # pylint: disable=import-outside-toplevel
     from superset.models.dashboard import Dashboard
@@ -508,6 +583,7 @@ def export_dashboard_excel(
             ReleaseDistributedLock(
                 EXPORT_LOCK_NAMESPACE,
                 export_lock_params(user_id, dashboard_id),
+                token=lock_token,
             ).run()
         except Exception:  # pylint: disable=broad-except
             # Best-effort: the lock's TTL is the backstop if this fails.
@@ -42,6 +42,10 @@ logger = logging.getLogger(__name__)
 # they complete quickly (just DB operations, no external calls)
 TASK_LOCK_TTL_SECONDS = 10
 
+# Operations on the same task are short, so a contending caller waits briefly
+# for the holder to release rather than failing outright
+TASK_LOCK_WAIT_SECONDS = 5
+
 
 @contextmanager
 def task_lock(dedup_key: str) -> Iterator[None]:
@@ -57,11 +61,14 @@ def task_lock(dedup_key: str) -> Iterator[None]:
 
     When DISTRIBUTED_COORDINATION_CONFIG is configured, uses Redis SET NX EX
     for efficient single-command locking. Otherwise falls back to
-    database-backed DistributedLock.
+    database-backed DistributedLock. A caller contending with another
+    operation on the same task waits up to ``TASK_LOCK_WAIT_SECONDS`` for it
+    to finish before giving up.
 
     :param dedup_key: Task deduplication key (from get_active_dedup_key)
     :yields: Nothing; used as context manager
-    :raises AcquireDistributedLockFailedException: If lock is already held
+    :raises AcquireDistributedLockFailedException: If lock is still held after
+        waiting ``TASK_LOCK_WAIT_SECONDS``
 
     Example:
         dedup_key = get_active_dedup_key(TaskScope.SHARED, "report", "monthly")
@@ -75,6 +82,7 @@ def task_lock(dedup_key: str) -> Iterator[None]:
         namespace="gtf:task",
         key=dedup_key,
         ttl_seconds=TASK_LOCK_TTL_SECONDS,
+        wait_timeout=TASK_LOCK_WAIT_SECONDS,
     ):
         yield
 
@@ -17,7 +17,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
@@ -37,14 +37,14 @@ from superset.commands.sql_lab.query import QueryPruneCommand
 from superset.commands.tasks.prune import TaskPruneCommand
 from superset.daos.report import ReportScheduleDAO
 from superset.daos.tasks import TaskDAO
-from superset.extensions import celery_app
+from superset.extensions import celery_app, db
 from superset.key_value.commands.prune import KeyValuePruneCommand
 from superset.reports.models import ReportScheduleType
 from superset.stats_logger import BaseStatsLogger
 from superset.tasks.ambient_context import use_context
 from superset.tasks.constants import ABORT_STATES, TERMINAL_STATES
 from superset.tasks.context import TaskContext
-from superset.tasks.cron_util import cron_schedule_window
+from superset.tasks.cron_util import cron_next_run, cron_schedule_window
 from superset.tasks.manager import TaskManager
 from superset.tasks.registry import TaskRegistry
 from superset.utils.core import LoggerLevel
@@ -88,27 +88,45 @@ def scheduler(self: Task) -> None:  # pylint: disable=unused-argument
 
     if not is_feature_enabled("ALERT_REPORTS"):
         return
-    active_schedules = ReportScheduleDAO.find_active()
     triggered_at = (
         datetime.fromisoformat(scheduler.request.expires)
         - current_app.config["CELERY_BEAT_SCHEDULER_EXPIRES"]
         if scheduler.request.expires
         else datetime.now(tz=timezone.utc)
     )
-    for active_schedule in active_schedules:
-        for schedule in cron_schedule_window(
-            triggered_at, active_schedule.crontab, active_schedule.timezone
-        ):
-            logger.info("Scheduling alert %s eta: %s", active_schedule.name, schedule)
-            async_options = {
-                "eta": schedule,
-                **get_report_task_timeout_options(
-                    is_report=active_schedule.type == ReportScheduleType.REPORT,
-                    working_timeout=active_schedule.working_timeout,
-                    config=current_app.config,
-                ),
-            }
-            execute.apply_async((active_schedule.id,), **async_options)
+    # only schedules whose next run falls before the end of the current window
+    # need to be evaluated; all others are skipped by the indexed lookup
+    window_size = current_app.config["ALERT_REPORTS_CRON_WINDOW_SIZE"]
+    stop_at = triggered_at + timedelta(seconds=window_size / 2)
+    due_schedules = ReportScheduleDAO.find_due(
+        stop_at.astimezone(timezone.utc).replace(tzinfo=None)
+    )
+    stats_logger.gauge("reports.scheduler.due", len(due_schedules))
+    if not due_schedules:
+        return
+
+    # publish all executions through a single producer connection
+    with celery_app.producer_or_acquire() as producer:
+        for due_schedule in due_schedules:
+            for schedule in cron_schedule_window(
+                triggered_at, due_schedule.crontab, due_schedule.timezone
+            ):
+                logger.info("Scheduling alert %s eta: %s", due_schedule.name, schedule)
+                async_options = {
+                    "eta": schedule,
+                    **get_report_task_timeout_options(
+                        is_report=due_schedule.type == ReportScheduleType.REPORT,
+                        working_timeout=due_schedule.working_timeout,
+                        config=current_app.config,
+                    ),
+                }
+                execute.apply_async(
+                    (due_schedule.id,), producer=producer, **async_options
+                )
+            due_schedule.next_run_at = cron_next_run(
+                due_schedule.crontab, due_schedule.timezone, stop_at
+            )
+    db.session.commit()  # pylint: disable=consider-using-transaction
 
 
 @celery_app.task(name="reports.execute", bind=True)
@@ -272,7 +290,9 @@ def prune_key_value(
     stats_logger.incr("prune_key_value")
 
     try:
-        KeyValuePruneCommand(max_rows_per_run).run()
+        deleted = KeyValuePruneCommand(max_rows_per_run).run()
+        for resource, count in deleted.items():
+            stats_logger.gauge(f"prune_key_value.{resource}.deleted", count)
     except CommandException as ex:
         logger.exception("An error occurred while pruning the key-value store: %s", ex)
 
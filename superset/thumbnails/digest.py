@@ -105,6 +105,17 @@ def _adjust_string_with_rls(
     return unique_string
 
 
+def get_executor_rls_digest(
+    datasources: list[SqlaTable | None] | set[BaseDatasource],
+    executor: str,
+) -> str:
+    """
+    Digest of an executor and the RLS filters applying to it on the given
+    datasources, to tell apart renders of the same resource by different users.
+    """
+    return hash_from_str(_adjust_string_with_rls(executor, datasources, executor))
+
+
 def get_dashboard_digest(dashboard: Dashboard) -> str | None:
     try:
         executor_type, executor = get_executor(
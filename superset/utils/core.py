@@ -46,7 +46,7 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formatdate
 from enum import Enum, IntEnum
-from io import BytesIO
+from io import BytesIO, RawIOBase
 from timeit import default_timer
 from types import TracebackType
 from typing import (
@@ -2218,6 +2218,42 @@ def create_zip(files: dict[str, Any]) -> BytesIO:
     return buf
 
 
+class _ZipChunkStream(RawIOBase):
+    """Write-only, non-seekable sink collecting the bytes ``ZipFile`` writes."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(files: Iterable[tuple[str, Callable[[], str]]]) -> Iterator[bytes]:
+    """
+    Build a ZIP file incrementally, yielding its bytes as each member is written.
+
+    Unlike ``create_zip`` the archive is never held in memory as a whole, so it can
+    be sent as a streamed response while ``files`` is still being produced.
+    """
+    stream = _ZipChunkStream()
+    with ZipFile(stream, "w") as bundle:
+        for file_name, file_content in files:
+            with bundle.open(file_name, "w") as fp:
+                fp.write(file_content().encode())
+            if chunk := stream.drain():
+                yield chunk
+    yield stream.drain()
+
+
 def check_is_safe_zip(zip_file: ZipFile) -> None:
     """
     Checks whether a ZIP file is safe, raises SupersetException if not.
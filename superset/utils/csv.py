@@ -133,12 +133,19 @@ def get_chart_dataframe(
     auth_cookies: Optional[dict[str, str]] = None,
     timeout: Optional[float] = None,
 ) -> Optional[pd.DataFrame]:
-    # Disable all the unnecessary-lambda violations in this function
-    # pylint: disable=unnecessary-lambda
     content = get_chart_csv_data(chart_url, auth_cookies, timeout)
     if content is None:
         return None
+    return chart_data_to_dataframe(content)
 
+
+def chart_data_to_dataframe(content: bytes) -> Optional[pd.DataFrame]:
+    """
+    Build a dataframe from a JSON chart data response, restoring temporal
+    columns and the hierarchical columns and index of post-processed results.
+    """
+    # Disable all the unnecessary-lambda violations in this function
+    # pylint: disable=unnecessary-lambda
     result = json.loads(content.decode("utf-8"))
     # need to convert float value to string to show full long number
     pd.set_option("display.float_format", lambda x: str(x))
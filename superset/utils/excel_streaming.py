@@ -36,6 +36,8 @@ from decimal import Decimal
 from io import BytesIO
 from typing import Any
 
+import numpy as np
+import pandas as pd
 import xlsxwriter
 
 from superset.utils.excel import FORMULA_PREFIXES, NEUTRAL_DOCUMENT_PROPERTIES
@@ -125,10 +127,13 @@ def _sanitize_cell(value: Any) -> Any:
 
     Quotes formula-like strings (defense against formula injection), stringifies
     integers/floats Excel cannot represent precisely, renders temporal values as
-    ISO strings (timezones are not natively supported), and blanks out ``None``
-    and non-finite floats.
+    ISO strings (timezones are not natively supported), and blanks out ``None``,
+    ``NaT`` and non-finite floats. NumPy scalars, as yielded when rows are
+    streamed from a DataFrame, are unboxed to their Python equivalents first.
     """
-    if value is None:
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or value is pd.NaT:
         return ""
     # bool is a subclass of int; preserve it before the numeric branches.
     if isinstance(value, bool):
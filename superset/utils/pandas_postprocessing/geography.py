@@ -16,14 +16,121 @@
 # under the License.
 from typing import Optional
 
-import pygeohash as geohash_lib
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from flask_babel import gettext as _
 from geopy.point import Point
-from pandas import DataFrame
+from pandas import DataFrame, Series
+from pandas.api.types import infer_dtype
 
 from superset.exceptions import InvalidPostProcessingError
 from superset.utils.pandas_postprocessing.utils import _append_columns
 
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 12
+
+# lookup table from ASCII code to the 5-bit value of a geohash character, with -1
+# marking characters that are not part of the geohash alphabet
+_GEOHASH_DECODE_TABLE = np.full(256, -1, dtype=np.int8)
+_GEOHASH_DECODE_TABLE[np.frombuffer(GEOHASH_BASE32.encode(), dtype=np.uint8)] = (
+    np.arange(32, dtype=np.int8)
+)
+_GEOHASH_ENCODE_TABLE = np.frombuffer(GEOHASH_BASE32.encode(), dtype=np.uint8)
+
+# fast path for plain "lat, lon[, alt unit]" strings, which geopy parses the same
+# way; anything else is handed over to geopy, which understands many more notations
+_DECIMAL = r"[-+]?\d+(?:\.\d+)?"
+_GEODETIC_PATTERN = (
+    rf"^\s*(?P<latitude>{_DECIMAL})\s*,\s*(?P<longitude>{_DECIMAL})"
+    rf"(?:\s*,\s*(?P<altitude>{_DECIMAL})[ ]*(?P<unit>km|m))?\s*$"
+)
+_ALTITUDE_UNITS_PER_KM = {"km": 1.0, "m": 1000.0}
+
+
+def _bisect(values: np.ndarray, lower: float, upper: float, bits: int) -> np.ndarray:
+    """
+    Bisect an array of coordinates ``bits`` times, returning for each value the
+    integer formed by the successive halving decisions. Values on a midpoint
+    fall into the upper half, matching ``pygeohash``.
+    """
+    low = np.full(values.shape, lower)
+    high = np.full(values.shape, upper)
+    result = np.zeros(values.shape, dtype=np.int64)
+    for _bit in range(bits):
+        mid = (low + high) / 2
+        above = values >= mid
+        result = (result << 1) | above
+        low = np.where(above, mid, low)
+        high = np.where(above, high, mid)
+    return result
+
+
+def _geohash_encode_arrays(
+    latitudes: np.ndarray, longitudes: np.ndarray, precision: int = GEOHASH_PRECISION
+) -> np.ndarray:
+    """
+    Encode arrays of latitudes and longitudes into an array of geohash strings.
+    """
+    total_bits = precision * 5
+    lon_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    lon_codes = _bisect(longitudes, -180.0, 180.0, lon_bits)
+    lat_codes = _bisect(latitudes, -90.0, 90.0, lat_bits)
+
+    # interleave the bits, starting with longitude on even positions
+    interleaved = np.zeros(latitudes.shape, dtype=np.int64)
+    for position in range(total_bits):
+        if position % 2 == 0:
+            bit = (lon_codes >> (lon_bits - 1 - position // 2)) & 1
+        else:
+            bit = (lat_codes >> (lat_bits - 1 - position // 2)) & 1
+        interleaved = (interleaved << 1) | bit
+
+    shifts = np.arange(precision - 1, -1, -1, dtype=np.int64) * 5
+    indexes = (interleaved[:, np.newaxis] >> shifts) & 0x1F
+    chars = _GEOHASH_ENCODE_TABLE[indexes]
+    return np.ascontiguousarray(chars).view(f"S{precision}").ravel().astype(str)
+
+
+def _geohash_decode_arrays(geohashes: Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Decode a series of geohash strings into arrays of latitudes and longitudes of
+    the center of each geohash cell.
+    """
+    if len(geohashes) and infer_dtype(geohashes, skipna=False) != "string":
+        raise ValueError("Geohash values must be strings")
+    encoded = geohashes.to_numpy(dtype="S")
+    lengths = np.char.str_len(encoded)
+    width = encoded.dtype.itemsize
+    chars = encoded.view(np.uint8).reshape(len(encoded), width)
+    values = _GEOHASH_DECODE_TABLE[chars]
+    padding = np.arange(width) >= lengths[:, np.newaxis]
+    if (lengths == 0).any() or ((values < 0) & ~padding).any():
+        raise ValueError("Invalid geohash string")
+
+    lat_low = np.full(len(encoded), -90.0)
+    lat_high = np.full(len(encoded), 90.0)
+    lon_low = np.full(len(encoded), -180.0)
+    lon_high = np.full(len(encoded), 180.0)
+    is_lon = True
+    for position in range(width):
+        active = ~padding[:, position]
+        char_values = values[:, position]
+        for mask in (16, 8, 4, 2, 1):
+            bit = (char_values & mask) > 0
+            if is_lon:
+                mid = (lon_low + lon_high) / 2
+                lon_low = np.where(active & bit, mid, lon_low)
+                lon_high = np.where(active & ~bit, mid, lon_high)
+            else:
+                mid = (lat_low + lat_high) / 2
+                lat_low = np.where(active & bit, mid, lat_low)
+                lat_high = np.where(active & ~bit, mid, lat_high)
+            is_lon = not is_lon
+
+    return (lat_low + lat_high) / 2, (lon_low + lon_high) / 2
+
 
 def geohash_decode(
     df: DataFrame, geohash: str, longitude: str, latitude: str
@@ -38,9 +145,9 @@ def geohash_decode(
     :return: DataFrame with decoded longitudes and latitudes
     """
     try:
-        lonlat_df = DataFrame()
-        lonlat_df["latitude"], lonlat_df["longitude"] = zip(
-            *df[geohash].apply(geohash_lib.decode), strict=False
+        latitudes, longitudes = _geohash_decode_arrays(df[geohash])
+        lonlat_df = DataFrame(
+            {"latitude": latitudes, "longitude": longitudes}, index=df.index
         )
         return _append_columns(
             df, lonlat_df, {"latitude": latitude, "longitude": longitude}
@@ -65,19 +172,60 @@ def geohash_encode(
     :return: DataFrame with decoded longitudes and latitudes
     """
     try:
-        encode_df = df[[latitude, longitude]]
-        encode_df.columns = ["latitude", "longitude"]
-        encode_df["geohash"] = encode_df.apply(
-            lambda row: geohash_lib.encode(
-                latitude=row["latitude"], longitude=row["longitude"]
-            ),
-            axis=1,
+        latitudes = df[latitude].to_numpy(dtype=float)
+        longitudes = df[longitude].to_numpy(dtype=float)
+        if not (
+            ((latitudes >= -90) & (latitudes <= 90)).all()
+            and ((longitudes >= -180) & (longitudes <= 180)).all()
+        ):
+            raise ValueError("Coordinates out of range")
+        encode_df = DataFrame(
+            {"geohash": _geohash_encode_arrays(latitudes, longitudes)},
+            index=df.index,
         )
         return _append_columns(df, encode_df, {"geohash": geohash})
-    except ValueError as ex:
+    except (TypeError, ValueError) as ex:
         raise InvalidPostProcessingError(_("Invalid longitude/latitude")) from ex
 
 
+def _parse_geodetic_series(
+    locations: Series,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parse a series of geodetic point strings into arrays of latitudes, longitudes
+    and altitudes (in kilometers). Plain decimal notation is parsed vectorized;
+    all other notations fall back to geopy row by row.
+    """
+    matches = pc.extract_regex(
+        pa.array(locations.astype(str), type=pa.string()), _GEODETIC_PATTERN
+    )
+
+    def _field(name: str) -> np.ndarray:
+        values = pc.struct_field(matches, name)
+        values = pc.if_else(pc.equal(values, ""), None, values)
+        return pc.cast(values, pa.float64()).to_numpy(zero_copy_only=False)
+
+    latitudes = _field("latitude")
+    longitudes = _field("longitude")
+    altitudes = np.nan_to_num(_field("altitude"), nan=0.0)
+    units = pc.struct_field(matches, "unit").to_pandas()
+    altitudes = altitudes / (
+        units.map(_ALTITUDE_UNITS_PER_KM).fillna(1.0).to_numpy(dtype=float)
+    )
+
+    # geopy validates latitudes and normalizes longitudes; leave these to it
+    fallback = (
+        np.isnan(latitudes)
+        | (np.abs(latitudes) > 90)
+        | (np.abs(longitudes) > 180)
+        | locations.isna().to_numpy()
+    )
+    for row in np.flatnonzero(fallback):
+        point = Point(locations.iloc[row])
+        latitudes[row], longitudes[row], altitudes[row] = point[0], point[1], point[2]
+    return latitudes, longitudes, altitudes
+
+
 def geodetic_parse(
     df: DataFrame,
     geodetic: str,
@@ -96,25 +244,15 @@ def geodetic_parse(
     :param altitude: Name of new column to be created containing altitude.
     :return: DataFrame with decoded longitudes and latitudes
     """
-
-    def _parse_location(location: str) -> tuple[float, float, float]:
-        """
-        Parse a string containing a geodetic point and return latitude, longitude
-        and altitude
-        """
-        point = Point(location)
-        return point[0], point[1], point[2]
-
     try:
-        geodetic_df = DataFrame()
-        (
-            geodetic_df["latitude"],
-            geodetic_df["longitude"],
-            geodetic_df["altitude"],
-        ) = zip(*df[geodetic].apply(_parse_location), strict=False)
+        latitudes, longitudes, altitudes = _parse_geodetic_series(df[geodetic])
+        geodetic_df = DataFrame(
+            {"latitude": latitudes, "longitude": longitudes, "altitude": altitudes},
+            index=df.index,
+        )
         columns = {"latitude": latitude, "longitude": longitude}
         if altitude:
             columns["altitude"] = altitude
         return _append_columns(df, geodetic_df, columns)
-    except ValueError as ex:
+    except (TypeError, ValueError) as ex:
         raise InvalidPostProcessingError(_("Invalid geodetic string")) from ex
@@ -18,12 +18,14 @@ from __future__ import annotations
 
 import base64
 import logging
+import time
 from datetime import datetime
 from enum import Enum
 from io import BytesIO
 from typing import cast, TYPE_CHECKING, TypedDict
 
 from flask import current_app as app
+from flask_caching.backends import NullCache
 
 from superset import thumbnail_cache
 from superset.distributed_lock import DistributedLock
@@ -32,6 +34,7 @@ from superset.exceptions import (
     ScreenshotImageNotAvailableException,
 )
 from superset.extensions import event_logger
+from superset.thumbnails.digest import get_executor_rls_digest
 from superset.utils.hashing import hash_from_dict
 from superset.utils.report_execution import ReportExecutionContext
 from superset.utils.urls import modify_url_query
@@ -61,6 +64,8 @@ if TYPE_CHECKING:
     from flask_appbuilder.security.sqla.models import User
     from flask_caching import Cache
 
+    from superset.connectors.sqla.models import BaseDatasource, SqlaTable
+
 
 class StatusValues(Enum):
     PENDING = "Pending"
@@ -271,6 +276,98 @@ class BaseScreenshot:
         )
         return self.screenshot
 
+    def get_coalesced_screenshot(
+        self,
+        user: User,
+        executor: str,
+        datasources: list[SqlaTable | None] | set[BaseDatasource],
+        log_context: str | None = None,
+        report_execution_context: ReportExecutionContext | None = None,
+    ) -> bytes | None:
+        """
+        Take a screenshot, sharing a single render between every caller asking
+        for the same URL, digest and window size as the same executor (with the
+        same RLS filters) within ``SCREENSHOT_COALESCE_WINDOW`` seconds.
+
+        The first caller takes a lease on the key in the thumbnail cache and
+        renders; the others wait for the rendered bytes to show up in the cache
+        instead of launching their own browser. The screenshot is rendered
+        directly when coalescing is disabled, the cache is a ``NullCache`` or the
+        render does not show up in time.
+
+        :param user: The user to take the screenshot as
+        :param executor: The username of the user
+        :param datasources: The datasources whose RLS filters affect the render
+        """
+        window = app.config["SCREENSHOT_COALESCE_WINDOW"]
+        if not window or isinstance(self.cache.cache, NullCache):
+            return self.get_screenshot(
+                user=user,
+                log_context=log_context,
+                report_execution_context=report_execution_context,
+            )
+
+        stats_logger = app.config["STATS_LOGGER"]
+        coalesce_key = hash_from_dict(
+            {
+                "thumbnail_type": self.thumbnail_type,
+                "url": self.url,
+                "digest": self.digest,
+                "window_size": self.window_size,
+                "executor": get_executor_rls_digest(datasources, executor),
+            }
+        )
+        cache_key = f"screenshot_coalesce:{coalesce_key}"
+        lease_key = f"{cache_key}:lease"
+        wait_timeout = float(app.config["SCREENSHOT_COALESCE_WAIT_TIMEOUT"])
+        if report_execution_context:
+            # leave enough of the budget to render the screenshot ourselves
+            wait_timeout = min(
+                wait_timeout,
+                report_execution_context.deadline.remaining_seconds
+                - report_execution_context.readiness_reserve_seconds,
+            )
+        deadline = time.monotonic() + wait_timeout
+
+        while True:
+            if payload := self.cache.get(cache_key):
+                logger.info("Reusing coalesced screenshot for %s", coalesce_key)
+                stats_logger.incr("screenshot.coalesce.hit")
+                return ScreenshotCachePayload.from_dict(payload).get_image().read()
+
+            if self.cache.add(lease_key, True, timeout=max(1, int(wait_timeout))):
+                stats_logger.incr("screenshot.coalesce.render")
+                try:
+                    image = self.get_screenshot(
+                        user=user,
+                        log_context=log_context,
+                        report_execution_context=report_execution_context,
+                    )
+                    if validate_screenshot_image(image) is None:
+                        self.cache.set(
+                            cache_key,
+                            ScreenshotCachePayload(image).to_dict(),
+                            timeout=window,
+                        )
+                    return image
+                finally:
+                    self.cache.delete(lease_key)
+
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(app.config["SCREENSHOT_COALESCE_POLL_INTERVAL"])
+
+        logger.warning(
+            "Timed out waiting for coalesced screenshot %s, rendering it directly",
+            coalesce_key,
+        )
+        stats_logger.incr("screenshot.coalesce.timeout")
+        return self.get_screenshot(
+            user=user,
+            log_context=log_context,
+            report_execution_context=report_execution_context,
+        )
+
     def get_cache_key(
         self,
         window_size: bool | WindowSize | None = None,
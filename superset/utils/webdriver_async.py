@@ -0,0 +1,297 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Concurrent screenshot capture of several pages in one browser.
+
+`WebDriverPlaywright` drives a single page at a time through Playwright's sync
+API, whose objects are bound to the thread that created them, so the worker's
+browser idles while a page waits for its charts. `AsyncPlaywrightCapture` uses
+the async API instead: one browser per worker process, reused across batches,
+and up to ``SCREENSHOT_CAPTURE_CONCURRENCY`` pages rendering at once, each
+bounded by ``SCREENSHOT_CAPTURE_PAGE_TIMEOUT``.
+
+It only implements the thumbnail-style readiness wait; report captures, which
+need tiling and execution deadlines, keep using `WebDriverPlaywright`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, TYPE_CHECKING, TypeVar
+from urllib.parse import urlparse
+
+from flask import current_app as app
+
+from superset.extensions import machine_auth_provider_factory
+from superset.utils.screenshot_utils import (
+    CHART_CONTAINER_READY_JS,
+    CHART_HOLDERS_READY_JS,
+)
+
+if TYPE_CHECKING:
+    from flask_appbuilder.security.sqla.models import User
+
+    from superset.utils.webdriver import WindowSize
+
+try:
+    from playwright.async_api import (
+        async_playwright,
+        Error as PlaywrightError,
+        TimeoutError as PlaywrightTimeout,
+    )
+except ImportError:
+    async_playwright = None
+    PlaywrightError = Exception
+    PlaywrightTimeout = Exception
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class PageCapture:
+    """The outcome of capturing one URL."""
+
+    url: str
+    screenshot: bytes | None = None
+    error: str | None = None
+
+
+class _AsyncPlaywrightBrowserManager:
+    """Manages a long-lived async Playwright browser per worker process.
+
+    Async Playwright objects are bound to the event loop that created them, so
+    the manager keeps its own loop, on which every batch runs, rather than one
+    loop per `asyncio.run` call. The browser is relaunched if it disconnects or
+    the process was forked from the one that launched it.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._pid: int | None = None
+
+    def run(
+        self,
+        browser_args: list[str],
+        batch: Callable[[Any], Coroutine[Any, Any, T]],
+    ) -> T:
+        """Run ``batch`` with the browser, launching it if needed."""
+        if self._pid != os.getpid():
+            # the loop and browser of the parent process can't be used here
+            self._loop = self._playwright = self._browser = None
+            self._pid = os.getpid()
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self._run(browser_args, batch))
+
+    async def _run(
+        self,
+        browser_args: list[str],
+        batch: Callable[[Any], Coroutine[Any, Any, T]],
+    ) -> T:
+        if self._browser is None or not self._browser.is_connected():
+            await self._close()
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(args=browser_args)
+        return await batch(self._browser)
+
+    async def _close(self) -> None:
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:  # noqa: S110
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:  # noqa: S110
+                pass
+            self._playwright = None
+
+    def _cleanup(self) -> None:
+        if self._loop is None or self._pid != os.getpid():
+            return
+        self._loop.run_until_complete(self._close())
+        self._loop.close()
+        self._loop = None
+
+
+_browser_manager = _AsyncPlaywrightBrowserManager()
+atexit.register(_browser_manager._cleanup)
+
+
+def close_capture_browser() -> None:
+    """Close the browser of the worker process, if one was launched."""
+    _browser_manager._cleanup()
+
+
+def can_capture_concurrently() -> bool:
+    """
+    Whether `AsyncPlaywrightCapture` can be used: the async API is installed and
+    no (synchronous) ``WEBDRIVER_AUTH_FUNC`` override is configured.
+    """
+    return async_playwright is not None and not app.config.get("WEBDRIVER_AUTH_FUNC")
+
+
+class AsyncPlaywrightCapture:  # pylint: disable=too-few-public-methods
+    """Capture screenshots of several URLs concurrently in the worker's browser."""
+
+    def __init__(
+        self,
+        window: WindowSize,
+        concurrency: int | None = None,
+        page_timeout: float | None = None,
+    ) -> None:
+        self._window = window
+        self._concurrency = max(
+            1, concurrency or app.config.get("SCREENSHOT_CAPTURE_CONCURRENCY", 1)
+        )
+        self._page_timeout = page_timeout or app.config.get(
+            "SCREENSHOT_CAPTURE_PAGE_TIMEOUT"
+        )
+        self._browser_args = app.config["WEBDRIVER_OPTION_ARGS"]
+        self._pixel_density = app.config["WEBDRIVER_WINDOW"].get("pixel_density", 1)
+        self._default_timeout = app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"]
+        self._wait_event = app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"]
+        self._headstart = app.config["SCREENSHOT_SELENIUM_HEADSTART"]
+        self._load_wait = app.config["SCREENSHOT_LOAD_WAIT"]
+        self._animation_wait = app.config["SCREENSHOT_SELENIUM_ANIMATION_WAIT"]
+        self._cookie_domain = urlparse(app.config["WEBDRIVER_BASEURL"]).netloc
+
+    def capture(
+        self,
+        urls: list[str],
+        element_name: str,
+        user: User | None = None,
+    ) -> list[PageCapture]:
+        """
+        Capture every URL, in order. A page failing or exceeding its deadline is
+        reported in its `PageCapture` and does not affect the others.
+        """
+        if async_playwright is None:
+            raise RuntimeError("Playwright is required for concurrent screenshots")
+        # Cookies are minted here, inside the app context, rather than on the
+        # event loop.
+        cookies = (
+            machine_auth_provider_factory.instance.get_auth_cookies(user)
+            if user
+            else {}
+        )
+        return _browser_manager.run(
+            self._browser_args,
+            lambda browser: self._capture_all(browser, urls, element_name, cookies),
+        )
+
+    async def _capture_all(
+        self,
+        browser: Any,
+        urls: list[str],
+        element_name: str,
+        cookies: dict[str, str],
+    ) -> list[PageCapture]:
+        semaphore = asyncio.Semaphore(self._concurrency)
+        return list(
+            await asyncio.gather(
+                *(
+                    self._capture_page(browser, semaphore, url, element_name, cookies)
+                    for url in urls
+                )
+            )
+        )
+
+    async def _capture_page(
+        self,
+        browser: Any,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        element_name: str,
+        cookies: dict[str, str],
+    ) -> PageCapture:
+        async with semaphore:
+            context = await browser.new_context(
+                bypass_csp=True,
+                viewport={"width": self._window[0], "height": self._window[1]},
+                device_scale_factor=self._pixel_density,
+            )
+            try:
+                context.set_default_timeout(self._default_timeout)
+                if cookies:
+                    await context.add_cookies(
+                        [
+                            {
+                                "name": name,
+                                "value": value,
+                                "domain": self._cookie_domain,
+                                "path": "/",
+                                "sameSite": "Lax",
+                                "httpOnly": True,
+                            }
+                            for name, value in cookies.items()
+                        ]
+                    )
+                page = await context.new_page()
+                screenshot = await asyncio.wait_for(
+                    self._render(page, url, element_name),
+                    timeout=self._page_timeout,
+                )
+                return PageCapture(url, screenshot=screenshot)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Screenshot of %s exceeded its %ss deadline",
+                    url,
+                    self._page_timeout,
+                )
+                return PageCapture(url, error="deadline exceeded")
+            except PlaywrightError as ex:
+                logger.warning("Screenshot of %s failed: %s", url, ex)
+                return PageCapture(url, error=str(ex))
+            finally:
+                await context.close()
+
+    async def _render(self, page: Any, url: str, element_name: str) -> bytes:
+        try:
+            await page.goto(url, wait_until=self._wait_event)
+        except PlaywrightTimeout:
+            logger.warning(
+                "Web event %s not detected. Page %s might not have been fully loaded",
+                self._wait_event,
+                url,
+            )
+        await page.wait_for_timeout(self._headstart * 1000)
+
+        element = page.locator(f".{element_name}")
+        await element.wait_for()
+        await page.wait_for_function(
+            CHART_CONTAINER_READY_JS
+            if element_name == "chart-container"
+            else CHART_HOLDERS_READY_JS,
+            timeout=self._load_wait * 1000,
+        )
+        if self._animation_wait > 0:
+            await page.wait_for_timeout(self._animation_wait * 1000)
+
+        if element_name == "standalone":
+            return await page.screenshot(full_page=True)
+        return await element.screenshot()
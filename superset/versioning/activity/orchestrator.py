@@ -59,8 +59,12 @@ from superset.versioning.activity.queries import (
     first_tracked_tx,
     mark_first_tracked_saves,
     resolve_path_entity,
+    search_tokens,
+)
+from superset.versioning.activity.render import (
+    apply_record_decoration,
+    search_may_match_summary_wording,
 )
-from superset.versioning.activity.render import apply_record_decoration
 from superset.versioning.activity.scope import resolve_scope
 from superset.versioning.activity.visibility import filter_records_by_visibility
 from superset.versioning.api_helpers import (
@@ -208,6 +212,25 @@ def _record_matches(record: dict[str, Any], q: str) -> bool:
     return any(needle in h.lower() for h in haystacks)
 
 
+def _sql_search(q: str | None) -> str | None:
+    """The search to pre-filter in SQL, or ``None`` to fetch unfiltered.
+
+    Pushed down only when the SQL filter is guaranteed not to drop a
+    record :func:`_record_matches` would keep: ASCII searches (databases
+    disagree on lower-casing beyond it, and stored JSON escapes non-ASCII
+    text), with at least one JSON token, that cannot match a summary's
+    fixed wording (see ``search_may_match_summary_wording``).
+    """
+    if (
+        not q
+        or not q.isascii()
+        or not search_tokens(q)
+        or search_may_match_summary_wording(q)
+    ):
+        return None
+    return q
+
+
 def get_activity(
     model_cls: type[Model],
     entity_uuid: UUID,
@@ -279,7 +302,9 @@ def get_activity(
     # tombstone probes + impact counts on records the requester
     # can't see (the silent-filter contract).
     with _phase_timer(kind_key, "fetch_ms"):
-        records, truncated = fetch_change_records(entity_windows, since, until)
+        records, truncated = fetch_change_records(
+            entity_windows, since, until, search=_sql_search(q)
+        )
     with _phase_timer(kind_key, "visibility_filter_ms"):
         records = filter_records_by_visibility(records)
     with _phase_timer(kind_key, "denormalize_ms"):
@@ -294,9 +319,9 @@ def get_activity(
     # Server-side search (the panel's client-side
     # search only covers loaded pages). Applied post-decoration so the
     # synthesized ``summary`` / ``entity_name`` participate, and pre-
-    # count so pagination paginates the MATCHES — the full record set
-    # is already materialized in Python (the documented design),
-    # so the filter adds no extra query.
+    # count so pagination paginates the MATCHES. When the search could be
+    # pushed down, the fetch already narrowed the rows to candidates in
+    # SQL; this exact match runs either way.
     if q:
         records = [r for r in records if _record_matches(r, q)]
 
@@ -37,6 +37,7 @@ mappers are configured.
 from __future__ import annotations
 
 import logging
+import re
 from datetime import datetime
 from heapq import heappush, heapreplace
 from typing import Any
@@ -64,6 +65,18 @@ logger = logging.getLogger(__name__)
 RecordSortKey = tuple[datetime, int, int, str, int]
 BoundedRecordHeap = list[tuple[RecordSortKey, int, dict[str, Any]]]
 
+# Runs of characters that appear verbatim in the stored JSON text of a path or
+# value. Whitespace and JSON punctuation are left out because spacing and
+# quoting differ between the client-facing form and what each dialect stores.
+_JSON_TOKEN_RE = re.compile(r'[^\s,:\[\]{}"\\]+')
+
+
+def search_tokens(q: str) -> list[str]:
+    """Split a search string into the tokens the SQL pre-filter matches
+    against the JSON ``path`` / ``from_value`` / ``to_value`` text."""
+    return _JSON_TOKEN_RE.findall(q)
+
+
 # ---- Path-entity resolution -----------------------------------------------
 
 
@@ -258,6 +271,7 @@ def fetch_change_records(
     entity_window_tuples: list[EntityWindows],
     since: datetime | None,
     until: datetime | None,
+    search: str | None = None,
 ) -> tuple[list[dict[str, Any]], bool]:
     """Fetch all ``version_changes`` rows matching any of the supplied
     entity-window tuples, joined with ``version_transaction`` for
@@ -291,6 +305,12 @@ def fetch_change_records(
     are dropped so truncation does not create per-kind holes), and the caller
     surfaces ``truncated`` on the response.
 
+    *search*, when supplied, pre-filters rows in SQL to those that can
+    match it (see :func:`_search_clause`), so the per-kind ceiling bounds
+    the candidate matches instead of the most recent history. It narrows
+    the candidates only; the exact match still runs on the decorated
+    records.
+
     Returns ``(records, truncated)``. Records are ordered by
     ``(issued_at DESC, transaction_id DESC, sequence DESC)`` — the
     secondary keys break ties for the stable-ordering contract.
@@ -337,6 +357,7 @@ def fetch_change_records(
         since,
         until,
         _MAX_FETCHED_RECORDS,
+        search,
     )
     filtered = rows
     if truncated and truncation_floor is not None:
@@ -367,6 +388,7 @@ def _select_change_rows_for_kinds(
     since: datetime | None,
     until: datetime | None,
     limit: int,
+    search: str | None = None,
 ) -> tuple[list[dict[str, Any]], bool, RecordSortKey | None]:
     """Fetch bounded candidates per entity kind and ID chunk.
 
@@ -442,6 +464,9 @@ def _select_change_rows_for_kinds(
         # global top ``limit + 1``.
         kind_heap: BoundedRecordHeap = []
         ordinal = 0
+        named_ids = (
+            _entity_ids_named_like(table_kind, entity_ids, search) if search else set()
+        )
         for chunk in chunked_ids(sorted(entity_ids)):
             stmt = (
                 sa.select(*select_cols)
@@ -462,6 +487,13 @@ def _select_change_rows_for_kinds(
                 stmt = stmt.where(tx_tbl.c.issued_at >= since)
             if until is not None:
                 stmt = stmt.where(tx_tbl.c.issued_at < until)
+            if search:
+                stmt = stmt.where(
+                    _search_clause(
+                        search,
+                        [entity_id for entity_id in chunk if entity_id in named_ids],
+                    )
+                )
             # Match fetch_change_records' final Python sort key order.
             # entity_kind is constant within a per-kind statement.
             stmt = stmt.order_by(
@@ -493,6 +525,75 @@ def _select_change_rows_for_kinds(
     return out, truncated, truncation_floor
 
 
+def _search_clause(search: str, named_ids: list[int]) -> sa.ColumnElement[bool]:
+    """SQL pre-filter for the ``q`` search over ``version_changes`` rows.
+
+    Keeps every row that can match *search* once decorated (see
+    ``orchestrator._record_matches``): rows whose ``kind`` contains it,
+    rows whose ``path`` / ``from_value`` / ``to_value`` JSON text contains
+    all of its tokens, rows of entities whose name contains it at some
+    version (*named_ids*), and ``__meta__`` rows, whose headline carries a
+    version number. The orchestrator only pushes searches down that cannot
+    match the fixed wording of a summary, so this is a superset of the
+    matches; the rows it lets through are filtered exactly afterwards.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.daos.base import _escape_like
+
+    vc = version_changes_table
+
+    def contains(column: Any, text: str) -> sa.ColumnElement[bool]:
+        return column.ilike(f"%{_escape_like(text)}%", escape="\\")
+
+    tokens = search_tokens(search)
+    clauses: list[sa.ColumnElement[bool]] = [
+        vc.c.kind == "__meta__",
+        contains(vc.c.kind, search),
+        *(
+            sa.and_(*(contains(sa.cast(column, sa.Text), token) for token in tokens))
+            for column in (vc.c.path, vc.c.from_value, vc.c.to_value)
+        ),
+    ]
+    if named_ids:
+        clauses.append(vc.c.entity_id.in_(named_ids))
+    return sa.or_(*clauses)
+
+
+def _entity_ids_named_like(
+    table_kind: str, entity_ids: set[int], search: str
+) -> set[int]:
+    """Ids among *entity_ids* whose name contains *search* in any shadow
+    version — the name-driven matches (``entity_name`` / ``summary``) the
+    row-level SQL pre-filter cannot see."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy_continuum import version_class
+
+    from superset.daos.base import _escape_like
+
+    api_kind = TABLE_KIND_TO_API.get(table_kind)
+    if api_kind is None or api_kind not in NAME_COLUMN:
+        return set()
+    model_name, name_col = NAME_COLUMN[api_kind]
+    shadow_tbl = version_class(load_live_model(model_name)).__table__
+    named: set[int] = set()
+    for chunk in chunked_ids(entity_ids):
+        named.update(
+            db.session.connection()
+            .execute(
+                sa.select(shadow_tbl.c.id)
+                .where(
+                    shadow_tbl.c.id.in_(chunk),
+                    shadow_tbl.c[name_col].ilike(
+                        f"%{_escape_like(search)}%", escape="\\"
+                    ),
+                )
+                .distinct()
+            )
+            .scalars()
+        )
+    return named
+
+
 def _record_sort_key(record: dict[str, Any]) -> RecordSortKey:
     """Return the total newest-first activity ordering key."""
     return (
@@ -271,6 +271,30 @@ def _build_summary(api_kind: str, record: dict[str, Any]) -> str:
     return f"{label} {verb}: {name}" if name else f"{label} {verb}"
 
 
+def search_may_match_summary_wording(q: str) -> bool:
+    """Whether *q* can match the fixed wording of a non-``__meta__``
+    headline rather than only the entity name inside it.
+
+    ``_build_summary`` renders ``"<label> <verb>: <name>"``,
+    ``"<label> <verb>"`` or ``"(deleted) <label>"``. A search that is
+    inside that wording (``"chart"``, ``"updated"``), or that runs from its
+    tail into the name (``": sales"``), can match records whatever their
+    name, so it cannot be narrowed to entities by name in SQL.
+    """
+    needle = q.lower()
+    verbs = {*_SUMMARY_VERBS.values(), "updated"}
+    for label in API_KIND_LABEL.values():
+        if needle in f"(deleted) {label}".lower():
+            return True
+        for verb in verbs:
+            frame = f"{label} {verb}: ".lower()
+            if needle in frame or any(
+                frame.endswith(needle[:size]) for size in range(1, len(needle))
+            ):
+                return True
+    return False
+
+
 def _changed_by_dict(record: dict[str, Any]) -> dict[str, Any] | None:
     """Project the user columns onto the ``changed_by`` shape, or
     ``None`` when no Flask user was attached to the save (CLI / Celery)
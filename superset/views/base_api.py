@@ -20,7 +20,7 @@ import functools
 import logging
 from typing import Any, Callable, cast, Optional, overload
 
-from flask import request, Response
+from flask import g, request, Response
 from flask_appbuilder import Model, ModelRestApi
 from flask_appbuilder.api import (
     BaseApi,
@@ -33,12 +33,21 @@ from flask_appbuilder.const import API_FILTERS_RIS_KEY
 from flask_appbuilder.models.filters import BaseFilter, Filters
 from flask_appbuilder.models.sqla.filters import FilterStartsWith
 from flask_appbuilder.models.sqla.interface import SQLAInterface
+from flask_appbuilder.utils.base import is_column_dotted
 from flask_babel import lazy_gettext as _
 from marshmallow import fields, Schema
 from sqlalchemy import and_, distinct, func
+from sqlalchemy.orm import ColumnProperty
 from sqlalchemy.orm.query import Query
+from sqlalchemy.orm.util import AliasedClass
 
 from superset import is_feature_enabled
+from superset.daos.base import (
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+    keyset_filter,
+    keyset_order_by,
+)
 from superset.exceptions import InvalidPayloadFormatError
 from superset.extensions import db, event_logger, security_manager, stats_logger_manager
 from superset.models.core import FavStar
@@ -238,6 +247,132 @@ class BaseFavoriteFilter(BaseFilter):  # pylint: disable=too-few-public-methods
         return query.filter(and_(~self.model.id.in_(users_favorite_query)))
 
 
+class KeysetSQLAInterface(SQLAInterface):
+    """
+    A FAB datamodel whose list pages can be walked with a keyset cursor.
+
+    Lists ordered by a column of the model are ordered by it, with its NULLs
+    last, then by primary key. When ``g.list_keyset_after`` holds the
+    ``(order value, id)`` of a row, a page starts right after that row instead
+    of at its offset, and a full page records the keyset of its last row in
+    ``g.list_next_keyset``.
+    """
+
+    def _keyset_columns(self, order_column: str) -> Optional[tuple[Any, Any]]:
+        """
+        The order and primary key attributes of a list ordered by
+        ``order_column``, or None if it isn't ordered by a column of the model.
+        The order attribute is None when the list is ordered by primary key.
+        """
+        if not order_column or is_column_dotted(order_column):
+            return None
+        attr = getattr(self.obj, order_column, None)
+        # Properties rendered by the ``renders`` decorator sort by their column
+        if hasattr(attr, "_col_name"):
+            attr = getattr(self.obj, attr._col_name, None)
+        if not isinstance(getattr(attr, "property", None), ColumnProperty):
+            return None
+        if attr.key == self.get_pk_name():
+            return None, attr
+        return attr, self.get_pk()
+
+    def apply_order_by(
+        self,
+        query: Query,
+        order_column: str,
+        order_direction: str,
+        aliases_mapping: Optional[dict[str, AliasedClass]] = None,
+        bypass_many_to_many: bool = False,
+        add_pk: bool = False,
+    ) -> Query:
+        if (keyset := self._keyset_columns(order_column)) is None:
+            return super().apply_order_by(
+                query,
+                order_column,
+                order_direction,
+                aliases_mapping=aliases_mapping,
+                bypass_many_to_many=bypass_many_to_many,
+                add_pk=add_pk,
+            )
+        order_attr, pk = keyset
+        if order_attr is None:
+            order_attr, pk = pk, None
+        return query.order_by(
+            *keyset_order_by(
+                order_attr, pk if add_pk else None, order_direction != "asc"
+            )
+        )
+
+    def _apply_inner_all(
+        self,
+        query: Query,
+        filters: Optional[Filters] = None,
+        order_column: str = "",
+        order_direction: str = "",
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        select_columns: Optional[list[str]] = None,
+        aliases_mapping: Optional[dict[str, AliasedClass]] = None,
+    ) -> Query:
+        after = g.get("list_keyset_after")
+        keyset = self._keyset_columns(order_column)
+        if not page_size or after is None or keyset is None:
+            return super()._apply_inner_all(
+                query,
+                filters,
+                order_column,
+                order_direction,
+                page,
+                page_size,
+                select_columns,
+                aliases_mapping,
+            )
+        query = super()._apply_inner_all(
+            query,
+            filters,
+            order_column,
+            order_direction,
+            None,
+            None,
+            select_columns,
+            aliases_mapping,
+        )
+        try:
+            keyset_filter_ = keyset_filter(*keyset, after, order_direction != "asc")
+        except ValueError as ex:
+            raise InvalidPayloadFormatError("Invalid cursor") from ex
+        return self.apply_pagination(query.filter(keyset_filter_), None, page_size)
+
+    def query(
+        self,
+        filters: Optional[Filters] = None,
+        order_column: str = "",
+        order_direction: str = "",
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        select_columns: Optional[list[str]] = None,
+        outer_default_load: bool = False,
+    ) -> tuple[int, list[Model]]:
+        count, items = super().query(
+            filters,
+            order_column,
+            order_direction,
+            page,
+            page_size,
+            select_columns,
+            outer_default_load,
+        )
+        keyset = self._keyset_columns(order_column)
+        if keyset is not None and page_size and len(items) == page_size:
+            order_attr, pk = keyset
+            last = items[-1]
+            g.list_next_keyset = (
+                getattr(last, order_attr.key) if order_attr is not None else None,
+                getattr(last, pk.key),
+            )
+        return count, items
+
+
 class BaseSupersetApiMixin:
     csrf_exempt = False
 
@@ -589,12 +724,38 @@ class BaseSupersetModelRestApi(BaseSupersetApiMixin, ModelRestApi):
     @handle_api_exception
     def get_list_headless(self, **kwargs: Any) -> Response:
         """
-        Add statsd metrics to builtin FAB GET list endpoint
+        Add statsd metrics to builtin FAB GET list endpoint, and resume lists of
+        a `KeysetSQLAInterface` after the row of the ``cursor`` query argument
         """
-        duration, response = time_function(super().get_list_headless, **kwargs)
+        after = None
+        if isinstance(self.datamodel, KeysetSQLAInterface) and (
+            cursor := request.args.get("cursor")
+        ):
+            try:
+                after = decode_keyset_cursor(cursor)
+            except ValueError:
+                return self.response_400(message="Invalid cursor")
+        g.list_keyset_after = after
+        g.pop("list_next_keyset", None)
+        try:
+            duration, response = time_function(super().get_list_headless, **kwargs)
+        finally:
+            g.pop("list_keyset_after", None)
+            g.pop("list_next_keyset", None)
         self.send_stats_metrics(response, self.get_list.__name__, duration)
         return response
 
+    def pre_get_list(self, data: dict[str, Any]) -> None:
+        """
+        Add the cursor of the next page to the lists of a `KeysetSQLAInterface`
+        """
+        super().pre_get_list(data)
+        if isinstance(self.datamodel, KeysetSQLAInterface):
+            keyset = g.pop("list_next_keyset", None)
+            data["next_cursor"] = (
+                encode_keyset_cursor(*keyset) if keyset is not None else None
+            )
+
     @event_logger.log_this_with_context(
         action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.post",
         object_ref=False,
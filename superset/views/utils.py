@@ -188,7 +188,12 @@ def get_request_json_body() -> dict[Any, Any]:
     raise ``BadRequest`` from ``request.get_json()``. A well-formed but
     non-object JSON body (e.g. ``null``, a scalar, or an array) is coerced to
     ``{}`` too, since callers treat the result as a mapping.
+
+    Within a batch chart data request, the query context being evaluated stands
+    in for the body.
     """
+    if (batch_item := g.get("batch_item_json_body")) is not None:
+        return batch_item
     if not request.is_json:
         return {}
     try:
@@ -41,6 +41,10 @@ class TestAsyncEventApi(SupersetTestCase):
         uri = f"{base_uri}?last_id={last_id}" if last_id else base_uri
         return self.client.get(uri)
 
+    def stream_events(self, last_id: Optional[str] = None):
+        headers = {"Last-Event-ID": last_id} if last_id else {}
+        return self.client.get("api/v1/async_event/stream", headers=headers)
+
     def cancel_event(self, job_id: str):
         return self.client.post(f"api/v1/async_event/{job_id}/cancel")
 
@@ -208,3 +212,28 @@ class TestAsyncEventApi(SupersetTestCase):
         async_query_manager_factory.init_app(app)
         rv = self.cancel_event(self.JOB_ID)
         assert rv.status_code == 401
+
+    def _test_stream_logic(self, mock_cache):
+        with mock.patch.object(
+            async_query_manager,
+            "stream_events",
+            return_value=iter(["retry: 500\n\n", ": heartbeat\n\n"]),
+        ) as mock_stream_events:
+            rv = self.stream_events("1607471525180-0")
+            data = rv.get_data(as_text=True)
+
+        assert rv.status_code == 200
+        assert rv.mimetype == "text/event-stream"
+        assert rv.headers["Cache-Control"] == "no-cache"
+        mock_stream_events.assert_called_once_with(self.UUID, "1607471525180-0")
+        assert data == "retry: 500\n\n: heartbeat\n\n"
+
+    @mock.patch("uuid.uuid4", return_value=UUID)
+    def test_stream_redis_cache_backend(self, mock_uuid4):
+        self.run_test_with_cache_backend(RedisCacheBackend, self._test_stream_logic)
+
+    def test_stream_no_login(self):
+        app._got_first_request = False
+        async_query_manager_factory.init_app(app)
+        rv = self.stream_events()
+        assert rv.status_code == 401
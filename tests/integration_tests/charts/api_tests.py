@@ -1993,6 +1993,44 @@ class TestChartApi(ApiEditorsTestCaseMixin, InsertChartMixin, SupersetTestCase):
         data = json.loads(rv.data.decode("utf-8"))
         assert len(data["result"]) == 3
 
+    @pytest.mark.usefixtures(
+        "load_energy_table_with_slice",
+        "load_birth_names_dashboard_with_slices",
+    )
+    def test_get_charts_cursor(self):
+        """
+        Chart API: Test walking the chart list with next_cursor
+        """
+        self.login(ADMIN_USERNAME)
+        arguments = {
+            "order_column": "changed_on",
+            "order_direction": "desc",
+            "page_size": 5,
+            "columns": ["id"],
+        }
+        uri = f"api/v1/chart/?q={rison.dumps(arguments)}"
+        expected_ids = [
+            slc.id
+            for slc in db.session.query(Slice)
+            .order_by(Slice.changed_on.desc(), Slice.id.desc())
+            .all()
+        ]
+
+        ids = []
+        rv = self.client.get(uri)
+        while True:
+            assert rv.status_code == 200
+            data = json.loads(rv.data.decode("utf-8"))
+            assert data["count"] == len(expected_ids)
+            ids.extend(data["ids"])
+            if data["next_cursor"] is None:
+                break
+            rv = self.client.get(f"{uri}&cursor={data['next_cursor']}")
+        assert ids == expected_ids
+
+        rv = self.client.get(f"{uri}&cursor=invalid")
+        assert rv.status_code == 400
+
     def test_get_charts_no_data_access(self):
         """
         Chart API: Test get charts no data access
@@ -896,6 +896,37 @@ class TestDashboardApi(ApiEditorsTestCaseMixin, InsertChartMixin, SupersetTestCa
             db.session.delete(dashboard)
             db.session.commit()
 
+    @pytest.mark.usefixtures("create_dashboards")
+    def test_get_dashboards_cursor(self):
+        """
+        Dashboard API: Test walking the dashboard list with next_cursor
+        """
+        self.login(ADMIN_USERNAME)
+        arguments = {
+            "order_column": "dashboard_title",
+            "order_direction": "asc",
+            "page_size": 3,
+            "columns": ["id"],
+        }
+        uri = f"api/v1/dashboard/?q={rison.dumps(arguments)}"
+        expected_ids = [
+            dashboard.id
+            for dashboard in db.session.query(Dashboard)
+            .order_by(Dashboard.dashboard_title.asc(), Dashboard.id.asc())
+            .all()
+        ]
+
+        ids = []
+        rv = self.client.get(uri)
+        while True:
+            assert rv.status_code == 200
+            data = json.loads(rv.data.decode("utf-8"))
+            ids.extend(data["ids"])
+            if data["next_cursor"] is None:
+                break
+            rv = self.client.get(f"{uri}&cursor={data['next_cursor']}")
+        assert ids == expected_ids
+
     def test_get_dashboards_admin_sees_existing_dashboards(self):
         """Regression for #25890: GET /api/v1/dashboard/ as an Admin user should
         return existing dashboards, not an empty list. The original report
@@ -3530,6 +3561,8 @@ class TestDashboardApi(ApiEditorsTestCaseMixin, InsertChartMixin, SupersetTestCa
         _, kwargs = mock_task.apply_async.call_args
         assert kwargs["task_id"] == job_id
         assert kwargs["kwargs"]["dashboard_id"] == dashboard.id
+        # The task releases the lock with the owner token of this acquisition.
+        assert kwargs["kwargs"]["lock_token"] == mock_acquire.return_value.token
 
     @pytest.mark.usefixtures("load_world_bank_dashboard_with_slices")
     @with_config({"EXCEL_EXPORT_S3_BUCKET": "exports"})
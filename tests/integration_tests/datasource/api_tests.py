@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import base64
 from datetime import datetime
 from unittest.mock import ANY, patch
 
@@ -347,6 +348,81 @@ class TestDatasourceApi(SupersetTestCase):
         assert rv_miss.headers.get("X-Cache-Status") == "MISS"
         assert rv_hit.headers.get("X-Cache-Status") == "HIT"
 
+    @pytest.mark.usefixtures("app_context", "virtual_dataset")
+    def test_get_column_values_page(self):
+        """Pages are sorted and chained through ``next_cursor``."""
+        self.login(ADMIN_USERNAME)
+        table = self.get_virtual_dataset()
+        url = f"api/v1/datasource/table/{table.id}/column/col2/values/page/"
+
+        rv = self.client.get(f"{url}?page_size=4")
+        assert rv.status_code == 200
+        first = json.loads(rv.data.decode("utf-8"))
+        assert first["result"] == ["a", "b", "c", "d"]
+        assert first["next_cursor"]
+
+        rv = self.client.get(f"{url}?page_size=4&cursor={first['next_cursor']}")
+        second = json.loads(rv.data.decode("utf-8"))
+        assert second["result"] == ["e", "f", "g", "h"]
+
+        rv = self.client.get(f"{url}?page_size=4&cursor={second['next_cursor']}")
+        last = json.loads(rv.data.decode("utf-8"))
+        assert last["result"] == ["i", "j"]
+        assert last["next_cursor"] is None
+
+    @pytest.mark.usefixtures("app_context", "virtual_dataset")
+    def test_get_column_values_page_search(self):
+        self.login(ADMIN_USERNAME)
+        table = self.get_virtual_dataset()
+        url = f"api/v1/datasource/table/{table.id}/column/col2/values/page/"
+
+        rv = self.client.get(f"{url}?search=C")
+        assert rv.status_code == 200
+        assert json.loads(rv.data.decode("utf-8")) == {
+            "result": ["c"],
+            "next_cursor": None,
+        }
+
+    @pytest.mark.usefixtures("app_context", "virtual_dataset")
+    def test_get_column_values_page_invalid_cursor(self):
+        self.login(ADMIN_USERNAME)
+        table = self.get_virtual_dataset()
+        rv = self.client.get(
+            f"api/v1/datasource/table/{table.id}/column/col2/values/page/"
+            "?cursor=not-a-cursor"
+        )
+        assert rv.status_code == 400
+
+    @pytest.mark.usefixtures("app_context", "virtual_dataset")
+    def test_get_column_values_page_non_scalar_cursor(self):
+        """Cursors resuming after a list or an object are rejected."""
+        self.login(ADMIN_USERNAME)
+        table = self.get_virtual_dataset()
+        url = f"api/v1/datasource/table/{table.id}/column/col2/values/page/"
+
+        for after in (["a"], {"a": 1}):
+            cursor = base64.urlsafe_b64encode(
+                json.dumps({"after": after}).encode()
+            ).decode()
+            rv = self.client.get(f"{url}?cursor={cursor}")
+            assert rv.status_code == 400
+
+    @pytest.mark.usefixtures("app_context", "virtual_dataset")
+    @patch("superset.models.helpers.ExploreMixin.values_for_column")
+    def test_get_column_values_page_cached_per_search(self, values_for_column_mock):
+        """Each page is cached under its own search and cursor."""
+        values_for_column_mock.return_value = ["v"]
+        self.login(ADMIN_USERNAME)
+        table = self.get_virtual_dataset()
+        url = f"api/v1/datasource/table/{table.id}/column/col2/values/page/"
+
+        self.client.get(f"{url}?search=a")
+        rv = self.client.get(f"{url}?search=a")
+        self.client.get(f"{url}?search=b")
+
+        assert rv.headers.get("X-Cache-Status") == "HIT"
+        assert values_for_column_mock.call_count == 2
+
     @patch("superset.datasource.api.security_manager.can_access")
     @patch("superset.datasource.api.GetCombinedDatasourceListCommand.run")
     def test_combined_list_invalid_order_column(
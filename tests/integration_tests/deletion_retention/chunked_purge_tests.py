@@ -0,0 +1,270 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Integration coverage for the set-based (chunked) retention purge.
+
+With ``SOFT_DELETE_PURGE_CHUNK_SIZE`` set, ``_purge_impl`` removes each chunk
+of expired entities with ``cascade_hard_delete_many``. These tests pin that it
+removes exactly what the per-entity purge removes, keeps blockers and audits
+per entity, and falls back to the per-entity purge when a chunk fails.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import patch
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+
+from superset import db, security_manager
+from superset.commands.deletion_retention import audit
+from superset.commands.deletion_retention.purge_cascade import (
+    cascade_hard_delete_many,
+    suppress_purge_association_versions,
+)
+from superset.connectors.sqla.models import SqlaTable
+from superset.models.dashboard import Dashboard
+from superset.models.slice import Slice
+from superset.reports.models import ReportSchedule
+from superset.tags.models import ObjectType, Tag, TaggedObject
+from superset.tasks.deletion_retention import _purge_impl
+
+from ._base import DeletionRetentionTestBase
+
+
+@contextmanager
+def _chunk_size(size: int) -> Iterator[None]:
+    from flask import current_app
+
+    with patch.dict(current_app.config, {"SOFT_DELETE_PURGE_CHUNK_SIZE": size}):
+        yield
+
+
+def _purge(chunk_size: int = 2) -> dict[str, Any]:
+    with _chunk_size(chunk_size):
+        return _purge_impl(30, dry_run=False)
+
+
+class TestChunkedPurge(DeletionRetentionTestBase):
+    def _audit_statuses(self, entity_uuid: str) -> list[str]:
+        return [
+            row.status
+            for row in db.session.query(audit.PurgeAuditLog).filter_by(
+                entity_uuid=entity_uuid
+            )
+        ]
+
+    def test_chunks_purge_expired_entities_and_their_dependents(self) -> None:
+        """Every expired root goes with its joins, children, tags, history and
+        permission; in-window, active and referenced entities survive."""
+        charts = [self.make_chart(f"aged_{index}") for index in range(5)]
+        recent = self.make_chart("recent")
+        live_dashboard = self.make_dashboard("live", slices=[*charts, recent])
+        aged_dashboard = self.make_dashboard("aged_dash", slices=[recent])
+        dataset = self.make_dataset("aged_ds", with_children=True)
+        permission_name = security_manager.get_dataset_perm(
+            dataset.id, dataset.table_name, dataset.database.database_name
+        )
+        tag = Tag(name="retention_it_chunk_tag")
+        db.session.add(tag)
+        db.session.commit()
+        db.session.add(
+            TaggedObject(
+                tag_id=tag.id, object_id=charts[0].id, object_type=ObjectType.chart
+            )
+        )
+        db.session.commit()
+        chart_ids = [chart.id for chart in charts]
+        chart_uuids = [str(chart.uuid) for chart in charts]
+        recent_id, dataset_id = recent.id, dataset.id
+        live_id, aged_dashboard_id = live_dashboard.id, aged_dashboard.id
+        for chart in charts:
+            self.soft_delete(chart, days_ago=90)
+        self.soft_delete(recent, days_ago=5)
+        self.soft_delete(aged_dashboard, days_ago=90)
+        self.soft_delete(dataset, days_ago=90)
+        self.forge_version_row(Slice, chart_ids[0], tx_id=910_001)
+
+        with patch(
+            "superset.tasks.deletion_retention._purge_each",
+            side_effect=AssertionError("chunk fell back to per-entity purge"),
+        ):
+            result = _purge()
+
+        assert result["purged"] == {"slices": 5, "dashboards": 1, "tables": 1}
+        assert result["cascade_failures"] == 0
+        assert not any(self.exists(Slice, chart_id) for chart_id in chart_ids)
+        assert not self.exists(Dashboard, aged_dashboard_id)
+        assert not self.exists(SqlaTable, dataset_id)
+        assert self.exists(Slice, recent_id)
+        assert self.exists(Dashboard, live_id)
+        assert (
+            self.count(
+                "SELECT count(*) FROM dashboard_slices WHERE dashboard_id = :d",
+                {"d": live_id},
+            )
+            == 1
+        )
+        assert (
+            self.count(
+                "SELECT count(*) FROM table_columns WHERE table_id = :i",
+                {"i": dataset_id},
+            )
+            == 0
+        )
+        assert (
+            self.count(
+                "SELECT count(*) FROM tagged_object WHERE object_id = :i "
+                "AND object_type = 'chart'",
+                {"i": chart_ids[0]},
+            )
+            == 0
+        )
+        assert (
+            self.count(
+                "SELECT count(*) FROM version_changes WHERE transaction_id = :t",
+                {"t": 910_001},
+            )
+            == 0
+        )
+        assert not security_manager.find_permission_view_menu(
+            "datasource_access", permission_name
+        )
+        for chart_uuid in chart_uuids:
+            assert self._audit_statuses(chart_uuid) == [audit.STATUS_CONFIRMED]
+        live_row = (
+            db.session.query(audit.PurgeAuditLog)
+            .filter_by(entity_uuid=chart_uuids[0])
+            .one()
+        )
+        assert live_row.removed_dashboard_slices == 1
+
+    def test_blocked_entity_does_not_hold_back_its_chunk(self) -> None:
+        """A report-referenced chart is blocked and audited as such while the
+        rest of its chunk is purged."""
+        reported = self.make_chart("reported")
+        other = self.make_chart("other")
+        report = ReportSchedule(
+            type="Report",
+            name="retention_it_chunk_report",
+            crontab="0 0 * * *",
+            chart=reported,
+        )
+        db.session.add(report)
+        db.session.commit()
+        reported_id, other_id = reported.id, other.id
+        reported_uuid = str(reported.uuid)
+        self.soft_delete(reported, days_ago=90)
+        self.soft_delete(other, days_ago=90)
+
+        result = _purge()
+
+        assert result["purged"] == {"slices": 1}
+        assert result["blocked_by_reference"] == 1
+        assert self.exists(Slice, reported_id)
+        assert not self.exists(Slice, other_id)
+        assert self._audit_statuses(reported_uuid) == [audit.STATUS_BLOCKED]
+
+    def test_failed_chunk_is_retried_one_entity_at_a_time(self) -> None:
+        """A chunk whose set-based cascade raises is rolled back, its audit
+        rows are failed, and its entities are purged individually."""
+        charts = [self.make_chart(f"fallback_{index}") for index in range(3)]
+        chart_ids = [chart.id for chart in charts]
+        chart_uuids = [str(chart.uuid) for chart in charts]
+        for chart in charts:
+            self.soft_delete(chart, days_ago=90)
+
+        with patch(
+            "superset.tasks.deletion_retention.cascade_hard_delete_many",
+            side_effect=RuntimeError("boom"),
+        ):
+            result = _purge(chunk_size=3)
+
+        assert result["purged"] == {"slices": 3}
+        assert result["cascade_failures"] == 0
+        assert not any(self.exists(Slice, chart_id) for chart_id in chart_ids)
+        for chart_uuid in chart_uuids:
+            assert sorted(self._audit_statuses(chart_uuid)) == sorted(
+                [audit.STATUS_FAILED, audit.STATUS_CONFIRMED]
+            )
+
+    def test_restored_entity_in_a_chunk_is_left_alone(self) -> None:
+        """A row restored after the audit snapshot fails its claim and is
+        reported unpurged; the rest of the chunk still goes."""
+        restored = self.make_chart("restored")
+        aged = self.make_chart("aged")
+        restored_id, aged_id = restored.id, aged.id
+        entity_uuids = {restored_id: str(restored.uuid), aged_id: str(aged.uuid)}
+        self.soft_delete(restored, days_ago=90)
+        self.soft_delete(aged, days_ago=90)
+        restored.deleted_at = None
+        db.session.commit()
+
+        with suppress_purge_association_versions(db.session):
+            batch = cascade_hard_delete_many(
+                db.session,
+                Slice,
+                entity_uuids,
+                cutoff=datetime.now() - timedelta(days=30),
+            )
+        db.session.commit()
+
+        assert batch.results[aged_id].purged
+        assert not batch.results[restored_id].purged
+        assert batch.results[restored_id].blocked_reason is None
+        assert self.exists(Slice, restored_id)
+        assert not self.exists(Slice, aged_id)
+
+    def test_chunk_statement_count_does_not_grow_with_chunk_size(self) -> None:
+        """The set-based cascade issues one statement per declared dependency
+        for a whole chunk, not one per entity."""
+        cutoff = datetime.now() - timedelta(days=30)
+
+        def statements_for(count: int) -> int:
+            charts = [self.make_chart(f"stmt_{count}_{i}") for i in range(count)]
+            self.make_dashboard(f"stmt_dash_{count}", slices=charts)
+            for chart in charts:
+                self.soft_delete(chart, days_ago=90)
+            entity_uuids = {chart.id: str(chart.uuid) for chart in charts}
+            statements: list[str] = []
+
+            def count_statement(
+                _connection: Connection,
+                _cursor: object,
+                statement: str,
+                _parameters: object,
+                _context: object,
+                _executemany: bool,
+            ) -> None:
+                statements.append(statement)
+
+            sa.event.listen(db.engine, "before_cursor_execute", count_statement)
+            try:
+                with suppress_purge_association_versions(db.session):
+                    batch = cascade_hard_delete_many(
+                        db.session, Slice, entity_uuids, cutoff=cutoff
+                    )
+                db.session.commit()
+            finally:
+                sa.event.remove(db.engine, "before_cursor_execute", count_statement)
+            assert all(result.purged for result in batch.results.values())
+            return len(statements)
+
+        assert statements_for(2) == statements_for(8)
@@ -15,8 +15,9 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from datetime import datetime
 from random import randint
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from freezegun import freeze_time
@@ -80,7 +81,10 @@ def test_scheduler_celery_no_timeout_ny(execute_mock, editors):
 
     with freeze_time("2020-01-01T09:00:00Z"):
         scheduler()
-        assert execute_mock.call_args[1] == {"eta": FakeDatetime(2020, 1, 1, 9, 0)}
+        assert execute_mock.call_args[1] == {
+            "eta": FakeDatetime(2020, 1, 1, 9, 0),
+            "producer": ANY,
+        }
     db.session.delete(report_schedule)
     db.session.commit()
     app.config["ALERT_REPORTS_WORKING_TIME_OUT_KILL"] = True
@@ -128,10 +132,11 @@ def test_scheduler_report_timeout_uses_end_to_end_budget(execute_mock, editors):
 
     # A lower per-schedule working_timeout caps the effective budget and the
     # derived Celery limits. Update via query so persistence does not depend
-    # on which session the fixture object is bound to.
+    # on which session the fixture object is bound to. The first run advanced
+    # the next run to the following day, so reset it to evaluate the same window.
     db.session.query(ReportSchedule).filter(
         ReportSchedule.id == report_schedule.id
-    ).update({"working_timeout": 900})
+    ).update({"working_timeout": 900, "next_run_at": None})
     db.session.commit()
     with freeze_time("2020-01-01T09:00:00Z"):
         scheduler()
@@ -159,12 +164,51 @@ def test_scheduler_celery_no_timeout_utc(execute_mock, editors):
 
     with freeze_time("2020-01-01T09:00:00Z"):
         scheduler()
-        assert execute_mock.call_args[1] == {"eta": FakeDatetime(2020, 1, 1, 9, 0)}
+        assert execute_mock.call_args[1] == {
+            "eta": FakeDatetime(2020, 1, 1, 9, 0),
+            "producer": ANY,
+        }
     db.session.delete(report_schedule)
     db.session.commit()
     app.config["ALERT_REPORTS_WORKING_TIME_OUT_KILL"] = True
 
 
+@pytest.mark.usefixtures("app_context")
+@patch("superset.tasks.scheduler.execute.apply_async")
+def test_scheduler_next_run_at(execute_mock, editors):
+    """
+    Reports scheduler: Test scheduler only evaluating due schedules
+    """
+    report_schedule = insert_report_schedule(
+        type=ReportScheduleType.ALERT,
+        name="report",
+        crontab="0 9 * * *",
+        timezone="UTC",
+        editors=editors,
+    )
+
+    with freeze_time("2020-01-01T09:00:00Z"):
+        scheduler()
+        assert execute_mock.call_count == 1
+        db.session.refresh(report_schedule)
+        assert report_schedule.next_run_at == datetime(2020, 1, 2, 9, 0)
+
+    # the next run is not due yet, so the schedule is not evaluated again
+    with freeze_time("2020-01-01T10:00:00Z"):
+        scheduler()
+        assert execute_mock.call_count == 1
+
+    with freeze_time("2020-01-02T09:00:00Z"):
+        scheduler()
+        assert execute_mock.call_count == 2
+        assert execute_mock.call_args[1]["eta"] == FakeDatetime(2020, 1, 2, 9, 0)
+        db.session.refresh(report_schedule)
+        assert report_schedule.next_run_at == datetime(2020, 1, 3, 9, 0)
+
+    db.session.delete(report_schedule)
+    db.session.commit()
+
+
 @pytest.mark.usefixtures("app_context")
 @patch("superset.tasks.scheduler.is_feature_enabled")
 @patch("superset.tasks.scheduler.execute.apply_async")
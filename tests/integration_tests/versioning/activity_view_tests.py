@@ -31,6 +31,7 @@ downstream tests via the shadow tables.
 from __future__ import annotations
 
 from typing import Any
+from unittest import mock
 from uuid import uuid4
 
 import pytest
@@ -879,6 +880,42 @@ class TestDashboardActivityView(SupersetTestCase):
             dashboard.dashboard_title = original_title
             db.session.commit()
 
+    def test_activity_q_is_applied_before_the_fetch_ceiling(self) -> None:
+        """``?q=`` narrows the change-record queries themselves, so a match
+        older than the per-kind ceiling's worth of edits is still found."""
+        _persist_fixture_state()
+        dashboard = _get_birth_names_dashboard()
+        assert dashboard is not None
+        dashboard_uuid = str(dashboard.uuid)
+        dashboard_id = dashboard.id
+        original_title = dashboard.dashboard_title
+        original_css = dashboard.css
+        needle = f"qceil{uuid4().hex[:6]}"
+
+        try:
+            dashboard.css = f"/* {needle} */"
+            db.session.commit()
+            dashboard.dashboard_title = f"{original_title} {uuid4().hex[:6]}"
+            db.session.commit()
+
+            self.login(ADMIN_USERNAME)
+            with mock.patch(
+                "superset.versioning.activity.queries._MAX_FETCHED_RECORDS", 1
+            ):
+                rv = self._activity(dashboard_uuid, q=needle)
+            assert rv.status_code == 200
+            body = _json.loads(rv.data.decode("utf-8"))
+            assert body["count"] >= 1
+            assert all(needle in _json.dumps(r).lower() for r in body["result"])
+        finally:
+            db.session.rollback()
+            dashboard = (
+                db.session.query(Dashboard).filter(Dashboard.id == dashboard_id).one()
+            )
+            dashboard.dashboard_title = original_title
+            dashboard.css = original_css
+            db.session.commit()
+
 
 class TestChartActivityView(SupersetTestCase):
     """T028–T032 — ``GET /api/v1/chart/<uuid>/activity/`` (US2).
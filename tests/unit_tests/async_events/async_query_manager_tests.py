@@ -27,6 +27,7 @@ from superset.async_events.async_query_manager import (
     AsyncQueryJobException,
     AsyncQueryManager,
     AsyncQueryTokenException,
+    build_job_metadata,
 )
 from superset.async_events.cache_backend import (
     RedisCacheBackend,
@@ -533,3 +534,239 @@ def test_update_job_clears_registry_before_terminal_event(cancellable_manager):
         "async-events-job-cancel:job-1"
     )
     assert calls == ["delete", "xadd", "xadd"]
+
+
+def test_read_events_blocking(cancellable_manager):
+    """XREAD resumes right after the last ID, decoding the raw Redis reply."""
+    cancellable_manager._cache.xread.return_value = [
+        [
+            b"async-events-chan-1",
+            [(b"1607477697866-0", {b"data": b'{"job_id": "job-1"}'})],
+        ]
+    ]
+
+    events = cancellable_manager.read_events_blocking("chan-1", "1607477697865-0", 1000)
+
+    cancellable_manager._cache.xread.assert_called_once_with(
+        {"async-events-chan-1": "1607477697865-0"}, 100, 1000
+    )
+    assert events == [{"id": "1607477697866-0", "job_id": "job-1"}]
+
+
+def test_read_events_blocking_timeout(cancellable_manager):
+    cancellable_manager._cache.xread.return_value = []
+
+    assert cancellable_manager.read_events_blocking("chan-1", None, 0) == []
+    # block=0 would make Redis wait forever
+    cancellable_manager._cache.xread.assert_called_once_with(
+        {"async-events-chan-1": "0"}, 100, 1
+    )
+
+
+def test_stream_events(cancellable_manager):
+    """Events are pushed as they come, with heartbeats in between."""
+    cancellable_manager._sse_heartbeat_interval = 15
+    cancellable_manager._sse_max_duration = 60
+    cancellable_manager._sse_retry_delay = 500
+    events = [
+        [{"id": "1-0", "job_id": "job-1"}, {"id": "2-0", "job_id": "job-2"}],
+        [],
+        [{"id": "3-0", "job_id": "job-3"}],
+    ]
+
+    with (
+        mock.patch.object(
+            cancellable_manager, "read_events_blocking", side_effect=events
+        ) as read_events_blocking,
+        mock.patch(
+            "superset.async_events.async_query_manager.time.monotonic",
+            side_effect=[0, 0, 30, 45, 60],
+        ),
+    ):
+        messages = list(cancellable_manager.stream_events("chan-1", "0-1"))
+
+    assert messages == [
+        "retry: 500\n\n",
+        'id: 1-0\ndata: {"id": "1-0", "job_id": "job-1"}\n\n',
+        'id: 2-0\ndata: {"id": "2-0", "job_id": "job-2"}\n\n',
+        ": heartbeat\n\n",
+        'id: 3-0\ndata: {"id": "3-0", "job_id": "job-3"}\n\n',
+    ]
+    assert read_events_blocking.call_args_list == [
+        mock.call("chan-1", "0-1", 15000),
+        mock.call("chan-1", "2-0", 15000),
+        mock.call("chan-1", "2-0", 15000),
+    ]
+
+
+@fixture
+def coalescing_manager(cancellable_manager):
+    """A manager coalescing identical chart data jobs."""
+    cancellable_manager._coalesce_window = 300
+    cancellable_manager._stream_limit = 100
+    cancellable_manager._stream_limit_firehose = 1000
+    cancellable_manager._load_chart_data_into_cache_job = Mock()
+    with (
+        mock.patch.object(
+            security_manager, "get_current_guest_user_if_guest", return_value=None
+        ),
+        mock.patch(
+            "superset.async_events.async_query_manager.current_app"
+        ) as current_app,
+    ):
+        cancellable_manager.stats_logger = current_app.config["STATS_LOGGER"]
+        yield cancellable_manager
+
+
+def test_submit_chart_data_job_starts_inflight_job(coalescing_manager):
+    """The first job for a cache key runs, and records the key it computes."""
+    coalescing_manager._cache.set.return_value = True
+
+    job_meta = coalescing_manager.submit_chart_data_job(
+        "chan-1", {"k": "v"}, 7, cache_key="key"
+    )
+
+    coalescing_manager._cache.set.assert_any_call(
+        "async-events-job-inflight:key", job_meta["job_id"], ex=300, nx=True
+    )
+    record = json.loads(coalescing_manager._cache.set.call_args.args[1])
+    assert record == {"channel_id": "chan-1", "user_id": 7, "cache_key": "key"}
+    coalescing_manager._load_chart_data_into_cache_job.apply_async.assert_called_once()
+    coalescing_manager._cache.rpush.assert_not_called()
+
+
+def test_submit_chart_data_job_computes_the_cache_key_to_coalesce(
+    coalescing_manager,
+):
+    """A function computing the cache key is called when jobs are coalesced."""
+    coalescing_manager._cache.set.return_value = True
+    get_cache_key = Mock(return_value="key")
+
+    coalescing_manager.submit_chart_data_job(
+        "chan-1", {"k": "v"}, 7, cache_key=get_cache_key
+    )
+
+    get_cache_key.assert_called_once_with()
+    coalescing_manager._cache.set.assert_any_call(
+        "async-events-job-inflight:key", ANY, ex=300, nx=True
+    )
+
+
+def test_submit_chart_data_job_not_coalescing(coalescing_manager):
+    """Without a coalescing window, the cache key is never computed."""
+    coalescing_manager._coalesce_window = 0
+    get_cache_key = Mock(return_value="key")
+
+    coalescing_manager.submit_chart_data_job(
+        "chan-1", {"k": "v"}, 7, cache_key=get_cache_key
+    )
+
+    get_cache_key.assert_not_called()
+    assert not any(
+        call.args[0].startswith("async-events-job-inflight")
+        for call in coalescing_manager._cache.set.call_args_list
+    )
+    coalescing_manager._load_chart_data_into_cache_job.apply_async.assert_called_once()
+
+
+def test_submit_chart_data_job_attaches_to_inflight_job(coalescing_manager):
+    """An identical job attaches to the running one instead of enqueuing."""
+    coalescing_manager._cache.set.side_effect = lambda *args, **kwargs: (
+        None if kwargs.get("nx") else True
+    )
+    coalescing_manager._cache.get.return_value = b"job-0"
+
+    job_meta = coalescing_manager.submit_chart_data_job(
+        "chan-1", {"k": "v"}, 7, cache_key="key"
+    )
+
+    coalescing_manager._load_chart_data_into_cache_job.apply_async.assert_not_called()
+    key, attached_job = coalescing_manager._cache.rpush.call_args.args
+    assert key == "async-events-job-inflight:key:attached"
+    assert json.loads(attached_job) == {
+        "job_metadata": job_meta,
+        "form_data": {"k": "v"},
+    }
+    coalescing_manager.stats_logger.incr.assert_called_once_with(
+        "async_query.coalesced"
+    )
+
+
+def test_submit_chart_data_job_inflight_job_finished(coalescing_manager):
+    """A job attaching to one that just finished runs on its own."""
+    coalescing_manager._cache.set.side_effect = lambda *args, **kwargs: (
+        None if kwargs.get("nx") else True
+    )
+    coalescing_manager._cache.get.return_value = None
+    coalescing_manager._cache.lrem.return_value = 1
+
+    coalescing_manager.submit_chart_data_job("chan-1", {"k": "v"}, 7, cache_key="key")
+
+    coalescing_manager._load_chart_data_into_cache_job.apply_async.assert_called_once()
+    coalescing_manager.stats_logger.incr.assert_not_called()
+
+
+def test_update_job_notifies_attached_jobs(coalescing_manager):
+    """Attached jobs get the outcome of the job they are attached to."""
+    attached_job = {
+        "job_metadata": {
+            **build_job_metadata("chan-2", "job-2", 8),
+            "guest_token": {"user": {}},
+        },
+        "form_data": {"k": "v"},
+    }
+    coalescing_manager._cache.get.side_effect = lambda key: (
+        json.dumps({"channel_id": "chan-1", "user_id": 7, "cache_key": "key"})
+        if key == "async-events-job-cancel:job-1"
+        else None
+    )
+    coalescing_manager._cache.lpop.side_effect = [json.dumps(attached_job), None]
+
+    coalescing_manager.update_job(
+        build_job_metadata("chan-1", "job-1", 7),
+        AsyncQueryManager.STATUS_DONE,
+        result_url="/api/v1/chart/data/qc-1",
+    )
+
+    coalescing_manager._cache.delete.assert_any_call("async-events-job-inflight:key")
+    streams = [call.args[0] for call in coalescing_manager._cache.xadd.call_args_list]
+    assert streams == [
+        "async-events-chan-1",
+        "async-events-full",
+        "async-events-chan-2",
+        "async-events-full",
+    ]
+    assert json.loads(
+        coalescing_manager._cache.xadd.call_args_list[2].args[1]["data"]
+    ) == {
+        **build_job_metadata("chan-2", "job-2", 8),
+        "status": AsyncQueryManager.STATUS_DONE,
+        "result_url": "/api/v1/chart/data/qc-1",
+    }
+
+
+def test_cancelled_job_hands_over_to_attached_job(coalescing_manager):
+    """Cancelling a job others are attached to enqueues one of them instead."""
+    attached_job = {
+        "job_metadata": build_job_metadata("chan-2", "job-2", 8),
+        "form_data": {"k": "v"},
+    }
+    coalescing_manager._cache.get.return_value = json.dumps(
+        {"channel_id": "chan-1", "user_id": 7, "cache_key": "key"}
+    )
+    coalescing_manager._cache.lpop.side_effect = [json.dumps(attached_job), None]
+
+    coalescing_manager.update_job(
+        build_job_metadata("chan-1", "job-1", 7), AsyncQueryManager.STATUS_CANCELLED
+    )
+
+    coalescing_manager._cache.set.assert_any_call(
+        "async-events-job-inflight:key", "job-2", ex=300
+    )
+    coalescing_manager._load_chart_data_into_cache_job.apply_async.assert_called_once_with(
+        args=[attached_job["job_metadata"], {"k": "v"}],
+        task_id="job-2",
+        expires=3600,
+    )
+    # only the cancelled job's own event is sent
+    assert coalescing_manager._cache.xadd.call_count == 2
@@ -375,3 +375,28 @@ def test_get_query_handles_parsing_error_with_null_sql_value() -> None:
         assert "query" not in result
         assert result["error"] == "Parsing error occurred"
         assert result["language"] == "sql"
+
+
+def test_run_df_returns_dataframe_payloads() -> None:
+    mock_query_context = Mock(spec=QueryContext)
+    payloads = [{"df": Mock(), "status": "success"}]
+    mock_query_context.get_df_payloads.return_value = payloads
+
+    command = ChartDataCommand(mock_query_context)
+
+    assert command.run_df(force_cached=True) is payloads
+    mock_query_context.get_df_payloads.assert_called_once_with(force_cached=True)
+
+
+def test_run_df_raises_on_error_payload() -> None:
+    mock_query_context = Mock(spec=QueryContext)
+    mock_query_context.get_df_payloads.return_value = [
+        {"df": None, "error": "Invalid column name"}
+    ]
+
+    command = ChartDataCommand(mock_query_context)
+
+    with pytest.raises(ChartDataQueryFailedError) as exc_info:
+        command.run_df()
+
+    assert "Invalid column name" in str(exc_info.value)
@@ -16,11 +16,16 @@
 # under the License.
 from __future__ import annotations
 
+import sqlite3
+from contextlib import closing
+from pathlib import Path
 from typing import Any, TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
 from flask import Flask, g
+from flask_caching import Cache
+from pytest_mock import MockerFixture
 
 from superset.charts.data.api import ChartDataRestApi
 from superset.charts.data.dashboard_filter_context import (
@@ -40,10 +45,12 @@ from superset.common.chart_data_timing import (
 )
 from superset.common.query_context_factory import QueryContextFactory
 from superset.connectors.sqla.models import SqlaTable, TableColumn
+from superset.constants import CacheRegion
 from superset.jinja_context import ExtraCache
 from superset.models.core import Database
 from superset.utils import json
 from superset.utils.error_sanitization import GENERIC_ERROR_MESSAGE
+from tests.unit_tests.conftest import with_feature_flags
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -858,3 +865,135 @@ def test_send_chart_response_does_not_double_extension_for_csv_filename() -> Non
     content_disposition = response.headers["Content-Disposition"]
     assert "my_export.csv.csv" not in content_disposition
     assert "my_export.csv" in content_disposition
+
+
+def test_data_batch_reads_the_cached_data_in_one_round_trip(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+    session: Session,
+    tmp_path: Path,
+) -> None:
+    with closing(sqlite3.connect(tmp_path / "data.db")) as connection:
+        connection.execute("CREATE TABLE animals (name TEXT)")
+        connection.execute("INSERT INTO animals VALUES ('cat'), ('dog')")
+        connection.commit()
+    SqlaTable.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    database = Database(
+        database_name="db", sqlalchemy_uri=f"sqlite:///{tmp_path / 'data.db'}"
+    )
+    table = SqlaTable(
+        table_name="animals",
+        database=database,
+        columns=[TableColumn(column_name="name", type="TEXT", groupby=True)],
+        metrics=[],
+    )
+    session.add(database)
+    session.add(table)
+    session.commit()
+
+    cache = Cache()
+    cache.init_app(client.application, {"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.dict(
+        "superset.common.utils.query_cache_manager._cache", {CacheRegion.DATA: cache}
+    )
+    query_context = {
+        "datasource": {"type": "table", "id": table.id},
+        "queries": [{"columns": ["name"], "metrics": [], "orderby": [["name", True]]}],
+        "result_format": "json",
+        "result_type": "full",
+    }
+
+    response = client.post(
+        "/api/v1/chart/data/batch", json={"queries": [query_context]}
+    )
+    assert response.status_code == 200
+    assert response.json["result"][0]["status_code"] == 200
+    assert not response.json["result"][0]["result"][0]["is_cached"]
+
+    get = mocker.spy(cache, "get")
+    get_many = mocker.spy(cache, "get_many")
+    unknown = {**query_context, "datasource": {"type": "table", "id": 999}}
+    response = client.post(
+        "/api/v1/chart/data/batch",
+        json={"queries": [query_context, unknown, query_context]},
+    )
+
+    assert response.status_code == 200
+    results = response.json["result"]
+    assert [result["status_code"] for result in results] == [200, 404, 200]
+    for result in (results[0], results[2]):
+        assert result["result"][0]["is_cached"] is True
+        assert result["result"][0]["data"] == [{"name": "cat"}, {"name": "dog"}]
+    get_many.assert_called_once()
+    # the second, identical query context is served by the first one's read
+    assert get.call_count == 1
+
+
+@with_feature_flags(ENABLE_TEMPLATE_PROCESSING=True)
+def test_data_batch_renders_each_query_context_with_its_own_form_data(
+    client: Any,
+    full_api_access: None,
+    session: Session,
+    tmp_path: Path,
+) -> None:
+    with closing(sqlite3.connect(tmp_path / "data.db")) as connection:
+        connection.execute("CREATE TABLE animals (name TEXT)")
+        connection.execute("INSERT INTO animals VALUES ('cat'), ('dog')")
+        connection.commit()
+    SqlaTable.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    database = Database(
+        database_name="db", sqlalchemy_uri=f"sqlite:///{tmp_path / 'data.db'}"
+    )
+    table = SqlaTable(
+        table_name="animal",
+        sql="SELECT name FROM animals WHERE name = '{{ url_param(\"animal\") }}'",
+        database=database,
+        columns=[TableColumn(column_name="name", type="TEXT", groupby=True)],
+        metrics=[],
+    )
+    session.add(database)
+    session.add(table)
+    session.commit()
+
+    def query_context(animal: str) -> dict[str, Any]:
+        return {
+            "datasource": {"type": "table", "id": table.id},
+            "queries": [
+                {
+                    "columns": ["name"],
+                    "metrics": [],
+                    "url_params": {"animal": animal},
+                }
+            ],
+            "form_data": {"url_params": {"animal": animal}},
+            "result_format": "json",
+            "result_type": "full",
+        }
+
+    response = client.post(
+        "/api/v1/chart/data/batch",
+        json={"queries": [query_context("cat"), query_context("dog")]},
+    )
+
+    assert response.status_code == 200
+    cat, dog = (result["result"][0] for result in response.json["result"])
+    assert cat["data"] == [{"name": "cat"}]
+    assert dog["data"] == [{"name": "dog"}]
+    assert cat["cache_key"] != dog["cache_key"]
+    response = client.post("/api/v1/chart/data", json=query_context("dog"))
+    assert response.json["result"][0]["cache_key"] == dog["cache_key"]
+
+
+def test_data_batch_rejects_more_query_contexts_than_allowed(
+    client: Any, full_api_access: None
+) -> None:
+    query_context = {"datasource": {"type": "table", "id": 1}, "queries": [{}]}
+    max_size = client.application.config["CHART_DATA_BATCH_MAX_SIZE"]
+
+    response = client.post(
+        "/api/v1/chart/data/batch",
+        json={"queries": [query_context] * (max_size + 1)},
+    )
+
+    assert response.status_code == 400
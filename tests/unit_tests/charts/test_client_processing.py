@@ -15,18 +15,26 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from decimal import Decimal
 from io import BytesIO, StringIO
+from typing import Any
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 import pytest
 from flask_babel import lazy_gettext as _
+from pytest_mock import MockerFixture
 from sqlalchemy.orm.session import Session
 
 from superset.charts.client_processing import (
+    add_column_subtotals_iteratively,
+    add_row_subtotals,
+    add_row_subtotals_iteratively,
     apply_client_processing,
     apply_pivot_number_formats,
     format_column,
+    get_level_runs,
     pivot_df,
     pivot_table_v2,
     table,
@@ -1804,6 +1812,136 @@ def test_pivot_df_complex_null_values():
     )
 
 
+def _subtotals_frame() -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    size = 240
+    df = pd.DataFrame(
+        {
+            "region": rng.choice(["north", "south", "east"], size),
+            "country": rng.choice(["fr", "de", None], size),
+            "city": rng.choice(["a", "b", "c", "d"], size),
+            "gender": rng.choice(["boy", "girl"], size),
+            "SUM(num)": rng.uniform(0, 100, size),
+            "COUNT(*)": rng.integers(0, 50, size),
+        }
+    )
+    return df
+
+
+def _pivot_df_iteratively(mocker: MockerFixture, *args: Any, **kwargs: Any) -> Any:
+    mocker.patch(
+        "superset.charts.client_processing.add_row_subtotals",
+        side_effect=add_row_subtotals_iteratively,
+    )
+    mocker.patch(
+        "superset.charts.client_processing.add_column_subtotals",
+        side_effect=add_column_subtotals_iteratively,
+    )
+    return pivot_df(*args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "aggfunc",
+    [
+        "Sum",
+        "Average",
+        "Median",
+        "Minimum",
+        "Maximum",
+        "Sum as Fraction of Rows",
+        "Sum as Fraction of Columns",
+    ],
+)
+@pytest.mark.parametrize(
+    "rows, columns",
+    [
+        (["region", "country", "city"], ["gender"]),
+        (["region"], ["gender", "country"]),
+        (["region", "city"], []),
+        ([], ["region", "city"]),
+    ],
+)
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"transpose_pivot": True},
+        {"combine_metrics": True},
+        {"apply_metrics_on_rows": True},
+        {"transpose_pivot": True, "combine_metrics": True},
+    ],
+)
+def test_pivot_df_subtotals_match_iterative_insertion(
+    mocker: MockerFixture,
+    aggfunc: str,
+    rows: list[str],
+    columns: list[str],
+    options: dict[str, bool],
+) -> None:
+    """
+    Subtotals assembled in one concatenation match inserting them one group
+    at a time, down to the dtypes and the last digit.
+    """
+    kwargs = {
+        "rows": rows,
+        "columns": columns,
+        "metrics": ["SUM(num)", "COUNT(*)"],
+        "aggfunc": aggfunc,
+        "show_rows_total": True,
+        "show_columns_total": True,
+        **options,
+    }
+
+    pivoted = pivot_df(_subtotals_frame(), **kwargs)
+    expected = _pivot_df_iteratively(mocker, _subtotals_frame(), **kwargs)
+
+    pd.testing.assert_frame_equal(pivoted, expected, check_exact=True)
+    assert pivoted.index.names == expected.index.names
+    assert pivoted.columns.names == expected.columns.names
+
+
+@pytest.mark.parametrize("aggfunc", ["Sum", "Average", "Maximum"])
+def test_pivot_df_subtotals_of_decimals_match_iterative_insertion(
+    mocker: MockerFixture, aggfunc: str
+) -> None:
+    """
+    Object columns are coerced to numbers one group at a time, as before.
+    """
+    df = _subtotals_frame()
+    df["SUM(num)"] = [Decimal(int(value)) / 7 for value in df["COUNT(*)"]]
+    kwargs = {
+        "rows": ["region", "city"],
+        "columns": ["gender"],
+        "metrics": ["SUM(num)"],
+        "aggfunc": aggfunc,
+        "show_rows_total": True,
+        "show_columns_total": True,
+    }
+
+    pivoted = pivot_df(df.copy(), **kwargs)
+    expected = _pivot_df_iteratively(mocker, df.copy(), **kwargs)
+
+    pd.testing.assert_frame_equal(pivoted, expected, check_exact=True)
+
+
+def test_add_row_subtotals_falls_back_when_a_group_is_split(
+    mocker: MockerFixture,
+) -> None:
+    """
+    A group whose rows are not contiguous has no single subtotal position,
+    so its subtotals are inserted one group at a time.
+    """
+    index = pd.MultiIndex.from_tuples([("a", "x"), ("b", "x"), ("a", "y")])
+    df = pd.DataFrame({("SUM(num)",): [1.0, 2.0, 3.0]}, index=index)
+    iteratively = mocker.patch(
+        "superset.charts.client_processing.add_row_subtotals_iteratively"
+    )
+
+    assert get_level_runs(index) is None
+    assert add_row_subtotals(df, "Sum", "Total") is iteratively.return_value
+    iteratively.assert_called_once_with(df, "Sum", "Total")
+
+
 def test_table():
     """
     Test that the table reports honor `d3NumberFormat`.
@@ -20,6 +20,7 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy.orm.session import Session
 
 from superset.charts.data.dashboard_filter_context import (
     _extract_filter_extra_form_data,
@@ -28,8 +29,11 @@ from superset.charts.data.dashboard_filter_context import (
     _merge_extra_form_data,
     _validate_chart_on_dashboard,
     DashboardFilterContext,
+    DashboardFilterScopeIndex,
     DashboardFilterStatus,
     get_dashboard_filter_context,
+    get_dashboard_filter_contexts,
+    get_filter_scope_index,
 )
 from superset.utils import json
 
@@ -782,3 +786,129 @@ def test_get_dashboard_filter_context_chart_not_in_layout_receives_root_filters(
     assert ctx.filters[0].id == "f1"
     assert ctx.filters[0].status == DashboardFilterStatus.APPLIED
     assert ctx.extra_form_data["filters"][0]["val"] == ["US"]
+
+
+@patch("superset.charts.data.dashboard_filter_context._check_dashboard_access")
+@patch("superset.charts.data.dashboard_filter_context.db")
+def test_get_dashboard_filter_contexts_resolves_all_charts(
+    mock_db: MagicMock,
+    mock_check_access: MagicMock,
+) -> None:
+    filter_config = [
+        _make_filter(
+            flt_id="f1",
+            name="Region",
+            scope_root=["ROW-abc"],
+            scope_excluded=[20],
+            default_value=["US"],
+        ),
+        _make_filter(flt_id="f2", name="Status", default_value=["active"]),
+    ]
+    dashboard = MagicMock()
+    dashboard.id = 1
+    dashboard.slices = [MagicMock(id=10), MagicMock(id=20), MagicMock(id=42)]
+    dashboard.json_metadata = json.dumps({"native_filter_configuration": filter_config})
+    dashboard.position_json = json.dumps(SAMPLE_POSITION_JSON)
+    (
+        mock_db.session.query.return_value.filter_by.return_value.one_or_none.return_value
+    ) = dashboard
+
+    contexts = get_dashboard_filter_contexts(dashboard_id=1)
+
+    assert {
+        chart_id: [f.id for f in ctx.filters] for chart_id, ctx in contexts.items()
+    } == {
+        10: ["f1", "f2"],
+        20: ["f2"],
+        42: ["f2"],
+    }
+    # Every chart gets its own context, so they can be mutated independently
+    assert contexts[20].extra_form_data is not contexts[42].extra_form_data
+    mock_check_access.assert_called_once_with(dashboard)
+
+    with pytest.raises(ValueError, match="not on dashboard"):
+        get_dashboard_filter_contexts(dashboard_id=1, chart_ids=[10, 99])
+
+
+def test_get_filter_scope_index_cached_per_version(session: Session) -> None:
+    from superset import db
+    from superset.models.dashboard import Dashboard
+
+    Dashboard.metadata.create_all(session.get_bind())
+    dashboard = Dashboard(
+        dashboard_title="scope_index_dash",
+        json_metadata=json.dumps(
+            {"native_filter_configuration": [_make_filter(flt_id="f1")]}
+        ),
+        position_json=json.dumps(SAMPLE_POSITION_JSON),
+    )
+    db.session.add(dashboard)
+    db.session.flush()
+
+    index = get_filter_scope_index(dashboard)
+    assert [flt["id"] for flt in index.filters_for_chart(10)] == ["f1"]
+    assert get_filter_scope_index(dashboard) is index
+
+    # Pending changes are never served from (nor stored in) the cache
+    dashboard.json_metadata = json.dumps(
+        {"native_filter_configuration": [_make_filter(flt_id="f2")]}
+    )
+    assert [flt["id"] for flt in get_filter_scope_index(dashboard).filters] == ["f2"]
+
+    # Saving bumps changed_on, which keys a fresh index
+    db.session.flush()
+    updated = get_filter_scope_index(dashboard)
+    assert updated is not index
+    assert [flt["id"] for flt in updated.filters] == ["f2"]
+
+
+@patch("superset.charts.data.dashboard_filter_context._check_dashboard_access")
+def test_get_dashboard_filter_contexts_reads_current_charts(
+    mock_check_access: MagicMock, session: Session
+) -> None:
+    from superset import db
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+    Dashboard.metadata.create_all(session.get_bind())
+    dashboard = Dashboard(
+        dashboard_title="membership_dash",
+        json_metadata=json.dumps(
+            {"native_filter_configuration": [_make_filter(flt_id="f1")]}
+        ),
+        position_json=json.dumps(SAMPLE_POSITION_JSON),
+    )
+    first = Slice(slice_name="first", datasource_type="table", datasource_id=1)
+    second = Slice(slice_name="second", datasource_type="table", datasource_id=1)
+    dashboard.slices = [first]
+    db.session.add_all([dashboard, second])
+    db.session.flush()
+    assert list(get_dashboard_filter_contexts(dashboard.id)) == [first.id]
+    changed_on = dashboard.changed_on
+
+    # Adding a chart to a dashboard doesn't bump its changed_on
+    dashboard.slices.append(second)
+    db.session.flush()
+    assert dashboard.changed_on == changed_on
+
+    assert sorted(get_dashboard_filter_contexts(dashboard.id)) == [
+        first.id,
+        second.id,
+    ]
+    assert list(get_dashboard_filter_contexts(dashboard.id, [second.id])) == [second.id]
+
+
+def test_filters_for_chart_returns_copies() -> None:
+    flt = _make_filter(flt_id="f1", default_value=["US"])
+    index = DashboardFilterScopeIndex(filters=[flt], chart_filters={10: [flt]})
+
+    # charts in the layout and charts resolved on demand alike
+    for chart_id in (10, 20):
+        filters = index.filters_for_chart(chart_id)
+        filters[0]["defaultDataMask"]["filterState"]["value"].append("FR")
+        filters.clear()
+
+    assert index.chart_filters == {
+        10: [_make_filter(flt_id="f1", default_value=["US"])]
+    }
+    assert flt == _make_filter(flt_id="f1", default_value=["US"])
@@ -46,6 +46,6 @@ def test_run_after_validate_submits_job():
         result = command.run(form_data={"k": "v"}, user_id=42)
 
         mock_manager.submit_chart_data_job.assert_called_once_with(
-            "channel-123", {"k": "v"}, 42
+            "channel-123", {"k": "v"}, 42, None
         )
         assert result == {"job_id": "abc"}
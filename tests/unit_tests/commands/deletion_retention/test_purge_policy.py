@@ -393,7 +393,7 @@ def test_version_target_resolution_rejects_invalid_declarations(
 
     with pytest.raises(RuntimeError, match="missing_version.id"):
         purge_cascade._entity_version_targets(
-            Slice, metadata, parent_shadow, entity_id=1
+            Slice, metadata, parent_shadow, entity_ids=[1]
         )
 
 
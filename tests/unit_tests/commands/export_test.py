@@ -16,6 +16,7 @@
 # under the License.
 # pylint: disable=invalid-name, unused-argument, import-outside-toplevel
 
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 import pytest
@@ -35,6 +36,7 @@ def test_export_assets_command(mocker: MockerFixture) -> None:
     ExportDatabasesCommand = mocker.patch(  # noqa: N806
         "superset.commands.export.assets.ExportDatabasesCommand"
     )
+    ExportDatabasesCommand.dao.iter_id_batches.return_value = [[1]]
     ExportDatabasesCommand.return_value.run.return_value = [
         (
             "metadata.yaml",
@@ -49,6 +51,7 @@ def test_export_assets_command(mocker: MockerFixture) -> None:
     ExportDatasetsCommand = mocker.patch(  # noqa: N806
         "superset.commands.export.assets.ExportDatasetsCommand"
     )
+    ExportDatasetsCommand.dao.iter_id_batches.return_value = [[1]]
     ExportDatasetsCommand.return_value.run.return_value = [
         (
             "metadata.yaml",
@@ -63,6 +66,7 @@ def test_export_assets_command(mocker: MockerFixture) -> None:
     ExportChartsCommand = mocker.patch(  # noqa: N806
         "superset.commands.export.assets.ExportChartsCommand"
     )
+    ExportChartsCommand.dao.iter_id_batches.return_value = [[1]]
     ExportChartsCommand.return_value.run.return_value = [
         (
             "metadata.yaml",
@@ -75,6 +79,7 @@ def test_export_assets_command(mocker: MockerFixture) -> None:
     ExportDashboardsCommand = mocker.patch(  # noqa: N806
         "superset.commands.export.assets.ExportDashboardsCommand"
     )
+    ExportDashboardsCommand.dao.iter_id_batches.return_value = [[1]]
     ExportDashboardsCommand.return_value.run.return_value = [
         (
             "metadata.yaml",
@@ -89,6 +94,7 @@ def test_export_assets_command(mocker: MockerFixture) -> None:
     ExportSavedQueriesCommand = mocker.patch(  # noqa: N806
         "superset.commands.export.assets.ExportSavedQueriesCommand"
     )
+    ExportSavedQueriesCommand.dao.iter_id_batches.return_value = [[1]]
     ExportSavedQueriesCommand.return_value.run.return_value = [
         (
             "metadata.yaml",
@@ -126,6 +132,77 @@ def test_export_assets_command(mocker: MockerFixture) -> None:
     ]
 
 
+def test_export_assets_command_batches_and_changed_since(
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test that each model type is exported batch by batch, filtered by
+    ``changed_since``, and that the tags cover every exported batch.
+    """
+    from superset.commands.export.assets import ExportAssetsCommand
+
+    commands = {}
+    for name in (
+        "ExportDatabasesCommand",
+        "ExportDatasetsCommand",
+        "ExportChartsCommand",
+        "ExportDashboardsCommand",
+        "ExportSavedQueriesCommand",
+    ):
+        mocked = mocker.patch(f"superset.commands.export.assets.{name}")
+        mocked.dao.iter_id_batches.return_value = []
+        commands[name] = mocked
+
+    charts = commands["ExportChartsCommand"]
+    charts.dao.iter_id_batches.return_value = [[1, 2], [3]]
+    charts.return_value.run.side_effect = [
+        [
+            ("metadata.yaml", lambda: "<METADATA>"),
+            ("charts/a.yaml", lambda: "<A>"),
+            ("charts/b.yaml", lambda: "<B>"),
+        ],
+        [
+            ("metadata.yaml", lambda: "<METADATA>"),
+            ("charts/c.yaml", lambda: "<C>"),
+        ],
+    ]
+    ExportTagsCommand = mocker.patch(  # noqa: N806
+        "superset.commands.export.assets.ExportTagsCommand"
+    )
+    ExportTagsCommand.return_value.run.return_value = []
+
+    with freeze_time("2022-01-02T00:00:00Z"):
+        command = ExportAssetsCommand(
+            changed_since=datetime(2022, 1, 1, 1, tzinfo=timezone(timedelta(hours=1))),
+            batch_size=2,
+        )
+        output = [(file[0], file[1]()) for file in list(command.run())]
+
+    assert output == [
+        (
+            "metadata.yaml",
+            "version: 1.0.0\n"
+            "type: assets\n"
+            "timestamp: '2022-01-02T00:00:00+00:00'\n"
+            "changed_since: '2022-01-01T00:00:00+00:00'\n",
+        ),
+        ("charts/a.yaml", "<A>"),
+        ("charts/b.yaml", "<B>"),
+        ("charts/c.yaml", "<C>"),
+    ]
+    charts.dao.iter_id_batches.assert_called_once_with(
+        2, changed_since=datetime(2022, 1, 1)
+    )
+    charts.assert_has_calls(
+        [
+            mocker.call([1, 2], export_related=False),
+            mocker.call([3], export_related=False),
+        ],
+        any_order=True,
+    )
+    ExportTagsCommand.assert_called_once_with(dashboard_ids=[], chart_ids=[1, 2, 3])
+
+
 @pytest.fixture
 def mock_export_tags_command_charts_dashboards(mocker):
     export_tags = mocker.patch("superset.commands.tag.export.ExportTagsCommand")
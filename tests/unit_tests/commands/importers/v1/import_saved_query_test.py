@@ -27,9 +27,7 @@ from superset.commands.query.importers.v1 import utils
 
 def _wire_existing(mocker: MockerFixture, existing: MagicMock | None) -> None:
     mocker.patch.object(utils, "db")
-    utils.db.session.query.return_value.filter_by.return_value.first.return_value = (
-        existing
-    )
+    mocker.patch.object(utils, "find_existing_for_import", return_value=existing)
 
 
 def test_overwrite_of_another_users_saved_query_is_rejected(
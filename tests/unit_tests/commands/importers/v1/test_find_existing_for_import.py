@@ -28,6 +28,7 @@ from __future__ import annotations
 from collections.abc import Generator
 
 import pytest
+from pytest_mock import MockerFixture
 from sqlalchemy import Column, Integer, String
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm.session import Session
@@ -36,6 +37,7 @@ from sqlalchemy_utils import UUIDType
 from superset.commands.importers.v1.utils import (
     clear_soft_deleted_for_import,
     find_existing_for_import,
+    prefetch_existing_for_import,
 )
 from superset.models.helpers import SoftDeleteMixin
 
@@ -178,3 +180,37 @@ def test_find_then_clear_is_the_intended_caller_sequence(
     session.flush()
     assert fresh.id is not None
     assert fresh.deleted_at is None
+
+
+@pytest.mark.usefixtures("_synthetic_table")
+def test_prefetch_answers_lookups_without_querying(
+    app_context: None, session: Session, mocker: MockerFixture
+) -> None:
+    """Inside ``prefetch_existing_for_import`` lookups for the prefetched
+    UUIDs — including soft-deleted and missing rows — are answered from the
+    rows loaded up front, once each."""
+    import uuid as uuid_lib
+
+    live_uuid, deleted_uuid, missing_uuid = (uuid_lib.uuid4() for _ in range(3))
+    live = _ImportableSoftDeletable(name="live", uuid=live_uuid)
+    deleted = _ImportableSoftDeletable(name="deleted", uuid=deleted_uuid)
+    session.add_all([live, deleted])
+    session.flush()
+    deleted.soft_delete()
+    session.flush()
+
+    uuids = [str(live_uuid), str(deleted_uuid), str(missing_uuid)]
+    with prefetch_existing_for_import({_ImportableSoftDeletable: uuids}):
+        query = mocker.spy(session, "query")
+
+        assert find_existing_for_import(_ImportableSoftDeletable, uuids[0]) is live
+        assert find_existing_for_import(_ImportableSoftDeletable, uuids[1]) is deleted
+        assert find_existing_for_import(_ImportableSoftDeletable, uuids[2]) is None
+        query.assert_not_called()
+
+        # a row created by the import is found by a repeated lookup
+        created = _ImportableSoftDeletable(name="created", uuid=missing_uuid)
+        session.add(created)
+        session.flush()
+        assert find_existing_for_import(_ImportableSoftDeletable, uuids[2]) is created
+        query.assert_called_once()
@@ -18,6 +18,7 @@
 
 import gzip
 import io
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import patch
 
 import pandas as pd
@@ -166,6 +167,48 @@ class TestLoadYaml:
             load_yaml("test.yaml", 'key: "unterminated string')
 
 
+class TestLoadYamls:
+    contents = {
+        "charts/a.yaml": "slice_name: A\nparams:\n  x: 1\n",
+        "charts/broken.yaml": "key: [unclosed",
+        "charts/b.yaml": "slice_name: B\n",
+    }
+
+    def _check(self, documents: dict[str, object]) -> None:
+        assert list(documents) == list(self.contents)
+        assert documents["charts/a.yaml"] == {"slice_name": "A", "params": {"x": 1}}
+        assert documents["charts/b.yaml"] == {"slice_name": "B"}
+        assert isinstance(documents["charts/broken.yaml"], ValidationError)
+
+    def test_in_process(self, app_context: None) -> None:
+        from superset.commands.importers.v1.utils import load_yamls
+
+        self._check(load_yamls(self.contents))
+
+    def test_worker_processes(self, app_context: None) -> None:
+        """Large bundles are parsed across worker processes with the same
+        per-file results."""
+        from flask import current_app
+
+        from superset.commands.importers.v1.utils import load_yamls
+
+        with (
+            patch.dict(current_app.config, {"IMPORT_YAML_PARSE_PROCESSES": 2}),
+            patch(
+                "superset.commands.importers.v1.utils.MIN_FILES_FOR_PARALLEL_PARSE",
+                1,
+            ),
+            patch(
+                "superset.commands.importers.v1.utils.ProcessPoolExecutor",
+                wraps=ProcessPoolExecutor,
+            ) as executor,
+        ):
+            documents = load_yamls(self.contents)
+
+        executor.assert_called_once_with(max_workers=2)
+        self._check(documents)
+
+
 class TestLoadConfigsNonMappingYaml:
     """A syntactically valid YAML document whose top-level value is a
     scalar or list (not a mapping) must be reported as a schema validation
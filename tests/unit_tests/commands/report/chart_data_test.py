@@ -0,0 +1,115 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from io import BytesIO
+from typing import Any
+from unittest.mock import MagicMock
+from zipfile import ZipFile
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.app import SupersetApp
+from superset.commands.report.chart_data import ReportChartDataCommand
+from superset.commands.report.exceptions import ReportScheduleForbiddenError
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.utils import json
+
+
+def _mock_chart_data(
+    mocker: MockerFixture,
+    result_format: ChartDataResultFormat,
+    queries: list[dict[str, Any]],
+    result_type: ChartDataResultType = ChartDataResultType.FULL,
+    can_export: bool = True,
+) -> MagicMock:
+    query_context = MagicMock(result_format=result_format, result_type=result_type)
+    mocker.patch(
+        "superset.commands.report.chart_data.ChartDataQueryContextSchema"
+    ).return_value.load.return_value = query_context
+    command = mocker.patch("superset.commands.report.chart_data.ChartDataCommand")
+    command.return_value.execute.return_value.materialize.return_value = {
+        "query_context": query_context,
+        "queries": queries,
+    }
+    mocker.patch(
+        "superset.commands.report.chart_data.security_manager.can_access",
+        return_value=can_export,
+    )
+    return command
+
+
+def test_csv_single_query(app: SupersetApp, mocker: MockerFixture) -> None:
+    command = _mock_chart_data(
+        mocker, ChartDataResultFormat.CSV, [{"data": b"a,b\n1,2\n"}]
+    )
+
+    assert ReportChartDataCommand({"queries": [{}]}).run() == b"a,b\n1,2\n"
+    command.return_value.validate.assert_called_once()
+
+
+def test_multiple_queries_are_zipped(app: SupersetApp, mocker: MockerFixture) -> None:
+    _mock_chart_data(
+        mocker,
+        ChartDataResultFormat.CSV,
+        [{"data": b"a\n1\n"}, {"data": "b\n2\n"}],
+    )
+
+    content = ReportChartDataCommand({"queries": [{}, {}]}).run()
+
+    assert content is not None
+    with ZipFile(BytesIO(content)) as bundle:
+        assert bundle.read("query_1.csv") == b"a\n1\n"
+        assert bundle.read("query_2.csv").decode("utf-8-sig") == "b\n2\n"
+
+
+def test_json_matches_api_payload(app: SupersetApp, mocker: MockerFixture) -> None:
+    queries = [{"data": [{"a": 1}], "colnames": ["a"]}]
+    _mock_chart_data(mocker, ChartDataResultFormat.JSON, queries)
+
+    content = ReportChartDataCommand({"queries": [{}]}).run()
+
+    assert content is not None
+    assert json.loads(content) == {"result": queries}
+
+
+def test_post_processed_uses_form_data(app: SupersetApp, mocker: MockerFixture) -> None:
+    _mock_chart_data(
+        mocker,
+        ChartDataResultFormat.CSV,
+        [{"data": b"raw"}],
+        result_type=ChartDataResultType.POST_PROCESSED,
+    )
+    apply_client_processing = mocker.patch(
+        "superset.commands.report.chart_data.apply_client_processing",
+        return_value={"queries": [{"data": "processed"}]},
+    )
+    form_data = {"viz_type": "pivot_table_v2"}
+
+    assert ReportChartDataCommand(
+        {"queries": [{}], "form_data": form_data}
+    ).run() == "processed".encode(app.config["CSV_EXPORT"].get("encoding", "utf-8"))
+    assert apply_client_processing.call_args.args[1] == form_data
+
+
+def test_export_permission_required(app: SupersetApp, mocker: MockerFixture) -> None:
+    command = _mock_chart_data(
+        mocker, ChartDataResultFormat.CSV, [{"data": b""}], can_export=False
+    )
+
+    with pytest.raises(ReportScheduleForbiddenError):
+        ReportChartDataCommand({"queries": [{}]}).run()
+    command.return_value.execute.assert_not_called()
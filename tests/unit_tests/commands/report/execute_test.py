@@ -1376,6 +1376,89 @@ def test_get_csv_data_keeps_screenshot_fallback_without_query_context(
     post_chart_data.assert_not_called()
 
 
+def test_get_csv_data_in_process_skips_webserver(
+    app: SupersetApp,
+    mocker: MockerFixture,
+) -> None:
+    """With in-process chart data, CSV is produced in the worker as the executor."""
+    mocker.patch.dict(app.config, {"ALERT_REPORTS_CHART_DATA_IN_PROCESS": True})
+    report_state = _executor_report_state(mocker)
+    report_state._report_schedule.chart.query_context = json.dumps(
+        {
+            "datasource": {"id": 1, "type": "table"},
+            "queries": [{"row_limit": 10}],
+            "form_data": {"viz_type": "table"},
+        }
+    )
+    user = mocker.MagicMock(username="report_executor")
+    mocker.patch(
+        "superset.commands.report.execute.resolve_executor_user",
+        return_value=(user, "report_executor"),
+    )
+    auth_provider = mocker.patch(
+        "superset.commands.report.execute.machine_auth_provider_factory"
+    )
+    override_user = mocker.patch("superset.commands.report.execute.override_user")
+    command = mocker.patch("superset.commands.report.execute.ReportChartDataCommand")
+    command.return_value.run.return_value = b"csv-data"
+    post_chart_data = mocker.patch.object(report_state, "_post_chart_data")
+
+    assert report_state._get_data(ChartDataResultFormat.CSV) == b"csv-data"
+
+    override_user.assert_called_once_with(user)
+    payload, form_data = command.call_args.args
+    assert payload["result_format"] == ChartDataResultFormat.CSV.value
+    assert payload["result_type"] == ChartDataResultType.POST_PROCESSED.value
+    assert form_data is None
+    post_chart_data.assert_not_called()
+    auth_provider.instance.get_auth_cookies.assert_not_called()
+
+
+def test_get_embedded_data_in_process_uses_chart_params(
+    app: SupersetApp,
+    mocker: MockerFixture,
+) -> None:
+    """In-process embedded data is post-processed with the saved chart params."""
+    mocker.patch.dict(app.config, {"ALERT_REPORTS_CHART_DATA_IN_PROCESS": True})
+    report_state = _executor_report_state(mocker)
+    report_state._report_schedule.chart.query_context = json.dumps(
+        {"datasource": {"id": 1, "type": "table"}, "queries": [{}]}
+    )
+    report_state._report_schedule.chart.params = json.dumps({"viz_type": "table"})
+    mocker.patch(
+        "superset.commands.report.execute.get_url_path",
+        return_value="/api/v1/chart/1/data/",
+    )
+    mocker.patch(
+        "superset.commands.report.execute.resolve_executor_user",
+        return_value=(mocker.MagicMock(), "report_executor"),
+    )
+    command = mocker.patch("superset.commands.report.execute.ReportChartDataCommand")
+    command.return_value.run.return_value = json.dumps(
+        {
+            "result": [
+                {
+                    "data": [{"name": "a", "count": 1}],
+                    "colnames": ["name", "count"],
+                    "coltypes": [1, 0],
+                    "indexnames": [0],
+                }
+            ]
+        }
+    ).encode()
+    get_chart_dataframe = mocker.patch(
+        "superset.commands.report.execute.get_chart_dataframe"
+    )
+
+    dataframe = report_state._get_embedded_data()
+
+    assert dataframe.values.tolist() == [["a", 1]]
+    payload, form_data = command.call_args.args
+    assert payload["result_format"] == ChartDataResultFormat.JSON.value
+    assert form_data == {"viz_type": "table"}
+    get_chart_dataframe.assert_not_called()
+
+
 def test_get_url_for_xlsx_report(mocker: MockerFixture) -> None:
     """XLSX reports should request post-processed chart data."""
     report_schedule = create_report_schedule(mocker)
@@ -1768,7 +1851,7 @@ def test_screenshot_soft_timeout_distinguishes_reports_from_alert_attachments(
     screenshot = mocker.patch(
         "superset.commands.report.execute.ChartScreenshot"
     ).return_value
-    screenshot.get_screenshot.side_effect = SoftTimeLimitExceeded()
+    screenshot.get_coalesced_screenshot.side_effect = SoftTimeLimitExceeded()
 
     with pytest.raises(expected_exception):
         state._get_screenshots()
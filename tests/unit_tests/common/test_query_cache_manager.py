@@ -55,3 +55,63 @@ class TestQueryCacheManagerGet:
         assert result.is_loaded == miss_result.is_loaded
         assert result.cache_value == miss_result.cache_value
         assert result.status == miss_result.status
+
+
+class TestQueryCacheManagerPrefetch:
+    def test_get_uses_the_prefetched_values(self, app):
+        """Keys read by prefetch() are not read again by get()."""
+        mock_cache = MagicMock()
+        mock_cache.get_many.return_value = [None, None]
+
+        with (
+            app.test_request_context(),
+            patch(
+                "superset.common.utils.query_cache_manager._cache",
+                {CacheRegion.DATA: mock_cache},
+            ),
+        ):
+            QueryCacheManager.prefetch(["a", None, "b", "a"], region=CacheRegion.DATA)
+            result = QueryCacheManager.get(key="a", region=CacheRegion.DATA)
+            # a prefetched value is only used once
+            QueryCacheManager.get(key="a", region=CacheRegion.DATA)
+
+        mock_cache.get_many.assert_called_once_with("a", "b")
+        mock_cache.get.assert_called_once_with("a")
+        assert result.is_loaded is False
+
+    def test_set_discards_the_prefetched_value(self, app):
+        """A key set after being prefetched is read from the cache again."""
+        mock_cache = MagicMock()
+        mock_cache.get_many.return_value = [None]
+
+        with (
+            app.test_request_context(),
+            patch(
+                "superset.common.utils.query_cache_manager._cache",
+                {CacheRegion.DATA: mock_cache},
+            ),
+            patch("superset.common.utils.query_cache_manager.set_and_log_cache"),
+        ):
+            QueryCacheManager.prefetch(["a"], region=CacheRegion.DATA)
+            QueryCacheManager.set("a", {}, region=CacheRegion.DATA)
+            QueryCacheManager.get(key="a", region=CacheRegion.DATA)
+
+        mock_cache.get.assert_called_once_with("a")
+
+    def test_prefetch_backend_error_falls_back_to_get(self, app):
+        """If the batched read fails, get() reads each key as before."""
+        mock_cache = MagicMock()
+        mock_cache.get_many.side_effect = ConnectionError("connection refused")
+        mock_cache.get.return_value = None
+
+        with (
+            app.test_request_context(),
+            patch(
+                "superset.common.utils.query_cache_manager._cache",
+                {CacheRegion.DATA: mock_cache},
+            ),
+        ):
+            QueryCacheManager.prefetch(["a"], region=CacheRegion.DATA)
+            QueryCacheManager.get(key="a", region=CacheRegion.DATA)
+
+        mock_cache.get.assert_called_once_with("a")
@@ -0,0 +1,73 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Tests for BaseDAO.iter_id_batches keyset paging."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer
+from sqlalchemy.orm import declarative_base, Session
+
+from superset.daos.base import BaseDAO
+
+_TestBase = declarative_base()
+
+
+class _Asset(_TestBase):  # type: ignore[misc, valid-type]
+    __tablename__ = "_id_batches_dao_test"
+
+    id = Column(Integer, primary_key=True)
+    changed_on = Column(DateTime, nullable=False)
+
+
+class _AssetDAO(BaseDAO[_Asset]):
+    model_cls = _Asset
+
+
+def _populate(session: Session) -> None:
+    _TestBase.metadata.create_all(session.get_bind())
+    session.add_all(
+        _Asset(id=id_, changed_on=datetime(2024, 1, id_)) for id_ in range(1, 8)
+    )
+    session.flush()
+
+
+def test_iter_id_batches_pages_by_id(session: Session) -> None:
+    _populate(session)
+
+    assert list(_AssetDAO.iter_id_batches(3)) == [[1, 2, 3], [4, 5, 6], [7]]
+
+
+def test_iter_id_batches_exact_multiple(session: Session) -> None:
+    _populate(session)
+
+    assert list(_AssetDAO.iter_id_batches(7)) == [[1, 2, 3, 4, 5, 6, 7]]
+
+
+def test_iter_id_batches_changed_since(session: Session) -> None:
+    _populate(session)
+
+    batches = _AssetDAO.iter_id_batches(2, changed_since=datetime(2024, 1, 4))
+
+    assert list(batches) == [[4, 5], [6, 7]]
+
+
+def test_iter_id_batches_empty(session: Session) -> None:
+    _TestBase.metadata.create_all(session.get_bind())
+
+    assert list(_AssetDAO.iter_id_batches(10)) == []
@@ -0,0 +1,221 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Tests for BaseDAO.list ordering, keyset paging, search and counts."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from flask import current_app
+from flask_caching import Cache
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.orm import declarative_base, Session
+
+from superset.daos.base import BaseDAO, decode_keyset_cursor
+
+_TestBase = declarative_base()
+
+
+class _Item(_TestBase):  # type: ignore[misc, valid-type]
+    __tablename__ = "_list_dao_test"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50))
+    rank = Column(Integer, nullable=False)
+    created = Column(DateTime)
+
+
+class _ItemDAO(BaseDAO[_Item]):
+    model_cls = _Item
+
+
+def _populate(session: Session) -> None:
+    _TestBase.metadata.create_all(session.get_bind())
+    # Ranks repeat, so ordering by rank alone would not be deterministic.
+    session.add_all(
+        _Item(
+            id=id_,
+            name=f"item {id_}",
+            rank=id_ // 3,
+            # some rows have no creation time, and two share one
+            created=datetime(2024, 1, min(id_, 8)) if id_ % 4 else None,
+        )
+        for id_ in range(1, 11)
+    )
+    session.flush()
+
+
+def test_list_breaks_order_ties_by_id(session: Session) -> None:
+    _populate(session)
+
+    items, total = _ItemDAO.list(order_column="rank", order_direction="desc")
+
+    assert total == 10
+    assert [item.id for item in items] == [10, 9, 8, 7, 6, 5, 4, 3, 2, 1]
+
+
+def test_list_keyset_pages_match_offset_pages(session: Session) -> None:
+    _populate(session)
+
+    for direction in ("asc", "desc"):
+        offset_pages = [
+            [
+                item.id
+                for item in _ItemDAO.list(
+                    order_column="rank",
+                    order_direction=direction,
+                    page=page,
+                    page_size=4,
+                )[0]
+            ]
+            for page in range(3)
+        ]
+
+        keyset_pages = []
+        after = None
+        for _ in range(3):
+            items, _total = _ItemDAO.list(
+                order_column="rank",
+                order_direction=direction,
+                page_size=4,
+                after=after,
+            )
+            keyset_pages.append([item.id for item in items])
+            after = (items[-1].rank, items[-1].id) if items else None
+
+        assert keyset_pages == offset_pages
+
+
+def test_list_keyset_ignores_page(session: Session) -> None:
+    _populate(session)
+
+    items, _ = _ItemDAO.list(
+        order_column="id", order_direction="asc", page=5, page_size=3, after=(4, 4)
+    )
+
+    assert [item.id for item in items] == [5, 6, 7]
+
+
+def test_list_keyset_cursor_pages_nulls_last(session: Session) -> None:
+    _populate(session)
+
+    for direction in ("asc", "desc"):
+        offset_ids = [
+            item.id
+            for item in _ItemDAO.list(
+                order_column="created", order_direction=direction, page_size=10
+            )[0]
+        ]
+        keyset_ids = []
+        after = None
+        for _ in range(4):
+            items, _total = _ItemDAO.list(
+                order_column="created",
+                order_direction=direction,
+                page_size=3,
+                after=after,
+            )
+            keyset_ids.extend(item.id for item in items)
+            if items:
+                cursor = _ItemDAO.keyset_cursor(items[-1], "created")
+                after = decode_keyset_cursor(cursor)
+
+        assert keyset_ids == offset_ids
+        # rows without a creation time come last in either direction
+        assert keyset_ids[-2:] == ([4, 8] if direction == "asc" else [8, 4])
+
+
+def test_list_columns_include_the_keyset(session: Session) -> None:
+    _populate(session)
+
+    rows, _ = _ItemDAO.list(
+        order_column="created", order_direction="asc", page_size=2, columns=["name"]
+    )
+
+    assert [row.name for row in rows] == ["item 1", "item 2"]
+    assert decode_keyset_cursor(_ItemDAO.keyset_cursor(rows[-1], "created")) == (
+        "2024-01-02T00:00:00",
+        2,
+    )
+
+
+def test_list_keyset_cursor_without_order_column(session: Session) -> None:
+    """Lists by a column the model lacks, e.g. the MCP default, page by id."""
+    _populate(session)
+
+    items, _ = _ItemDAO.list(order_column="changed_on", page_size=4)
+    after = decode_keyset_cursor(_ItemDAO.keyset_cursor(items[-1], "changed_on"))
+    items, _ = _ItemDAO.list(order_column="changed_on", page_size=4, after=after)
+
+    assert after == (None, 7)
+    assert [item.id for item in items] == [6, 5, 4, 3]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "!!",
+        # "[1]", "[[1], 1]" and "[1, null]"
+        "WzFd",
+        "W1sxXSwgMV0=",
+        "WzEsIG51bGxd",
+    ],
+)
+def test_decode_keyset_cursor_invalid(cursor: str) -> None:
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_keyset_cursor(cursor)
+
+
+def test_list_search_string_and_non_string_columns(session: Session) -> None:
+    _populate(session)
+
+    by_name, total = _ItemDAO.list(search="ITEM 1", search_columns=["name"])
+    by_id, _ = _ItemDAO.list(search="7", search_columns=["id"])
+
+    assert sorted(item.id for item in by_name) == [1, 10]
+    assert total == 2
+    assert [item.id for item in by_id] == [7]
+
+
+def test_list_inexact_count_is_cached(session: Session) -> None:
+    _populate(session)
+    cache = Cache(current_app, config={"CACHE_TYPE": "SimpleCache"})
+
+    with patch("superset.daos.base.cache_manager") as mock_cache_manager:
+        mock_cache_manager.cache = cache
+        _, first = _ItemDAO.list(page_size=2, exact_count=False)
+        session.add(_Item(id=11, name="item 11", rank=9))
+        session.flush()
+        _, cached = _ItemDAO.list(page=1, page_size=2, exact_count=False)
+        _, exact = _ItemDAO.list(page_size=2)
+
+    assert (first, cached, exact) == (10, 10, 11)
+
+
+def test_list_inexact_count_without_timeout_counts(session: Session) -> None:
+    _populate(session)
+
+    with (
+        patch.dict(current_app.config, {"DAO_LIST_COUNT_CACHE_TIMEOUT": 0}),
+        patch("superset.daos.base.cache_manager") as mock_cache_manager,
+    ):
+        _, total = _ItemDAO.list(exact_count=False)
+
+    assert total == 10
+    mock_cache_manager.cache.get.assert_not_called()
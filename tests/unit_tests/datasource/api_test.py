@@ -0,0 +1,90 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+
+@pytest.mark.parametrize("value", ["Alice", 42, 1.5, "2024-01-01T00:00:00"])
+def test_values_cursor_round_trip(app_context: None, value: object) -> None:
+    from superset.datasource.api import _decode_values_cursor, _encode_values_cursor
+
+    assert _decode_values_cursor(_encode_values_cursor(value)) == value
+
+
+def test_values_cursor_empty(app_context: None) -> None:
+    from superset.datasource.api import _decode_values_cursor
+
+    assert _decode_values_cursor(None) is None
+    assert _decode_values_cursor("") is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "!!",
+        "bm90IGpzb24=",
+        "WzFd",
+        # {"after": [1]} and {"after": {"a": 1}}
+        "eyJhZnRlciI6IFsxXX0=",
+        "eyJhZnRlciI6IHsiYSI6IDF9fQ==",
+    ],
+)
+def test_values_cursor_malformed(app_context: None, cursor: str) -> None:
+    from superset.datasource.api import _decode_values_cursor
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _decode_values_cursor(cursor)
+
+
+def test_get_column_values_page(
+    client: Any, full_api_access: None, mocker: MockerFixture
+) -> None:
+    from superset.datasource.api import _decode_values_cursor
+    from superset.extensions import security_manager
+
+    datasource = MagicMock(
+        uid="1__table", normalize_columns=False, cache_timeout=None, changed_on=None
+    )
+    datasource.values_for_column.return_value = ["a", "ab", "abc"]
+    mocker.patch(
+        "superset.datasource.api.DatasourceDAO.get_datasource",
+        return_value=datasource,
+    )
+    mocker.patch.object(security_manager, "get_rls_cache_key", return_value=[])
+
+    response = client.get(
+        "/api/v1/datasource/table/1/column/name/values/page/"
+        "?search=a&prefix=true&page_size=2"
+    )
+
+    assert response.status_code == 200
+    assert response.json["result"] == ["a", "ab"]
+    assert _decode_values_cursor(response.json["next_cursor"]) == "ab"
+    datasource.values_for_column.assert_called_once_with(
+        column_name="name",
+        limit=3,
+        denormalize_column=True,
+        array_elements=False,
+        search="a",
+        search_prefix=True,
+        after=None,
+        ordered=True,
+    )
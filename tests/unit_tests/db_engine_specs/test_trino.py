@@ -20,6 +20,7 @@ from __future__ import annotations
 import copy
 from collections import namedtuple
 from datetime import datetime
+from decimal import Decimal
 from typing import Any, Optional
 from unittest.mock import MagicMock, Mock, patch
 
@@ -1363,6 +1364,54 @@ def test_handle_cursor_breaks_on_execute_event_set(
     mock_cancel_query.assert_not_called()
 
 
+@pytest.mark.parametrize("start_time_type", [float, Decimal])
+@patch("superset.db_engine_specs.presto.PrestoBaseEngineSpec.handle_cursor")
+@patch("superset.db_engine_specs.trino.TrinoEngineSpec.cancel_query")
+@patch("superset.db_engine_specs.trino.db")
+@patch("superset.db_engine_specs.trino.app")
+def test_handle_cursor_backs_off_while_waiting_for_execute_event(
+    mock_app: Mock,
+    mock_db: Mock,
+    mock_cancel_query: Mock,
+    mock_presto_handle_cursor: Mock,
+    start_time_type: type,
+    mocker: MockerFixture,
+) -> None:
+    """Test that handle_cursor polls less often as the query ages."""
+    import time
+
+    from superset.db_engine_specs.trino import TrinoEngineSpec
+    from superset.models.sql_lab import Query
+
+    mock_app.config = {
+        "DB_POLL_INTERVAL_SECONDS": {"trino": 1},
+        "DB_POLL_MAX_INTERVAL_SECONDS": 10,
+        "DB_POLL_BACKOFF_AGE_RATIO": 0.1,
+    }
+
+    cursor_mock = mocker.MagicMock(
+        spec=["query_id", "stats", "info_uri", "_execute_result", "_execute_event"]
+    )
+    cursor_mock.query_id = "test-query-id"
+    cursor_mock.stats = {"state": "RUNNING", "completedSplits": 5, "totalSplits": 10}
+    cursor_mock._execute_result = {}
+    cursor_mock._execute_event = mocker.MagicMock()
+    cursor_mock._execute_event.is_set.side_effect = [False] * 4 + [True]
+    sleep = mocker.patch("superset.db_engine_specs.trino.time.sleep")
+
+    query = Query()
+    query.status = "running"
+    # started a minute ago, so polls are at most 6 seconds apart; a query loaded
+    # from the database has a Decimal start time
+    query.start_time = start_time_type((time.time() - 60) * 1000)
+    TrinoEngineSpec.handle_cursor(cursor=cursor_mock, query=query)
+
+    assert [
+        call.args[0] for call in cursor_mock._execute_event.wait.call_args_list
+    ] == pytest.approx([1, 2, 4, 6], abs=0.1)
+    sleep.assert_not_called()
+
+
 @patch("superset.db_engine_specs.presto.PrestoBaseEngineSpec.handle_cursor")
 @patch("superset.db_engine_specs.trino.TrinoEngineSpec.cancel_query")
 @patch("superset.db_engine_specs.trino.db")
@@ -17,9 +17,9 @@
 
 # pylint: disable=invalid-name
 
-from typing import Any
+import threading
 from unittest.mock import MagicMock, patch
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from freezegun import freeze_time
@@ -28,19 +28,25 @@ from sqlalchemy.orm import Session, sessionmaker
 # Force module loading before tests run so patches work correctly
 import superset.commands.distributed_lock.acquire as acquire_module
 import superset.commands.distributed_lock.release as release_module
+import superset.commands.distributed_lock.renew as renew_module
 from superset import db
+from superset.commands.distributed_lock.acquire import AcquireDistributedLock
+from superset.commands.distributed_lock.release import ReleaseDistributedLock
+from superset.commands.distributed_lock.renew import RenewDistributedLock
 from superset.distributed_lock import DistributedLock
 from superset.distributed_lock.types import LockValue
 from superset.distributed_lock.utils import get_key
-from superset.exceptions import AcquireDistributedLockFailedException
+from superset.exceptions import (
+    AcquireDistributedLockFailedException,
+    LockAlreadyHeldException,
+)
 from superset.key_value.types import JsonKeyValueCodec
 
-LOCK_VALUE: LockValue = {"value": True}
 MAIN_KEY = get_key("ns", a=1, b=2)
 OTHER_KEY = get_key("ns2", a=1, b=2)
 
 
-def _get_lock(key: UUID, session: Session) -> Any:
+def _get_lock(key: UUID, session: Session) -> LockValue | None:
     from superset.key_value.models import KeyValueEntry
 
     entry = db.session.query(KeyValueEntry).filter_by(uuid=key).first()
@@ -50,6 +56,11 @@ def _get_lock(key: UUID, session: Session) -> Any:
     return JsonKeyValueCodec().decode(entry.value)
 
 
+def _is_locked(key: UUID, session: Session) -> bool:
+    lock = _get_lock(key, session)
+    return lock is not None and lock["value"] is True and "owner" in lock
+
+
 def _get_other_session() -> Session:
     # This session is used to simulate what another worker will find in the metastore
     # during the locking process.
@@ -80,7 +91,7 @@ def test_distributed_lock_kv_happy_path() -> None:
 
             with DistributedLock("ns", a=1, b=2) as key:
                 assert key == MAIN_KEY
-                assert _get_lock(key, session) == LOCK_VALUE
+                assert _is_locked(key, session)
                 assert _get_lock(OTHER_KEY, session) is None
 
                 with pytest.raises(AcquireDistributedLockFailedException):
@@ -108,7 +119,7 @@ def test_distributed_lock_kv_expired() -> None:
         with freeze_time("2021-01-01"):
             assert _get_lock(MAIN_KEY, session) is None
             with DistributedLock("ns", a=1, b=2):
-                assert _get_lock(MAIN_KEY, session) == LOCK_VALUE
+                assert _is_locked(MAIN_KEY, session)
                 with freeze_time("2022-01-01"):
                     assert _get_lock(MAIN_KEY, session) is None
 
@@ -133,8 +144,9 @@ def test_distributed_lock_uses_redis_when_configured() -> None:
             assert call_args.kwargs["nx"] is True
             assert "ex" in call_args.kwargs
 
-        # Verify DELETE was called on exit
-        mock_redis.delete.assert_called_once()
+        # Verify the owner-checked DELETE was called on exit with the token set
+        mock_redis.eval.assert_called_once()
+        assert mock_redis.eval.call_args.args[-1] == call_args.args[1]
 
 
 def test_distributed_lock_redis_already_taken() -> None:
@@ -205,7 +217,162 @@ def test_distributed_lock_fallback_to_kv_when_redis_not_configured() -> None:
             with DistributedLock("test_fallback", key="value") as lock_key:
                 assert lock_key == test_key
                 # Verify lock exists in KV store
-                assert _get_lock(test_key, session) == LOCK_VALUE
+                assert _is_locked(test_key, session)
 
             # Lock should be released
             assert _get_lock(test_key, session) is None
+
+
+def test_distributed_lock_kv_takes_over_expired_lock() -> None:
+    """Test an expired KV lock is taken over by the next acquisition."""
+    session = _get_other_session()
+    stale = uuid4().hex
+
+    with (
+        patch.object(acquire_module, "get_redis_client", return_value=None),
+        patch.object(release_module, "get_redis_client", return_value=None),
+    ):
+        with freeze_time("2021-01-01"):
+            AcquireDistributedLock("ns", {"a": 1, "b": 2}, token=stale).run()
+
+        with freeze_time("2022-01-01"):
+            with DistributedLock("ns", a=1, b=2):
+                lock = _get_lock(MAIN_KEY, session)
+                assert lock is not None
+                assert lock["owner"] != stale
+
+            assert _get_lock(MAIN_KEY, session) is None
+
+
+def test_distributed_lock_kv_release_checks_owner() -> None:
+    """Test releasing a KV lock with another owner's token leaves it in place."""
+    session = _get_other_session()
+    params = {"a": 1, "b": 2}
+    owner, other = uuid4().hex, uuid4().hex
+
+    with (
+        patch.object(acquire_module, "get_redis_client", return_value=None),
+        patch.object(release_module, "get_redis_client", return_value=None),
+        patch.object(renew_module, "get_redis_client", return_value=None),
+    ):
+        with freeze_time("2021-01-01"):
+            AcquireDistributedLock("ns", params, token=owner).run()
+
+            ReleaseDistributedLock("ns", params, token=other).run()
+            assert _is_locked(MAIN_KEY, session)
+            assert not RenewDistributedLock("ns", params, token=other).run()
+            assert RenewDistributedLock("ns", params, token=owner).run()
+
+            ReleaseDistributedLock("ns", params, token=owner).run()
+            assert _get_lock(MAIN_KEY, session) is None
+
+
+def test_distributed_lock_kv_release_spares_a_lock_taken_over() -> None:
+    """Test a lock taken over while its old owner releases it stays in place."""
+    from sqlalchemy import update
+
+    from superset.key_value.models import KeyValueEntry
+
+    session = _get_other_session()
+    params = {"a": 1, "b": 2}
+    owner, new_owner = uuid4().hex, uuid4().hex
+    codec = JsonKeyValueCodec()
+
+    def decode_then_take_over(value: bytes) -> dict[str, object]:
+        # Another worker takes the lock over right after the owner check
+        decoded = codec.decode(value)
+        db.session.execute(
+            update(KeyValueEntry)
+            .where(KeyValueEntry.uuid == MAIN_KEY)
+            .values(value=codec.encode({**decoded, "owner": new_owner}))
+            .execution_options(synchronize_session=False)
+        )
+        return decoded
+
+    with (
+        patch.object(acquire_module, "get_redis_client", return_value=None),
+        patch.object(release_module, "get_redis_client", return_value=None),
+        freeze_time("2021-01-01"),
+    ):
+        AcquireDistributedLock("ns", params, token=owner).run()
+
+        with patch.object(
+            ReleaseDistributedLock, "codec", MagicMock(decode=decode_then_take_over)
+        ):
+            ReleaseDistributedLock("ns", params, token=owner).run()
+
+        lock = _get_lock(MAIN_KEY, session)
+        assert lock is not None
+        assert lock["owner"] == new_owner
+        ReleaseDistributedLock("ns", params, token=new_owner).run()
+
+
+def test_distributed_lock_kv_wait_timeout() -> None:
+    """Test a KV lock still held after ``wait_timeout`` raises."""
+    with (
+        patch.object(acquire_module, "get_redis_client", return_value=None),
+        patch.object(release_module, "get_redis_client", return_value=None),
+    ):
+        with DistributedLock("ns", a=1, b=2):
+            with pytest.raises(LockAlreadyHeldException):
+                with DistributedLock("ns", wait_timeout=0.1, a=1, b=2):
+                    pass
+
+
+def test_distributed_lock_redis_waits_for_release() -> None:
+    """Test a blocking Redis acquisition retries after a release notification."""
+    mock_redis = MagicMock()
+    mock_redis.set.side_effect = [None, True]
+    mock_redis.pttl.return_value = 5000
+    pubsub = mock_redis.pubsub.return_value
+
+    with (
+        patch.object(acquire_module, "get_redis_client", return_value=mock_redis),
+        patch.object(release_module, "get_redis_client", return_value=mock_redis),
+    ):
+        with DistributedLock("test_redis", wait_timeout=10, key="value"):
+            assert mock_redis.set.call_count == 2
+
+    pubsub.subscribe.assert_called_once_with(
+        f"lock:test_redis:{get_key('test_redis', key='value')}:released"
+    )
+    # The wait is bounded by the holder's remaining TTL, not the full timeout
+    assert pubsub.get_message.call_args.kwargs["timeout"] <= 5
+    pubsub.close.assert_called_once()
+
+
+def test_distributed_lock_redis_wait_timeout() -> None:
+    """Test a blocking Redis acquisition gives up at its deadline."""
+    mock_redis = MagicMock()
+    mock_redis.set.return_value = None
+    mock_redis.pttl.return_value = 10
+
+    with patch.object(acquire_module, "get_redis_client", return_value=mock_redis):
+        with pytest.raises(LockAlreadyHeldException):
+            with DistributedLock("test_redis", wait_timeout=0.05, key="value"):
+                pass
+
+    mock_redis.pubsub.return_value.close.assert_called_once()
+
+
+def test_distributed_lock_heartbeat_renews(app_context: None) -> None:
+    """Test the heartbeat renews the lease with the acquisition's token."""
+    mock_redis = MagicMock()
+    mock_redis.set.return_value = True
+    renewed = threading.Event()
+    mock_redis.eval.side_effect = lambda *args: renewed.set() or 1
+
+    with (
+        patch.object(acquire_module, "get_redis_client", return_value=mock_redis),
+        patch.object(release_module, "get_redis_client", return_value=mock_redis),
+        patch.object(renew_module, "get_redis_client", return_value=mock_redis),
+    ):
+        with DistributedLock("test", ttl_seconds=1, heartbeat=True, key="value"):
+            assert renewed.wait(2)
+
+    token = mock_redis.set.call_args.args[1]
+    renew_call = mock_redis.eval.call_args_list[0]
+    assert renew_call.args[0] == renew_module.RENEW_SCRIPT
+    assert renew_call.args[3:] == (token, 1000)
+    # The last call is the owner-checked release
+    assert mock_redis.eval.call_args.args[0] == release_module.RELEASE_SCRIPT
@@ -0,0 +1,76 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, unused-argument
+from __future__ import annotations
+
+from collections.abc import Generator
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+from flask.ctx import AppContext
+from freezegun import freeze_time
+
+from superset.extensions import db
+from superset.extensions.metastore_cache import SupersetMetastoreCache
+from superset.key_value.types import JsonKeyValueCodec
+
+NAMESPACE = UUID("ee173d1b-ccf3-40aa-941c-985c15224496")
+
+
+@pytest.fixture
+def cache(app_context: AppContext) -> Generator[SupersetMetastoreCache, None, None]:
+    from superset.key_value.models import KeyValueEntry
+
+    # The cache commits, so empty the table around each test for isolation.
+    db.session.query(KeyValueEntry).delete()
+    db.session.commit()  # pylint: disable=consider-using-transaction
+    yield SupersetMetastoreCache(
+        namespace=NAMESPACE,
+        default_timeout=600,
+        codec=JsonKeyValueCodec(),
+    )
+    db.session.query(KeyValueEntry).delete()
+    db.session.commit()  # pylint: disable=consider-using-transaction
+
+
+def test_add_takes_over_expired_entry_without_purging(
+    cache: SupersetMetastoreCache,
+) -> None:
+    from superset.key_value.models import KeyValueEntry
+
+    with freeze_time(datetime.now() - timedelta(hours=1)):
+        assert cache.add("foo", "old", timeout=60) is True
+        assert cache.add("bar", "other", timeout=60) is True
+
+    with patch(
+        "superset.daos.key_value.KeyValueDAO.delete_expired_entries"
+    ) as mock_delete_expired:
+        assert cache.add("foo", "new", timeout=60) is True
+
+    mock_delete_expired.assert_not_called()
+    assert cache.get("foo") == "new"
+    # Other expired entries are left to the prune_key_value task.
+    assert db.session.query(KeyValueEntry).count() == 2
+    assert cache.get("bar") is None
+
+
+def test_add_keeps_live_entry(cache: SupersetMetastoreCache) -> None:
+    assert cache.add("foo", "first") is True
+    assert cache.add("foo", "second") is False
+    assert cache.get("foo") == "first"
@@ -70,6 +70,46 @@ def test_export_assets(
     assert contents == dict(mocked_contents)
 
 
+def test_export_assets_changed_since(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test exporting only the assets changed since a given time.
+    """
+    from datetime import datetime, timezone
+
+    ExportAssetsCommand = mocker.patch("superset.importexport.api.ExportAssetsCommand")  # noqa: N806
+    ExportAssetsCommand().run.return_value = [
+        ("databases/example.yaml", lambda: "<DATABASE CONTENTS>"),
+    ]
+
+    response = client.get(
+        "/api/v1/assets/export/?changed_since=2024-01-01T00:00:00%2B00:00"
+    )
+    assert response.status_code == 200
+    assert is_zipfile(BytesIO(response.data))
+    ExportAssetsCommand.assert_called_with(
+        changed_since=datetime(2024, 1, 1, tzinfo=timezone.utc)
+    )
+
+
+def test_export_assets_invalid_changed_since(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test that an unparsable ``changed_since`` is rejected.
+    """
+    ExportAssetsCommand = mocker.patch("superset.importexport.api.ExportAssetsCommand")  # noqa: N806
+
+    response = client.get("/api/v1/assets/export/?changed_since=yesterday")
+    assert response.status_code == 400
+    ExportAssetsCommand().run.assert_not_called()
+
+
 def test_import_assets(
     mocker: MockerFixture,
     client: Any,
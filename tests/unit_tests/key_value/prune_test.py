@@ -166,3 +166,30 @@ def test_prune_respects_max_rows_per_run(
 
     # Only the two oldest expired rows are removed in a single capped run
     assert db.session.query(KeyValueEntry).count() == 1
+
+
+def test_prune_returns_deleted_counts_per_resource(
+    clean_key_value_store: None,
+) -> None:
+    from superset.key_value.commands.prune import KeyValuePruneCommand
+    from superset.key_value.models import KeyValueEntry
+
+    _add_entry(datetime.now() - timedelta(days=1))
+    _add_entry(datetime.now() - timedelta(days=1))
+    lock = _add_entry(datetime.now() - timedelta(days=1))
+    lock.resource = KeyValueResource.LOCK
+    _add_entry(datetime.now() + timedelta(days=1))
+    db.session.flush()
+
+    deleted = KeyValuePruneCommand().run()
+
+    assert deleted == {RESOURCE.value: 2, KeyValueResource.LOCK.value: 1}
+    assert db.session.query(KeyValueEntry).count() == 1
+
+
+def test_prune_empty_store_reports_nothing(
+    clean_key_value_store: None,
+) -> None:
+    from superset.key_value.commands.prune import KeyValuePruneCommand
+
+    assert KeyValuePruneCommand().run() == {}
@@ -17,9 +17,19 @@
 
 """Tests for system-level utility functions."""
 
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
-from superset.mcp_service.system.system_utils import calculate_feature_availability
+from pytest_mock import MockerFixture
+from sqlalchemy import event
+from sqlalchemy.orm.session import Session
+
+from superset.mcp_service.system.system_utils import (
+    calculate_dashboard_breakdown,
+    calculate_database_breakdown,
+    calculate_feature_availability,
+)
+from tests.unit_tests.conftest import with_feature_flags
 
 
 def test_calculate_feature_availability_returns_menus():
@@ -58,3 +68,82 @@ def test_calculate_feature_availability_menus_sorted():
         result = calculate_feature_availability({}, {}, {})
 
     assert result.accessible_menus == ["Aaa", "Mmm", "Zzz"]
+
+
+def test_calculate_database_breakdown_groups_by_scheme(session: Session) -> None:
+    """Test that database types are counted with one grouped query."""
+    from superset.models.core import Database
+
+    Database.metadata.create_all(session.get_bind())
+    session.add_all(
+        [
+            Database(database_name="a", sqlalchemy_uri="postgresql://u@h/a"),
+            Database(database_name="b", sqlalchemy_uri="postgresql://u@h/b"),
+            Database(database_name="c", sqlalchemy_uri="mysql+pymysql://h/c"),
+            Database(database_name="d", sqlalchemy_uri="not-a-uri"),
+        ]
+    )
+    session.flush()
+    statements: list[str] = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    result = calculate_database_breakdown({}, {}, {})
+
+    assert result.by_type == {"postgresql": 2, "mysql+pymysql": 1, "unknown": 1}
+    assert len(statements) == 1
+
+
+@with_feature_flags(SOFT_DELETE=True)
+def test_calculate_dashboard_breakdown(session: Session, mocker: MockerFixture) -> None:
+    """Test published, certified and with-charts counts in one query."""
+    from superset.connectors.sqla.models import Database, SqlaTable
+    from superset.daos.dashboard import DashboardDAO
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+    mocker.patch.object(DashboardDAO, "base_filter", None)
+    Dashboard.metadata.create_all(session.get_bind())
+    dataset = SqlaTable(
+        table_name="t", database=Database(database_name="d", sqlalchemy_uri="sqlite://")
+    )
+    session.add(dataset)
+    session.flush()
+
+    def chart(deleted: bool = False) -> Slice:
+        return Slice(
+            slice_name="c",
+            datasource_id=dataset.id,
+            datasource_type="table",
+            deleted_at=datetime(2026, 1, 1, tzinfo=timezone.utc) if deleted else None,
+        )
+
+    session.add_all(
+        [
+            Dashboard(dashboard_title="a", published=True, slices=[chart()]),
+            Dashboard(dashboard_title="b", published=True, certified_by="ops"),
+            # Only a trashed chart, so it counts as having no charts
+            Dashboard(dashboard_title="c", slices=[chart(deleted=True)]),
+            # Trashed dashboards are not counted at all
+            Dashboard(
+                dashboard_title="d",
+                published=True,
+                slices=[chart()],
+                deleted_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            ),
+        ]
+    )
+    session.flush()
+
+    result = calculate_dashboard_breakdown(
+        {"total_dashboards": 3}, {}, {"dashboards": DashboardDAO}
+    )
+
+    assert result.published == 2
+    assert result.unpublished == 1
+    assert result.certified == 1
+    assert result.with_charts == 1
+    assert result.without_charts == 2
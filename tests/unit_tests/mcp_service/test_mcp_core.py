@@ -23,15 +23,17 @@ slug-like identifiers (e.g. "world-banks-data") to dashboards whose
 slug column is empty but whose title matches.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic import BaseModel
+from sqlalchemy import event
 
 from superset.mcp_service.mcp_core import (
     _slugify,
+    InstanceInfoCore,
     ModelGetInfoCore,
     ModelListCore,
 )
@@ -383,3 +385,189 @@ def test_build_deleted_state_filter_rejects_unconfigured_resource() -> None:
     core = _build_list_core(deleted_state_filter=None)
     with pytest.raises(ValueError, match="not supported"):
         core._build_deleted_state_filter("only")
+
+
+class _FakeListOutput(BaseModel):
+    model_config = {"extra": "allow"}
+
+    has_next: bool
+    has_previous: bool
+    next_cursor: str | None = None
+
+
+def _run_list_core_page(
+    mocker: Any, items: list[Any], cursor: str | None = None
+) -> tuple[_FakeListOutput, MagicMock]:
+    dao = MagicMock()
+    dao.list.return_value = (items, 5)
+    dao.keyset_cursor.side_effect = lambda item, order_column: f"after-{item.id}"
+    mocker.patch("superset.mcp_service.mcp_core.get_current_user", return_value=None)
+    core = ModelListCore(
+        dao_class=dao,
+        output_schema=_FakeOutput,
+        item_serializer=lambda obj, cols: _FakeOutput(id=obj.id, title="t"),
+        filter_type=_FakeOutput,
+        default_columns=["id"],
+        search_columns=[],
+        list_field_name="items",
+        output_list_schema=_FakeListOutput,
+    )
+    response = core.run_tool(page_size=2, cursor=cursor)
+    return response, dao
+
+
+def test_list_core_returns_next_cursor_of_last_item(mocker: Any) -> None:
+    response, dao = _run_list_core_page(mocker, [MagicMock(id=1), MagicMock(id=2)])
+
+    assert response.has_next
+    assert response.next_cursor == "after-2"
+    assert dao.list.call_args.kwargs["after"] is None
+    assert dao.list.call_args.kwargs["order_column"] == "changed_on"
+
+
+def test_list_core_resumes_after_cursor(mocker: Any) -> None:
+    from superset.daos.base import encode_keyset_cursor
+
+    cursor = encode_keyset_cursor("2024-01-01T00:00:00", 7)
+
+    response, dao = _run_list_core_page(mocker, [MagicMock(id=8)], cursor)
+
+    assert dao.list.call_args.kwargs["after"] == ("2024-01-01T00:00:00", 7)
+    assert response.has_previous
+    # A short page resumed from a cursor is the last one
+    assert not response.has_next
+    assert response.next_cursor is None
+
+
+def test_list_core_rejects_invalid_cursor(mocker: Any) -> None:
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _run_list_core_page(mocker, [], cursor="not-a-cursor")
+
+
+class _FakeInstanceInfo(BaseModel):
+    total_charts: int
+    total_tags: int
+    recent: dict[str, int]
+    monthly: dict[str, int]
+    timestamp: str
+
+
+def _build_instance_info_core(session: Any) -> InstanceInfoCore:
+    from superset.connectors.sqla.models import Database, SqlaTable
+    from superset.daos.chart import ChartDAO
+    from superset.daos.tag import TagDAO
+    from superset.models.slice import Slice
+
+    Slice.metadata.create_all(session.get_bind())
+    dataset = SqlaTable(
+        table_name="t", database=Database(database_name="d", sqlalchemy_uri="sqlite://")
+    )
+    session.add(dataset)
+    session.flush()
+    now = datetime.now()
+    for days_ago in (1, 10, 100):
+        session.add(
+            Slice(
+                slice_name=f"chart {days_ago}",
+                datasource_id=dataset.id,
+                datasource_type="table",
+                created_on=now - timedelta(days=days_ago),
+                changed_on=now - timedelta(days=min(days_ago, 5)),
+            )
+        )
+    session.flush()
+
+    return InstanceInfoCore(
+        dao_classes={"charts": ChartDAO, "tags": TagDAO},
+        output_schema=_FakeInstanceInfo,
+        metric_calculators={},
+        time_windows={"recent": 7, "monthly": 30},
+    )
+
+
+def test_instance_info_counts_each_entity_in_one_query(
+    session: Any, mocker: Any
+) -> None:
+    """Totals and every time window come from one aggregate per entity."""
+    from superset.daos.chart import ChartDAO
+
+    mocker.patch.object(ChartDAO, "base_filter", None)
+    core = _build_instance_info_core(session)
+    statements: list[str] = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    base_counts, time_metrics = core._calculate_entity_metrics()
+
+    assert base_counts == {"total_charts": 3, "total_tags": 0}
+    assert time_metrics["recent"]["charts_created"] == 1
+    assert time_metrics["recent"]["charts_modified"] == 3
+    assert time_metrics["monthly"]["charts_created"] == 2
+    assert time_metrics["monthly"]["tags_created"] == 0
+    assert len(statements) == 2
+
+
+def test_instance_info_counts_entities_without_time_tracking(session: Any) -> None:
+    """Entities without created_on/changed_on columns still count their rows."""
+    from sqlalchemy import Column, Integer
+    from sqlalchemy.orm import declarative_base
+
+    from superset.daos.base import BaseDAO
+
+    untracked_base = declarative_base()
+
+    class _Untracked(untracked_base):  # type: ignore[misc, valid-type]
+        __tablename__ = "_instance_info_untracked"
+
+        id = Column(Integer, primary_key=True)
+
+    class _UntrackedDAO(BaseDAO[_Untracked]):
+        model_cls = _Untracked
+
+    untracked_base.metadata.create_all(session.get_bind())
+    session.add_all(_Untracked(id=id_) for id_ in range(1, 4))
+    session.flush()
+    core = InstanceInfoCore(
+        dao_classes={"untracked": _UntrackedDAO},
+        output_schema=_FakeInstanceInfo,
+        metric_calculators={},
+        time_windows={"recent": 7},
+    )
+
+    base_counts, time_metrics = core._calculate_entity_metrics()
+
+    assert base_counts == {"total_untracked": 3}
+    assert time_metrics == {"recent": {}}
+
+
+def test_instance_info_is_cached_per_user(
+    app_context: None, session: Any, mocker: Any
+) -> None:
+    """Responses are reused for the same user within the TTL only."""
+    from flask import current_app
+
+    from superset.daos.chart import ChartDAO
+
+    mocker.patch.object(ChartDAO, "base_filter", None)
+    mocker.patch.dict(current_app.config, {"MCP_INSTANCE_INFO_CACHE_TTL": 60})
+    get_user_id = mocker.patch("superset.utils.core.get_user_id", return_value=1)
+    monotonic = mocker.patch("superset.mcp_service.mcp_core.time.monotonic")
+    monotonic.return_value = 100.0
+    core = _build_instance_info_core(session)
+    compute = mocker.spy(core, "_compute_instance_info")
+
+    first = core.run_tool()
+    first.total_charts = -1
+    assert core.run_tool().total_charts == 3
+    assert compute.call_count == 1
+
+    get_user_id.return_value = 2
+    core.run_tool()
+    assert compute.call_count == 2
+
+    monotonic.return_value = 161.0
+    core.run_tool()
+    assert compute.call_count == 3
@@ -0,0 +1,168 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for the per-process MCP principal cache."""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask_appbuilder.security.sqla.models import Group, Role, User
+from sqlalchemy import event
+from sqlalchemy.orm import joinedload, Session
+
+from superset.mcp_service.auth import load_user_with_relationships
+from superset.mcp_service.principal_cache import (
+    install_invalidation_listeners,
+    principal_cache,
+    PrincipalCache,
+)
+
+KEY = ("username", "alice")
+
+
+@pytest.fixture
+def users(session: Session) -> Session:
+    User.metadata.create_all(session.get_bind())
+    session.add(
+        User(
+            first_name="Alice",
+            last_name="Doe",
+            username="alice",
+            email="alice@example.com",
+            active=True,
+            roles=[Role(name="Alpha")],
+            groups=[Group(name="analysts", roles=[Role(name="Gamma")])],
+        )
+    )
+    session.commit()
+    return session
+
+
+def _loader(session: Session) -> Any:
+    def load() -> User | None:
+        return (
+            session.query(User)
+            .options(
+                joinedload(User.roles),
+                joinedload(User.groups).joinedload(Group.roles),
+            )
+            .filter_by(username="alice")
+            .one_or_none()
+        )
+
+    return load
+
+
+def _count_queries(session: Session) -> list[str]:
+    statements: list[str] = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+def test_cached_user_is_bound_to_session_without_queries(users: Session) -> None:
+    cache = PrincipalCache()
+    cache.get_or_load(KEY, 60, _loader(users))
+    # The next tool call starts with a fresh session.
+    users.expunge_all()
+    statements = _count_queries(users)
+
+    user = cache.get_or_load(KEY, 60, MagicMock(side_effect=AssertionError))
+
+    assert user in users
+    assert user.username == "alice"
+    assert [role.name for role in user.roles] == ["Alpha"]
+    assert [role.name for group in user.groups for role in group.roles] == ["Gamma"]
+    assert statements == []
+
+
+def test_expired_entry_is_reloaded(users: Session) -> None:
+    cache = PrincipalCache()
+    load = MagicMock(wraps=_loader(users))
+
+    with patch("superset.mcp_service.principal_cache.time.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        cache.get_or_load(KEY, 30, load)
+        monotonic.return_value = 129.0
+        cache.get_or_load(KEY, 30, load)
+        assert load.call_count == 1
+        monotonic.return_value = 131.0
+        cache.get_or_load(KEY, 30, load)
+
+    assert load.call_count == 2
+
+
+def test_missing_user_is_not_cached() -> None:
+    cache = PrincipalCache()
+
+    assert cache.get_or_load(KEY, 60, lambda: None) is None
+    assert len(cache) == 0
+
+
+def test_load_racing_invalidation_is_not_stored(users: Session) -> None:
+    cache = PrincipalCache()
+    load = _loader(users)
+
+    def load_then_invalidate() -> User | None:
+        user = load()
+        cache.clear()
+        return user
+
+    assert cache.get_or_load(KEY, 60, load_then_invalidate) is not None
+    assert len(cache) == 0
+
+
+def test_role_change_clears_cache(users: Session) -> None:
+    install_invalidation_listeners(User, Role, Group)
+    principal_cache.get_or_load(KEY, 60, _loader(users))
+    assert len(principal_cache) == 1
+
+    users.query(Role).filter_by(name="Alpha").one().name = "Beta"
+    users.flush()
+
+    assert len(principal_cache) == 0
+
+
+def test_load_user_with_relationships_uses_cache(app_context: None) -> None:
+    from flask import current_app
+
+    user = MagicMock(username="alice")
+    with (
+        patch.dict(current_app.config, {"MCP_PRINCIPAL_CACHE_TTL": 30}),
+        patch("superset.mcp_service.auth.security_manager") as security_manager,
+        patch("superset.mcp_service.auth.install_invalidation_listeners"),
+        patch("superset.mcp_service.auth.principal_cache") as cache,
+    ):
+        cache.get_or_load.return_value = user
+
+        assert load_user_with_relationships("alice") is user
+        assert load_user_with_relationships(email="a@example.com") is user
+
+        current_app.config["MCP_PRINCIPAL_CACHE_TTL"] = 0
+        load_user_with_relationships("alice")
+
+    assert [call.args[:2] for call in cache.get_or_load.call_args_list] == [
+        (("username", "alice"), 30),
+        (("email", "a@example.com"), 30),
+    ]
+    security_manager.find_user_with_relationships.assert_called_once_with(
+        username="alice", email=None
+    )
@@ -0,0 +1,141 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Tests for the bounded MCP tool executor."""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from contextvars import ContextVar
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import g
+
+from superset.mcp_service.auth import MCP_ASYNC_VARIANT_ATTR, mcp_auth_hook
+from superset.mcp_service.tool_executor import ToolExecutor
+
+
+@pytest.fixture
+def stats() -> Iterator[object]:
+    with patch(
+        "superset.mcp_service.tool_executor.stats_logger_manager"
+    ) as stats_logger_manager:
+        yield stats_logger_manager.instance
+
+
+@pytest.fixture
+def executor(stats: object) -> Iterator[ToolExecutor]:
+    executor = ToolExecutor(max_workers=4, tool_concurrency={"slow_tool": 1})
+    yield executor
+    executor.shutdown()
+
+
+def test_per_tool_cap_and_queue_depth(executor: ToolExecutor, stats: object) -> None:
+    release = threading.Event()
+    running: list[str] = []
+
+    def work(name: str) -> str:
+        running.append(name)
+        release.wait(5)
+        return name
+
+    async def scenario() -> list[str]:
+        calls = [
+            asyncio.ensure_future(executor.run("slow_tool", work, f"slow-{i}"))
+            for i in range(3)
+        ]
+        other = asyncio.ensure_future(executor.run("other_tool", work, "other"))
+        while len(running) < 2:
+            await asyncio.sleep(0.01)
+
+        # One slow_tool call holds its only slot; another tool still runs.
+        assert sorted(running) == ["other", "slow-0"]
+        assert executor.active("slow_tool") == 1
+        assert executor.queue_depth("slow_tool") == 2
+        assert executor.queue_depth() == 2
+
+        release.set()
+        return await asyncio.gather(*calls, other)
+
+    assert asyncio.run(scenario()) == ["slow-0", "slow-1", "slow-2", "other"]
+    assert executor.queue_depth() == 0
+    assert executor.active() == 0
+    stats.gauge.assert_any_call("mcp.tool_executor.slow_tool.queued", 2)
+    stats.gauge.assert_any_call("mcp.tool_executor.other_tool.active", 0)
+    stats.gauge.assert_any_call("mcp.tool_executor.queued", 2)
+
+
+def test_cancelled_call_leaves_queue(executor: ToolExecutor) -> None:
+    release = threading.Event()
+
+    async def scenario() -> None:
+        first = asyncio.ensure_future(executor.run("slow_tool", release.wait, 5))
+        second = asyncio.ensure_future(executor.run("slow_tool", release.wait, 5))
+        while executor.active("slow_tool") < 1:
+            await asyncio.sleep(0.01)
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        assert executor.queue_depth("slow_tool") == 0
+        release.set()
+        await first
+
+    asyncio.run(scenario())
+
+
+def test_context_is_copied_to_worker(executor: ToolExecutor) -> None:
+    var: ContextVar[str] = ContextVar("var", default="unset")
+
+    async def scenario() -> tuple[str, str]:
+        var.set("caller")
+        return await executor.run(
+            "tool", lambda: (var.get(), threading.current_thread().name)
+        )
+
+    value, thread_name = asyncio.run(scenario())
+
+    assert value == "caller"
+    assert thread_name.startswith("mcp-tool")
+
+
+def test_sync_tool_async_variant_runs_on_executor(app, executor) -> None:
+    user = MagicMock(username="alice", roles=[], groups=[])
+
+    def sync_tool() -> str:
+        """A sync tool."""
+        assert g.user is user
+        return threading.current_thread().name
+
+    wrapped = mcp_auth_hook(sync_tool)
+    variant = getattr(wrapped, MCP_ASYNC_VARIANT_ATTR)
+
+    assert asyncio.iscoroutinefunction(variant)
+    assert variant._mcp_auth_protected is True
+    with (
+        app.app_context(),
+        patch(
+            "superset.mcp_service.tool_executor.get_tool_executor",
+            return_value=executor,
+        ),
+        patch("superset.mcp_service.auth.get_user_from_request", return_value=user),
+        patch("superset.mcp_service.auth.check_tool_permission", return_value=True),
+        patch("superset.mcp_service.auth._remove_session_safe"),
+    ):
+        thread_name = asyncio.run(variant())
+
+    assert thread_name.startswith("mcp-tool")
@@ -39,6 +39,7 @@ from superset.utils.core import FilterOperator, GenericDataType
 from tests.unit_tests.conftest import with_feature_flags
 
 if TYPE_CHECKING:
+    from superset.app import SupersetApp
     from superset.jinja_context import BaseTemplateProcessor
     from superset.models.core import Database
 
@@ -105,6 +106,97 @@ def test_values_for_column(database: Database) -> None:
         assert table.values_for_column("a") == [1, None]
 
 
+def test_values_for_column_search_and_paging(database: Database) -> None:
+    """
+    Test that search, ordering and keyset paging run in the database.
+    """
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[
+            TableColumn(column_name="a", type="INTEGER"),
+            TableColumn(column_name="b", type="TEXT"),
+        ],
+    )
+
+    assert table.values_for_column("b", search="LI") == ["Alice"]
+    assert table.values_for_column("b", search="o", search_prefix=True) == []
+    assert table.values_for_column("b", search="b", search_prefix=True) == ["Bob"]
+    # LIKE wildcards in the search text are matched literally
+    assert table.values_for_column("b", search="%") == []
+    # Non-string columns are searched as text
+    assert table.values_for_column("a", search="1") == [1]
+
+    assert table.values_for_column("b", ordered=True, limit=1) == ["Alice"]
+    assert table.values_for_column("b", ordered=True, after="Alice") == ["Bob"]
+    # NULL is left out of ordered values
+    assert table.values_for_column("a", ordered=True) == [1]
+
+
+def test_values_for_column_paging_converts_the_cursor(database: Database) -> None:
+    """
+    Test that keyset paging compares the cursor as the type of the column.
+    """
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.exceptions import QueryObjectValidationError
+
+    with database.get_sqla_engine() as engine:
+        connection = engine.raw_connection()
+        connection.execute("CREATE TABLE u (ts DATETIME, flag BOOLEAN)")
+        connection.execute("INSERT INTO u VALUES ('2024-01-01 00:00:00', 0)")
+        connection.execute("INSERT INTO u VALUES ('2024-01-02 00:00:00', 1)")
+        connection.commit()
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="u",
+        columns=[
+            TableColumn(column_name="ts", type="DATETIME", is_dttm=True),
+            TableColumn(column_name="flag", type="BOOLEAN"),
+        ],
+    )
+
+    assert table.values_for_column("ts", ordered=True, after="2024-01-01T00:00:00") == [
+        "2024-01-02 00:00:00"
+    ]
+    assert table.values_for_column("flag", ordered=True, after=False) == [1]
+    assert table.values_for_column("flag", ordered=True, after=0) == [1]
+    assert table.values_for_column("flag", ordered=True, after=True) == []
+
+    for column_name, after in [
+        ("ts", "yesterday"),
+        ("ts", 1),
+        ("flag", "true"),
+        ("flag", 2),
+    ]:
+        with pytest.raises(QueryObjectValidationError, match="Invalid cursor"):
+            table.values_for_column(column_name, ordered=True, after=after)
+
+
+def test_values_for_column_paging_rejects_cursors_of_another_type(
+    database: Database,
+) -> None:
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.exceptions import QueryObjectValidationError
+
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[
+            TableColumn(column_name="a", type="INTEGER"),
+            TableColumn(column_name="b", type="TEXT"),
+        ],
+    )
+
+    for column_name, after in [("a", "1"), ("a", True), ("b", 1), ("b", [1])]:
+        with pytest.raises(QueryObjectValidationError, match="Invalid cursor"):
+            table.values_for_column(column_name, ordered=True, after=after)
+
+
 def test_values_for_column_passes_catalog_and_schema(
     mocker: MockerFixture,
     session: Session,
@@ -4974,3 +5066,54 @@ def test_adhoc_type_probe_does_not_get_sampling_retry(
     table.adhoc_column_to_sqla(adhoc_col)
 
     retry.assert_not_called()
+
+
+def test_get_memoized_sqla_query(
+    mocker: MockerFixture,
+    app: SupersetApp,
+    database: Database,
+) -> None:
+    """
+    Within a `sqla_query_memo` block, collecting the extra cache keys and
+    building the SQL of a templated virtual dataset share a single `SqlaQuery`.
+    """
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+    from superset.models.helpers import sqla_query_memo
+
+    mocker.patch(
+        "superset.connectors.sqla.models.security_manager.get_rls_filters",
+        return_value=[],
+    )
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="virtual",
+        sql="SELECT * FROM t WHERE b = '{{ url_param('name') }}'",
+        columns=[TableColumn(column_name="a"), TableColumn(column_name="b")],
+    )
+    query_obj = cast(
+        Any,
+        {
+            "columns": ["b"],
+            "metrics": [],
+            "is_timeseries": False,
+            "filter": [],
+            "extras": {},
+        },
+    )
+    with app.test_request_context(query_string={"name": "Alice"}):
+        get_sqla_query = mocker.spy(table, "get_sqla_query")
+
+        extra_cache_keys = table.get_extra_cache_keys(query_obj)
+        table.get_query_str_extended(query_obj)
+        assert get_sqla_query.call_count == 2
+
+        get_sqla_query.reset_mock()
+        with sqla_query_memo():
+            assert table.get_extra_cache_keys(query_obj) == extra_cache_keys
+            sql = table.get_query_str_extended(query_obj).sql
+            # another query object is built on its own
+            table.get_query_str_extended({**query_obj, "columns": ["a"]})
+        assert get_sqla_query.call_count == 2
+        assert "Alice" in sql
+        assert "Alice" in extra_cache_keys
@@ -14,6 +14,13 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import numpy as np
+import pygeohash
+import pytest
+from geopy.point import Point
+from pandas import DataFrame
+
+from superset.exceptions import InvalidPostProcessingError
 from superset.utils.pandas_postprocessing import (
     geodetic_parse,
     geohash_decode,
@@ -88,3 +95,103 @@ def test_geodetic_parse():
         lonlat_df["longitude"]
     )
     assert series_to_list(post_df["latitude"]), series_to_list(lonlat_df["latitude"])
+
+
+def test_geohash_encode_matches_pygeohash():
+    rng = np.random.default_rng(42)
+    latitudes = np.concatenate([[0, 90, -90, 45, 22.5], rng.uniform(-90, 90, 1000)])
+    longitudes = np.concatenate([[0, 180, -180, 90, -45], rng.uniform(-180, 180, 1000)])
+    post_df = geohash_encode(
+        df=DataFrame({"lat": latitudes, "lon": longitudes}),
+        latitude="lat",
+        longitude="lon",
+        geohash="geohash",
+    )
+    assert post_df["geohash"].tolist() == [
+        pygeohash.encode(lat, lon)
+        for lat, lon in zip(latitudes, longitudes, strict=True)
+    ]
+
+
+def test_geohash_decode_matches_pygeohash():
+    geohashes = ["s", "ez", "dr5r", "r3gx2u9", "dr5regw3pg6f", "zzzzzzzzzzzz"]
+    post_df = geohash_decode(
+        df=DataFrame({"geohash": geohashes}),
+        geohash="geohash",
+        latitude="latitude",
+        longitude="longitude",
+    )
+    assert list(zip(post_df["latitude"], post_df["longitude"], strict=True)) == [
+        tuple(pygeohash.decode(geohash)) for geohash in geohashes
+    ]
+
+
+def test_geodetic_parse_matches_geopy():
+    geodetics = [
+        "40.71277496, -74.00597306",
+        "-33.85598011,151.20666526, 12 m",
+        "1, 2, 3km",
+        "41.5 N 81.0 W",
+        "23 26m 22s N 23 27m 30s E",
+        "10, 190",
+        "1.5, 2.5, 3mi",
+    ]
+    post_df = geodetic_parse(
+        df=DataFrame({"geodetic": geodetics}),
+        geodetic="geodetic",
+        latitude="latitude",
+        longitude="longitude",
+        altitude="altitude",
+    )
+    assert list(
+        zip(
+            post_df["latitude"],
+            post_df["longitude"],
+            post_df["altitude"],
+            strict=True,
+        )
+    ) == [tuple(Point(geodetic)) for geodetic in geodetics]
+
+
+def test_geohash_decode_invalid():
+    with pytest.raises(InvalidPostProcessingError):
+        geohash_decode(
+            df=DataFrame({"geohash": ["dr5r", "invalid"]}),
+            geohash="geohash",
+            latitude="latitude",
+            longitude="longitude",
+        )
+    with pytest.raises(InvalidPostProcessingError):
+        geohash_decode(
+            df=DataFrame({"geohash": ["dr5r", None]}),
+            geohash="geohash",
+            latitude="latitude",
+            longitude="longitude",
+        )
+
+
+def test_geohash_encode_invalid():
+    with pytest.raises(InvalidPostProcessingError):
+        geohash_encode(
+            df=DataFrame({"lat": [91.0], "lon": [0.0]}),
+            latitude="lat",
+            longitude="lon",
+            geohash="geohash",
+        )
+    with pytest.raises(InvalidPostProcessingError):
+        geohash_encode(
+            df=DataFrame({"lat": [np.nan], "lon": [0.0]}),
+            latitude="lat",
+            longitude="lon",
+            geohash="geohash",
+        )
+
+
+def test_geodetic_parse_invalid():
+    with pytest.raises(InvalidPostProcessingError):
+        geodetic_parse(
+            df=DataFrame({"geodetic": ["1, 2", "not a point"]}),
+            geodetic="geodetic",
+            latitude="latitude",
+            longitude="longitude",
+        )
@@ -0,0 +1,68 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+from flask_caching.backends import NullCache
+
+from scripts import benchmark_chart_data
+
+
+def _benchmark(name: str, best: float) -> dict[str, Any]:
+    return {"name": name, "stats": {"min": best}}
+
+
+def test_find_regressions_flags_cases_slower_than_the_tolerance() -> None:
+    baseline = [
+        _benchmark("result_set[sqlite-10000]", 1.0),
+        _benchmark("pivot_df[sqlite-10000]", 1.0),
+    ]
+    benchmarks = [
+        _benchmark("result_set[sqlite-10000]", 1.2),
+        _benchmark("pivot_df[sqlite-10000]", 1.3),
+        _benchmark("pivot_df[sqlite-5000000]", 60.0),
+    ]
+
+    assert benchmark_chart_data.find_regressions(benchmarks, baseline, 0.25) == [
+        "pivot_df[sqlite-10000]"
+    ]
+
+
+def test_run_benchmarks_times_every_case(app_context: None) -> None:
+    from superset.extensions import cache_manager
+
+    benchmarks = benchmark_chart_data.run_benchmarks(
+        rows=[50], engines=benchmark_chart_data.ENGINES, repeat=2, seed=0
+    )
+
+    assert [benchmark["name"] for benchmark in benchmarks] == [
+        f"{case}[{engine}{suffix}]"
+        for engine in benchmark_chart_data.ENGINES
+        for case, suffix in [
+            ("sql_script", ""),
+            ("result_set", "-50"),
+            ("df_to_records", "-50"),
+            ("json_dumps", "-50"),
+            ("df_to_escaped_csv", "-50"),
+            ("exec_post_processing", "-50"),
+            ("query_cache_set", "-50"),
+            ("query_cache_get", "-50"),
+            ("pivot_df", "-50"),
+        ]
+    ]
+    assert all(benchmark["stats"]["rounds"] == 2 for benchmark in benchmarks)
+    # the in-process cache used for the run is replaced by the configured one
+    assert isinstance(cache_manager.data_cache.cache, NullCache)
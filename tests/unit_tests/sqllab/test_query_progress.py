@@ -0,0 +1,150 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from decimal import Decimal
+
+from flask import Flask
+from pytest_mock import MockerFixture
+
+from superset.constants import QUERY_ASYNC_CHANNEL_KEY
+from superset.models.sql_lab import Query
+from superset.sqllab.query_progress import PollBackoff, ProgressReporter
+from superset.sqllab.sqllab_execution_context import SqlJsonExecutionContext
+from superset.utils import json
+from tests.unit_tests.conftest import with_feature_flags
+
+
+def test_poll_backoff_doubles_up_to_the_age_of_the_query(
+    mocker: MockerFixture,
+) -> None:
+    clock = mocker.patch("superset.sqllab.query_progress.time")
+    clock.time.return_value = 100.0
+    backoff = PollBackoff(interval=1, max_interval=10, age_ratio=0.1, started=70.0)
+
+    # 30 seconds in, polls are at most 3 seconds apart
+    assert [backoff.next_interval() for _ in range(4)] == [1, 2, 3, 3]
+
+    clock.time.return_value = 1000.0
+    assert [backoff.next_interval() for _ in range(3)] == [6, 10, 10]
+
+
+def test_poll_backoff_never_waits_less_than_the_interval(
+    mocker: MockerFixture,
+) -> None:
+    clock = mocker.patch("superset.sqllab.query_progress.time")
+    clock.time.return_value = 0.0
+
+    backoff = PollBackoff(interval=2, max_interval=0, age_ratio=0.1, started=0.0)
+    assert [backoff.next_interval() for _ in range(3)] == [2, 2, 2]
+
+
+def test_progress_reporter_sets_every_change_on_the_query() -> None:
+    query = Query(progress=0, extra_json="{}")
+    reporter = ProgressReporter(query, commit_interval=30)
+
+    assert reporter.update(10, "RUNNING")
+    assert not reporter.update(10, "RUNNING")
+    assert reporter.update(20)
+    assert query.progress == 20
+    assert query.extra["progress_text"] == "RUNNING"
+
+
+def test_progress_reporter_publishes_to_the_async_channel(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("superset.sqllab.query_progress.is_feature_enabled", return_value=True)
+    async_query_manager = mocker.patch(
+        "superset.sqllab.query_progress.async_query_manager", new=mocker.MagicMock()
+    )
+    clock = mocker.patch("superset.sqllab.query_progress.time")
+    clock.monotonic.return_value = 0.0
+    query = Query(
+        client_id="abc",
+        user_id=1,
+        progress=0,
+        extra_json=json.dumps({QUERY_ASYNC_CHANNEL_KEY: "channel"}),
+    )
+    reporter = ProgressReporter(query, commit_interval=30)
+
+    clock.monotonic.return_value = 10.0
+    assert not reporter.update(10, "RUNNING")
+    assert query.progress == 0
+    clock.monotonic.return_value = 40.0
+    assert reporter.update(20, "RUNNING")
+    assert query.progress == 20
+
+    job_metadata, status = async_query_manager.update_job.call_args_list[0].args
+    assert job_metadata["channel_id"] == "channel"
+    assert job_metadata["job_id"] == "abc"
+    assert status == "running"
+    assert [call.kwargs for call in async_query_manager.update_job.call_args_list] == [
+        {"progress": 10, "progress_text": "RUNNING"},
+        {"progress": 20, "progress_text": "RUNNING"},
+    ]
+
+
+def test_progress_reporter_falls_back_to_the_query_when_publishing_fails(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("superset.sqllab.query_progress.is_feature_enabled", return_value=True)
+    async_query_manager = mocker.patch(
+        "superset.sqllab.query_progress.async_query_manager", new=mocker.MagicMock()
+    )
+    async_query_manager.update_job.side_effect = ConnectionError()
+    query = Query(
+        progress=0, extra_json=json.dumps({QUERY_ASYNC_CHANNEL_KEY: "channel"})
+    )
+    reporter = ProgressReporter(query, commit_interval=30)
+
+    assert reporter.update(10)
+    assert reporter.update(20)
+    assert query.progress == 20
+    async_query_manager.update_job.assert_called_once()
+
+
+@with_feature_flags(GLOBAL_ASYNC_QUERIES=True)
+def test_create_query_records_the_async_channel(
+    mocker: MockerFixture, app: Flask
+) -> None:
+    async_query_manager = mocker.patch(
+        "superset.sqllab.query_progress.async_query_manager", new=mocker.MagicMock()
+    )
+    async_query_manager.parse_channel_id_from_request.return_value = "channel"
+
+    with app.test_request_context():
+        query = SqlJsonExecutionContext({"sql": "SELECT 1"}).create_query()
+
+    assert query.extra[QUERY_ASYNC_CHANNEL_KEY] == "channel"
+
+
+@with_feature_flags(GLOBAL_ASYNC_QUERIES=False)
+def test_create_query_without_async_queries(app: Flask) -> None:
+    with app.test_request_context():
+        query = SqlJsonExecutionContext({"sql": "SELECT 1"}).create_query()
+
+    assert QUERY_ASYNC_CHANNEL_KEY not in query.extra
+
+
+def test_poll_backoff_accepts_a_decimal_start_time(mocker: MockerFixture) -> None:
+    clock = mocker.patch("superset.sqllab.query_progress.time")
+    clock.time.return_value = 100.0
+
+    backoff = PollBackoff(
+        interval=1, max_interval=10, age_ratio=0.1, started=Decimal("70.5")
+    )
+    assert [backoff.next_interval() for _ in range(3)] == [1, 2, 2.95]
@@ -17,6 +17,8 @@
 from typing import Any, Optional
 from unittest import mock
 
+from superset.utils import json
+
 
 def _fake_app(config: Optional[dict[str, Any]] = None) -> mock.MagicMock:
     """Build a stand-in for ``current_app`` with a controllable config dict."""
@@ -429,3 +431,177 @@ def test_native_filter_options_strategy_registered() -> None:
     from superset.tasks.cache import NativeFilterOptionsStrategy, strategy_registry
 
     assert strategy_registry["native_filter_options"] is NativeFilterOptionsStrategy
+
+
+def _chart(chart_id: int, query_context: Optional[dict[str, Any]]) -> mock.MagicMock:
+    chart: mock.MagicMock = mock.MagicMock()
+    chart.id = chart_id
+    chart.query_context = json.dumps(query_context) if query_context else None
+    return chart
+
+
+def test_get_dashboard_chart_payloads_applies_default_filters() -> None:
+    """Saved query contexts get the dashboard's default filters; others skip."""
+    from superset.charts.data.dashboard_filter_context import DashboardFilterContext
+    from superset.tasks.cache import get_dashboard_chart_payloads
+
+    dashboard: mock.MagicMock = mock.MagicMock()
+    dashboard.id = 7
+    dashboard.slices = [
+        _chart(1, {"queries": [{"filters": []}], "result_type": "samples"}),
+        _chart(2, None),
+        _chart(3, {"queries": [{}]}),
+    ]
+    filter_contexts: dict[int, DashboardFilterContext] = {
+        1: DashboardFilterContext(
+            extra_form_data={"filters": [{"col": "country", "op": "IN", "val": ["FR"]}]}
+        ),
+        2: DashboardFilterContext(),
+        3: DashboardFilterContext(),
+    }
+
+    with mock.patch(
+        "superset.tasks.cache.get_dashboard_filter_contexts",
+        return_value=filter_contexts,
+    ) as mock_contexts:
+        payloads: list[Any] = get_dashboard_chart_payloads(dashboard)
+
+    mock_contexts.assert_called_once_with(7)
+    assert [payload.name for payload in payloads] == [
+        "dashboard:7:chart:1",
+        "dashboard:7:chart:3",
+    ]
+    query_context: dict[str, Any] = payloads[0].query_context
+    assert query_context["result_type"] == "full"
+    assert query_context["force"] is False
+    assert query_context["queries"][0]["filters"] == [
+        {"col": "country", "op": "IN", "val": ["FR"], "isExtra": True}
+    ]
+    assert payloads[1].query_context["queries"] == [{}]
+
+
+def test_dashboard_strategies_data_only() -> None:
+    """``data_only`` turns a dashboard strategy into a browser-free one."""
+    from superset.tasks.cache import DashboardTagsStrategy, TopNDashboardsStrategy
+
+    assert TopNDashboardsStrategy().uses_webdriver
+    strategy: Any = TopNDashboardsStrategy(top_n=3, data_only=True)
+    assert strategy.data_only
+    assert not strategy.uses_webdriver
+    assert not DashboardTagsStrategy(tags=["core"], data_only=True).uses_webdriver
+
+
+def test_cache_warmup_data_only_fans_out_chart_tasks(app_context: None) -> None:
+    """A data-only strategy queues one chart task per payload and no browser."""
+    from superset.tasks.cache import cache_warmup, ChartWarmupPayload
+
+    payloads: list[ChartWarmupPayload] = [
+        ChartWarmupPayload(1, 10, {"queries": [{}]}),
+        ChartWarmupPayload(1, 11, {"queries": [{}]}),
+    ]
+
+    with (
+        mock.patch(
+            "superset.tasks.cache.current_app",
+            _fake_app({"SUPERSET_CACHE_WARMUP_USER": "bot"}),
+        ),
+        mock.patch("superset.tasks.cache.security_manager") as mock_sm,
+        mock.patch("superset.tasks.cache.WebDriverPlaywright") as mock_wd,
+        mock.patch("superset.tasks.cache.group") as mock_group,
+        mock.patch(
+            "superset.tasks.cache.TopNDashboardsStrategy.get_chart_payloads",
+            return_value=payloads,
+        ),
+    ):
+        mock_sm.find_user = mock.MagicMock(return_value=mock.MagicMock())
+        result: dict[str, list[str]] | str = cache_warmup(
+            "top_n_dashboards", top_n=1, data_only=True
+        )
+
+    assert result == {
+        "success": [],
+        "errors": [],
+        "queued": ["dashboard:1:chart:10", "dashboard:1:chart:11"],
+    }
+    mock_wd.assert_not_called()
+    signatures: list[Any] = list(mock_group.call_args.args[0])
+    assert [sig.args for sig in signatures] == [
+        ("bot", 1, 10, {"queries": [{}]}),
+        ("bot", 1, 11, {"queries": [{}]}),
+    ]
+    mock_group.return_value.apply_async.assert_called_once_with()
+
+
+def test_cache_warmup_chart_runs_chart_data_command(app_context: None) -> None:
+    """The chart task runs the query context through ChartDataCommand."""
+    from superset.tasks.cache import cache_warmup_chart
+
+    with (
+        mock.patch("superset.tasks.cache.security_manager") as mock_sm,
+        mock.patch(
+            "superset.charts.schemas.ChartDataQueryContextSchema.load"
+        ) as mock_load,
+        mock.patch(
+            "superset.commands.chart.data.get_data_command.ChartDataCommand"
+        ) as mock_command,
+    ):
+        mock_sm.find_user = mock.MagicMock(return_value=mock.MagicMock())
+        result: dict[str, list[str]] = cache_warmup_chart(
+            "bot", 1, 10, {"queries": [{}]}
+        )
+
+    assert result == {"success": ["dashboard:1:chart:10"], "errors": []}
+    mock_load.assert_called_once_with({"queries": [{}]})
+    mock_command.assert_called_once_with(mock_load.return_value)
+    mock_command.return_value.run.assert_called_once_with(cache=True)
+
+
+def test_cache_warmup_chart_records_errors(app_context: None) -> None:
+    """A failing chart query is recorded as an error rather than raised."""
+    from superset.tasks.cache import cache_warmup_chart
+
+    with (
+        mock.patch("superset.tasks.cache.security_manager") as mock_sm,
+        mock.patch(
+            "superset.charts.schemas.ChartDataQueryContextSchema.load",
+            side_effect=ValueError("bad"),
+        ),
+    ):
+        mock_sm.find_user = mock.MagicMock(return_value=mock.MagicMock())
+        result: dict[str, list[str]] = cache_warmup_chart(
+            "bot", 1, 10, {"queries": [{}]}
+        )
+
+    assert result == {"success": [], "errors": ["dashboard:1:chart:10"]}
+
+
+def test_warmup_urls_captures_concurrently_when_enabled(app_context: None) -> None:
+    """With concurrent capture available, the URLs are rendered as one batch."""
+    from superset.tasks.cache import _warmup_urls
+    from superset.utils.webdriver_async import PageCapture
+
+    urls: list[str] = ["http://localhost/dash/ok", "http://localhost/dash/boom"]
+    results: dict[str, list[str]] = {"success": [], "errors": []}
+    user: mock.MagicMock = mock.MagicMock()
+
+    with (
+        mock.patch(
+            "superset.tasks.cache.current_app",
+            _fake_app({"SCREENSHOT_CAPTURE_CONCURRENCY": 4}),
+        ),
+        mock.patch("superset.tasks.cache.can_capture_concurrently", return_value=True),
+        mock.patch("superset.tasks.cache.AsyncPlaywrightCapture") as mock_capture,
+        mock.patch("superset.tasks.cache.WebDriverPlaywright") as mock_wd,
+    ):
+        mock_capture.return_value.capture.return_value = [
+            PageCapture(urls[0], screenshot=b"PNG"),
+            PageCapture(urls[1], error="deadline exceeded"),
+        ]
+        _warmup_urls(urls, user, (1600, 1200), results)
+
+    assert results == {"success": [urls[0]], "errors": [urls[1]]}
+    mock_capture.assert_called_once_with((1600, 1200), concurrency=4)
+    mock_capture.return_value.capture.assert_called_once_with(
+        urls, "grid-container", user=user
+    )
+    mock_wd.assert_not_called()
@@ -20,7 +20,11 @@ import pytest
 from croniter import croniter
 from freezegun.api import FakeDatetime
 
-from superset.tasks.cron_util import cron_schedule_window, get_cron_description
+from superset.tasks.cron_util import (
+    cron_next_run,
+    cron_schedule_window,
+    get_cron_description,
+)
 
 
 @pytest.mark.parametrize(
@@ -259,6 +263,42 @@ def test_cron_schedule_window_invalid_cron_date(
     )
 
 
+@pytest.mark.parametrize(
+    "after, cron, timezone, expected",
+    [
+        # a trigger exactly at the lookup time is included
+        ("2020-01-01T09:00:00+00:00", "0 9 * * *", "UTC", datetime(2020, 1, 1, 9)),
+        ("2020-01-01T09:00:01+00:00", "0 9 * * *", "UTC", datetime(2020, 1, 2, 9)),
+        ("2020-01-01T08:59:30+00:00", "* * * * *", "UTC", datetime(2020, 1, 1, 9)),
+        # the crontab is evaluated in its own timezone, the result is naive UTC
+        (
+            "2020-01-01T00:00:00+00:00",
+            "0 1 * * *",
+            "America/Los_Angeles",
+            datetime(2020, 1, 1, 9),
+        ),
+        (
+            "2020-07-01T00:00:00+00:00",
+            "0 1 * * *",
+            "America/Los_Angeles",
+            datetime(2020, 7, 1, 8),
+        ),
+        # invalid timezones fall back to UTC
+        ("2020-01-01T00:00:00+00:00", "0 1 * * *", "invalid", datetime(2020, 1, 1, 1)),
+        # crontabs that can never match have no next run
+        ("2020-01-01T00:00:00+00:00", "0 0 31 2 *", "UTC", None),
+    ],
+)
+def test_cron_next_run(
+    after: str, cron: str, timezone: str, expected: datetime | None
+) -> None:
+    """
+    Reports scheduler: Test computing the next trigger of a crontab
+    """
+
+    assert cron_next_run(cron, timezone, datetime.fromisoformat(after)) == expected
+
+
 @pytest.mark.parametrize(
     "cron, expected",
     [
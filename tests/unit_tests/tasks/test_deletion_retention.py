@@ -229,3 +229,34 @@ def test_scheduled_purge_fails_closed_when_write_ahead_fails(
     purged, would, failures, blocked = result
     assert (purged, would, blocked) == (0, 0, 0)
     assert failures == 1
+
+
+@pytest.mark.parametrize(
+    "configured, expected",
+    [(0, 0), (200, 200), (5000, 500), (-1, 0), ("200", 0), (True, 0)],
+)
+def test_set_based_chunk_size_is_capped_and_validated(
+    app_config: Config, configured: object, expected: int
+) -> None:
+    import superset.tasks.deletion_retention as mod
+
+    app_config["SOFT_DELETE_PURGE_CHUNK_SIZE"] = configured
+    assert mod._set_based_chunk_size() == expected
+
+
+def test_purge_model_uses_per_entity_purge_by_default(app_context: None) -> None:
+    import superset.tasks.deletion_retention as mod
+    from superset import config
+    from superset.models.slice import Slice
+
+    assert config.SOFT_DELETE_PURGE_CHUNK_SIZE == 0
+    with (
+        patch.object(mod, "_iter_eligible_ids", return_value=[[1, 2]]),
+        patch.object(mod, "_purge_each", return_value=(2, 0, 0)) as each,
+        patch.object(mod, "_purge_chunk") as chunk,
+    ):
+        result = mod._purge_model(Slice, datetime.now(), dry_run=False)
+
+    chunk.assert_not_called()
+    each.assert_called_once()
+    assert result == (2, 0, 0, 0)
@@ -19,14 +19,19 @@ from __future__ import annotations
 import glob
 import os
 import tempfile
+import threading
+import time
 from collections.abc import Iterator
 from contextlib import contextmanager, ExitStack
 from typing import Any
 from unittest import mock
 
+import pandas as pd
 import pytest
 from celery.exceptions import SoftTimeLimitExceeded
+from flask import current_app
 
+from superset.charts.data.dashboard_filter_context import DashboardFilterContext
 from superset.utils import json
 
 MODULE = "superset.tasks.export_dashboard_excel"
@@ -77,7 +82,7 @@ def mocks() -> Iterator[dict[str, Any]]:
                 "security_manager",
                 "db",
                 "get_charts_in_layout_order",
-                "get_dashboard_filter_context",
+                "get_dashboard_filter_contexts",
                 "ChartDataQueryContextSchema",
                 "ChartDataCommand",
                 "render_chart_image",
@@ -86,6 +91,11 @@ def mocks() -> Iterator[dict[str, Any]]:
                 "ReleaseDistributedLock",
             )
         }
+        # Run chart queries one at a time so sequenced side effects line up with
+        # the charts in layout order.
+        stack.enter_context(
+            mock.patch.dict(current_app.config, {"EXCEL_EXPORT_QUERY_CONCURRENCY": 1})
+        )
         user = mock.MagicMock()
         user.email = "user@example.com"
         patched["security_manager"].get_user_by_id.return_value = user
@@ -99,7 +109,11 @@ def mocks() -> Iterator[dict[str, Any]]:
             dashboard
         )
 
-        patched["get_dashboard_filter_context"].return_value.extra_form_data = {}
+        patched["get_dashboard_filter_contexts"].side_effect = (
+            lambda dashboard_id, chart_ids, **kwargs: {
+                chart_id: DashboardFilterContext() for chart_id in chart_ids
+            }
+        )
         patched["s3"].generate_presigned_url.return_value = "https://signed/file.xlsx"
 
         patched["user"] = user
@@ -122,6 +136,11 @@ def _run(
     )
 
 
+def _frames(*columns: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """``ChartDataCommand.run_df`` payloads, one per query."""
+    return [{"df": pd.DataFrame(data)} for data in columns]
+
+
 def _no_temp_files_left(job_id: str) -> bool:
     pattern = os.path.join(tempfile.gettempdir(), f"dash-export-{job_id}-*")
     return glob.glob(pattern) == []
@@ -143,9 +162,9 @@ def test_happy_path_uploads_and_emails(mocks: dict[str, Any]) -> None:
         _chart(10, "First"),
         _chart(20, "Second"),
     ]
-    mocks["ChartDataCommand"].return_value.run.side_effect = [
-        {"queries": [{"colnames": ["a", "b"], "data": [{"a": 1, "b": 2}]}]},
-        {"queries": [{"colnames": ["c"], "data": [{"c": "x"}]}]},
+    mocks["ChartDataCommand"].return_value.run_df.side_effect = [
+        _frames({"a": [1], "b": [2]}),
+        _frames({"c": ["x"]}),
     ]
 
     # Capture the workbook before the task deletes it.
@@ -165,14 +184,61 @@ def test_happy_path_uploads_and_emails(mocks: dict[str, Any]) -> None:
     assert _no_temp_files_left("job-1")
 
 
+def test_chart_queries_run_concurrently_and_sheets_keep_layout_order(
+    mocks: dict[str, Any],
+) -> None:
+    charts = [_chart(chart_id, f"Chart {chart_id}") for chart_id in (10, 20, 30)]
+    for chart in charts:
+        chart.query_context = json.dumps({"queries": [{"chart": chart.id}]})
+    mocks["get_charts_in_layout_order"].return_value = charts
+    mocks["ChartDataQueryContextSchema"].return_value.load.side_effect = (
+        lambda body: body
+    )
+    # Every query waits until all three are in flight, so the export only
+    # completes if they actually run in parallel; the first chart in the layout
+    # then finishes last.
+    started = threading.Barrier(3, timeout=5)
+    delays = {10: 0.2, 20: 0.1, 30: 0.0}
+
+    def _command(body: dict[str, Any]) -> mock.MagicMock:
+        chart_id = body["queries"][0]["chart"]
+
+        def _run_df() -> list[dict[str, Any]]:
+            started.wait()
+            time.sleep(delays[chart_id])
+            return _frames({"chart": [chart_id]})
+
+        command = mock.MagicMock()
+        command.run_df.side_effect = _run_df
+        return command
+
+    mocks["ChartDataCommand"].side_effect = _command
+    uploaded: dict[str, Any] = {}
+
+    def _capture(path: str, bucket: str, key: str) -> None:
+        uploaded["sheets"] = _read_sheets(path)
+
+    mocks["s3"].upload_file_to_s3.side_effect = _capture
+
+    with mock.patch.dict(current_app.config, {"EXCEL_EXPORT_QUERY_CONCURRENCY": 4}):
+        _run("job-concurrent")
+
+    assert uploaded["sheets"] == {
+        "10 - Chart 10": [["chart"], [10]],
+        "20 - Chart 20": [["chart"], [20]],
+        "30 - Chart 30": [["chart"], [30]],
+    }
+    _, kwargs = mocks["email"].build_success_email.call_args
+    assert kwargs["errored"] == {}
+    assert _no_temp_files_left("job-concurrent")
+
+
 def test_chart_without_query_context_is_skipped(mocks: dict[str, Any]) -> None:
     mocks["get_charts_in_layout_order"].return_value = [
         _chart(10, "Good"),
         _chart(20, "NoContext", has_context=False),
     ]
-    mocks["ChartDataCommand"].return_value.run.return_value = {
-        "queries": [{"colnames": ["a"], "data": [{"a": 1}]}]
-    }
+    mocks["ChartDataCommand"].return_value.run_df.return_value = _frames({"a": [1]})
 
     _run()
 
@@ -204,16 +270,14 @@ def test_chart_with_empty_query_context_is_skipped(
     empty = _chart(20, "Empty")
     empty.query_context = raw_context
     mocks["get_charts_in_layout_order"].return_value = [good, empty]
-    mocks["ChartDataCommand"].return_value.run.return_value = {
-        "queries": [{"colnames": ["a"], "data": [{"a": 1}]}]
-    }
+    mocks["ChartDataCommand"].return_value.run_df.return_value = _frames({"a": [1]})
 
     _run()
 
     _, kwargs = mocks["email"].build_success_email.call_args
     assert kwargs["errored"] == {mocks["email"].ERROR_NO_QUERY_CONTEXT: ["20 - Empty"]}
     # The empty chart is skipped before any query runs; only the good one runs.
-    mocks["ChartDataCommand"].return_value.run.assert_called_once()
+    mocks["ChartDataCommand"].return_value.run_df.assert_called_once()
 
 
 def test_empty_query_context_rebuilt_from_form_data_for_eligible_viz(
@@ -228,16 +292,14 @@ def test_empty_query_context_rebuilt_from_form_data_for_eligible_viz(
     rebuilt.datasource_id = 5
     rebuilt.datasource_type = "table"
     mocks["get_charts_in_layout_order"].return_value = [good, rebuilt]
-    mocks["ChartDataCommand"].return_value.run.return_value = {
-        "queries": [{"colnames": ["a"], "data": [{"a": 1}]}]
-    }
+    mocks["ChartDataCommand"].return_value.run_df.return_value = _frames({"a": [1]})
 
     _run()
 
     _, kwargs = mocks["email"].build_success_email.call_args
     assert kwargs["errored"] == {}
     # Both charts ran a query (the saved one and the rebuilt one).
-    assert mocks["ChartDataCommand"].return_value.run.call_count == 2
+    assert mocks["ChartDataCommand"].return_value.run_df.call_count == 2
 
 
 def test_empty_query_context_ineligible_viz_is_skipped(
@@ -251,9 +313,7 @@ def test_empty_query_context_ineligible_viz_is_skipped(
     ineligible.params = json.dumps({"groupby": ["x"], "metrics": ["count"]})
     ineligible.datasource_id = 5
     mocks["get_charts_in_layout_order"].return_value = [good, ineligible]
-    mocks["ChartDataCommand"].return_value.run.return_value = {
-        "queries": [{"colnames": ["a"], "data": [{"a": 1}]}]
-    }
+    mocks["ChartDataCommand"].return_value.run_df.return_value = _frames({"a": [1]})
 
     _run()
 
@@ -261,7 +321,7 @@ def test_empty_query_context_ineligible_viz_is_skipped(
     assert kwargs["errored"] == {
         mocks["email"].ERROR_NO_QUERY_CONTEXT: ["20 - Ineligible"]
     }
-    mocks["ChartDataCommand"].return_value.run.assert_called_once()
+    mocks["ChartDataCommand"].return_value.run_df.assert_called_once()
 
 
 def _rebuildable_chart(
@@ -299,7 +359,10 @@ def _builder_hook(builder: Any) -> Iterator[None]:
         "EXCEL_EXPORT_S3_BUCKET": "bucket",
         "EXCEL_EXPORT_S3_KEY_PREFIX": "dashboard-exports/",
         "EXCEL_EXPORT_LINK_TTL_SECONDS": 3600,
+        "EXCEL_EXPORT_QUERY_CONCURRENCY": 1,
     }.__getitem__
+    # Chart queries run on pool threads, which push a real app context.
+    fake_app._get_current_object.return_value = current_app._get_current_object()
     with mock.patch.object(module, "current_app", fake_app):
         yield
 
@@ -448,19 +511,22 @@ def test_builder_hook_result_is_not_mutated_across_charts(
     second.id = 20
     mocks["get_charts_in_layout_order"].return_value = [first, second]
 
-    def _fresh_filter_context(**kwargs: Any) -> mock.MagicMock:
+    def _fresh_filter_contexts(
+        dashboard_id: int, chart_ids: list[int], **kwargs: Any
+    ) -> dict[int, DashboardFilterContext]:
         # Resolved per chart in production, and consumed destructively by
-        # apply_dashboard_filter_context, so it must not be shared here.
-        context = mock.MagicMock()
-        context.extra_form_data = {
-            "filters": [{"col": "country", "op": "IN", "val": ["US"]}]
+        # apply_dashboard_filter_context, so they must not be shared here.
+        return {
+            chart_id: DashboardFilterContext(
+                extra_form_data={
+                    "filters": [{"col": "country", "op": "IN", "val": ["US"]}]
+                }
+            )
+            for chart_id in chart_ids
         }
-        return context
 
-    mocks["get_dashboard_filter_context"].side_effect = _fresh_filter_context
-    mocks["ChartDataCommand"].return_value.run.return_value = {
-        "queries": [{"colnames": ["a"], "data": [{"a": 1}]}]
-    }
+    mocks["get_dashboard_filter_contexts"].side_effect = _fresh_filter_contexts
+    mocks["ChartDataCommand"].return_value.run_df.return_value = _frames({"a": [1]})
 
     with _builder_hook(builder):
         _run()
@@ -496,16 +562,14 @@ def test_eligible_viz_skipped_when_form_data_unusable(
     bad.datasource_id = datasource_id
     bad.datasource_type = "table"
     mocks["get_charts_in_layout_order"].return_value = [good, bad]
-    mocks["ChartDataCommand"].return_value.run.return_value = {
-        "queries": [{"colnames": ["a"], "data": [{"a": 1}]}]
-    }
+    mocks["ChartDataCommand"].return_value.run_df.return_value = _frames({"a": [1]})
 
     _run()
 
     _, kwargs = mocks["email"].build_success_email.call_args
     assert kwargs["errored"] == {mocks["email"].ERROR_NO_QUERY_CONTEXT: ["20 - Bad"]}
     # Only the good chart ran a query; the unusable one never reached execution.
-    mocks["ChartDataCommand"].return_value.run.assert_called_once()
+    mocks["ChartDataCommand"].return_value.run_df.assert_called_once()
 
 
 @pytest.mark.parametrize(
@@ -533,15 +597,13 @@ def test_eligible_viz_skipped_when_form_data_needs_post_processing(
     fancy.datasource_id = 5
     fancy.datasource_type = "table"
     mocks["get_charts_in_layout_order"].return_value = [good, fancy]
-    mocks["ChartDataCommand"].return_value.run.return_value = {
-        "queries": [{"colnames": ["a"], "data": [{"a": 1}]}]
-    }
+    mocks["ChartDataCommand"].return_value.run_df.return_value = _frames({"a": [1]})
 
     _run()
 
     _, kwargs = mocks["email"].build_success_email.call_args
     assert kwargs["errored"] == {mocks["email"].ERROR_NO_QUERY_CONTEXT: ["20 - Fancy"]}
-    mocks["ChartDataCommand"].return_value.run.assert_called_once()
+    mocks["ChartDataCommand"].return_value.run_df.assert_called_once()
 
 
 def test_rebuilt_query_context_payload_carries_query_shape(
@@ -572,9 +634,7 @@ def test_rebuilt_query_context_payload_carries_query_shape(
         }
     )
     mocks["get_charts_in_layout_order"].return_value = [chart]
-    mocks["ChartDataCommand"].return_value.run.return_value = {
-        "queries": [{"colnames": ["a"], "data": [{"a": 1}]}]
-    }
+    mocks["ChartDataCommand"].return_value.run_df.return_value = _frames({"a": [1]})
 
     _run()
 
@@ -629,9 +689,9 @@ def test_chart_query_error_grouped_as_general_export_continues(
         _chart(10, "Boom"),
         _chart(20, "Ok"),
     ]
-    mocks["ChartDataCommand"].return_value.run.side_effect = [
+    mocks["ChartDataCommand"].return_value.run_df.side_effect = [
         RuntimeError("query failed"),
-        {"queries": [{"colnames": ["a"], "data": [{"a": 1}]}]},
+        _frames({"a": [1]}),
     ]
 
     _run()
@@ -652,8 +712,8 @@ def test_chart_timeout_aborts_export_and_sends_failure_email(
         _chart(10, "Ok"),
         _chart(20, "Slow"),
     ]
-    mocks["ChartDataCommand"].return_value.run.side_effect = [
-        {"queries": [{"colnames": ["a"], "data": [{"a": 1}]}]},
+    mocks["ChartDataCommand"].return_value.run_df.side_effect = [
+        _frames({"a": [1]}),
         SoftTimeLimitExceeded(),
     ]
 
@@ -703,9 +763,7 @@ def test_upload_failure_sends_failure_email_and_cleans_up(
     mocks: dict[str, Any],
 ) -> None:
     mocks["get_charts_in_layout_order"].return_value = [_chart(10, "Good")]
-    mocks["ChartDataCommand"].return_value.run.return_value = {
-        "queries": [{"colnames": ["a"], "data": [{"a": 1}]}]
-    }
+    mocks["ChartDataCommand"].return_value.run_df.return_value = _frames({"a": [1]})
     mocks["s3"].upload_file_to_s3.side_effect = RuntimeError("s3 down")
 
     with pytest.raises(RuntimeError):
@@ -737,9 +795,7 @@ def test_images_mode_embeds_non_table_and_keeps_tables_tabular(
         _chart(20, "Tbl", viz_type="table"),
     ]
     mocks["render_chart_image"].return_value = _PNG_1x1
-    mocks["ChartDataCommand"].return_value.run.return_value = {
-        "queries": [{"colnames": ["a"], "data": [{"a": 1}]}]
-    }
+    mocks["ChartDataCommand"].return_value.run_df.return_value = _frames({"a": [1]})
 
     uploaded: dict[str, Any] = {}
 
@@ -757,7 +813,7 @@ def test_images_mode_embeds_non_table_and_keeps_tables_tabular(
     assert render_args[0].id == 10
     assert render_args[3] is mocks["user"]
     # ...and the table chart still goes through the data path.
-    mocks["ChartDataCommand"].return_value.run.assert_called_once()
+    mocks["ChartDataCommand"].return_value.run_df.assert_called_once()
 
     assert set(uploaded["sheets"].keys()) == {"10 - Line", "20 - Tbl"}
     # Exactly one embedded image (the non-table chart).
@@ -810,25 +866,21 @@ def test_images_mode_none_render_is_skipped(mocks: dict[str, Any]) -> None:
 
 def test_inflight_lock_released_on_success(mocks: dict[str, Any]) -> None:
     mocks["get_charts_in_layout_order"].return_value = [_chart(10, "Good")]
-    mocks["ChartDataCommand"].return_value.run.return_value = {
-        "queries": [{"colnames": ["a"], "data": [{"a": 1}]}]
-    }
+    mocks["ChartDataCommand"].return_value.run_df.return_value = _frames({"a": [1]})
 
     _run()
 
     # The distributed lock is released for this user+dashboard when the task
     # settles (namespace + params match what the API acquired).
     mocks["ReleaseDistributedLock"].assert_called_once_with(
-        "excel_export", {"user_id": 2, "dashboard_id": 1}
+        "excel_export", {"user_id": 2, "dashboard_id": 1}, token=None
     )
     mocks["ReleaseDistributedLock"].return_value.run.assert_called_once_with()
 
 
 def test_inflight_lock_released_on_failure(mocks: dict[str, Any]) -> None:
     mocks["get_charts_in_layout_order"].return_value = [_chart(10, "Good")]
-    mocks["ChartDataCommand"].return_value.run.return_value = {
-        "queries": [{"colnames": ["a"], "data": [{"a": 1}]}]
-    }
+    mocks["ChartDataCommand"].return_value.run_df.return_value = _frames({"a": [1]})
     mocks["s3"].upload_file_to_s3.side_effect = RuntimeError("s3 down")
 
     with pytest.raises(RuntimeError):
@@ -836,6 +888,6 @@ def test_inflight_lock_released_on_failure(mocks: dict[str, Any]) -> None:
 
     # The lock is freed in ``finally`` even when the export fails.
     mocks["ReleaseDistributedLock"].assert_called_once_with(
-        "excel_export", {"user_id": 2, "dashboard_id": 1}
+        "excel_export", {"user_id": 2, "dashboard_id": 1}, token=None
     )
     mocks["ReleaseDistributedLock"].return_value.run.assert_called_once_with()
@@ -20,6 +20,8 @@ from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from superset.utils import excel_streaming
@@ -99,6 +101,14 @@ def test_sanitize_cell_non_finite_floats_blanked() -> None:
     assert _sanitize_cell(float("inf")) == ""
 
 
+def test_sanitize_cell_unboxes_numpy_scalars() -> None:
+    assert _sanitize_cell(np.bool_(True)) is True
+    assert _sanitize_cell(np.int64(7)) == 7
+    assert _sanitize_cell(np.float64(1.5)) == 1.5
+    assert _sanitize_cell(np.float64("nan")) == ""
+    assert _sanitize_cell(pd.NaT) == ""
+
+
 def test_sanitize_cell_non_finite_decimals_blanked() -> None:
     # float(Decimal("NaN")) is nan and float(Decimal("Infinity")) is inf, both
     # of which xlsxwriter rejects; they must be blanked rather than crash.
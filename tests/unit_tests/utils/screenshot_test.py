@@ -451,3 +451,85 @@ class TestScreenshotSubclassesDriverBehavior:
 
         assert driver._window == custom_window_size
         assert chart_screenshot.thumb_size == custom_thumb_size
+
+
+class TestGetCoalescedScreenshot:
+    @pytest.fixture
+    def cache(self, mocker: MockerFixture):
+        cache = MagicMock()
+        cache.get.return_value = None
+        cache.add.return_value = True
+        mocker.patch.object(BaseScreenshot, "cache", cache)
+        mocker.patch(
+            "superset.utils.screenshots.get_executor_rls_digest",
+            return_value="rls_digest",
+        )
+        return cache
+
+    def test_disabled(
+        self, mocker: MockerFixture, app_context, cache, screenshot_obj, mock_user
+    ):
+        """Coalescing disabled renders the screenshot directly"""
+        mocker.patch.dict("flask.current_app.config", {"SCREENSHOT_COALESCE_WINDOW": 0})
+        get_screenshot = mocker.patch(
+            BASE_SCREENSHOT_PATH + ".get_screenshot", return_value=FAKE_PNG_BYTES
+        )
+
+        image = screenshot_obj.get_coalesced_screenshot(mock_user, "admin", [])
+
+        assert image == FAKE_PNG_BYTES
+        get_screenshot.assert_called_once()
+        cache.get.assert_not_called()
+
+    def test_reuses_render(
+        self, mocker: MockerFixture, app_context, cache, screenshot_obj, mock_user
+    ):
+        """A render within the window is shared instead of taking a new one"""
+        cache.get.return_value = ScreenshotCachePayload(FAKE_PNG_BYTES).to_dict()
+        get_screenshot = mocker.patch(BASE_SCREENSHOT_PATH + ".get_screenshot")
+
+        image = screenshot_obj.get_coalesced_screenshot(mock_user, "admin", [])
+
+        assert image == FAKE_PNG_BYTES
+        get_screenshot.assert_not_called()
+        cache.add.assert_not_called()
+
+    def test_lease_holder_renders(
+        self, mocker: MockerFixture, app_context, cache, screenshot_obj, mock_user
+    ):
+        """The lease holder renders, shares the image and releases the lease"""
+        get_screenshot = mocker.patch(
+            BASE_SCREENSHOT_PATH + ".get_screenshot", return_value=FAKE_PNG_BYTES
+        )
+
+        image = screenshot_obj.get_coalesced_screenshot(mock_user, "admin", [])
+
+        assert image == FAKE_PNG_BYTES
+        get_screenshot.assert_called_once()
+        cache_key = cache.set.call_args.args[0]
+        assert cache_key.startswith("screenshot_coalesce:")
+        assert cache.set.call_args.args[1]["image"] is not None
+        cache.delete.assert_called_once_with(f"{cache_key}:lease")
+
+    def test_wait_timeout(
+        self, mocker: MockerFixture, app_context, cache, screenshot_obj, mock_user
+    ):
+        """A render that never shows up falls back to rendering directly"""
+        cache.add.return_value = False
+        mocker.patch.dict(
+            "flask.current_app.config",
+            {
+                "SCREENSHOT_COALESCE_WAIT_TIMEOUT": 0,
+                "SCREENSHOT_COALESCE_POLL_INTERVAL": 0,
+            },
+        )
+        get_screenshot = mocker.patch(
+            BASE_SCREENSHOT_PATH + ".get_screenshot", return_value=FAKE_PNG_BYTES
+        )
+
+        image = screenshot_obj.get_coalesced_screenshot(mock_user, "admin", [])
+
+        assert image == FAKE_PNG_BYTES
+        get_screenshot.assert_called_once()
+        cache.set.assert_not_called()
+        cache.delete.assert_not_called()
@@ -16,8 +16,10 @@
 # under the License.
 import os
 from dataclasses import dataclass
+from io import BytesIO
 from typing import Any, Optional
 from unittest.mock import MagicMock, patch
+from zipfile import ZipFile
 
 import numpy as np
 import pandas as pd
@@ -55,6 +57,7 @@ from superset.utils.core import (
     sanitize_cookie_token,
     sanitize_svg_content,
     sanitize_url,
+    stream_zip,
 )
 from tests.conftest import with_config
 
@@ -2088,3 +2091,22 @@ def test_extract_dataframe_dtypes_with_duplicate_columns() -> None:
     df = pd.DataFrame([[1, 2, 3]], columns=["a", "b", "a"])
     result = extract_dataframe_dtypes(df)
     assert len(result) == 3
+
+
+def test_stream_zip_yields_archive_incrementally() -> None:
+    produced: list[str] = []
+
+    def _files() -> Any:
+        for name in ("a.yaml", "b.yaml"):
+            produced.append(name)
+            yield name, lambda name=name: f"<{name}>"
+
+    chunks = stream_zip(_files())
+    first = next(chunks)
+    # the first member is flushed before the next one is produced
+    assert first
+    assert produced == ["a.yaml"]
+
+    with ZipFile(BytesIO(first + b"".join(chunks))) as bundle:
+        assert bundle.namelist() == ["a.yaml", "b.yaml"]
+        assert bundle.read("b.yaml") == b"<b.yaml>"
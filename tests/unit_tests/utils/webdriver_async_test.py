@@ -0,0 +1,180 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from flask import current_app
+
+from superset.utils.webdriver_async import (
+    _AsyncPlaywrightBrowserManager,
+    AsyncPlaywrightCapture,
+    can_capture_concurrently,
+    close_capture_browser,
+)
+
+
+class _FakeBrowser:
+    """Records how many pages render at once; URLs ending in "slow" hang."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+        self.contexts: list[MagicMock] = []
+        self.launch = AsyncMock(return_value=self)
+        self.is_connected = MagicMock(return_value=True)
+        self.close = AsyncMock()
+
+    async def new_context(self, **kwargs: Any) -> MagicMock:
+        context = MagicMock()
+        context.add_cookies = AsyncMock()
+        context.close = AsyncMock()
+        context.new_page = AsyncMock(return_value=self._page())
+        self.contexts.append(context)
+        return context
+
+    def _page(self) -> MagicMock:
+        page = MagicMock()
+        url: dict[str, str] = {}
+
+        async def goto(target: str, **kwargs: Any) -> None:
+            url["value"] = target
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+        async def screenshot(**kwargs: Any) -> bytes:
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            if url["value"].endswith("slow"):
+                await asyncio.sleep(10)
+            return url["value"].encode()
+
+        page.goto = goto
+        page.wait_for_timeout = AsyncMock()
+        page.wait_for_function = AsyncMock()
+        locator = MagicMock()
+        locator.wait_for = AsyncMock()
+        locator.screenshot = screenshot
+        page.locator.return_value = locator
+        return page
+
+
+@pytest.fixture
+def fake_browser() -> Any:
+    browser = _FakeBrowser()
+    playwright = MagicMock()
+    playwright.chromium.launch = browser.launch
+    playwright.stop = AsyncMock()
+    manager = MagicMock()
+    manager.start = AsyncMock(return_value=playwright)
+    browser_manager = _AsyncPlaywrightBrowserManager()
+    with (
+        patch(
+            "superset.utils.webdriver_async.async_playwright",
+            MagicMock(return_value=manager),
+        ),
+        patch("superset.utils.webdriver_async._browser_manager", browser_manager),
+    ):
+        yield browser
+        browser_manager._cleanup()
+
+
+def test_capture_caps_concurrency_and_keeps_order(
+    app_context: None, fake_browser: _FakeBrowser
+) -> None:
+    urls = [f"http://localhost/dashboard/{i}" for i in range(5)]
+
+    captures = AsyncPlaywrightCapture((800, 600), concurrency=2).capture(
+        urls, "grid-container"
+    )
+
+    assert [capture.url for capture in captures] == urls
+    assert [capture.screenshot for capture in captures] == [
+        url.encode() for url in urls
+    ]
+    assert fake_browser.max_active == 2
+    assert all(context.close.await_count == 1 for context in fake_browser.contexts)
+    # the browser is kept for the next batch
+    fake_browser.close.assert_not_awaited()
+
+
+def test_capture_reuses_the_browser_across_batches(
+    app_context: None, fake_browser: _FakeBrowser
+) -> None:
+    capture = AsyncPlaywrightCapture((800, 600), concurrency=2)
+
+    capture.capture(["http://localhost/dashboard/1"], "grid-container")
+    capture.capture(["http://localhost/dashboard/2"], "grid-container")
+    assert len(fake_browser.contexts) == 2
+    fake_browser.launch.assert_awaited_once()
+    fake_browser.close.assert_not_awaited()
+
+    # a browser that went away is relaunched
+    fake_browser.is_connected.return_value = False
+    capture.capture(["http://localhost/dashboard/3"], "grid-container")
+    assert fake_browser.launch.await_count == 2
+    fake_browser.close.assert_awaited_once()
+
+    close_capture_browser()
+    assert fake_browser.close.await_count == 2
+
+
+def test_capture_page_deadline_does_not_affect_others(
+    app_context: None, fake_browser: _FakeBrowser
+) -> None:
+    urls = ["http://localhost/dashboard/ok", "http://localhost/dashboard/slow"]
+
+    captures = AsyncPlaywrightCapture(
+        (800, 600), concurrency=2, page_timeout=0.2
+    ).capture(urls, "grid-container")
+
+    assert captures[0].screenshot == b"http://localhost/dashboard/ok"
+    assert captures[1].screenshot is None
+    assert captures[1].error == "deadline exceeded"
+
+
+def test_capture_authenticates_each_context(
+    app_context: None, fake_browser: _FakeBrowser
+) -> None:
+    with patch(
+        "superset.utils.webdriver_async.machine_auth_provider_factory"
+    ) as mock_auth:
+        mock_auth.instance.get_auth_cookies.return_value = {"session": "abc"}
+        AsyncPlaywrightCapture((800, 600), concurrency=2).capture(
+            ["http://localhost/a", "http://localhost/b"],
+            "grid-container",
+            user=MagicMock(),
+        )
+
+    for context in fake_browser.contexts:
+        cookies = context.add_cookies.await_args.args[0]
+        assert [(c["name"], c["value"]) for c in cookies] == [("session", "abc")]
+
+
+def test_can_capture_concurrently(app_context: None) -> None:
+    with (
+        patch("superset.utils.webdriver_async.async_playwright", MagicMock()),
+        patch.dict(current_app.config, {"WEBDRIVER_AUTH_FUNC": None}),
+    ):
+        assert can_capture_concurrently()
+        current_app.config["WEBDRIVER_AUTH_FUNC"] = lambda context, user: context
+        assert not can_capture_concurrently()
+
+    with patch("superset.utils.webdriver_async.async_playwright", None):
+        assert not can_capture_concurrently()
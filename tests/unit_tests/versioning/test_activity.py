@@ -825,3 +825,44 @@ def test_build_summary_meta_headline_branches() -> None:
         "entity_name": "",
     }
     assert _build_summary("Dashboard", unknown) == "Dashboard updated"
+
+
+@pytest.mark.parametrize(
+    "q, pushed_down",
+    [
+        ("Sales Transactions", True),
+        ("revenue (eur)", True),
+        ('"label"', True),
+        # The fixed headline wording matches records whatever their name
+        ("chart", False),
+        ("Filter Changed", False),
+        ("(deleted)", False),
+        ("updated: sales", False),
+        (": sales", False),
+        # Non-ASCII and punctuation-only searches are matched in Python only
+        ("café", False),
+        (": ,", False),
+    ],
+)
+def test_sql_search_pushes_down_only_name_and_value_searches(
+    q: str, pushed_down: bool
+) -> None:
+    """A search is pre-filtered in SQL only when that cannot drop a
+    record the Python match would keep."""
+    from superset.versioning.activity.orchestrator import _sql_search
+
+    assert (_sql_search(q) == q) is pushed_down
+
+
+def test_search_tokens_drop_json_punctuation() -> None:
+    """Tokens are what appears verbatim in stored JSON text, whatever the
+    dialect's spacing: the client-facing path form joins segments with
+    spaces, the stored form is a JSON array."""
+    from superset.versioning.activity.queries import search_tokens
+
+    assert search_tokens("adhoc_filters country") == ["adhoc_filters", "country"]
+    assert search_tokens('{"label": "Revenue (EUR)"}') == [
+        "label",
+        "Revenue",
+        "(EUR)",
+    ]
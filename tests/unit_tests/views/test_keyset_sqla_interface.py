@@ -0,0 +1,130 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Tests of the keyset cursor of ``KeysetSQLAInterface`` list pages."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+import pytest
+from flask import g
+from sqlalchemy import Column, create_engine, DateTime, Integer, String
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from superset.daos.base import decode_keyset_cursor, encode_keyset_cursor
+from superset.exceptions import InvalidPayloadFormatError
+from superset.views.base_api import KeysetSQLAInterface
+
+Base = declarative_base()
+
+
+class Row(Base):  # type: ignore[misc, valid-type]
+    __tablename__ = "row"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50))
+    changed_on = Column(DateTime, nullable=True)
+
+
+def _datamodel() -> KeysetSQLAInterface:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all(
+        [
+            Row(
+                id=i,
+                name=f"row{i % 3}",
+                changed_on=None if i % 4 == 0 else datetime(2024, 1, 1 + i % 5),
+            )
+            for i in range(1, 12)
+        ]
+    )
+    session.commit()
+    return KeysetSQLAInterface(Row, session)
+
+
+def _page(
+    datamodel: KeysetSQLAInterface,
+    order_column: str,
+    order_direction: str,
+    cursor: Optional[str],
+) -> tuple[int, list[Any], Optional[str]]:
+    g.list_keyset_after = decode_keyset_cursor(cursor) if cursor else None
+    g.pop("list_next_keyset", None)
+    count, items = datamodel.query(
+        order_column=order_column,
+        order_direction=order_direction,
+        page=0,
+        page_size=4,
+    )
+    keyset = g.pop("list_next_keyset", None)
+    return count, items, encode_keyset_cursor(*keyset) if keyset else None
+
+
+@pytest.mark.parametrize(
+    "order_column, order_direction",
+    [
+        ("changed_on", "desc"),
+        ("changed_on", "asc"),
+        ("name", "asc"),
+        ("id", "desc"),
+    ],
+)
+def test_keyset_cursor_walks_every_row_once(
+    order_column: str, order_direction: str
+) -> None:
+    datamodel = _datamodel()
+    _, offset_items = datamodel.query(
+        order_column=order_column, order_direction=order_direction
+    )
+
+    seen: list[int] = []
+    cursor = None
+    while True:
+        count, items, cursor = _page(datamodel, order_column, order_direction, cursor)
+        assert count == 11
+        seen.extend(item.id for item in items)
+        if cursor is None:
+            break
+
+    assert seen == [item.id for item in offset_items]
+    if order_column == "changed_on":
+        # NULLs sort last in either direction
+        assert [item.changed_on is None for item in offset_items[-2:]] == [
+            True,
+            True,
+        ]
+
+
+def test_keyset_cursor_ignored_without_order_column() -> None:
+    datamodel = _datamodel()
+    g.list_keyset_after = (None, 3)
+    g.pop("list_next_keyset", None)
+
+    count, items = datamodel.query(page=1, page_size=4)
+
+    assert count == 11
+    assert len(items) == 4
+    assert "list_next_keyset" not in g
+
+
+def test_keyset_cursor_invalid_value() -> None:
+    datamodel = _datamodel()
+    g.list_keyset_after = ("not a date", 3)
+
+    with pytest.raises(InvalidPayloadFormatError):
+        datamodel.query(order_column="changed_on", order_direction="desc", page_size=4)